@@ -71,7 +71,9 @@ from .coordinator_local import HortiLocalCoordinator
 from .entity_utils import ensure_entities_exist
 from .health_monitor import async_release_dataset_health, async_setup_dataset_health
 from .http import async_register_http_views
+from .lookup_cache import async_setup_lookup_caches, async_unload_lookup_caches
 from .profile.compat import sync_thresholds
+from .profile.store import async_update_profile_fields, extract_options_bulk, strip_options_bulk
 from .profile.utils import ensure_sections
 from .profile_registry import ProfileRegistry
 from .profile_store import ProfileStore
@@ -83,6 +85,7 @@ except ImportError:  # pragma: no cover - fallback for stubbed tests
 
     DEFAULT_DATA: dict[str, Any] = {}
 from .utils.entry_helpers import (
+    async_setup_nutrient_tracker,
     backfill_profile_devices_from_options,
     ensure_all_profile_devices_registered,
     get_entry_data,
@@ -1060,6 +1063,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not profile_store_ready:
         profile_store = None
 
+    try:
+        await async_setup_lookup_caches(hass)
+    except Exception as err:  # pragma: no cover - cached lookups are best effort
+        _LOGGER.debug("Unable to restore lookup caches: %s", err)
+
+    try:
+        await async_setup_nutrient_tracker(hass)
+    except Exception as err:  # pragma: no cover - nutrient sensors report unavailable without it
+        _LOGGER.warning("Unable to set up nutrient tracker: %s", err)
+
     cloud_sync_manager = CloudSyncManager(hass, entry)
 
     profile_registry: ProfileRegistry | None = ProfileRegistry(hass, entry)
@@ -1549,6 +1562,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             await _invoke_callback(getattr(profiles, "async_unload", None))
 
         remove_entry_data(hass, entry.entry_id)
+        if DOMAIN not in hass.data:
+            # Last entry gone: write pending lookups and drop the shared store.
+            with contextlib.suppress(Exception):
+                await async_unload_lookup_caches(hass)
     return unload_ok
 
 
@@ -1758,6 +1775,29 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 continue
             entity_registry.async_update_entity(item.entity_id, unique_id=f"{entry_prefix}{unique_id}")
 
+    if entry.version < 5:
+        migrated = True
+        entry.version = 5
+
+        # Move run/harvest history, statistics and derived sections out of the
+        # options payload; the profile store already owns this data.
+        raw_profiles = options.get(CONF_PROFILES)
+        if isinstance(raw_profiles, Mapping):
+            light_profiles: dict[str, Any] = {}
+            for pid, payload in raw_profiles.items():
+                if not isinstance(pid, str) or not isinstance(payload, Mapping):
+                    continue
+                bulk = extract_options_bulk(payload)
+                if bulk:
+                    try:
+                        await async_update_profile_fields(hass, pid, bulk, default=payload, overwrite=False)
+                    except Exception as err:  # pragma: no cover - keep options intact on storage failure
+                        _LOGGER.warning("Unable to move stored history for profile %s: %s", pid, err)
+                        light_profiles[pid] = dict(payload)
+                        continue
+                light_profiles[pid] = strip_options_bulk(payload)
+            options[CONF_PROFILES] = light_profiles
+
     if migrated:
         hass.config_entries.async_update_entry(entry, data=data, options=options)
 
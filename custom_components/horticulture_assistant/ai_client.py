@@ -3,7 +3,6 @@ from __future__ import annotations
 import asyncio
 import json
 import math
-import re
 from collections.abc import Hashable, Mapping
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
@@ -14,10 +13,12 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from yarl import URL
 
 from .ai_utils import extract_numbers
+from .lookup_cache import LookupCache, schedule_lookup_cache_save
+from .web_fetch import clear_page_cache, fetch_page_text
 
 CacheKey = tuple[str, str, tuple[tuple[str, Hashable], ...]]
 
-_AI_CACHE: dict[CacheKey, tuple[dict[str, Any], datetime]] = {}
+_AI_CACHE = LookupCache("ai_recommendations", max_entries=512)
 
 DEFAULT_TTL_HOURS = 720.0
 
@@ -93,16 +94,36 @@ def _make_cache_key(plant_id: str, key: str, context: dict[str, Any]) -> CacheKe
 
 
 async def _fetch_text(session, url: str) -> str:
-    """Fetch raw text content from a URL, stripping HTML tags."""
+    """Fetch visible text content from a URL through the bounded page fetcher."""
+
+    return await fetch_page_text(session, url)
+
+
+def _heuristic_value(nums: list[float]) -> float | None:
+    """Return a trimmed mean of ``nums`` or ``None`` when empty."""
+
+    if not nums:
+        return None
+    ordered = sorted(nums)
+    k = max(0, int(len(ordered) * 0.1))
+    core = ordered[k : len(ordered) - k] or ordered
+    return sum(core) / len(core)
+
+
+def _parse_batch_answer(text: str | None) -> dict[str, Any]:
+    """Extract the JSON object from a batched LLM reply."""
+
+    if not text:
+        return {}
+    start = text.find("{")
+    end = text.rfind("}")
+    if start < 0 or end <= start:
+        return {}
     try:
-        async with session.get(url, timeout=15) as resp:
-            if resp.status != 200:
-                return ""
-            txt = await resp.text()
-    except Exception:
-        return ""
-    # naive HTML strip
-    return re.sub(r"<[^>]+>", " ", txt)
+        data = json.loads(text[start : end + 1])
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
 
 
 class AIClient:
@@ -113,9 +134,9 @@ class AIClient:
         self.provider = provider
         self.model = model
 
-    async def generate_setpoint(self, context: dict[str, Any]) -> tuple[float, float, str, list[str]]:
-        """Return (value, confidence, summary, links)."""
-        session = async_get_clientsession(self.hass)
+    async def _sweep(self, session, context: Mapping[str, Any]) -> tuple[list[str], list[float]]:
+        """Return search result links and candidate numbers for ``context``."""
+
         key = context.get("key")
         plant_id = context.get("plant_id")
         search_endpoint = context.get("search_endpoint")
@@ -148,13 +169,41 @@ class AIClient:
         nums: list[float] = []
         for t in texts:
             nums.extend(extract_numbers(t)[:10])
+        return links, nums
 
-        value: float | None = None
-        if nums:
-            nums.sort()
-            k = max(0, int(len(nums) * 0.1))
-            core = nums[k : len(nums) - k] or nums
-            value = sum(core) / len(core)
+    async def _chat(self, session, api_key: str, prompt: str) -> str | None:
+        """Return the completion text for ``prompt`` or ``None`` on failure."""
+
+        body = {
+            "model": self.model,
+            "temperature": 0.2,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        try:
+            async with session.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+                data=json.dumps(body),
+                timeout=30,
+            ) as resp:
+                if resp.status == 200:
+                    jr = await resp.json()
+                    return jr["choices"][0]["message"]["content"]
+        except Exception:
+            pass
+        return None
+
+    async def generate_setpoint(self, context: dict[str, Any]) -> tuple[float, float, str, list[str]]:
+        """Return (value, confidence, summary, links)."""
+        session = async_get_clientsession(self.hass)
+        key = context.get("key")
+        plant_id = context.get("plant_id")
+
+        links, nums = await self._sweep(session, context)
+        value = _heuristic_value(nums)
         confidence = 0.5 if value is not None else 0.2
 
         api_key = self._get_openai_key()
@@ -164,36 +213,60 @@ class AIClient:
                 f"Given the candidate values {nums} for variable '{key}' in plant '{plant_id}', "
                 "return a single numeric setpoint and one-sentence justification."
             )
-            body = {
-                "model": self.model,
-                "temperature": 0.2,
-                "messages": [{"role": "user", "content": prompt}],
-            }
-            try:
-                async with session.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    data=json.dumps(body),
-                    timeout=30,
-                ) as resp:
-                    if resp.status == 200:
-                        jr = await resp.json()
-                        txt = jr["choices"][0]["message"]["content"]
-                        cand = extract_numbers(txt)
-                        if cand:
-                            value = cand[0]
-                        summary = txt[:400]
-                        confidence = 0.7
-            except Exception:
-                pass
+            txt = await self._chat(session, api_key, prompt)
+            if txt is not None:
+                cand = extract_numbers(txt)
+                if cand:
+                    value = cand[0]
+                summary = txt[:400]
+                confidence = 0.7
 
         if value is None:
             value = 0.0
         return float(value), confidence, summary, links[:5]
 
+    async def generate_setpoints(
+        self, contexts: Mapping[str, dict[str, Any]]
+    ) -> dict[str, tuple[float, float, str, list[str]]]:
+        """Return setpoints for several variables keyed like ``contexts``.
+
+        Web sweeps run concurrently and a single prompt asks the LLM for every
+        variable at once.  Without an API key (or for a single variable) this
+        falls back to :meth:`generate_setpoint` per variable.
+        """
+
+        keys = list(contexts)
+        api_key = self._get_openai_key()
+        if not api_key or len(keys) < 2:
+            results = await asyncio.gather(*(self.generate_setpoint(contexts[key]) for key in keys))
+            return dict(zip(keys, results, strict=True))
+
+        session = async_get_clientsession(self.hass)
+        sweeps = await asyncio.gather(*(self._sweep(session, contexts[key]) for key in keys))
+        plant_id = contexts[keys[0]].get("plant_id")
+        candidates = {key: nums for key, (_links, nums) in zip(keys, sweeps, strict=True)}
+        prompt = (
+            f"For plant '{plant_id}', choose a numeric setpoint for each variable given these candidate "
+            f"values: {json.dumps(candidates)}. Reply with a JSON object mapping each variable name to "
+            'an object with "value" (number) and "justification" (one sentence).'
+        )
+        answers = _parse_batch_answer(await self._chat(session, api_key, prompt))
+
+        results: dict[str, tuple[float, float, str, list[str]]] = {}
+        for key, (links, nums) in zip(keys, sweeps, strict=True):
+            value = _heuristic_value(nums)
+            confidence = 0.5 if value is not None else 0.2
+            summary = "Heuristic synthesis (no LLM)"
+            answer = answers.get(key)
+            if isinstance(answer, Mapping):
+                raw_value = answer.get("value")
+                if isinstance(raw_value, int | float) and not isinstance(raw_value, bool):
+                    value = float(raw_value)
+                    confidence = 0.7
+                    summary = str(answer.get("justification") or summary)[:400]
+            results[key] = (float(value if value is not None else 0.0), confidence, summary, links[:5])
+        return results
+
     def _get_openai_key(self) -> str | None:
         """Return the OpenAI API key from Home Assistant secrets."""
 
@@ -219,8 +292,8 @@ class AIClient:
         return None
 
 
-async def async_recommend_variable(hass, key: str, plant_id: str, ttl_hours: int = 720, **kwargs) -> dict[str, Any]:
-    """Return AI recommendation for a variable with simple caching."""
+def _ai_request(ttl_hours: Any, kwargs: Mapping[str, Any]) -> tuple[str, str, float, dict[str, Any]]:
+    """Return provider, model, TTL and cache context for an AI lookup."""
 
     raw_provider = kwargs.get("provider")
     provider = raw_provider.strip() if isinstance(raw_provider, str) else raw_provider
@@ -239,30 +312,57 @@ async def async_recommend_variable(hass, key: str, plant_id: str, ttl_hours: int
     cache_context["provider"] = provider
     cache_context["model"] = model
     cache_context["ttl_hours"] = ttl
-    cache_key = _make_cache_key(plant_id, key, cache_context)
+    return provider, model, ttl, cache_context
+
+
+async def async_recommend_variable(hass, key: str, plant_id: str, ttl_hours: int = 720, **kwargs) -> dict[str, Any]:
+    """Return AI recommendation for a variable with simple caching."""
+
+    results = await async_recommend_variables(hass, [key], plant_id, ttl_hours=ttl_hours, **kwargs)
+    return results[key]
+
+
+async def async_recommend_variables(
+    hass, keys: list[str], plant_id: str, ttl_hours: int = 720, **kwargs
+) -> dict[str, dict[str, Any]]:
+    """Return AI recommendations for ``keys``, batching uncached variables."""
+
+    provider, model, ttl, cache_context = _ai_request(ttl_hours, kwargs)
     now = datetime.now(UTC)
-    cached = _AI_CACHE.get(cache_key)
-    if cached:
-        cached_result, created_at = cached
-        if now - created_at < timedelta(hours=ttl):
-            return deepcopy(cached_result)
-
-    client = AIClient(hass, provider, model)
-    context = {"key": key, "plant_id": plant_id, **cache_context}
-    val, conf, summary, links = await client.generate_setpoint(context)
-    result = {
-        "value": val,
-        "confidence": conf,
-        "summary": summary,
-        "links": links,
-        "provider": provider,
-        "model": model,
-    }
-    snapshot = deepcopy(result)
-    _AI_CACHE[cache_key] = (snapshot, now)
-    return result
+    cache_keys = {_make_cache_key(plant_id, key, cache_context): key for key in keys}
+
+    async def _generate(missing_keys: list[CacheKey]) -> dict[CacheKey, dict[str, Any]]:
+        missing = {
+            cache_keys[ck]: {"key": cache_keys[ck], "plant_id": plant_id, **cache_context} for ck in missing_keys
+        }
+        client = AIClient(hass, provider, model)
+        if len(missing) == 1:
+            (key, context), *_ = missing.items()
+            generated = {key: await client.generate_setpoint(context)}
+        else:
+            generated = await client.generate_setpoints(missing)
+        created: dict[CacheKey, dict[str, Any]] = {}
+        for ck, key in cache_keys.items():
+            if key not in generated:
+                continue
+            val, conf, summary, links = generated[key]
+            created[ck] = {
+                "value": val,
+                "confidence": conf,
+                "summary": summary,
+                "links": links,
+                "provider": provider,
+                "model": model,
+            }
+        return created
+
+    cached = await _AI_CACHE.get_or_create_many(cache_keys, _generate, ttl=timedelta(hours=ttl), now=now)
+    schedule_lookup_cache_save(hass)
+    results = {cache_keys[ck]: deepcopy(result) for ck, result in cached.items()}
+    return {key: results[key] for key in keys if key in results}
 
 
 def clear_ai_cache() -> None:
-    """Clear cached AI recommendations."""
+    """Clear cached AI recommendations and fetched web pages."""
     _AI_CACHE.clear()
+    clear_page_cache()
@@ -1,5 +1,18 @@
+"""Lux to PPFD model fitting.
+
+The ``fit_*`` helpers fit a single model to one sample array.  The batch
+engine below fits every candidate model in one vectorized pass, optionally
+with outlier-robust weighting, selects between them by cross-validation and
+can fit many sensors at once.
+"""
+
 from __future__ import annotations
 
+import warnings
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
 import numpy as np
 
 
@@ -38,14 +51,373 @@ def fit_power(lux: np.ndarray, ppfd: np.ndarray) -> tuple[list[float], float, fl
 
 
 def eval_model(model: str, coeffs: list[float], lux: np.ndarray) -> np.ndarray:
+    return compile_evaluator(model, coeffs)(lux)
+
+
+MODELS: tuple[str, ...] = ("linear", "quadratic", "power")
+
+# Exponents of the basis functions for each model.  Power fits are a straight
+# line in log-log space, so they share the linear basis.
+_EXPONENTS: dict[str, tuple[int, ...]] = {
+    "linear": (1, 0),
+    "quadratic": (2, 1, 0),
+    "power": (1, 0),
+}
+_HUBER_DELTA = 1.345
+_HUBER_ITERATIONS = 20
+_RANSAC_TRIALS = 64
+
+
+@dataclass
+class FitResult:
+    """Coefficients and quality metrics for one fitted model."""
+
+    model: str
+    coefficients: list[float]
+    r2: float
+    rmse: float
+    n: int
+    cv_rmse: float | None = None
+
+
+def compile_evaluator(model: str, coeffs: list[float]) -> Callable[[Any], np.ndarray]:
+    """Return a function mapping an array of lux values to PPFD.
+
+    Coefficients are unpacked and validated once so history backfill can
+    evaluate large arrays without per-point dispatch.
+    """
+
     if model == "linear":
-        a, b = coeffs
-        return a * lux + b
+        a, b = (float(c) for c in coeffs)
+        return lambda lux: a * np.asarray(lux, dtype=float) + b
     if model == "quadratic":
-        a, b, c = coeffs
-        return a * (lux**2) + b * lux + c
+        poly = np.array([float(c) for c in coeffs], dtype=float)
+        if poly.shape != (3,):
+            raise ValueError(f"quadratic model needs 3 coefficients, got {len(poly)}")
+        return lambda lux: np.polyval(poly, np.asarray(lux, dtype=float))
     if model == "power":
-        a, b = coeffs
-        lux_pos = np.clip(lux, 1e-6, None)
-        return a * (lux_pos**b)
+        a, b = (float(c) for c in coeffs)
+        return lambda lux: a * np.power(np.clip(np.asarray(lux, dtype=float), 1e-6, None), b)
     raise ValueError(f"Unknown model: {model}")
+
+
+def _as_batch(lux: Any, ppfd: Any) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(x, y, mask)`` as ``(sensors, points)`` arrays."""
+
+    x = np.atleast_2d(np.asarray(lux, dtype=float))
+    y = np.atleast_2d(np.asarray(ppfd, dtype=float))
+    if x.shape != y.shape:
+        raise ValueError("lux and ppfd must have the same shape")
+    mask = np.isfinite(x) & np.isfinite(y)
+    return np.where(mask, x, 0.0), np.where(mask, y, 0.0), mask.astype(float)
+
+
+def _transform(model: str, x: np.ndarray, y: np.ndarray, w: np.ndarray):
+    """Return the basis input, target and weights used to fit ``model``."""
+
+    if model == "power":
+        positive = (y > 0) & (w > 0)
+        t = np.log(np.clip(x, 1e-6, None))
+        return t, np.log(np.where(positive, y, 1.0)), np.where(positive, w, 0.0), np.ones(x.shape[:-1])
+    if model not in _EXPONENTS:
+        raise ValueError(f"Unknown model: {model}")
+    # Scale lux to roughly [0, 1] per sensor so the normal equations stay
+    # well conditioned for quadratic terms of 100 klx readings.
+    scale = np.max(np.abs(x) * (w > 0), axis=-1)
+    scale = np.where(scale > 0, scale, 1.0)
+    return x / scale[..., None], y, w, scale
+
+
+def _solve(t: np.ndarray, y: np.ndarray, w: np.ndarray, exps: tuple[int, ...]) -> np.ndarray:
+    """Weighted least squares for every leading index at once."""
+
+    basis = np.stack([t**e for e in exps], axis=-1)
+    weighted = basis * w[..., None]
+    normal = np.einsum("...ni,...nj->...ij", weighted, basis)
+    rhs = np.einsum("...ni,...n->...i", weighted, y)
+    return (np.linalg.pinv(normal) @ rhs[..., None])[..., 0]
+
+
+def _huber(t, y, w, exps, beta):
+    """Refine ``beta`` with iteratively reweighted least squares."""
+
+    basis = np.stack([t**e for e in exps], axis=-1)
+    valid = w > 0
+    for _ in range(_HUBER_ITERATIONS):
+        resid = np.abs(y - np.einsum("...ni,...i->...n", basis, beta))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN rows for empty folds
+            mad = np.nanmedian(np.where(valid, resid, np.nan), axis=-1, keepdims=True)
+        scale = np.where(np.isfinite(mad) & (mad > 0), 1.4826 * mad, np.inf)
+        u = resid / (_HUBER_DELTA * scale)
+        beta_new = _solve(t, y, w * np.where(u > 1, 1 / np.maximum(u, 1e-12), 1.0), exps)
+        if np.allclose(beta_new, beta, rtol=1e-9, atol=1e-12):
+            return beta_new
+        beta = beta_new
+    return beta
+
+
+def _ransac(t, y, w, exps, beta):
+    """Refit each dataset on the largest consensus set of random minimal fits."""
+
+    rng = np.random.default_rng(0)
+    basis = np.stack([t**e for e in exps], axis=-1)
+    out = beta.copy()
+    flat_t = t.reshape(-1, t.shape[-1])
+    flat_y = y.reshape(-1, y.shape[-1])
+    flat_w = w.reshape(-1, w.shape[-1])
+    flat_basis = basis.reshape(-1, *basis.shape[-2:])
+    flat_out = out.reshape(-1, beta.shape[-1])
+    p = len(exps)
+    for i in range(flat_t.shape[0]):
+        idx = np.flatnonzero(flat_w[i] > 0)
+        if len(idx) <= p:
+            continue
+        resid = np.abs(flat_y[i, idx] - flat_basis[i, idx] @ flat_out[i])
+        threshold = 2.5 * 1.4826 * float(np.median(resid))
+        if threshold <= 0:
+            continue
+        picks = np.argsort(rng.random((_RANSAC_TRIALS, len(idx))), axis=1)[:, :p]
+        samples = idx[picks]
+        candidates = (np.linalg.pinv(flat_basis[i, samples]) @ flat_y[i, samples][..., None])[..., 0]
+        errors = np.abs(flat_y[i, idx][None, :] - candidates @ flat_basis[i, idx].T)
+        inliers = errors <= threshold
+        best = inliers[int(np.argmax(inliers.sum(axis=1)))]
+        if best.sum() > p:
+            keep = np.zeros_like(flat_w[i])
+            keep[idx[best]] = flat_w[i, idx[best]]
+            flat_out[i] = _solve(flat_t[i], flat_y[i], keep, exps)
+    return out
+
+
+def _fit_stack(model: str, x: np.ndarray, y: np.ndarray, w: np.ndarray, robust: str | None) -> np.ndarray:
+    """Return natural-unit coefficients of ``model`` for every leading index."""
+
+    exps = _EXPONENTS.get(model)
+    if exps is None:
+        raise ValueError(f"Unknown model: {model}")
+    t, target, weights, scale = _transform(model, x, y, w)
+    t, target, weights = np.broadcast_arrays(t, target, weights)
+    beta = _solve(t, target, weights, exps)
+    if robust == "huber":
+        beta = _huber(t, target, weights, exps, beta)
+    elif robust == "ransac":
+        beta = _ransac(t, target, weights, exps, beta)
+    elif robust is not None:
+        raise ValueError(f"Unknown robust method: {robust}")
+    if model == "power":
+        return np.stack([np.exp(beta[..., 1]), beta[..., 0]], axis=-1)
+    return beta / np.stack([scale**e for e in exps], axis=-1)
+
+
+def _predict(model: str, coeffs: np.ndarray, x: np.ndarray) -> np.ndarray:
+    if model == "power":
+        return coeffs[..., :1] * np.power(np.clip(x, 1e-6, None), coeffs[..., 1:2])
+    return sum(coeffs[..., i : i + 1] * x**e for i, e in enumerate(_EXPONENTS[model]))
+
+
+def _metrics(y: np.ndarray, pred: np.ndarray, w: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    n = w.sum(axis=-1)
+    mean = (y * w).sum(axis=-1) / np.maximum(n, 1)
+    ss_res = (((y - pred) ** 2) * w).sum(axis=-1)
+    ss_tot = (((y - mean[..., None]) ** 2) * w).sum(axis=-1)
+    r2 = np.where(ss_tot > 0, 1.0 - ss_res / np.where(ss_tot > 0, ss_tot, 1.0), 0.0)
+    return r2, np.sqrt(ss_res / np.maximum(n, 1))
+
+
+def _cv_rmse(model: str, x, y, w, folds: int, robust: str | None) -> np.ndarray:
+    """K-fold RMSE per dataset, with every fold solved in one stacked call."""
+
+    n = w.sum(axis=-1).astype(int)
+    k = np.clip(np.minimum(folds, n), 1, None)
+    # Interleaved folds so each one spans the lux range of sweep-ordered points.
+    fold_of = np.arange(x.shape[-1])[None, :] % k[:, None]
+    held = np.stack([(fold_of == f) & (w > 0) for f in range(folds)])
+    coeffs = _fit_stack(model, x, y, w * ~held, robust)
+    errors = ((_predict(model, coeffs, x) - y) ** 2) * held
+    return np.sqrt(errors.sum(axis=(0, -1)) / np.maximum(n, 1))
+
+
+def _fit_batch(
+    models: tuple[str, ...],
+    x: np.ndarray,
+    y: np.ndarray,
+    w: np.ndarray,
+    *,
+    folds: int | None,
+    robust: str | None,
+) -> dict[str, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray | None]]:
+    out = {}
+    for model in models:
+        coeffs = _fit_stack(model, x, y, w, robust)
+        r2, rmse = _metrics(y, _predict(model, coeffs, x), w)
+        cv = _cv_rmse(model, x, y, w, folds, robust) if folds and folds > 1 else None
+        out[model] = (coeffs, r2, rmse, cv)
+    return out
+
+
+def _result(model: str, row: tuple, i: int, n: int) -> FitResult:
+    coeffs, r2, rmse, cv = row
+    return FitResult(
+        model=model,
+        coefficients=[float(c) for c in coeffs[i]],
+        r2=float(r2[i]),
+        rmse=float(rmse[i]),
+        n=n,
+        cv_rmse=None if cv is None else float(cv[i]),
+    )
+
+
+def fit_models(
+    lux: Any,
+    ppfd: Any,
+    models: tuple[str, ...] = MODELS,
+    *,
+    robust: str | None = None,
+    folds: int | None = None,
+) -> dict[str, FitResult]:
+    """Fit every model in ``models`` to one set of samples.
+
+    ``robust`` selects an outlier-resistant variant: ``"huber"`` (IRLS) or
+    ``"ransac"`` (consensus refit).  When ``folds`` is given each result also
+    carries its cross-validated RMSE.
+    """
+
+    x, y, w = _as_batch(lux, ppfd)
+    n = int(w.sum())
+    batch = _fit_batch(tuple(models), x, y, w, folds=folds, robust=robust)
+    return {model: _result(model, row, 0, n) for model, row in batch.items()}
+
+
+def _pick(results: dict[str, FitResult]) -> FitResult:
+    # Ties go to the earlier (simpler) model in ``MODELS`` order.
+    return min(results.values(), key=lambda r: (r.cv_rmse if r.cv_rmse is not None else r.rmse))
+
+
+def select_model(
+    lux: Any,
+    ppfd: Any,
+    models: tuple[str, ...] = MODELS,
+    *,
+    folds: int = 5,
+    robust: str | None = None,
+) -> FitResult:
+    """Return the model with the lowest ``folds``-fold cross-validated RMSE."""
+
+    return _pick(fit_models(lux, ppfd, models, robust=robust, folds=folds))
+
+
+def fit_many(
+    datasets: Mapping[str, tuple[Any, Any]],
+    model: str = "auto",
+    *,
+    folds: int = 5,
+    robust: str | None = None,
+) -> dict[str, FitResult]:
+    """Fit many sensors at once.
+
+    ``datasets`` maps a key (usually the lux entity id) to ``(lux, ppfd)``
+    samples of any length.  Samples are padded into one masked matrix so all
+    sensors, models and CV folds are solved together.  ``model="auto"`` picks
+    the best candidate per sensor by cross-validated RMSE.
+    """
+
+    keys = list(datasets)
+    if not keys:
+        return {}
+    rows = [tuple(np.asarray(v, dtype=float).ravel() for v in datasets[k]) for k in keys]
+    width = max(len(lx) for lx, _ in rows)
+    x = np.full((len(rows), width), np.nan)
+    y = np.full((len(rows), width), np.nan)
+    for i, (lx, py) in enumerate(rows):
+        if len(lx) != len(py):
+            raise ValueError(f"{keys[i]}: lux and ppfd must have the same length")
+        x[i, : len(lx)] = lx
+        y[i, : len(py)] = py
+    x, y, w = _as_batch(x, y)
+    models = MODELS if model == "auto" else (model,)
+    batch = _fit_batch(models, x, y, w, folds=folds if model == "auto" else None, robust=robust)
+    counts = w.sum(axis=-1).astype(int)
+    out: dict[str, FitResult] = {}
+    for i, key in enumerate(keys):
+        results = {m: _result(m, row, i, int(counts[i])) for m, row in batch.items()}
+        out[key] = _pick(results)
+    return out
+
+
+class IncrementalFit:
+    """Running normal-equation sums for calibration points.
+
+    Points can be added one at a time while a session is in progress and any
+    model can be solved from the accumulated sums without revisiting earlier
+    samples.  The raw points are kept for metrics and cross-validation.
+    """
+
+    def __init__(self) -> None:
+        self.lux: list[float] = []
+        self.ppfd: list[float] = []
+        self._scale = 1.0
+        self._sx = np.zeros(5)  # sum (lux / scale)**k, k = 0..4
+        self._sxy = np.zeros(3)  # sum (lux / scale)**k * ppfd, k = 0..2
+        self._lx = np.zeros(3)  # sum log(lux)**k over positive ppfd
+        self._lxy = np.zeros(2)  # sum log(lux)**k * log(ppfd)
+
+    def __len__(self) -> int:
+        return len(self.lux)
+
+    def add(self, lux: Any, ppfd: Any) -> None:
+        """Add one point or arrays of points."""
+
+        x = np.atleast_1d(np.asarray(lux, dtype=float))
+        y = np.atleast_1d(np.asarray(ppfd, dtype=float))
+        keep = np.isfinite(x) & np.isfinite(y)
+        x, y = x[keep], y[keep]
+        if not len(x):
+            return
+        peak = float(np.max(np.abs(x)))
+        if peak > self._scale:
+            # Re-express the sums in the new unit so scaled lux stays <= 1.
+            ratio = self._scale / peak
+            self._sx *= ratio ** np.arange(5)
+            self._sxy *= ratio ** np.arange(3)
+            self._scale = peak
+        xs = x / self._scale
+        self._sx += (xs[None, :] ** np.arange(5)[:, None]).sum(axis=1)
+        self._sxy += (xs[None, :] ** np.arange(3)[:, None] * y).sum(axis=1)
+        positive = y > 0
+        lx = np.log(np.clip(x[positive], 1e-6, None))
+        ly = np.log(y[positive])
+        self._lx += (lx[None, :] ** np.arange(3)[:, None]).sum(axis=1)
+        self._lxy += (lx[None, :] ** np.arange(2)[:, None] * ly).sum(axis=1)
+        self.lux.extend(x.tolist())
+        self.ppfd.extend(y.tolist())
+
+    def coefficients(self, model: str) -> list[float]:
+        """Solve ``model`` from the accumulated sums."""
+
+        exps = _EXPONENTS.get(model)
+        if exps is None:
+            raise ValueError(f"Unknown model: {model}")
+        if model == "power":
+            sums, rhs = self._lx, self._lxy
+        else:
+            sums, rhs = self._sx, self._sxy
+        normal = np.array([[sums[i + j] for j in exps] for i in exps])
+        beta = np.linalg.pinv(normal) @ np.array([rhs[i] for i in exps])
+        if model == "power":
+            return [float(np.exp(beta[1])), float(beta[0])]
+        return [float(b / self._scale**e) for b, e in zip(beta, exps, strict=True)]
+
+    def fit(self, model: str) -> FitResult:
+        """Return ``model`` solved from the running sums with metrics."""
+
+        coeffs = self.coefficients(model)
+        y = np.asarray(self.ppfd, dtype=float)
+        pred = compile_evaluator(model, coeffs)(self.lux)
+        r2, rmse = _r2_rmse(y, pred)
+        return FitResult(model, coeffs, r2, rmse, len(y))
+
+    def select(self, models: tuple[str, ...] = MODELS, *, folds: int = 5, robust: str | None = None) -> FitResult:
+        """Cross-validated model selection over the points added so far."""
+
+        return select_model(self.lux, self.ppfd, models, folds=folds, robust=robust)
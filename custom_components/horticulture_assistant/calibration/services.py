@@ -4,10 +4,9 @@ import asyncio
 import logging
 import math
 import uuid
+from dataclasses import asdict
 from typing import Any
 
-import numpy as np
-
 try:  # pragma: no cover - allow import without Home Assistant
     from homeassistant.core import HomeAssistant, ServiceCall
     from homeassistant.exceptions import HomeAssistantError
@@ -15,10 +14,10 @@ except Exception:  # pragma: no cover
     HomeAssistant = Any  # type: ignore
     ServiceCall = Any  # type: ignore
 
-from .fit import fit_linear, fit_power, fit_quadratic
+from .fit import MODELS, FitResult, fit_many
 from .schema import CalibrationModel, CalibrationPoint, CalibrationRecord
 from .session import CalibrationSession, LivePoint, now_iso
-from .store import async_save_for_entity
+from .store import async_load_all, async_save_for_entity, async_save_many
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,6 +50,7 @@ async def _handle_start(hass: HomeAssistant, call: ServiceCall) -> dict[str, str
         model=call.data.get("model", "linear"),
         averaging_seconds=call.data.get("averaging_seconds", 3),
         notes=call.data.get("notes"),
+        robust=call.data.get("robust"),
     )
     _SESSIONS[session_id] = session
     hass.bus.async_fire("horticulture_assistant_calibration_started", {"session_id": session_id})
@@ -71,7 +71,7 @@ async def _handle_add_point(hass: HomeAssistant, call: ServiceCall) -> None:
         ppfd = float(call.data["ppfd_value"])
         if ppfd <= 0:
             raise HomeAssistantError("invalid ppfd value")
-    session.points.append(LivePoint(lux, ppfd, now_iso()))
+    session.add_point(LivePoint(lux, ppfd, now_iso()))
     hass.bus.async_fire(
         "horticulture_assistant_calibration_update",
         {"session_id": session.session_id, "n": len(session.points)},
@@ -84,29 +84,17 @@ async def _handle_finish(hass: HomeAssistant, call: ServiceCall) -> None:
         raise HomeAssistantError("unknown session")
     if len(session.points) < 5:
         raise HomeAssistantError("need at least 5 points")
-    lux = np.array([p.lux for p in session.points], dtype=float)
-    ppfd = np.array([p.ppfd for p in session.points], dtype=float)
-    fit = {
-        "linear": fit_linear,
-        "quadratic": fit_quadratic,
-        "power": fit_power,
-    }.get(session.model)
-    if not fit:
+    if session.model != "auto" and session.model not in MODELS:
         raise HomeAssistantError("unknown model")
-    coeffs, r2, rmse = fit(lux, ppfd)
+    try:
+        fit = session.result()
+    except ValueError as err:
+        raise HomeAssistantError(str(err)) from err
+    coeffs, r2, rmse = fit.coefficients, fit.r2, fit.rmse
     record = CalibrationRecord(
         lux_entity_id=session.lux_entity_id,
         device_id=None,
-        model=CalibrationModel(
-            model=session.model,
-            coefficients=coeffs,
-            r2=r2,
-            rmse=rmse,
-            n=len(session.points),
-            lux_min=float(lux.min()),
-            lux_max=float(lux.max()),
-            notes=session.notes,
-        ),
+        model=_model_from_fit(fit, [p.lux for p in session.points], session.notes),
         points=[CalibrationPoint(p.lux, p.ppfd, p.at_utc) for p in session.points],
     )
     await async_save_for_entity(hass, session.lux_entity_id, record.to_json())
@@ -129,13 +117,61 @@ async def _handle_finish(hass: HomeAssistant, call: ServiceCall) -> None:
     _LOGGER.info(
         "Stored calibration for %s: model=%s coeffs=%s r2=%.3f rmse=%.3f",
         session.lux_entity_id,
-        session.model,
+        fit.model,
         coeffs,
         r2,
         rmse,
     )
 
 
+def _model_from_fit(fit: FitResult, lux: list[float], notes: str | None) -> CalibrationModel:
+    return CalibrationModel(
+        model=fit.model,
+        coefficients=fit.coefficients,
+        r2=fit.r2,
+        rmse=fit.rmse,
+        n=fit.n,
+        lux_min=float(min(lux)),
+        lux_max=float(max(lux)),
+        notes=notes,
+    )
+
+
+async def async_recalibrate(
+    hass: HomeAssistant,
+    lux_entity_ids: list[str] | None = None,
+    *,
+    model: str = "auto",
+    robust: str | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Refit stored calibrations from their recorded points in one batch.
+
+    All sensors are fitted together and the store is written once.  Records
+    with fewer than five points are left unchanged.  Returns the updated
+    model entries keyed by lux entity id.
+    """
+
+    stored = await async_load_all(hass)
+    wanted = stored.keys() if lux_entity_ids is None else [e for e in lux_entity_ids if e in stored]
+    datasets: dict[str, tuple[list[float], list[float]]] = {}
+    for entity_id in wanted:
+        points = stored[entity_id].get("points") or []
+        if len(points) >= 5:
+            datasets[entity_id] = ([p["lux"] for p in points], [p["ppfd"] for p in points])
+    if not datasets:
+        return {}
+    fits = fit_many(datasets, model, robust=robust)
+    updated: dict[str, dict[str, Any]] = {}
+    for entity_id, fit in fits.items():
+        record = dict(stored[entity_id])
+        notes = (record.get("model") or {}).get("notes")
+        record["model"] = asdict(_model_from_fit(fit, datasets[entity_id][0], notes))
+        updated[entity_id] = record
+    await async_save_many(hass, updated)
+    _LOGGER.info("Recalibrated %d lux sensors", len(updated))
+    return {entity_id: record["model"] for entity_id, record in updated.items()}
+
+
 async def _handle_abort(hass: HomeAssistant, call: ServiceCall) -> None:
     session = _SESSIONS.pop(call.data["session_id"], None)
     if session:
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
+from .fit import FitResult, IncrementalFit
+
 
 @dataclass
 class LivePoint:
@@ -19,7 +21,24 @@ class CalibrationSession:
     model: str = "linear"
     averaging_seconds: int = 3
     notes: str | None = None
+    robust: str | None = None
     points: list[LivePoint] = field(default_factory=list)
+    fitter: IncrementalFit = field(default_factory=IncrementalFit, repr=False)
+
+    def add_point(self, point: LivePoint) -> None:
+        """Record ``point`` and fold it into the running fit."""
+
+        self.points.append(point)
+        self.fitter.add(point.lux, point.ppfd)
+
+    def result(self) -> FitResult:
+        """Fit the session model; ``"auto"`` or a robust fit uses cross-validation."""
+
+        if self.model == "auto":
+            return self.fitter.select(robust=self.robust)
+        if self.robust:
+            return self.fitter.select((self.model,), robust=self.robust)
+        return self.fitter.fit(self.model)
 
 
 def now_iso() -> str:
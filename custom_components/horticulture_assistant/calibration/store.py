@@ -39,3 +39,11 @@ async def async_save_for_entity(hass: HomeAssistant, lux_entity_id: str, record:
 
 async def async_get_for_entity(hass: HomeAssistant, lux_entity_id: str) -> dict[str, Any] | None:
     return (await async_load_all(hass)).get(lux_entity_id)
+
+
+async def async_save_many(hass: HomeAssistant, records: dict[str, dict[str, Any]]) -> None:
+    """Store several calibration records with a single write."""
+
+    data = await async_load_all(hass)
+    data.update(records)
+    await _store(hass).async_save(data)
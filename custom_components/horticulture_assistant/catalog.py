@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+from collections.abc import Mapping
 from dataclasses import dataclass
 from functools import cache
 
@@ -23,6 +25,29 @@ _RATES = lazy_dataset(RATE_FILE)
 _COMPAT = lazy_dataset(COMPAT_FILE)
 _DILUTION = lazy_dataset(DILUTION_FILE)
 
+MOLAR_MASS_CONVERSIONS = {
+    "P2O5": ("P", 0.436),
+    "K2O": ("K", 0.830),
+}
+
+
+def convert_guaranteed_analysis(ga: dict) -> dict:
+    """Return GA with P₂O₅/K₂O converted to elemental P and K."""
+    result: dict[str, float] = {}
+    for k, v in ga.items():
+        if v is None:
+            continue
+        try:
+            val = float(v)
+        except (TypeError, ValueError):
+            continue
+        if k in MOLAR_MASS_CONVERSIONS:
+            element, factor = MOLAR_MASS_CONVERSIONS[k]
+            result[element] = result.get(element, 0) + val * factor
+        else:
+            result[k] = result.get(k, 0) + val
+    return result
+
 
 @dataclass(frozen=True, slots=True)
 class Fertilizer:
@@ -34,9 +59,67 @@ class Fertilizer:
     wsda_product_number: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class NutrientCostMatrix:
+    """Dense product × nutrient cost table derived from prices and analyses.
+
+    ``costs[i][j]`` is the USD cost per gram of ``nutrients[j]`` supplied by
+    ``products[i]`` (``math.inf`` when the product does not contain it).
+    ``cheapest`` lists every source of a nutrient ordered by cost, ties kept
+    in catalog order.
+    """
+
+    products: tuple[str, ...]
+    nutrients: tuple[str, ...]
+    costs: tuple[tuple[float, ...], ...]
+    price_per_gram: Mapping[str, float]
+    cheapest: Mapping[str, tuple[tuple[str, float], ...]]
+    rows: Mapping[str, Mapping[str, float]]
+
+    def product_costs(self, fertilizer_id: str) -> dict[str, float]:
+        """Return per-nutrient costs for ``fertilizer_id`` in analysis order."""
+
+        return dict(self.rows.get(fertilizer_id, {}))
+
+    def cheapest_source(self, nutrient: str) -> tuple[str, float] | None:
+        """Return ``(product_id, cost_per_gram)`` for the cheapest source."""
+
+        sources = self.cheapest.get(nutrient)
+        return sources[0] if sources else None
+
+
+def _build_cost_matrix(
+    products: list[str], inventory: Mapping[str, Fertilizer], prices: Mapping[str, float]
+) -> NutrientCostMatrix:
+    rows: dict[str, dict[str, float]] = {}
+    price_per_gram: dict[str, float] = {}
+    for pid in products:
+        info = inventory.get(pid)
+        price = prices.get(pid)
+        if info is None or price is None or info.density_kg_per_l <= 0:
+            continue
+        cost_per_gram = price / (info.density_kg_per_l * 1000)
+        price_per_gram[pid] = cost_per_gram
+        ga = convert_guaranteed_analysis(info.guaranteed_analysis)
+        rows[pid] = {nutrient: round(cost_per_gram / fraction, 4) for nutrient, fraction in ga.items() if fraction > 0}
+
+    nutrients = tuple(sorted({nutrient for row in rows.values() for nutrient in row}))
+    priced = tuple(rows)
+    costs = tuple(tuple(rows[pid].get(nutrient, math.inf) for nutrient in nutrients) for pid in priced)
+    cheapest: dict[str, tuple[tuple[str, float], ...]] = {}
+    for col, nutrient in enumerate(nutrients):
+        sources = [(priced[idx], row[col]) for idx, row in enumerate(costs) if row[col] != math.inf]
+        # ``sorted`` is stable, so equal costs keep catalog order.
+        cheapest[nutrient] = tuple(sorted(sources, key=lambda item: item[1]))
+    return NutrientCostMatrix(priced, nutrients, costs, price_per_gram, cheapest, rows)
+
+
 class FertilizerCatalog:
     """Cached access to fertilizer datasets."""
 
+    # (prices, inventory, matrix); rebuilt when either cached dataset is reloaded.
+    _cost_state: tuple[dict, dict, NutrientCostMatrix] | None = None
+
     @staticmethod
     @cache
     def inventory() -> dict[str, Fertilizer]:
@@ -101,7 +184,44 @@ class FertilizerCatalog:
             raise KeyError(f"Unknown fertilizer '{fertilizer_id}'")
         return inv[fertilizer_id]
 
+    def cost_matrix(self) -> NutrientCostMatrix:
+        """Return the cost-per-nutrient matrix, building it once per dataset load."""
+
+        prices = self.prices()
+        inventory = self.inventory()
+        state = FertilizerCatalog._cost_state
+        if state is not None and state[0] is prices and state[1] is inventory:
+            return state[2]
+        matrix = _build_cost_matrix(self.list_products(), inventory, prices)
+        FertilizerCatalog._cost_state = (prices, inventory, matrix)
+        return matrix
+
+    @classmethod
+    def refresh(cls) -> None:
+        """Drop cached datasets and derived tables so they reload on next use."""
+
+        for loader in (_DATA, _PRICES, _SOLUBILITY, _APPLICATION, _RATES, _COMPAT, _DILUTION):
+            loader.cache_clear()
+        for method in (
+            cls.inventory,
+            cls.prices,
+            cls.solubility,
+            cls.application_methods,
+            cls.application_rates,
+            cls.compatibility,
+            cls.dilution_limits,
+        ):
+            method.cache_clear()
+        cls._cost_state = None
+
 
 CATALOG = FertilizerCatalog()
 
-__all__ = ["Fertilizer", "FertilizerCatalog", "CATALOG"]
+__all__ = [
+    "Fertilizer",
+    "FertilizerCatalog",
+    "NutrientCostMatrix",
+    "CATALOG",
+    "MOLAR_MASS_CONVERSIONS",
+    "convert_guaranteed_analysis",
+]
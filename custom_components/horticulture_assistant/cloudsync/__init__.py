@@ -4,7 +4,16 @@ from .auth import CloudAuthClient, CloudAuthError, CloudAuthTokens, CloudOrganiz
 from .conflict import ConflictPolicy, ConflictResolver
 from .edge_store import EdgeSyncStore
 from .edge_worker import EdgeSyncWorker
-from .events import SyncEvent, VectorClock, decode_ndjson, encode_ndjson
+from .events import (
+    NDJSONDecoder,
+    SyncEvent,
+    VectorClock,
+    aiter_decode_ndjson,
+    aiter_ndjson_bytes,
+    decode_ndjson,
+    encode_ndjson,
+    iter_ndjson,
+)
 from .manager import CloudSyncConfig, CloudSyncError, CloudSyncManager
 from .publisher import CloudSyncPublisher
 from .resolver_service import (
@@ -33,6 +42,10 @@ __all__ = [
     "ConflictResolver",
     "encode_ndjson",
     "decode_ndjson",
+    "iter_ndjson",
+    "aiter_ndjson_bytes",
+    "aiter_decode_ndjson",
+    "NDJSONDecoder",
     "CloudSyncManager",
     "CloudSyncConfig",
     "CloudSyncPublisher",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import StrEnum
 from typing import Any
@@ -11,6 +11,8 @@ from .events import SyncEvent, VectorClock
 META_KEY = "__meta__"
 OP_KEY = "__op__"
 
+_Path = tuple[str, ...]
+
 
 class ConflictPolicy(StrEnum):
     """Supported conflict resolution strategies."""
@@ -117,6 +119,113 @@ class ConflictResolver:
             root[key] = value
             meta_store[path_key] = field_meta.to_dict()
 
+    def compact(self, events: Sequence[SyncEvent]) -> list[SyncEvent]:
+        """Coalesce consecutive upserts of one entity into the fewest field writes.
+
+        ``events`` must be in the order the cloud applies them and contain
+        only compactable upserts of a single entity from a single device.
+        Each LWW field is kept only in the event whose :class:`FieldMeta`
+        wins under :meth:`FieldMeta.dominates`, so the stored clock and
+        timestamp of every field match applying all events. OR-set and
+        multi-value deltas are folded into the last event touching the
+        field. Events left without fields are dropped. Applying the result
+        gives the same state, including ``__meta__``, as applying ``events``.
+        """
+
+        winners: dict[_Path, tuple[int, FieldMeta]] = {}
+        merged: dict[_Path, tuple[int, Any]] = {}
+        for index, event in enumerate(events):
+            meta = FieldMeta(clock=event.vector or VectorClock(event.device_id, 0), ts=event.ts)
+            for path, policy, value in self._iter_fields(event.patch or {}, ()):
+                if policy == ConflictPolicy.LWW:
+                    current = winners.get(path)
+                    if current is None or meta.dominates(current[1]):
+                        winners[path] = (index, meta)
+                    continue
+                previous = merged.get(path)
+                if previous is None:
+                    merged[path] = (index, value)
+                elif policy == ConflictPolicy.OR_SET:
+                    merged[path] = (index, self._merge_or_set_delta(previous[1], value))
+                else:
+                    values = self._apply_mv_register(None, previous[1])
+                    merged[path] = (index, self._apply_mv_register(values, value))
+
+        compacted: list[SyncEvent] = []
+        for index, event in enumerate(events):
+            patch = self._prune_patch(event.patch or {}, (), index, winners, merged)
+            if not patch:
+                continue
+            compacted.append(event if patch == event.patch else replace(event, patch=patch))
+        return compacted
+
+    def _iter_fields(self, patch: Mapping[str, Any], path: _Path) -> Iterable[tuple[_Path, ConflictPolicy, Any]]:
+        """Yield the fields ``_apply_patch`` records metadata for."""
+
+        for key, value in patch.items():
+            current_path = path + (key,)
+            policy = self.field_policies.get(".".join(current_path), self.default_policy)
+            if policy == ConflictPolicy.LWW and isinstance(value, Mapping) and OP_KEY not in value:
+                yield from self._iter_fields(value, current_path)
+            else:
+                yield current_path, policy, value
+
+    def _prune_patch(
+        self,
+        patch: Mapping[str, Any],
+        path: _Path,
+        index: int,
+        winners: Mapping[_Path, tuple[int, FieldMeta]],
+        merged: Mapping[_Path, tuple[int, Any]],
+    ) -> dict[str, Any]:
+        pruned: dict[str, Any] = {}
+        for key, value in patch.items():
+            current_path = path + (key,)
+            policy = self.field_policies.get(".".join(current_path), self.default_policy)
+            if policy != ConflictPolicy.LWW:
+                owner, delta = merged[current_path]
+                if owner == index:
+                    pruned[key] = delta
+            elif isinstance(value, Mapping) and OP_KEY not in value:
+                if not value:
+                    # An empty mapping only ensures the container exists.
+                    pruned[key] = {}
+                    continue
+                child = self._prune_patch(value, current_path, index, winners, merged)
+                if child:
+                    pruned[key] = child
+            elif winners[current_path][0] == index:
+                pruned[key] = value
+        return pruned
+
+    def _merge_or_set_delta(self, prior: Any, value: Any) -> Any:
+        """Fold ``value`` into the accumulated OR-set delta ``prior``.
+
+        Within one delta adds are applied before removes, so an element takes
+        the state given by the last delta that mentions it.
+        """
+
+        adds: dict[Any, None] = {}
+        removes: dict[Any, None] = {}
+        if isinstance(prior, Mapping):
+            adds = dict.fromkeys(prior.get("add", []))
+            removes = dict.fromkeys(prior.get("remove", []))
+        elif prior is not None:
+            adds = dict.fromkeys(prior)
+        value_is_mapping = isinstance(value, Mapping)
+        new_adds = value.get("add", []) if value_is_mapping else value or []
+        new_removes = dict.fromkeys(value.get("remove", [])) if value_is_mapping else {}
+        for item in new_adds:
+            if item not in new_removes:
+                removes.pop(item, None)
+                adds[item] = None
+        for item in new_removes:
+            adds.pop(item, None)
+            removes[item] = None
+        if not removes:
+            return list(adds)
+        return {"add": list(adds), "remove": list(removes)}
+
     def _apply_or_set(self, current: Any, value: Any) -> set[Any]:
         result: set[Any]
         if isinstance(current, Iterable) and not isinstance(current, str | bytes | dict):
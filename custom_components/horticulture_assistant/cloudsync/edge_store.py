@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Mapping
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from .events import SyncEvent, VectorClock, decode_ndjson, encode_ndjson
+from ..utils.perf_stats import timed
+from .conflict import ConflictResolver
+from .events import SyncEvent, VectorClock, decode_ndjson
 
 
 @dataclass(slots=True)
@@ -32,6 +34,8 @@ class EdgeSyncStore:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self._is_memory = str(self.path) == ":memory:"
         self._shared_conn: sqlite3.Connection | None = None
+        # Unknown after start-up, so the first backlog is compacted once.
+        self._outbox_dirty = True
         self._ensure_schema()
 
     # ------------------------------------------------------------------
@@ -39,7 +43,8 @@ class EdgeSyncStore:
     def _connection(self) -> Iterator[sqlite3.Connection]:
         if self._is_memory:
             if self._shared_conn is None:
-                self._shared_conn = sqlite3.connect(":memory:")
+                # Compaction may run in a worker thread.
+                self._shared_conn = sqlite3.connect(":memory:", check_same_thread=False)
                 self._shared_conn.row_factory = sqlite3.Row
             yield self._shared_conn
         else:
@@ -111,6 +116,13 @@ class EdgeSyncStore:
             )
             self._ensure_cloud_cache_schema(conn)
             conn.commit()
+        self._outbox_dirty = True
+
+    @property
+    def outbox_dirty(self) -> bool:
+        """Return whether events were appended since the last compaction pass."""
+
+        return self._outbox_dirty
 
     def _ensure_cloud_cache_schema(self, conn: sqlite3.Connection) -> None:
         columns = {row["name"]: row for row in conn.execute("PRAGMA table_info(cloud_cache)").fetchall()}
@@ -166,24 +178,82 @@ class EdgeSyncStore:
             )
             conn.commit()
 
+    @timed("cloud_sync.compact")
+    def compact_outbox(self, resolver: ConflictResolver | None = None) -> int:
+        """Coalesce superseded outbox updates and return how many events were removed.
+
+        Consecutive upserts of an entity from one device are merged with
+        :meth:`ConflictResolver.compact` under ``resolver``'s field policies.
+        Upserts followed by a delete of the same entity are dropped. Events
+        already attempted, signed or chained, and operations other than
+        upsert and delete, are left untouched and end the run of events
+        merged around them.
+        """
+
+        resolver = resolver or ConflictResolver()
+        # Cleared first so events appended during the pass mark the outbox again.
+        self._outbox_dirty = False
+        runs: dict[tuple[str, str | None, str, str, str], list[SyncEvent]] = {}
+        removed: list[str] = []
+        rewritten: list[tuple[str, str]] = []
+
+        def _flush(key: tuple[str, str | None, str, str, str]) -> None:
+            run = runs.pop(key, None)
+            if not run or len(run) < 2:
+                return
+            kept = {event.event_id: event for event in resolver.compact(run)}
+            for event in run:
+                compacted = kept.get(event.event_id)
+                if compacted is None:
+                    removed.append(event.event_id)
+                elif compacted is not event:
+                    rewritten.append((compacted.to_json_line(), event.event_id))
+
+        with self._connection() as conn:
+            rows = conn.execute("SELECT payload, attempts FROM outbox_events ORDER BY ts ASC, event_id ASC").fetchall()
+            for row in rows:
+                event = SyncEvent.from_json_line(row["payload"])
+                key = (event.tenant_id, event.org_id, event.entity_type, event.entity_id, event.device_id)
+                if row["attempts"] or event.signature or event.hash_prev:
+                    _flush(key)
+                elif event.op == "delete":
+                    removed.extend(pending.event_id for pending in runs.pop(key, []))
+                elif event.op == "upsert" and isinstance(event.patch, Mapping):
+                    runs.setdefault(key, []).append(event)
+                else:
+                    _flush(key)
+            for key in list(runs):
+                _flush(key)
+            conn.executemany("DELETE FROM outbox_events WHERE event_id = ?", ((event_id,) for event_id in removed))
+            conn.executemany("UPDATE outbox_events SET payload = ? WHERE event_id = ?", rewritten)
+            conn.commit()
+        return len(removed)
+
     # ------------------------------------------------------------------
     def record_incoming(self, ndjson_payload: str | bytes) -> list[SyncEvent]:
         events = decode_ndjson(ndjson_payload)
+        self.record_incoming_events(events)
+        return events
+
+    def record_incoming_events(self, events: Iterable[SyncEvent]) -> None:
+        """Store already decoded events in the inbox within one transaction."""
+
         with self._connection() as conn:
-            for event in events:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO inbox_events(event_id, payload, ts)
-                    VALUES(?, ?, ?)
-                    """,
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO inbox_events(event_id, payload, ts)
+                VALUES(?, ?, ?)
+                """,
+                (
                     (
                         event.event_id,
                         event.to_json_line(),
                         event.ts.replace(tzinfo=UTC).isoformat(),
-                    ),
-                )
+                    )
+                    for event in events
+                ),
+            )
             conn.commit()
-        return events
 
     def update_cloud_cache(
         self,
@@ -372,9 +442,45 @@ class EdgeSyncStore:
         return VectorClock(device=device_id, counter=counter)
 
     # ------------------------------------------------------------------
+    def iter_outbox_ndjson(self, *, limit: int | None = None, page_size: int = 500) -> Iterator[str]:
+        """Yield the outbox as NDJSON text, one page of stored lines at a time.
+
+        Stored payloads are already serialised event lines, so pages are
+        streamed with keyset pagination instead of being decoded and
+        re-encoded in one pass.
+        """
+
+        remaining = limit
+        last: tuple[str, str] | None = None
+        first = True
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            with self._connection() as conn:
+                if last is None:
+                    rows = conn.execute(
+                        "SELECT event_id, payload, ts FROM outbox_events ORDER BY ts ASC, event_id ASC LIMIT ?",
+                        (size,),
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        """
+                        SELECT event_id, payload, ts FROM outbox_events
+                         WHERE ts > ? OR (ts = ? AND event_id > ?)
+                         ORDER BY ts ASC, event_id ASC LIMIT ?
+                        """,
+                        (last[0], last[0], last[1], size),
+                    ).fetchall()
+            if not rows:
+                return
+            chunk = "\n".join(row["payload"] for row in rows)
+            yield chunk if first else "\n" + chunk
+            first = False
+            last = (rows[-1]["ts"], rows[-1]["event_id"])
+            if remaining is not None:
+                remaining -= len(rows)
+
     def export_outbox_ndjson(self) -> str:
-        events = self.get_outbox_batch(limit=10_000)
-        return encode_ndjson(events)
+        return "".join(self.iter_outbox_ndjson(limit=10_000))
 
     # ------------------------------------------------------------------
     def outbox_size(self) -> int:
@@ -8,12 +8,17 @@ from datetime import UTC, datetime
 from typing import Any
 
 from ..utils.aiohttp import ClientError, ClientSession
+from ..utils.perf_stats import timed
 from .conflict import ConflictPolicy, ConflictResolver
 from .edge_store import EdgeSyncStore
-from .events import SyncEvent, encode_ndjson
+from .events import NDJSONDecoder, SyncEvent, aiter_ndjson_bytes
 
 LOGGER = logging.getLogger(__name__)
 
+# Events decoded from a streamed pull are committed to the inbox in batches.
+PULL_BATCH_SIZE = 200
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class EdgeSyncWorker:
     """Bidirectional sync worker for the Home Assistant edge add-on."""
@@ -48,11 +53,17 @@ class EdgeSyncWorker:
         self.last_success_at: datetime | None = None
 
     # ------------------------------------------------------------------
+    @timed("cloud_sync.push")
     async def push_once(self, limit: int = 100) -> int:
+        if self.store.outbox_dirty and self.store.outbox_size() > limit:
+            # A backlog built up while offline; drop superseded updates once,
+            # off the event loop, instead of rescanning it on every push.
+            removed = await asyncio.to_thread(self.store.compact_outbox, self.conflicts)
+            if removed:
+                self.logger.debug("Compacted %d superseded outbox events", removed)
         events = self.store.get_outbox_batch(limit)
         if not events:
             return 0
-        ndjson_payload = encode_ndjson(events)
         headers = {
             "Authorization": f"Bearer {self.device_token}",
             "Content-Type": "application/x-ndjson",
@@ -63,7 +74,7 @@ class EdgeSyncWorker:
         try:
             async with self.session.post(
                 f"{self.base_url}/sync/up",
-                data=ndjson_payload,
+                data=aiter_ndjson_bytes(events),
                 headers=headers,
                 timeout=30,
             ) as resp:
@@ -82,6 +93,7 @@ class EdgeSyncWorker:
         self.last_success_at = datetime.now(tz=UTC)
         return len(acked)
 
+    @timed("cloud_sync.pull")
     async def pull_once(self) -> int:
         cursor = self.store.get_cursor("cloud")
         headers = {
@@ -102,26 +114,54 @@ class EdgeSyncWorker:
                 timeout=30,
             ) as resp:
                 content_type = resp.headers.get("Content-Type", "")
-                body = await resp.read()
-                if resp.status == 204 or not body.strip():
+                if resp.status == 204:
                     return 0
                 if resp.status >= 400:
+                    body = await resp.read()
                     raise ClientError(f"sync/down failed: {resp.status} {body.decode()}")
-                ndjson_payload, next_cursor = self._parse_down_response(body, content_type, resp.headers)
+                if content_type.startswith("application/json"):
+                    body = await resp.read()
+                    if not body.strip():
+                        return 0
+                    ndjson_payload, next_cursor = self._parse_down_response(body, content_type, resp.headers)
+                    count = self._ingest(self.store.record_incoming(ndjson_payload))
+                else:
+                    next_cursor = resp.headers.get("X-Sync-Cursor")
+                    count = await self._ingest_stream(resp)
         except ClientError as err:
             self.logger.warning("Sync pull failed: %s", err)
             self.last_pull_error = str(err)
             return 0
 
-        events = self.store.record_incoming(ndjson_payload)
-        for event in events:
-            if event.tenant_id != self.tenant_id:
-                continue
-            self._apply_to_cache(event)
         if next_cursor:
             self.store.set_cursor("cloud", next_cursor)
         self.last_pull_error = None
         self.last_success_at = datetime.now(tz=UTC)
+        return count
+
+    async def _ingest_stream(self, resp: Any) -> int:
+        """Decode an NDJSON response as it arrives, committing events in batches."""
+
+        decoder = NDJSONDecoder()
+        batch: list[SyncEvent] = []
+        count = 0
+        async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+            batch.extend(decoder.feed(chunk))
+            if len(batch) >= PULL_BATCH_SIZE:
+                self.store.record_incoming_events(batch)
+                count += self._ingest(batch)
+                batch = []
+        batch.extend(decoder.flush())
+        if batch:
+            self.store.record_incoming_events(batch)
+            count += self._ingest(batch)
+        return count
+
+    def _ingest(self, events: Sequence[SyncEvent]) -> int:
+        for event in events:
+            if event.tenant_id != self.tenant_id:
+                continue
+            self._apply_to_cache(event)
         return len(events)
 
     async def run_forever(self, *, interval_seconds: int = 60) -> None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
@@ -114,12 +114,81 @@ class SyncEvent:
         return cls.from_dict(json.loads(line))
 
 
+def iter_ndjson(events: Iterable[SyncEvent]) -> Iterator[str]:
+    """Yield NDJSON text for ``events`` one line at a time.
+
+    Lines are separated, not terminated, by ``\n`` so the joined output
+    matches :func:`encode_ndjson`.
+    """
+
+    first = True
+    for event in events:
+        line = event.to_json_line()
+        yield line if first else "\n" + line
+        first = False
+
+
+async def aiter_ndjson_bytes(events: Iterable[SyncEvent], *, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """Yield UTF-8 NDJSON for ``events`` in chunks of roughly ``chunk_size`` bytes.
+
+    Suitable as an ``aiohttp`` request body so large uploads are never held
+    as a single string.
+    """
+
+    buffer: list[bytes] = []
+    size = 0
+    for line in iter_ndjson(events):
+        encoded = line.encode("utf-8")
+        buffer.append(encoded)
+        size += len(encoded)
+        if size >= chunk_size:
+            yield b"".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+class NDJSONDecoder:
+    """Incrementally decode NDJSON chunks into :class:`SyncEvent` objects.
+
+    Only the trailing partial line is buffered between :meth:`feed` calls, so
+    memory stays proportional to one chunk rather than the whole stream.
+    """
+
+    def __init__(self) -> None:
+        self._pending = b""
+
+    def feed(self, chunk: str | bytes) -> list[SyncEvent]:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        data = self._pending + chunk
+        lines = data.split(b"\n")
+        self._pending = lines.pop()
+        return [SyncEvent.from_json_line(line.decode("utf-8")) for line in lines if line.strip()]
+
+    def flush(self) -> list[SyncEvent]:
+        pending, self._pending = self._pending, b""
+        if not pending.strip():
+            return []
+        return [SyncEvent.from_json_line(pending.decode("utf-8"))]
+
+
+async def aiter_decode_ndjson(chunks: AsyncIterable[str | bytes]) -> AsyncIterator[SyncEvent]:
+    """Yield events from an async stream of NDJSON chunks as each line completes."""
+
+    decoder = NDJSONDecoder()
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
+    for event in decoder.flush():
+        yield event
+
+
 def encode_ndjson(events: Iterable[SyncEvent]) -> str:
-    return "\n".join(event.to_json_line() for event in events)
+    return "".join(iter_ndjson(events))
 
 
 def decode_ndjson(payload: str | bytes) -> list[SyncEvent]:
-    if isinstance(payload, bytes):
-        payload = payload.decode("utf-8")
-    lines = [line for line in payload.splitlines() if line.strip()]
-    return [SyncEvent.from_json_line(line) for line in lines]
+    decoder = NDJSONDecoder()
+    return decoder.feed(payload) + decoder.flush()
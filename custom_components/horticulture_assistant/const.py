@@ -78,6 +78,8 @@ PLANT_SENSOR_TYPES: dict[str, PlantSensorMetadata] = {
 # and allowing unused sensors to be disabled/removed when profiles don't require them.
 
 SIGNAL_PROFILE_CONTEXTS_UPDATED = "horticulture_profile_contexts_updated"
+# Sent once a nutrient tracker is stored in ``hass.data[DOMAIN]``.
+SIGNAL_NUTRIENT_TRACKER_REGISTERED = "horticulture_nutrient_tracker_registered"
 
 # Home Assistant event types fired when profile history is updated.
 EVENT_PROFILE_RUN_RECORDED = "horticulture_assistant_profile_run_recorded"
@@ -37,6 +37,7 @@ except (ImportError, ModuleNotFoundError):  # pragma: no cover - tests without H
 from .const import CONF_PROFILES, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_MINUTES, DOMAIN
 from .engine.metrics import accumulate_dli, dew_point_c, lux_to_ppfd, mold_risk, profile_status, vpd_kpa
 from .utils.intervals import _normalise_update_minutes
+from .utils.perf_stats import timed
 from .utils.state_helpers import get_numeric_state, parse_entities
 
 _LOGGER = logging.getLogger(__name__)
@@ -151,6 +152,7 @@ class HorticultureCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         else:
             self._dli_totals.pop(profile_id, None)
 
+    @timed("coordinator.refresh")
     async def _async_update_data(self) -> dict[str, Any]:
         try:
             raw_profiles = self._options.get(CONF_PROFILES, {})
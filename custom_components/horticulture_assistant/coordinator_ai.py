@@ -21,14 +21,22 @@ except (ImportError, ModuleNotFoundError):  # pragma: no cover - tests without H
 
 
 from .api import ChatApi
-from .engine import guidelines  # type: ignore[import]
 from .storage import LocalStore
 from .utils.aiohttp import ClientError
 from .utils.logging import warn_once
+from .utils.perf_stats import timed
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _guideline_summary(plant_type: str, stage: str | None) -> dict[str, Any]:
+    # Imported here so the dataset-backed guideline modules load in the
+    # executor on first use instead of in the event loop during setup.
+    from .engine.plant_engine.guidelines import get_guideline_summary
+
+    return get_guideline_summary(plant_type, stage)
+
+
 class HortiAICoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator handling slow AI calls."""
 
@@ -62,6 +70,7 @@ class HortiAICoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Refresh immediately without the built-in debouncer."""
         await self._async_refresh()
 
+    @timed("coordinator_ai.refresh")
     async def _async_update_data(self) -> dict[str, Any]:
         now = utcnow()
         if self.breaker_open and self._breaker_until and now < self._breaker_until:
@@ -79,7 +88,7 @@ class HortiAICoordinator(DataUpdateCoordinator[dict[str, Any]]):
             profile = self.store_data.get("profile", {})
             plant_type = profile.get("plant_type", "tomato")
             stage = profile.get("stage")
-            summary = guidelines.get_guideline_summary(plant_type, stage)
+            summary = await self.hass.async_add_executor_job(_guideline_summary, plant_type, stage)
             messages = [
                 {"role": "system", "content": "You are a horticulture assistant."},
                 {
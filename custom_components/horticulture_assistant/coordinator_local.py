@@ -9,6 +9,7 @@ from typing import Any
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .storage import LocalStore
+from .utils.perf_stats import timed
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ class HortiLocalCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.store = store
         self.data = store.data or {}
 
+    @timed("coordinator_local.refresh")
     async def _async_update_data(self) -> dict[str, Any]:
         return self.store.data or {}
 
@@ -18,6 +18,9 @@ __all__ = [
     "generate_pulse_schedule",
     "recommend_fertigation_schedule",
     "calculate_ec_drift",
+    "SimulationResult",
+    "simulate_pulse_schedules",
+    "rank_schedules",
     "load_config",
     "parse_args",
     "main",
@@ -37,6 +40,9 @@ _MODULE_MAP = {
     "generate_pulse_schedule": "pulse_scheduler",
     "recommend_fertigation_schedule": "fertigation",
     "calculate_ec_drift": "ec_model",
+    "SimulationResult": "simulation",
+    "simulate_pulse_schedules": "simulation",
+    "rank_schedules": "simulation",
     "load_config": "utils",
     "parse_args": "main",
     "main": "main",
@@ -51,6 +57,7 @@ if TYPE_CHECKING:
     from .main import main, parse_args
     from .media_models import MediaProfile, get_media_profile
     from .pulse_scheduler import generate_pulse_schedule
+    from .simulation import SimulationResult, rank_schedules, simulate_pulse_schedules
     from .species_profiles import SpeciesProfile, get_species_profile
     from .utils import load_config
     from .wc_monitor import get_current_wc
@@ -42,44 +42,35 @@ def generate_pulse_schedule(
     if hours <= 0:
         raise ValueError("hours must be positive")
 
-    schedule = []
     current_time = datetime.now().replace(minute=0, second=0, microsecond=0)
 
-    nutrient_params = nutrient_params or {}
-    D_base = nutrient_params.get("D_base", 1e-5)
-    conc_high = nutrient_params.get("conc_high", 100.0)
-    conc_low = nutrient_params.get("conc_low", 50.0)
-    distance_cm = nutrient_params.get("distance_cm", 1.0)
-    area_cm2 = nutrient_params.get("area_cm2", 10.0)
-    duration_s = nutrient_params.get("duration_s", 3600.0)
-
-    for offset in range(hours):
-        hour = start_hour + offset
-        if wc < species_profile.ideal_wc_plateau:
-            pulse_volume = int(30 + D_eff * 100000)
-            ec_low = species_profile.ec_low
-            ec_high = species_profile.ec_high
-            if ec > ec_high:
-                pulse_volume = int(pulse_volume * 0.8)
-            elif ec < ec_low:
-                pulse_volume = int(pulse_volume * 1.2)
-            mass_mg = estimate_diffusion_mass(
-                D_base,
-                wc,
-                media_profile.porosity,
-                media_profile.tortuosity,
-                conc_high,
-                conc_low,
-                distance_cm,
-                area_cm2,
-                duration_s,
-            )
-            schedule.append(
-                {
-                    "time": (current_time + timedelta(hours=hour)).strftime("%H:%M"),
-                    "volume": pulse_volume,
-                    "mass_mg": mass_mg,
-                }
-            )
+    # Water content and EC do not change between pulses, so every pulse in
+    # the window shares one volume and mass estimate.
+    if wc >= species_profile.ideal_wc_plateau:
+        return []
 
-    return schedule
+    nutrient_params = nutrient_params or {}
+    pulse_volume = int(30 + D_eff * 100000)
+    if ec > species_profile.ec_high:
+        pulse_volume = int(pulse_volume * 0.8)
+    elif ec < species_profile.ec_low:
+        pulse_volume = int(pulse_volume * 1.2)
+    mass_mg = estimate_diffusion_mass(
+        nutrient_params.get("D_base", 1e-5),
+        wc,
+        media_profile.porosity,
+        media_profile.tortuosity,
+        nutrient_params.get("conc_high", 100.0),
+        nutrient_params.get("conc_low", 50.0),
+        nutrient_params.get("distance_cm", 1.0),
+        nutrient_params.get("area_cm2", 10.0),
+        nutrient_params.get("duration_s", 3600.0),
+    )
+    return [
+        {
+            "time": (current_time + timedelta(hours=start_hour + offset)).strftime("%H:%M"),
+            "volume": pulse_volume,
+            "mass_mg": mass_mg,
+        }
+        for offset in range(hours)
+    ]
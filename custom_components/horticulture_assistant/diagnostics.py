@@ -10,7 +10,9 @@ from homeassistant.core import HomeAssistant
 from .const import CONF_API_KEY, DOMAIN
 from .profile_monitor import ProfileMonitor
 from .profile_registry import ProfileRegistry
+from .utils import perf_stats
 from .utils.entry_helpers import entry_device_identifier, profile_device_identifier, serialise_device_info
+from .web_fetch import fetch_timings
 
 TO_REDACT = {CONF_API_KEY}
 _ONBOARDING_TIMELINE_LIMIT = 50
@@ -187,6 +189,10 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry) -> dict
             if monitors:
                 payload["profile_monitors"] = monitors
 
+    payload["performance"] = {
+        "operations": perf_stats.snapshot(),
+        "recent_page_fetches": fetch_timings(),
+    }
     payload["log_tail"] = await hass.async_add_executor_job(_read_log_tail, hass, entry)
     return async_redact_data(payload, TO_REDACT)
 
@@ -2,9 +2,16 @@
 
 Provides convenient access to bundled agronomy helpers.  The heavy
 ``plant_engine`` package lives one level deeper, but we surface commonly
-used modules like :mod:`guidelines` for internal callers.
+used modules like :mod:`guidelines` for internal callers.  They are imported
+on first access so loading the integration does not read every dataset.
 """
 
-from .plant_engine import guidelines  # noqa: F401
+from importlib import import_module
 
 __all__ = ["guidelines"]
+
+
+def __getattr__(name: str):
+    if name == "guidelines":
+        return import_module(".plant_engine.guidelines", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
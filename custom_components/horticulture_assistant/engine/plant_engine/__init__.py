@@ -1,80 +1,90 @@
-"""Convenient access to plant engine functionality."""
+"""Convenient access to plant engine functionality.
+
+Submodules and their helpers are imported on first attribute access (PEP 562)
+so importing the package does not pull in every dataset-backed module. Only
+the lightweight :mod:`.utils` helpers are bound eagerly.
+"""
 
 from __future__ import annotations
 
 from importlib import import_module
 
-from . import (environment_tips, hardiness_zone, height_manager, ingredients,
-               media_manager, reference_data, utils)
-from .crop_advisor import CropAdvice, generate_crop_advice
-from .environment_tips import *  # noqa: F401,F403
-from .fertigation_optimizer import generate_fertigation_plan
-from .growth_rate_manager import estimate_growth, get_daily_growth_rate
-from .growth_rate_manager import \
-    list_supported_plants as list_growth_rate_plants
-from .ingredients import *  # noqa: F401,F403
-from .media_manager import *  # noqa: F401,F403
-from .nutrient_absorption import apply_absorption_rates, get_absorption_rates
-from .nutrient_absorption import list_stages as list_absorption_stages
-from .nutrient_conversion import get_conversion_factors, oxide_to_elemental
-from .nutrient_planner import (NutrientManagementReport,
-                               generate_nutrient_management_report)
-from .nutrient_synergy import (apply_synergy_adjustments, get_synergy_factor,
-                               list_synergy_pairs)
-from .precipitation_risk import estimate_precipitation_risk
-from .precipitation_risk import \
-    list_supported_plants as list_precipitation_plants
-from .reference_data import load_reference_data, refresh_reference_data
+from . import utils
 from .utils import *  # noqa: F401,F403
 
-__all__ = sorted(
-    set(utils.__all__)
-    | set(environment_tips.__all__)
-    | set(media_manager.__all__)
-    | set(ingredients.__all__)
-    | set(height_manager.__all__)
-    | set(hardiness_zone.__all__)
-    | {"load_reference_data", "refresh_reference_data"}
-    | {
-        "NutrientManagementReport",
-        "generate_nutrient_management_report",
-        "list_synergy_pairs",
-        "get_synergy_factor",
-        "apply_synergy_adjustments",
-        "list_absorption_stages",
-        "get_absorption_rates",
-        "apply_absorption_rates",
-        "list_precipitation_plants",
-        "estimate_precipitation_risk",
-        "generate_fertigation_plan",
-        "list_growth_rate_plants",
-        "get_daily_growth_rate",
-        "estimate_growth",
-        "get_conversion_factors",
-        "oxide_to_elemental",
-        "CropAdvice",
-        "generate_crop_advice",
-    }
-)
+# Public name -> (submodule, attribute) for helpers re-exported by the package.
+_EXPORTS: dict[str, tuple[str, str]] = {
+    "CropAdvice": ("crop_advisor", "CropAdvice"),
+    "generate_crop_advice": ("crop_advisor", "generate_crop_advice"),
+    "generate_fertigation_plan": ("fertigation_optimizer", "generate_fertigation_plan"),
+    "estimate_growth": ("growth_rate_manager", "estimate_growth"),
+    "get_daily_growth_rate": ("growth_rate_manager", "get_daily_growth_rate"),
+    "list_growth_rate_plants": ("growth_rate_manager", "list_supported_plants"),
+    "apply_absorption_rates": ("nutrient_absorption", "apply_absorption_rates"),
+    "get_absorption_rates": ("nutrient_absorption", "get_absorption_rates"),
+    "list_absorption_stages": ("nutrient_absorption", "list_stages"),
+    "get_conversion_factors": ("nutrient_conversion", "get_conversion_factors"),
+    "oxide_to_elemental": ("nutrient_conversion", "oxide_to_elemental"),
+    "NutrientManagementReport": ("nutrient_planner", "NutrientManagementReport"),
+    "generate_nutrient_management_report": ("nutrient_planner", "generate_nutrient_management_report"),
+    "apply_synergy_adjustments": ("nutrient_synergy", "apply_synergy_adjustments"),
+    "get_synergy_factor": ("nutrient_synergy", "get_synergy_factor"),
+    "list_synergy_pairs": ("nutrient_synergy", "list_synergy_pairs"),
+    "estimate_precipitation_risk": ("precipitation_risk", "estimate_precipitation_risk"),
+    "list_precipitation_plants": ("precipitation_risk", "list_supported_plants"),
+    "load_reference_data": ("reference_data", "load_reference_data"),
+    "refresh_reference_data": ("reference_data", "refresh_reference_data"),
+}
+
+# Submodules whose whole ``__all__`` is re-exported by the package.
+_STAR_MODULES = ("environment_tips", "media_manager", "ingredients", "height_manager", "hardiness_zone")
+
+# Submodules that also add their ``__all__`` to the package once accessed.
+_EXTEND_ALL = frozenset({"nutrient_diffusion", "phenology", "thermal_time"})
+
+
+def _submodule(name: str):
+    try:
+        return import_module(f".{name}", __name__)
+    except ModuleNotFoundError as err:
+        if err.name != f"{__name__}.{name}":
+            raise
+        return None
+
+
+def _all() -> list[str]:
+    names = set(utils.__all__) | set(_EXPORTS)
+    for mod_name in _STAR_MODULES:
+        names |= set(_submodule(mod_name).__all__)
+    return sorted(names)
 
 
 def __getattr__(name: str):
-    if name == "nutrient_diffusion":
-        module = import_module(".nutrient_diffusion", __name__)
+    if name.startswith("__"):
+        if name == "__all__":
+            value = globals()["__all__"] = _all()
+            return value
+        raise AttributeError(f"module 'plant_engine' has no attribute {name!r}")
+    target = _EXPORTS.get(name)
+    if target is not None:
+        value = getattr(import_module(f".{target[0]}", __name__), target[1])
+        globals()[name] = value
+        return value
+    module = _submodule(name)
+    if module is not None:
         globals()[name] = module
-        __all__.append(name)
-        __all__.extend(getattr(module, "__all__", []))
-        return module
-    if name == "phenology":
-        module = import_module(".phenology", __name__)
-        globals()[name] = module
-        __all__.append(name)
-        __all__.extend(getattr(module, "__all__", []))
-        return module
-    if name == "thermal_time":
-        module = import_module(".thermal_time", __name__)
-        globals()[name] = module
-        __all__.append(name)
-        __all__.extend(getattr(module, "__all__", []))
+        if name in _EXTEND_ALL:
+            exported = __getattr__("__all__")
+            exported.append(name)
+            exported.extend(getattr(module, "__all__", []))
         return module
+    for mod_name in _STAR_MODULES:
+        module = _submodule(mod_name)
+        if name in module.__all__ and hasattr(module, name):
+            value = globals()[name] = getattr(module, name)
+            return value
     raise AttributeError(f"module 'plant_engine' has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__getattr__("__all__")))
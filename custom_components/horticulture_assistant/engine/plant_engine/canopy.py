@@ -5,11 +5,11 @@ from __future__ import annotations
 from functools import cache
 
 from .plant_density import get_spacing_cm
-from .utils import load_dataset, normalize_key
+from .utils import lazy_dataset, normalize_key
 
 DATA_FILE = "stages/canopy_area.json"
 
-_DATA: dict[str, dict[str, float]] = load_dataset(DATA_FILE)
+_DATA = lazy_dataset(DATA_FILE)
 
 __all__ = ["get_canopy_area", "estimate_canopy_area"]
 
@@ -17,7 +17,7 @@ __all__ = ["get_canopy_area", "estimate_canopy_area"]
 @cache
 def get_canopy_area(plant_type: str, stage: str | None = None) -> float | None:
     """Return canopy area for ``plant_type`` and ``stage`` if defined."""
-    plant = _DATA.get(normalize_key(plant_type))
+    plant = _DATA().get(normalize_key(plant_type))
     if not plant:
         return None
     if stage:
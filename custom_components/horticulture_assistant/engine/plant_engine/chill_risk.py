@@ -4,13 +4,13 @@ from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
 
-from .utils import list_dataset_entries, load_dataset, normalize_key
+from .utils import lazy_dataset, list_dataset_entries, normalize_key
 
 COLD_DATA_FILE = "local/plants/temperature/cold_stress_thresholds.json"
 SENSITIVITY_FILE = "local/plants/temperature/chill_sensitivity.json"
 
-_COLD_THRESHOLDS: Mapping[str, float] = load_dataset(COLD_DATA_FILE)
-_SENSITIVITY: Mapping[str, Mapping[str, float]] = load_dataset(SENSITIVITY_FILE)
+_COLD_THRESHOLDS = lazy_dataset(COLD_DATA_FILE)
+_SENSITIVITY = lazy_dataset(SENSITIVITY_FILE)
 
 __all__ = [
     "list_supported_plants",
@@ -21,12 +21,13 @@ __all__ = [
 
 def list_supported_plants() -> list[str]:
     """Return plant types with chill sensitivity data."""
-    return list_dataset_entries(_SENSITIVITY)
+    return list_dataset_entries(_SENSITIVITY())
 
 
 def get_chill_buffer(plant_type: str) -> float:
     """Return early warning buffer in °C for ``plant_type``."""
-    entry = _SENSITIVITY.get(normalize_key(plant_type)) or _SENSITIVITY.get("default")
+    sensitivity = _SENSITIVITY()
+    entry = sensitivity.get(normalize_key(plant_type)) or sensitivity.get("default")
     if isinstance(entry, Mapping):
         try:
             return float(entry.get("buffer_c", 0))
@@ -36,9 +37,10 @@ def get_chill_buffer(plant_type: str) -> float:
 
 
 def _cold_threshold(plant_type: str) -> float | None:
+    thresholds = _COLD_THRESHOLDS()
     try:
         return float(
-            _COLD_THRESHOLDS.get(normalize_key(plant_type), _COLD_THRESHOLDS.get("default"))
+            thresholds.get(normalize_key(plant_type), thresholds.get("default"))
         )
     except (TypeError, ValueError):  # pragma: no cover - defensive
         return None
@@ -1,34 +1,44 @@
-"""Utilities for estimating plant water use via evapotranspiration."""
+"""Utilities for estimating plant water use via evapotranspiration.
+
+The bulk helpers work on NumPy arrays: :func:`compute_transpiration_batch`
+evaluates many plants over many readings in one call. The DataFrame helpers
+are thin pandas adapters over the same kernel, and pandas is imported only
+when they are used.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import asdict, dataclass
 from functools import cache
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .canopy import estimate_canopy_area
-from .constants import DEFAULT_ENV
-from .utils import load_dataset, normalize_key
+from .constants import default_env
+from .utils import lazy_dataset, normalize_key
 
 MODIFIER_FILE = "coefficients/crop_coefficient_modifiers.json"
-# cached via load_dataset
-_MODIFIERS: dict[str, dict[str, float]] = load_dataset(MODIFIER_FILE)
+_MODIFIERS = lazy_dataset(MODIFIER_FILE)
 
-from .et_model import calculate_et0, calculate_et0_series, calculate_eta
+from .et_model import calculate_et0, calculate_et0_array, calculate_eta
 
 DATA_FILE = "coefficients/crop_coefficients.json"
-# cached via load_dataset
-_KC_DATA: dict[str, dict[str, float]] = load_dataset(DATA_FILE)
+_KC_DATA = lazy_dataset(DATA_FILE)
 
 # Public API
 __all__ = [
     "TranspirationMetrics",
     "adjust_crop_coefficient",
+    "adjust_crop_coefficient_array",
     "lookup_crop_coefficient",
     "compute_transpiration",
+    "compute_transpiration_array",
+    "compute_transpiration_batch",
     "compute_transpiration_series",
     "compute_weighted_transpiration_dataframe",
     "compute_transpiration_dataframe",
@@ -54,7 +64,7 @@ def adjust_crop_coefficient(kc: float, temp_c: float | None, rh_pct: float | Non
     """Return KC adjusted for temperature and humidity."""
     result = kc
 
-    humidity = _MODIFIERS.get("humidity", {})
+    humidity = _MODIFIERS().get("humidity", {})
     if rh_pct is not None:
         low_t = humidity.get("low_threshold")
         high_t = humidity.get("high_threshold")
@@ -63,7 +73,7 @@ def adjust_crop_coefficient(kc: float, temp_c: float | None, rh_pct: float | Non
         if high_t is not None and rh_pct > high_t:
             result *= humidity.get("high_factor", 1.0)
 
-    temp = _MODIFIERS.get("temperature", {})
+    temp = _MODIFIERS().get("temperature", {})
     if temp_c is not None:
         low_t = temp.get("low_threshold")
         high_t = temp.get("high_threshold")
@@ -75,13 +85,32 @@ def adjust_crop_coefficient(kc: float, temp_c: float | None, rh_pct: float | Non
     return float(result)
 
 
+def adjust_crop_coefficient_array(kc, temp_c, rh_pct) -> np.ndarray:
+    """Vectorized :func:`adjust_crop_coefficient`; NaN readings are left unadjusted."""
+
+    rh = np.asarray(rh_pct, dtype=float)
+    temp_arr = np.asarray(temp_c, dtype=float)
+    result = np.asarray(kc, dtype=float) * np.ones(np.broadcast_shapes(rh.shape, temp_arr.shape))
+    for values, modifier in (
+        (rh, _MODIFIERS().get("humidity", {})),
+        (temp_arr, _MODIFIERS().get("temperature", {})),
+    ):
+        low_t = modifier.get("low_threshold")
+        if low_t is not None:
+            result = np.where(values < low_t, result * modifier.get("low_factor", 1.0), result)
+        high_t = modifier.get("high_threshold")
+        if high_t is not None:
+            result = np.where(values > high_t, result * modifier.get("high_factor", 1.0), result)
+    return result
+
+
 @cache
 def lookup_crop_coefficient(plant_type: str, stage: str | None = None) -> float:
     """Return crop coefficient for ``plant_type`` and ``stage``.
 
     Results are cached to avoid repeated dataset lookups.
     """
-    plant = _KC_DATA.get(normalize_key(plant_type))
+    plant = _KC_DATA().get(normalize_key(plant_type))
     if not plant:
         return 1.0
     if stage:
@@ -91,6 +120,21 @@ def lookup_crop_coefficient(plant_type: str, stage: str | None = None) -> float:
     return float(plant.get("default", 1.0))
 
 
+def _profile_kc(plant_profile: Mapping) -> float:
+    kc = plant_profile.get("kc")
+    if kc is None:
+        plant_type = plant_profile.get("plant_type")
+        kc = lookup_crop_coefficient(plant_type, plant_profile.get("stage")) if plant_type else 1.0
+    return float(kc)
+
+
+def _profile_canopy(plant_profile: Mapping) -> float:
+    canopy = plant_profile.get("canopy_m2")
+    if canopy is None:
+        canopy = estimate_canopy_area(plant_profile.get("plant_type"), plant_profile.get("stage"))
+    return float(canopy)
+
+
 def compute_transpiration(plant_profile: Mapping, env_data: Mapping) -> dict[str, float]:
     """Return evapotranspiration metrics for a single plant profile.
 
@@ -108,7 +152,7 @@ def compute_transpiration(plant_profile: Mapping, env_data: Mapping) -> dict[str
     if "light_ppfd" in env and "par_w_m2" not in env:
         env["par_w_m2"] = env.pop("light_ppfd")
 
-    env = {**DEFAULT_ENV, **env}
+    env = {**default_env(), **env}
 
     et0 = calculate_et0(
         temperature_c=env["temp_c"],
@@ -118,23 +162,10 @@ def compute_transpiration(plant_profile: Mapping, env_data: Mapping) -> dict[str
         elevation_m=env.get("elevation_m", 200),
     )
 
-    kc = plant_profile.get("kc")
-    if kc is None:
-        plant_type = plant_profile.get("plant_type")
-        stage = plant_profile.get("stage")
-        if plant_type:
-            kc = lookup_crop_coefficient(plant_type, stage)
-        else:
-            kc = 1.0
-
-    kc = adjust_crop_coefficient(kc, env.get("temp_c"), env.get("rh_pct"))
+    kc = adjust_crop_coefficient(_profile_kc(plant_profile), env.get("temp_c"), env.get("rh_pct"))
     et_actual = calculate_eta(et0, kc)
 
-    canopy_m2 = plant_profile.get("canopy_m2")
-    if canopy_m2 is None:
-        canopy_m2 = estimate_canopy_area(
-            plant_profile.get("plant_type"), plant_profile.get("stage")
-        )
+    canopy_m2 = _profile_canopy(plant_profile)
     mm_per_day = et_actual
     ml_per_day = mm_per_day * MM_TO_ML_PER_M2 * canopy_m2
 
@@ -147,6 +178,111 @@ def compute_transpiration(plant_profile: Mapping, env_data: Mapping) -> dict[str
     return metrics.as_dict()
 
 
+def compute_transpiration_array(
+    kc,
+    canopy_m2,
+    temp_c,
+    rh_pct,
+    par_w_m2,
+    wind_m_s=1.0,
+    elevation_m=200,
+) -> dict[str, np.ndarray]:
+    """Return transpiration metric arrays for broadcastable inputs.
+
+    Rounding matches :func:`compute_transpiration` so each element equals the
+    scalar result for the same plant and reading.
+    """
+
+    et0 = calculate_et0_array(temp_c, rh_pct, par_w_m2, wind_m_s, elevation_m)
+    eta = np.round(et0 * adjust_crop_coefficient_array(kc, temp_c, rh_pct), 2)
+    transp = np.round(eta * MM_TO_ML_PER_M2 * np.asarray(canopy_m2, dtype=float), 1)
+    et0, eta, transp = np.broadcast_arrays(et0, eta, transp)
+    return {"et0_mm_day": et0, "eta_mm_day": eta, "transpiration_ml_day": transp}
+
+
+def _env_arrays(env: Mapping) -> dict[str, np.ndarray]:
+    """Return environment columns from ``env`` with missing values defaulted."""
+
+    defaults = {**default_env(), "elevation_m": 200}
+    columns: dict[str, np.ndarray] = {}
+    for key in ("temp_c", "rh_pct", "par_w_m2", "wind_speed_m_s", "elevation_m"):
+        raw = env.get(key)
+        if raw is None:
+            columns[key] = np.asarray(float(defaults[key]))
+            continue
+        values = np.asarray(raw, dtype=float)
+        columns[key] = np.where(np.isnan(values), float(defaults[key]), values)
+    return columns
+
+
+def _records_to_columns(records: Iterable[Mapping]) -> dict[str, np.ndarray]:
+    rows = list(records)
+    return {
+        key: np.array([np.nan if row.get(key) is None else row[key] for row in rows], dtype=float)
+        for key in ("temp_c", "rh_pct", "par_w_m2", "wind_speed_m_s", "elevation_m")
+    }
+
+
+def _profile_metrics(plant_profile: Mapping, env: Mapping) -> dict[str, np.ndarray]:
+    columns = _env_arrays(env)
+    return compute_transpiration_array(
+        _profile_kc(plant_profile),
+        _profile_canopy(plant_profile),
+        columns["temp_c"],
+        columns["rh_pct"],
+        columns["par_w_m2"],
+        columns["wind_speed_m_s"],
+        columns["elevation_m"],
+    )
+
+
+def compute_transpiration_batch(
+    plant_profiles: Sequence[Mapping],
+    env: Mapping,
+) -> dict[str, np.ndarray]:
+    """Return metrics shaped ``(plants, readings)`` for every plant and reading.
+
+    ``env`` maps ``temp_c``, ``rh_pct``, ``par_w_m2`` and optionally
+    ``wind_speed_m_s`` and ``elevation_m`` to scalars, 1-D reading arrays
+    shared by every plant, or ``(plants, readings)`` arrays. Missing columns
+    and NaN readings fall back to :data:`DEFAULT_ENV`.
+    """
+
+    kc = np.array([_profile_kc(profile) for profile in plant_profiles], dtype=float)[:, None]
+    canopy = np.array([_profile_canopy(profile) for profile in plant_profiles], dtype=float)[:, None]
+    columns = _env_arrays(env)
+    return compute_transpiration_array(
+        kc,
+        canopy,
+        columns["temp_c"],
+        columns["rh_pct"],
+        columns["par_w_m2"],
+        columns["wind_speed_m_s"],
+        columns["elevation_m"],
+    )
+
+
+def _weighted_metrics(metrics: Mapping[str, np.ndarray], weights) -> dict[str, float]:
+    count = len(metrics["et0_mm_day"])
+    if weights is None:
+        weights_arr = np.ones(count)
+    else:
+        weights_arr = np.asarray(list(weights), dtype=float)
+        if len(weights_arr) != count:
+            raise ValueError("weights length must match env_df length")
+
+    weights_arr = np.where(weights_arr > 0, weights_arr, 0)
+    total_w = weights_arr.sum()
+    if total_w == 0:
+        return TranspirationMetrics(0.0, 0.0, 0.0).as_dict()
+
+    return TranspirationMetrics(
+        round(float(metrics["et0_mm_day"] @ weights_arr / total_w), 2),
+        round(float(metrics["eta_mm_day"] @ weights_arr / total_w), 2),
+        round(float(metrics["transpiration_ml_day"] @ weights_arr / total_w), 1),
+    ).as_dict()
+
+
 def compute_transpiration_series(
     plant_profile: Mapping,
     env_series: Iterable[Mapping] | pd.DataFrame,
@@ -154,20 +290,24 @@ def compute_transpiration_series(
 ) -> dict[str, float]:
     """Return weighted average transpiration metrics for ``env_series``.
 
-    ``env_series`` is converted to a :class:`~pandas.DataFrame` and processed
-    in bulk for efficiency. When ``weights`` are provided they must match the
-    length of ``env_series``. Non‑positive weights are ignored in the final
-    average.
+    ``env_series`` may be an iterable of reading mappings or a
+    :class:`~pandas.DataFrame`; both are processed in bulk as NumPy columns.
+    When ``weights`` are provided they must match the length of
+    ``env_series``. Non‑positive weights are ignored in the final average.
     """
 
-    if isinstance(env_series, pd.DataFrame):
-        df = env_series
+    if hasattr(env_series, "columns"):
+        env = env_series
+        count = len(env_series)
     else:
-        df = pd.DataFrame(list(env_series))
-    if df.empty:
+        env = _records_to_columns(env_series)
+        count = len(env["temp_c"])
+    if count == 0:
         return TranspirationMetrics(0.0, 0.0, 0.0).as_dict()
 
-    return compute_weighted_transpiration_dataframe(plant_profile, df, weights)
+    metrics = _profile_metrics(plant_profile, env)
+    metrics = {key: np.broadcast_to(value, (count,)) for key, value in metrics.items()}
+    return _weighted_metrics(metrics, weights)
 
 
 def compute_transpiration_dataframe(plant_profile: Mapping, env_df: pd.DataFrame) -> pd.DataFrame:
@@ -175,73 +315,17 @@ def compute_transpiration_dataframe(plant_profile: Mapping, env_df: pd.DataFrame
 
     The input DataFrame should contain the same columns accepted by
     :func:`compute_transpiration`. The resulting DataFrame shares the
-    same index.
+    same index. This is a pandas adapter over :func:`compute_transpiration_array`.
     """
 
+    import pandas as pd
+
     if not isinstance(env_df, pd.DataFrame):
         raise TypeError("env_df must be a pandas DataFrame")
 
-    df = env_df.copy()
-    for key, default in DEFAULT_ENV.items():
-        if key not in df:
-            df[key] = default
-        else:
-            df[key] = df[key].fillna(default)
-
-    kc = plant_profile.get("kc")
-    if kc is None:
-        plant_type = plant_profile.get("plant_type")
-        stage = plant_profile.get("stage")
-        kc = lookup_crop_coefficient(plant_type or "", stage) if plant_type else 1.0
-
-    # Vectorised adjustment of the crop coefficient using the modifier dataset
-    humidity = _MODIFIERS.get("humidity", {})
-    kc_series = pd.Series(float(kc), index=df.index)
-    low_t = humidity.get("low_threshold")
-    if low_t is not None:
-        kc_series = np.where(
-            df["rh_pct"] < low_t, kc_series * humidity.get("low_factor", 1.0), kc_series
-        )
-    high_t = humidity.get("high_threshold")
-    if high_t is not None:
-        kc_series = np.where(
-            df["rh_pct"] > high_t, kc_series * humidity.get("high_factor", 1.0), kc_series
-        )
-
-    temp_mod = _MODIFIERS.get("temperature", {})
-    low_t = temp_mod.get("low_threshold")
-    if low_t is not None:
-        kc_series = np.where(
-            df["temp_c"] < low_t, kc_series * temp_mod.get("low_factor", 1.0), kc_series
-        )
-    high_t = temp_mod.get("high_threshold")
-    if high_t is not None:
-        kc_series = np.where(
-            df["temp_c"] > high_t, kc_series * temp_mod.get("high_factor", 1.0), kc_series
-        )
-
-    et0 = calculate_et0_series(
-        df["temp_c"],
-        df["rh_pct"],
-        df["par_w_m2"],
-        df.get("wind_speed_m_s", 1.0),
-        df.get("elevation_m", 200),
-    )
-
-    eta = (et0 * kc_series).round(2)
-
-    canopy = plant_profile.get("canopy_m2")
-    if canopy is None:
-        canopy = estimate_canopy_area(plant_profile.get("plant_type"), plant_profile.get("stage"))
-
-    transp_ml = (eta * MM_TO_ML_PER_M2 * canopy).round(1)
-
+    metrics = _profile_metrics(plant_profile, env_df)
     return pd.DataFrame(
-        {
-            "et0_mm_day": et0,
-            "eta_mm_day": eta,
-            "transpiration_ml_day": transp_ml,
-        },
+        {key: np.broadcast_to(value, (len(env_df),)) for key, value in metrics.items()},
         index=env_df.index,
     )
 
@@ -264,23 +348,6 @@ def compute_weighted_transpiration_dataframe(
         Weights for each row when averaging. Non-positive weights are ignored.
     """
 
-    metrics = compute_transpiration_dataframe(plant_profile, env_df)
-
-    if weights is None:
-        weights_arr = np.ones(len(metrics))
-    else:
-        weights_arr = np.asarray(list(weights), dtype=float)
-        if len(weights_arr) != len(metrics):
-            raise ValueError("weights length must match env_df length")
-
-    weights_arr = np.where(weights_arr > 0, weights_arr, 0)
-    total_w = weights_arr.sum()
-    if total_w == 0:
-        return TranspirationMetrics(0.0, 0.0, 0.0).as_dict()
-
-    weighted = metrics.mul(weights_arr, axis=0).sum() / total_w
-    return TranspirationMetrics(
-        round(float(weighted["et0_mm_day"]), 2),
-        round(float(weighted["eta_mm_day"]), 2),
-        round(float(weighted["transpiration_ml_day"]), 1),
-    ).as_dict()
+    metrics = _profile_metrics(plant_profile, env_df)
+    metrics = {key: np.broadcast_to(value, (len(env_df),)) for key, value in metrics.items()}
+    return _weighted_metrics(metrics, weights)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import cache
 
 from .utils import lazy_dataset, load_dataset, normalize_key
 
@@ -60,12 +61,23 @@ def get_stage_multiplier(stage: str) -> float:
     return float(stage_multipliers().get(normalize_key(stage), 1.0))
 
 
-# Default environment readings applied when a plant profile lacks recent data.
-DEFAULT_ENV: dict[str, float] = _load_default_env()
+@cache
+def default_env() -> dict[str, float]:
+    """Return default environment readings applied when a profile lacks data."""
+
+    return _load_default_env()
+
+
+def __getattr__(name: str):
+    # ``DEFAULT_ENV`` is resolved on first access so importing reads no files.
+    if name == "DEFAULT_ENV":
+        return default_env()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "stage_multipliers",
     "get_stage_multiplier",
     "DEFAULT_ENV",
+    "default_env",
     "DEFAULT_ENV_FILE",
 ]
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import cache
 
-from .utils import list_dataset_entries, load_dataset, normalize_key
+from .utils import lazy_dataset, list_dataset_entries, normalize_key
 
 RESISTANCE_FILE = "diseases/disease_resistance_ratings.json"
 
@@ -14,28 +15,32 @@ FUNGICIDE_FILE = "fungicides/fungicide_recommendations.json"
 RATE_FILE = "fungicides/fungicide_application_rates.json"
 
 
-# Dataset is cached by ``load_dataset`` so load once at import time
-_DATA: dict[str, dict[str, str]] = load_dataset(DATA_FILE)
-_PREVENTION: dict[str, dict[str, str]] = load_dataset(PREVENTION_FILE)
-_RESISTANCE: dict[str, dict[str, float]] = load_dataset(RESISTANCE_FILE)
-_FUNGICIDES_RAW: dict[str, list[str]] = load_dataset(FUNGICIDE_FILE)
-_RATES_RAW: dict[str, float] = load_dataset(RATE_FILE)
-_FUNGICIDES: dict[str, list[str]] = {
-    normalize_key(k): list(v) if isinstance(v, list) else [] for k, v in _FUNGICIDES_RAW.items()
-}
-_RATES: dict[str, float] = {
-    normalize_key(k): float(v) for k, v in _RATES_RAW.items() if isinstance(v, int | float)
-}
+# Datasets load on first use; ``lazy_dataset`` caches the result.
+_DATA = lazy_dataset(DATA_FILE)
+_PREVENTION = lazy_dataset(PREVENTION_FILE)
+_RESISTANCE = lazy_dataset(RESISTANCE_FILE)
+_FUNGICIDES_RAW = lazy_dataset(FUNGICIDE_FILE)
+_RATES_RAW = lazy_dataset(RATE_FILE)
+
+
+@cache
+def _fungicides() -> dict[str, list[str]]:
+    return {normalize_key(k): list(v) if isinstance(v, list) else [] for k, v in _FUNGICIDES_RAW().items()}
+
+
+@cache
+def _rates() -> dict[str, float]:
+    return {normalize_key(k): float(v) for k, v in _RATES_RAW().items() if isinstance(v, int | float)}
 
 
 def list_supported_plants() -> list[str]:
     """Return all plant types with disease guidelines."""
-    return list_dataset_entries(_DATA)
+    return list_dataset_entries(_DATA())
 
 
 def get_disease_guidelines(plant_type: str) -> dict[str, str]:
     """Return disease management guidelines for the specified plant type."""
-    return _DATA.get(normalize_key(plant_type), {})
+    return _DATA().get(normalize_key(plant_type), {})
 
 
 def list_known_diseases(plant_type: str) -> list[str]:
@@ -54,7 +59,7 @@ def recommend_treatments(plant_type: str, diseases: Iterable[str]) -> dict[str,
 
 def get_disease_prevention(plant_type: str) -> dict[str, str]:
     """Return disease prevention guidelines for the specified plant type."""
-    return _PREVENTION.get(normalize_key(plant_type), {})
+    return _PREVENTION().get(normalize_key(plant_type), {})
 
 
 def recommend_prevention(plant_type: str, diseases: Iterable[str]) -> dict[str, str]:
@@ -73,7 +78,7 @@ def get_disease_resistance(plant_type: str, disease: str) -> float | None:
     defined for the plant/disease combination.
     """
 
-    data = _RESISTANCE.get(normalize_key(plant_type), {})
+    data = _RESISTANCE().get(normalize_key(plant_type), {})
     value = data.get(normalize_key(disease))
     return float(value) if isinstance(value, int | float) else None
 
@@ -81,7 +86,7 @@ def get_disease_resistance(plant_type: str, disease: str) -> float | None:
 def get_fungicide_options(disease: str) -> list[str]:
     """Return recommended fungicide products for ``disease``."""
 
-    options = _FUNGICIDES.get(normalize_key(disease))
+    options = _fungicides().get(normalize_key(disease))
     if isinstance(options, list):
         return list(options)
     return []
@@ -90,7 +95,7 @@ def get_fungicide_options(disease: str) -> list[str]:
 def get_fungicide_application_rate(product: str) -> float | None:
     """Return recommended application rate for a fungicide product."""
 
-    value = _RATES.get(normalize_key(product))
+    value = _rates().get(normalize_key(product))
     return float(value) if isinstance(value, int | float) else None
 
 
@@ -12,7 +12,7 @@ from .monitor_utils import calculate_risk_score
 from .monitor_utils import generate_schedule as _generate_schedule
 from .monitor_utils import get_interval as _get_interval
 from .monitor_utils import next_date as _next_date
-from .utils import list_dataset_entries, load_dataset, normalize_key
+from .utils import lazy_dataset, list_dataset_entries, normalize_key
 
 DATA_FILE = "diseases/disease_thresholds.json"
 MONITOR_INTERVAL_FILE = "diseases/disease_monitoring_intervals.json"
@@ -22,13 +22,13 @@ RISK_INTERVAL_MOD_FILE = "diseases/disease_risk_interval_modifiers.json"
 SCOUTING_METHOD_FILE = "diseases/disease_scouting_methods.json"
 
 # Cached dataset
-_THRESHOLDS: dict[str, dict[str, int]] = load_dataset(DATA_FILE)
+_THRESHOLDS = lazy_dataset(DATA_FILE)
 # Recommended days between scouting events per plant stage
-_MONITOR_INTERVALS: dict[str, dict[str, int]] = load_dataset(MONITOR_INTERVAL_FILE)
-_RISK_FACTORS: dict[str, dict[str, dict[str, list]]] = load_dataset(RISK_DATA_FILE)
-_SEVERITY_ACTIONS: dict[str, str] = load_dataset(SEVERITY_ACTIONS_FILE)
-_RISK_MODIFIERS: dict[str, float] = load_dataset(RISK_INTERVAL_MOD_FILE)
-_SCOUTING_METHODS: dict[str, str] = load_dataset(SCOUTING_METHOD_FILE)
+_MONITOR_INTERVALS = lazy_dataset(MONITOR_INTERVAL_FILE)
+_RISK_FACTORS = lazy_dataset(RISK_DATA_FILE)
+_SEVERITY_ACTIONS = lazy_dataset(SEVERITY_ACTIONS_FILE)
+_RISK_MODIFIERS = lazy_dataset(RISK_INTERVAL_MOD_FILE)
+_SCOUTING_METHODS = lazy_dataset(SCOUTING_METHOD_FILE)
 
 __all__ = [
     "list_supported_plants",
@@ -54,12 +54,12 @@ __all__ = [
 
 def list_supported_plants() -> list[str]:
     """Return plant types with disease threshold data."""
-    return list_dataset_entries(_THRESHOLDS)
+    return list_dataset_entries(_THRESHOLDS())
 
 
 def get_disease_thresholds(plant_type: str) -> dict[str, int]:
     """Return disease count thresholds for ``plant_type`` with normalized keys."""
-    raw = _THRESHOLDS.get(normalize_key(plant_type), {})
+    raw = _THRESHOLDS().get(normalize_key(plant_type), {})
     return {normalize_key(k): int(v) for k, v in raw.items()}
 
 
@@ -107,7 +107,7 @@ def recommend_threshold_actions(plant_type: str, observations: Mapping[str, int]
 def estimate_disease_risk(plant_type: str, environment: Mapping[str, float]) -> dict[str, str]:
     """Return disease risk level based on environmental conditions."""
 
-    factors = _RISK_FACTORS.get(normalize_key(plant_type), {})
+    factors = _RISK_FACTORS().get(normalize_key(plant_type), {})
     if not factors:
         return {}
 
@@ -151,7 +151,7 @@ def estimate_adjusted_disease_risk(
 def get_monitoring_interval(plant_type: str, stage: str | None = None) -> int | None:
     """Return recommended days between disease scouting events."""
 
-    return _get_interval(_MONITOR_INTERVALS, plant_type, stage)
+    return _get_interval(_MONITOR_INTERVALS(), plant_type, stage)
 
 
 def risk_adjusted_monitor_interval(
@@ -172,7 +172,7 @@ def risk_adjusted_monitor_interval(
     elif any(r == "moderate" for r in risks.values()):
         level = "moderate"
 
-    modifier = _RISK_MODIFIERS.get(level, 1.0)
+    modifier = _RISK_MODIFIERS().get(level, 1.0)
     interval = int(round(base * modifier))
     return max(1, interval)
 
@@ -180,7 +180,7 @@ def risk_adjusted_monitor_interval(
 def next_monitor_date(plant_type: str, stage: str | None, last_date: date) -> date | None:
     """Return the next disease scouting date based on guidelines."""
 
-    return _next_date(_MONITOR_INTERVALS, plant_type, stage, last_date)
+    return _next_date(_MONITOR_INTERVALS(), plant_type, stage, last_date)
 
 
 def generate_monitoring_schedule(
@@ -190,7 +190,7 @@ def generate_monitoring_schedule(
     events: int,
 ) -> list[date]:
     """Return list of upcoming disease monitoring dates."""
-    return _generate_schedule(_MONITOR_INTERVALS, plant_type, stage, start, events)
+    return _generate_schedule(_MONITOR_INTERVALS(), plant_type, stage, start, events)
 
 
 def generate_detailed_monitoring_schedule(
@@ -210,13 +210,13 @@ def generate_detailed_monitoring_schedule(
 def get_severity_action(level: str) -> str:
     """Return recommended action for a severity ``level``."""
 
-    return _SEVERITY_ACTIONS.get(level.lower(), "")
+    return _SEVERITY_ACTIONS().get(level.lower(), "")
 
 
 def get_scouting_method(disease: str) -> str:
     """Return recommended scouting approach for ``disease``."""
 
-    return _SCOUTING_METHODS.get(normalize_key(disease), "")
+    return _SCOUTING_METHODS().get(normalize_key(disease), "")
 
 
 @dataclass
@@ -2,9 +2,12 @@
 
 import math
 from functools import cache
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .utils import load_dataset, normalize_key
 
@@ -53,28 +56,21 @@ def calculate_eta(et0: float, kc: float = 1.0) -> float:
     return round(et0 * kc, 2)
 
 
-def calculate_et0_series(
-    temperature_c: "pd.Series",
-    rh_percent: "pd.Series",
-    solar_rad_w_m2: "pd.Series",
-    wind_m_s: "pd.Series | float" = 1.0,
-    elevation_m: "pd.Series | float" = 200,
-) -> "pd.Series":
-    """Vectorized ET₀ calculation for pandas Series."""
+def calculate_et0_array(
+    temperature_c,
+    rh_percent,
+    solar_rad_w_m2,
+    wind_m_s=1.0,
+    elevation_m=200,
+) -> np.ndarray:
+    """Vectorized :func:`calculate_et0` over broadcastable NumPy arrays."""
 
-    temp = pd.Series(temperature_c, dtype=float)
-    rh = pd.Series(rh_percent, dtype=float)
-    solar = pd.Series(solar_rad_w_m2, dtype=float)
-    if isinstance(wind_m_s, pd.Series):
-        wind = wind_m_s.astype(float)
-    else:
-        wind = pd.Series(float(wind_m_s), index=temp.index)
-    if isinstance(elevation_m, pd.Series):
-        elevation = elevation_m.astype(float)
-    else:
-        elevation = pd.Series(float(elevation_m), index=temp.index)
+    temp = np.asarray(temperature_c, dtype=float)
+    rh = np.asarray(rh_percent, dtype=float)
+    wind = np.asarray(wind_m_s, dtype=float)
+    elevation = np.asarray(elevation_m, dtype=float)
 
-    solar_rad_mj = solar * 0.0864
+    solar_rad_mj = np.asarray(solar_rad_w_m2, dtype=float) * 0.0864
     gamma = 0.665e-3 * (101.3 * ((293 - 0.0065 * elevation) / 293) ** 5.26)
     es = 0.6108 * np.exp((17.27 * temp) / (temp + 237.3))
     ea = es * (rh / 100)
@@ -83,7 +79,29 @@ def calculate_et0_series(
     et0 = ((0.408 * delta * rn) + (gamma * 900 * wind * (es - ea) / (temp + 273))) / (
         delta + gamma * (1 + 0.34 * wind)
     )
-    return et0.round(2)
+    return np.round(et0, 2)
+
+
+def calculate_et0_series(
+    temperature_c: "pd.Series",
+    rh_percent: "pd.Series",
+    solar_rad_w_m2: "pd.Series",
+    wind_m_s: "pd.Series | float" = 1.0,
+    elevation_m: "pd.Series | float" = 200,
+) -> "pd.Series":
+    """pandas adapter for :func:`calculate_et0_array`."""
+
+    import pandas as pd
+
+    temp = pd.Series(temperature_c, dtype=float)
+    values = calculate_et0_array(
+        temp.to_numpy(),
+        np.asarray(rh_percent, dtype=float),
+        np.asarray(solar_rad_w_m2, dtype=float),
+        np.asarray(wind_m_s, dtype=float),
+        np.asarray(elevation_m, dtype=float),
+    )
+    return pd.Series(values, index=temp.index)
 
 
 ET0_DATA_FILE = "et0/reference_et0.json"
@@ -147,6 +165,7 @@ def adjust_et0_for_climate(et0: float, zone: str | None) -> float:
 __all__ = [
     "calculate_et0",
     "calculate_eta",
+    "calculate_et0_array",
     "calculate_et0_series",
     "get_reference_et0",
     "get_reference_et0_range",
@@ -1200,19 +1200,16 @@ def estimate_solution_ec(schedule: Mapping[str, float]) -> float:
     return round(total_us_cm / 1000, 3)
 
 
-def _schedule_from_totals(
-    totals: Mapping[str, float],
-    num_plants: int,
-    fertilizers: Mapping[str, str],
+def _nutrient_purity(
+    fert: str,
+    nutrient: str,
     purity_overrides: Mapping[str, float] | None = None,
-) -> dict[str, float]:
-    """Return fertilizer grams needed for nutrient totals."""
+) -> float:
+    """Return the purity fraction of ``nutrient`` supplied by ``fert``."""
 
-    schedule: dict[str, float] = {}
-    for nutrient, mg in totals.items():
-        fert = fertilizers.get(nutrient)
-        if not fert:
-            continue
+    if purity_overrides and nutrient in purity_overrides:
+        purity = purity_overrides[nutrient]
+    else:
         purity = get_fertilizer_purity(fert).get(nutrient, 0.0)
         if purity <= 0:
             try:
@@ -1224,11 +1221,26 @@ def _schedule_from_totals(
                 purity = ga.get(nutrient, 0.0)
             except Exception:
                 purity = 0.0
-        if purity_overrides and nutrient in purity_overrides:
-            purity = purity_overrides[nutrient]
-        if purity <= 0:
-            # Fall back to assuming pure nutrient to avoid divide errors
-            purity = 1.0
+    if purity <= 0:
+        # Fall back to assuming pure nutrient to avoid divide errors
+        purity = 1.0
+    return purity
+
+
+def _schedule_from_totals(
+    totals: Mapping[str, float],
+    num_plants: int,
+    fertilizers: Mapping[str, str],
+    purity_overrides: Mapping[str, float] | None = None,
+) -> dict[str, float]:
+    """Return fertilizer grams needed for nutrient totals."""
+
+    schedule: dict[str, float] = {}
+    for nutrient, mg in totals.items():
+        fert = fertilizers.get(nutrient)
+        if not fert:
+            continue
+        purity = _nutrient_purity(fert, nutrient, purity_overrides)
         grams = mg * num_plants / 1000 / purity
         schedule[fert] = round(schedule.get(fert, 0.0) + grams, 3)
     return schedule
@@ -3,34 +3,41 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import Any
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
-from .utils import load_dataset, normalize_key
+from .utils import lazy_dataset, normalize_key
 
 DATA_FILE = "stages/growth_stages.json"
 GERMINATION_FILE = "stages/germination_duration.json"
 
 
-# Load growth stage dataset once. ``load_dataset`` handles caching.
-_DATA: dict[str, dict[str, Any]] = load_dataset(DATA_FILE)
-_GERMINATION: dict[str, int] = load_dataset(GERMINATION_FILE)
-
-# Precompute cumulative stage end days for quick lookups
-_STAGE_BOUNDS: dict[str, list[tuple[str, int]]] = {}
-for plant, stages in _DATA.items():
-    if not isinstance(stages, dict):
-        continue
-    elapsed = 0
-    bounds: list[tuple[str, int]] = []
-    for stage, info in stages.items():
-        days = info.get("duration_days")
-        if isinstance(days, int | float):
-            elapsed += int(days)
-            bounds.append((stage, elapsed))
-    if bounds:
-        _STAGE_BOUNDS[plant] = bounds
+# Datasets load on first use. ``lazy_dataset`` handles caching.
+_DATA = lazy_dataset(DATA_FILE)
+_GERMINATION = lazy_dataset(GERMINATION_FILE)
+
+
+@cache
+def _stage_bounds() -> dict[str, list[tuple[str, int]]]:
+    """Return cumulative stage end days per plant for quick lookups."""
+
+    result: dict[str, list[tuple[str, int]]] = {}
+    for plant, stages in _DATA().items():
+        if not isinstance(stages, dict):
+            continue
+        elapsed = 0
+        bounds: list[tuple[str, int]] = []
+        for stage, info in stages.items():
+            days = info.get("duration_days")
+            if isinstance(days, int | float):
+                elapsed += int(days)
+                bounds.append((stage, elapsed))
+        if bounds:
+            result[plant] = bounds
+    return result
 
 
 __all__ = [
@@ -58,12 +65,12 @@ __all__ = [
 
 def get_stage_info(plant_type: str, stage: str) -> dict[str, Any]:
     """Return information about a particular growth stage."""
-    return _DATA.get(normalize_key(plant_type), {}).get(normalize_key(stage), {})
+    return _DATA().get(normalize_key(plant_type), {}).get(normalize_key(stage), {})
 
 
 def list_growth_stages(plant_type: str) -> list[str]:
     """Return all defined growth stages for a plant type."""
-    stages = _DATA.get(normalize_key(plant_type), {})
+    stages = _DATA().get(normalize_key(plant_type), {})
     return list(stages.keys())
 
 
@@ -79,7 +86,7 @@ def get_stage_duration(plant_type: str, stage: str) -> int | None:
 def get_total_cycle_duration(plant_type: str) -> int | None:
     """Return total days for all stages of ``plant_type`` if available."""
 
-    stages = _DATA.get(normalize_key(plant_type))
+    stages = _DATA().get(normalize_key(plant_type))
     if not isinstance(stages, dict):
         return None
     total = 0
@@ -93,7 +100,7 @@ def get_total_cycle_duration(plant_type: str) -> int | None:
 def stage_bounds(plant_type: str) -> list[tuple[str, int]]:
     """Return cumulative ``(stage, end_day)`` pairs for ``plant_type``."""
 
-    return list(_STAGE_BOUNDS.get(normalize_key(plant_type), []))
+    return list(_stage_bounds().get(normalize_key(plant_type), []))
 
 
 def estimate_stage_from_age(plant_type: str, days_since_start: int) -> str | None:
@@ -121,7 +128,7 @@ def estimate_stage_from_date(plant_type: str, start_date: date, current_date: da
 
 def predict_harvest_date(plant_type: str, start_date: date) -> date | None:
     """Return estimated harvest date based on growth stage durations."""
-    stages = _DATA.get(normalize_key(plant_type))
+    stages = _DATA().get(normalize_key(plant_type))
     if not isinstance(stages, dict):
         return None
 
@@ -262,7 +269,7 @@ def days_until_next_stage(plant_type: str, current_stage: str, days_elapsed: int
 def get_germination_duration(plant_type: str) -> int | None:
     """Return default days to germination for ``plant_type`` if known."""
 
-    value = _GERMINATION.get(normalize_key(plant_type))
+    value = _GERMINATION().get(normalize_key(plant_type))
     if isinstance(value, int | float):
         return int(value)
     return None
@@ -339,6 +346,8 @@ def generate_stage_schedule(plant_type: str, start_date: date) -> list[dict[str,
 def stage_schedule_df(plant_type: str, start_date: date) -> pd.DataFrame:
     """Return stage schedule as a :class:`pandas.DataFrame`."""
 
+    import pandas as pd
+
     schedule = generate_stage_schedule(plant_type, start_date)
     if not schedule:
         return pd.DataFrame()
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 
-from .utils import list_dataset_entries, load_dataset, normalize_key
+from .utils import lazy_dataset, list_dataset_entries, normalize_key
 
 DATA_FILE = "nutrients/micronutrient_guidelines.json"
 
 # Cached dataset loaded once
-_DATA: dict[str, dict[str, dict[str, float]]] = load_dataset(DATA_FILE)
+_DATA = lazy_dataset(DATA_FILE)
 
 __all__ = [
     "list_supported_plants",
@@ -22,12 +22,12 @@ __all__ = [
 
 def list_supported_plants() -> list[str]:
     """Return plants with micronutrient guidelines."""
-    return list_dataset_entries(_DATA)
+    return list_dataset_entries(_DATA())
 
 
 def get_recommended_levels(plant_type: str, stage: str) -> dict[str, float]:
     """Return recommended micronutrient levels."""
-    plant = _DATA.get(normalize_key(plant_type))
+    plant = _DATA().get(normalize_key(plant_type))
     if not plant:
         return {}
     return plant.get(normalize_key(stage), {})
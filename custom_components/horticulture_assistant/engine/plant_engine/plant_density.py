@@ -2,23 +2,23 @@
 
 from __future__ import annotations
 
-from .utils import list_dataset_entries, load_dataset, normalize_key
+from .utils import lazy_dataset, list_dataset_entries, normalize_key
 
 DATA_FILE = "plants/plant_density_guidelines.json"
 
-_DATA: dict[str, float] = load_dataset(DATA_FILE)
+_DATA = lazy_dataset(DATA_FILE)
 
 __all__ = ["list_supported_plants", "get_spacing_cm", "plants_per_area"]
 
 
 def list_supported_plants() -> list[str]:
     """Return plant types with spacing guidelines."""
-    return list_dataset_entries(_DATA)
+    return list_dataset_entries(_DATA())
 
 
 def get_spacing_cm(plant_type: str) -> float | None:
     """Return recommended in-row spacing in centimeters."""
-    value = _DATA.get(normalize_key(plant_type))
+    value = _DATA().get(normalize_key(plant_type))
     return float(value) if isinstance(value, int | float) else None
 
 
@@ -4,11 +4,11 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Mapping
 
-from .utils import list_dataset_entries, load_dataset, normalize_key
+from .utils import lazy_dataset, list_dataset_entries, normalize_key
 
 DATA_FILE = "species/species_precipitation_risk.json"
 
-_DATA: dict[str, Iterable[dict[str, object]]] = load_dataset(DATA_FILE)
+_DATA = lazy_dataset(DATA_FILE)
 
 __all__ = [
     "list_supported_plants",
@@ -19,12 +19,12 @@ __all__ = [
 
 def list_supported_plants() -> list[str]:
     """Return plant types with precipitation risk definitions."""
-    return list_dataset_entries(_DATA)
+    return list_dataset_entries(_DATA())
 
 
 def get_precipitation_rules(plant_type: str) -> Iterable[dict[str, object]]:
     """Return precipitation risk rules for ``plant_type``."""
-    data = _DATA.get(normalize_key(plant_type))
+    data = _DATA().get(normalize_key(plant_type))
     return data if isinstance(data, Iterable) else []
 
 
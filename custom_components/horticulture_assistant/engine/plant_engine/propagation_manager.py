@@ -4,11 +4,11 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 
-from .utils import list_dataset_entries, load_dataset, normalize_key
+from .utils import lazy_dataset, list_dataset_entries, normalize_key
 
 DATA_FILE = "propagation/propagation_guidelines.json"
 
-_DATA: dict[str, dict[str, dict[str, object]]] = load_dataset(DATA_FILE)
+_DATA = lazy_dataset(DATA_FILE)
 
 __all__ = [
     "list_supported_plants",
@@ -20,18 +20,18 @@ __all__ = [
 
 def list_supported_plants() -> list[str]:
     """Return plant types with propagation guidelines."""
-    return list_dataset_entries(_DATA)
+    return list_dataset_entries(_DATA())
 
 
 def list_propagation_methods(plant_type: str) -> list[str]:
     """Return supported propagation methods for ``plant_type``."""
-    plant = _DATA.get(normalize_key(plant_type), {})
+    plant = _DATA().get(normalize_key(plant_type), {})
     return sorted(str(m) for m in plant.keys())
 
 
 def get_propagation_guidelines(plant_type: str, method: str) -> dict[str, object]:
     """Return guideline mapping for ``plant_type`` and ``method``."""
-    plant = _DATA.get(normalize_key(plant_type), {})
+    plant = _DATA().get(normalize_key(plant_type), {})
     return plant.get(normalize_key(method), {})
 
 
@@ -6,16 +6,25 @@ from bisect import bisect_left
 from collections.abc import Mapping, Sequence
 from functools import cache
 
-from .utils import list_dataset_entries, load_dataset, normalize_key
+from .utils import lazy_dataset, list_dataset_entries, normalize_key
 
 DATA_FILE = "temperature/root_temperature_uptake.json"
 OPTIMA_FILE = "local/plants/temperature/root_temperature_optima.json"
 
-_DATA = load_dataset(DATA_FILE)
-_OPTIMA = load_dataset(OPTIMA_FILE)
-_TEMPS: Sequence[float] = [float(t) for t in _DATA.get("temperature_c", [])]
-_FACTORS: Sequence[float] = [float(f) for f in _DATA.get("factor", [])]
-_DEFAULT_OPTIMUM = next((t for t, f in zip(_TEMPS, _FACTORS, strict=False) if f == 1.0), 21.0)
+_DATA = lazy_dataset(DATA_FILE)
+_OPTIMA = lazy_dataset(OPTIMA_FILE)
+
+
+@cache
+def _curve() -> tuple[Sequence[float], Sequence[float], float]:
+    """Return ``(temps, factors, default_optimum)`` for the uptake curve."""
+
+    data = _DATA()
+    temps = [float(t) for t in data.get("temperature_c", [])]
+    factors = [float(f) for f in data.get("factor", [])]
+    optimum = next((t for t, f in zip(temps, factors, strict=False) if f == 1.0), 21.0)
+    return temps, factors, optimum
+
 
 __all__ = [
     "list_supported_plants",
@@ -29,13 +38,13 @@ __all__ = [
 def list_supported_plants() -> list[str]:
     """Return plant types with defined optimal root temperatures."""
 
-    return list_dataset_entries(_OPTIMA)
+    return list_dataset_entries(_OPTIMA())
 
 
 def get_optimal_root_temperature(plant_type: str) -> float | None:
     """Return optimal root zone temperature for ``plant_type`` when known."""
 
-    value = _OPTIMA.get(normalize_key(plant_type))
+    value = _OPTIMA().get(normalize_key(plant_type))
     try:
         return float(value) if value is not None else None
     except (TypeError, ValueError):  # pragma: no cover - dataset corruption
@@ -52,21 +61,22 @@ def get_uptake_factor(temp_c: float, plant_type: str | None = None) -> float:
 
     Results are cached to speed up repeated calls with the same parameters.
     """
-    if not _TEMPS or len(_TEMPS) != len(_FACTORS):
+    temps, factors, default_optimum = _curve()
+    if not temps or len(temps) != len(factors):
         return 1.0
 
     if plant_type:
-        opt = _OPTIMA.get(plant_type.lower())
+        opt = _OPTIMA().get(plant_type.lower())
         if isinstance(opt, int | float):
-            temp_c = temp_c + (_DEFAULT_OPTIMUM - float(opt))
+            temp_c = temp_c + (default_optimum - float(opt))
 
-    idx = bisect_left(_TEMPS, temp_c)
+    idx = bisect_left(temps, temp_c)
     if idx <= 0:
-        return float(_FACTORS[0])
-    if idx >= len(_TEMPS):
-        return float(_FACTORS[-1])
-    lo_t, hi_t = _TEMPS[idx - 1], _TEMPS[idx]
-    lo_f, hi_f = _FACTORS[idx - 1], _FACTORS[idx]
+        return float(factors[0])
+    if idx >= len(temps):
+        return float(factors[-1])
+    lo_t, hi_t = temps[idx - 1], temps[idx]
+    lo_f, hi_f = factors[idx - 1], factors[idx]
     fraction = (temp_c - lo_t) / (hi_t - lo_t)
     return round(lo_f + fraction * (hi_f - lo_f), 3)
 
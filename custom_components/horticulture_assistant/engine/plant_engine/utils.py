@@ -14,6 +14,8 @@ from typing import Any, TextIO, Union
 
 import yaml
 
+from ...utils.perf_stats import timed
+
 __all__ = [
     "load_json",
     "save_json",
@@ -254,6 +256,7 @@ def dataset_file(filename: str) -> Path | None:
 
 
 @cache
+@timed("dataset.load")
 def load_dataset(filename: str) -> dict[str, Any]:
     """Return dataset ``filename`` merged with any overlay data."""
 
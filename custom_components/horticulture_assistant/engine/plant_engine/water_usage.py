@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from .utils import list_dataset_entries, load_dataset, normalize_key
+from .utils import lazy_dataset, list_dataset_entries, load_dataset, normalize_key
 
 DATA_FILE = "water/water_usage_guidelines.json"
 
-_DATA: dict[str, dict[str, float]] = load_dataset(DATA_FILE)
+_DATA = lazy_dataset(DATA_FILE)
 
 from .growth_stage import get_stage_duration, list_growth_stages
 from .plant_density import get_spacing_cm
@@ -27,12 +27,12 @@ __all__ = [
 
 def list_supported_plants() -> list[str]:
     """Return all plant types with water use data."""
-    return list_dataset_entries(_DATA)
+    return list_dataset_entries(_DATA())
 
 
 def get_daily_use(plant_type: str, stage: str) -> float:
     """Return daily water usage in milliliters for a plant stage."""
-    plant = _DATA.get(normalize_key(plant_type))
+    plant = _DATA().get(normalize_key(plant_type))
     if not plant:
         return 0.0
     try:
@@ -11,33 +11,10 @@ from __future__ import annotations
 import datetime
 from collections.abc import Mapping
 
-from .catalog import CATALOG, Fertilizer
+from .catalog import CATALOG, MOLAR_MASS_CONVERSIONS, Fertilizer, convert_guaranteed_analysis
 from .engine.plant_engine import fertilizer_limits, nutrient_manager
 from .engine.plant_engine.fertilizer_dataset_lookup import recommend_products_for_nutrient as _recommend_products
 
-MOLAR_MASS_CONVERSIONS = {
-    "P2O5": ("P", 0.436),
-    "K2O": ("K", 0.830),
-}
-
-
-def convert_guaranteed_analysis(ga: dict) -> dict:
-    """Return GA with P₂O₅/K₂O converted to elemental P and K."""
-    result: dict[str, float] = {}
-    for k, v in ga.items():
-        if v is None:
-            continue
-        try:
-            val = float(v)
-        except (TypeError, ValueError):
-            continue
-        if k in MOLAR_MASS_CONVERSIONS:
-            element, factor = MOLAR_MASS_CONVERSIONS[k]
-            result[element] = result.get(element, 0) + val * factor
-        else:
-            result[k] = result.get(k, 0) + val
-    return result
-
 
 def calculate_fertilizer_nutrients(plant_id: str, fertilizer_id: str, volume_ml: float) -> dict[str, object]:
     """Return nutrient mass (mg) for ``volume_ml`` of a fertilizer."""
@@ -190,22 +167,18 @@ def estimate_mix_cost(schedule: Mapping[str, float]) -> float:
     any product lacks price or density information.
     """
 
-    prices = CATALOG.prices()
-    inventory = CATALOG.inventory()
+    price_per_gram = CATALOG.cost_matrix().price_per_gram
 
     total = 0.0
     for fert_id, grams in schedule.items():
         if grams <= 0:
             continue
-        if fert_id not in prices:
-            raise KeyError(f"Price for '{fert_id}' is not defined")
-        if fert_id not in inventory:
+        unit_cost = price_per_gram.get(fert_id)
+        if unit_cost is None:
+            if fert_id not in CATALOG.prices():
+                raise KeyError(f"Price for '{fert_id}' is not defined")
             raise KeyError(f"Density for '{fert_id}' is not defined")
-
-        density = inventory[fert_id].density_kg_per_l  # kg/L
-        grams_per_liter = density * 1000
-        volume_l = grams / grams_per_liter
-        total += prices[fert_id] * volume_l
+        total += grams * unit_cost
 
     return round(total, 2)
 
@@ -432,21 +405,10 @@ def estimate_cost_per_nutrient(fertilizer_id: str) -> dict[str, float]:
     if fertilizer_id not in prices:
         raise KeyError(f"Price for '{fertilizer_id}' is not defined")
 
-    info = inventory[fertilizer_id]
-    density = info.density_kg_per_l
-    if density <= 0:
+    if inventory[fertilizer_id].density_kg_per_l <= 0:
         raise ValueError("density must be positive")
 
-    cost_per_gram = prices[fertilizer_id] / (density * 1000)
-    ga = convert_guaranteed_analysis(info.guaranteed_analysis)
-
-    costs: dict[str, float] = {}
-    for nutrient, fraction in ga.items():
-        if fraction <= 0:
-            continue
-        costs[nutrient] = round(cost_per_gram / fraction, 4)
-
-    return costs
+    return CATALOG.cost_matrix().product_costs(fertilizer_id)
 
 
 def get_cheapest_product(nutrient: str) -> tuple[str, float]:
@@ -460,30 +422,11 @@ def get_cheapest_product(nutrient: str) -> tuple[str, float]:
     if not nutrient:
         raise ValueError("nutrient must be non-empty")
 
-    best_id: str | None = None
-    best_cost: float | None = None
-
-    # Iterate through the catalog and evaluate each product's nutrient costs.
-    for pid in list_products():
-        try:
-            costs = estimate_cost_per_nutrient(pid)
-        except (KeyError, ValueError):
-            # Skip products with missing cost data.
-            continue
-        except Exception:
-            # Skip products that raise unexpected errors during cost calculation.
-            continue
-        cost = costs.get(nutrient)
-        if cost is None:
-            continue
-        if best_cost is None or cost < best_cost:
-            best_id = pid
-            best_cost = cost
-
-    if best_id is None or best_cost is None:
+    best = CATALOG.cost_matrix().cheapest_source(nutrient)
+    if best is None:
         raise KeyError(f"No priced product contains nutrient '{nutrient}'")
 
-    return best_id, best_cost
+    return best
 
 
 def list_products() -> list[str]:
@@ -780,6 +723,7 @@ __all__ = [
     "calculate_fertilizer_nutrients",
     "calculate_fertilizer_nutrients_from_mass",
     "convert_guaranteed_analysis",
+    "MOLAR_MASS_CONVERSIONS",
     "calculate_fertilizer_cost",
     "calculate_fertilizer_cost_from_mass",
     "calculate_fertilizer_ppm",
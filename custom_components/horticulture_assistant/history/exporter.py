@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import json
 import os
-from collections.abc import Mapping
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -85,6 +86,19 @@ class HistoryExporter:
             raise ValueError(f"unknown history event type {event_type}")
         await self._hass.async_add_executor_job(self._write_entry, profile_id, event_type, dict(payload))
 
+    async def async_append_many(self, records: Iterable[tuple[str, str, Mapping[str, Any]]]) -> None:
+        """Append ``(profile_id, event_type, payload)`` records in one executor job.
+
+        Each history file is opened once and the index is rewritten once.
+        """
+
+        batch = [(profile_id, event_type, dict(payload)) for profile_id, event_type, payload in records]
+        for _profile_id, event_type, _payload in batch:
+            if event_type not in self._EVENT_FILE_MAP:
+                raise ValueError(f"unknown history event type {event_type}")
+        if batch:
+            await self._hass.async_add_executor_job(self._write_entries, batch)
+
     async def async_index(self) -> dict[str, HistoryIndex]:
         """Return a snapshot of the on-disk index."""
 
@@ -104,12 +118,26 @@ class HistoryExporter:
             handle.write(os.linesep)
         self._update_index(profile_id, event_type, payload)
 
+    def _write_entries(self, batch: list[tuple[str, str, dict[str, Any]]]) -> None:
+        grouped: defaultdict[tuple[str, str], list[str]] = defaultdict(list)
+        for profile_id, event_type, payload in batch:
+            grouped[(profile_id, event_type)].append(json.dumps(payload, ensure_ascii=False, sort_keys=True))
+        for (profile_id, event_type), lines in grouped.items():
+            profile_dir = self._base / profile_id
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            with (profile_dir / self._EVENT_FILE_MAP[event_type]).open("a", encoding="utf-8") as handle:
+                handle.writelines(f"{line}{os.linesep}" for line in lines)
+        self._update_index_many(batch)
+
     def _update_index(self, profile_id: str, event_type: str, payload: Mapping[str, Any]) -> None:
+        self._update_index_many([(profile_id, event_type, payload)])
+
+    def _update_index_many(self, batch: Iterable[tuple[str, str, Mapping[str, Any]]]) -> None:
         existing = self._load_index()
-        record = existing.get(profile_id) or HistoryIndex(profile_id)
-        timestamp = self._extract_timestamp(event_type, payload)
-        record.touch(event_type, timestamp)
-        existing[profile_id] = record
+        for profile_id, event_type, payload in batch:
+            record = existing.get(profile_id) or HistoryIndex(profile_id)
+            record.touch(event_type, self._extract_timestamp(event_type, payload))
+            existing[profile_id] = record
         serialised = {key: value.to_json() for key, value in existing.items()}
         tmp_path = self._index_path.with_suffix(".tmp")
         tmp_path.write_text(json.dumps(serialised, indent=2, ensure_ascii=False), encoding="utf-8")
@@ -0,0 +1,321 @@
+"""Shared async cache for remote AI and OpenPlantbook lookups.
+
+:class:`LookupCache` keeps recent results in a bounded LRU map, coalesces
+concurrent requests for the same key into a single in-flight call, remembers
+failures for a short period so a broken upstream is not hammered, and can be
+persisted to Home Assistant storage so cached lookups survive a restart.
+Writes after a lookup are coalesced with ``Store.async_delay_save`` and
+flushed once more when the integration unloads.
+
+Callers pass the current time and TTL explicitly so each client keeps control
+of its own clock and expiry policy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORE_KEY = "horticulture_assistant_lookup_cache"
+STORE_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_NEGATIVE_TTL = timedelta(minutes=5)
+SAVE_DELAY = 30
+
+_CACHES: dict[str, LookupCache] = {}
+_STORES: dict[int, Store] = {}
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert JSON-decoded lists back into the tuples used as cache keys."""
+
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _Entry:
+    __slots__ = ("created_at", "durable", "error", "expires_at", "value")
+
+    def __init__(
+        self,
+        value: Any,
+        created_at: datetime,
+        *,
+        error: BaseException | None = None,
+        expires_at: datetime | None = None,
+    ) -> None:
+        self.value = value
+        self.created_at = created_at
+        self.error = error
+        self.expires_at = expires_at
+        self.durable = True
+
+
+class LookupCache:
+    """Bounded TTL cache with single-flight coalescing and negative caching."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        negative_ttl: timedelta = DEFAULT_NEGATIVE_TTL,
+        persist: bool = True,
+    ) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self.persist = persist
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._dirty = False
+        _CACHES[name] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def clear(self) -> None:
+        """Drop every cached entry, including remembered failures."""
+
+        if self._entries:
+            self._dirty = True
+        self._entries.clear()
+
+    def get(self, key: Hashable, *, ttl: timedelta, now: datetime) -> tuple[bool, Any]:
+        """Return ``(hit, value)`` for ``key``.
+
+        A cached failure that has not yet expired is re-raised.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry.error is not None:
+            if entry.expires_at is not None and now < entry.expires_at:
+                self._entries.move_to_end(key)
+                raise entry.error
+            self._entries.pop(key, None)
+            return False, None
+        if now - entry.created_at >= ttl:
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry.value
+
+    def peek(self, key: Hashable) -> Any:
+        """Return the stored value for ``key`` regardless of age, or ``None``."""
+
+        entry = self._entries.get(key)
+        if entry is None or entry.error is not None:
+            return None
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, *, now: datetime) -> None:
+        """Store ``value`` for ``key`` and evict the least recently used entries.
+
+        Values that cannot be encoded as JSON stay in memory but are never
+        written to storage.
+        """
+
+        entry = _Entry(value, now)
+        if self.persist:
+            try:
+                json.dumps([key, value])
+            except (TypeError, ValueError):
+                _LOGGER.debug("Not persisting non-serialisable %s lookup %r", self.name, key)
+                entry.durable = False
+            else:
+                self._dirty = True
+        self._store(key, entry)
+
+    def set_error(self, key: Hashable, err: BaseException, *, now: datetime) -> None:
+        """Remember that looking up ``key`` failed with ``err``."""
+
+        self._store(key, _Entry(None, now, error=err, expires_at=now + self.negative_ttl))
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        *,
+        ttl: timedelta,
+        now: datetime,
+    ) -> Any:
+        """Return the cached value for ``key`` or create it with ``factory``."""
+
+        async def _many(_keys: list[Hashable]) -> dict[Hashable, Any]:
+            return {key: await factory()}
+
+        results = await self.get_or_create_many([key], _many, ttl=ttl, now=now)
+        return results[key]
+
+    async def get_or_create_many(
+        self,
+        keys: Iterable[Hashable],
+        factory: Callable[[list[Hashable]], Awaitable[Mapping[Hashable, Any]]],
+        *,
+        ttl: timedelta,
+        now: datetime,
+    ) -> dict[Hashable, Any]:
+        """Return values for ``keys``, creating all misses with one ``factory`` call.
+
+        Keys already being fetched by another caller are awaited instead of
+        requested again. Keys missing from the factory result are left
+        uncached and omitted from the returned mapping.
+        """
+
+        results: dict[Hashable, Any] = {}
+        waiting: dict[Hashable, asyncio.Future] = {}
+        missing: list[Hashable] = []
+        for key in dict.fromkeys(keys):
+            hit, value = self.get(key, ttl=ttl, now=now)
+            if hit:
+                results[key] = value
+            elif key in self._inflight:
+                waiting[key] = self._inflight[key]
+            else:
+                missing.append(key)
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            futures = {key: loop.create_future() for key in missing}
+            self._inflight.update(futures)
+            try:
+                created = await factory(list(missing))
+            except Exception as err:
+                for key, future in futures.items():
+                    self.set_error(key, err, now=now)
+                    future.set_exception(err)
+                    # Mark retrieved so unawaited futures do not log warnings.
+                    future.exception()
+                raise
+            except BaseException:
+                for future in futures.values():
+                    future.cancel()
+                raise
+            finally:
+                for key, future in futures.items():
+                    if self._inflight.get(key) is future:
+                        del self._inflight[key]
+            for key, future in futures.items():
+                if key in created:
+                    self.set(key, created[key], now=now)
+                    results[key] = created[key]
+                future.set_result((key in created, created.get(key)))
+
+        for key, future in waiting.items():
+            found, value = await asyncio.shield(future)
+            if found:
+                results[key] = value
+        return results
+
+    def dump(self) -> list[list[Any]]:
+        """Return successful entries in a JSON-serialisable form."""
+
+        return [
+            [key, entry.value, entry.created_at.isoformat()]
+            for key, entry in self._entries.items()
+            if entry.error is None and entry.durable
+        ]
+
+    def restore(self, rows: Iterable[Any]) -> None:
+        """Load entries produced by :meth:`dump`, keeping newer in-memory values."""
+
+        for row in rows:
+            try:
+                raw_key, value, created = row
+                created_at = datetime.fromisoformat(created)
+                key = _freeze(raw_key)
+                hash(key)
+            except (TypeError, ValueError):
+                continue
+            current = self._entries.get(key)
+            if current is not None and current.created_at >= created_at:
+                continue
+            self._store(key, _Entry(value, created_at))
+            self._entries.move_to_end(key, last=False)
+
+
+async def async_setup_lookup_caches(hass: HomeAssistant) -> None:
+    """Restore persisted lookup caches for ``hass`` once."""
+
+    if id(hass) in _STORES:
+        return
+    store: Store = Store(hass, STORE_VERSION, STORE_KEY)
+    _STORES[id(hass)] = store
+    data = await store.async_load()
+    if not isinstance(data, Mapping):
+        return
+    for name, rows in data.items():
+        cache = _CACHES.get(name)
+        if cache is not None and cache.persist and isinstance(rows, list):
+            cache.restore(rows)
+
+
+def _dirty() -> bool:
+    return any(cache._dirty for cache in _CACHES.values() if cache.persist)
+
+
+def _payload() -> dict[str, Any]:
+    """Return every persisted cache's rows and mark the caches clean."""
+
+    payload: dict[str, Any] = {}
+    for name, cache in _CACHES.items():
+        if cache.persist:
+            payload[name] = cache.dump()
+        cache._dirty = False
+    return payload
+
+
+def schedule_lookup_cache_save(hass: HomeAssistant) -> None:
+    """Persist changed lookup caches for ``hass`` after ``SAVE_DELAY`` seconds.
+
+    Repeated calls within the delay collapse into a single storage write.
+    """
+
+    store = _STORES.get(id(hass))
+    if store is not None and _dirty():
+        store.async_delay_save(_payload, SAVE_DELAY)
+
+
+async def async_flush_lookup_caches(hass: HomeAssistant | None = None) -> None:
+    """Persist lookup caches that changed since the last flush right away."""
+
+    if hass is None:
+        stores = list(_STORES.values())
+    elif id(hass) in _STORES:
+        stores = [_STORES[id(hass)]]
+    else:
+        return
+    if not stores or not _dirty():
+        return
+    payload = _payload()
+    for store in stores:
+        await store.async_save(payload)
+
+
+async def async_unload_lookup_caches(hass: HomeAssistant) -> None:
+    """Flush pending lookup cache changes and release the store for ``hass``."""
+
+    await async_flush_lookup_caches(hass)
+    _STORES.pop(id(hass), None)
@@ -7,9 +7,23 @@ from typing import Any
 
 import aiohttp
 
+try:
+    from .lookup_cache import LookupCache, schedule_lookup_cache_save
+except ImportError:  # pragma: no cover - fallback for direct execution
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(
+        "lookup_cache",
+        Path(__file__).resolve().parent / "lookup_cache.py",
+    )
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)  # type: ignore
+    LookupCache = mod.LookupCache  # type: ignore
+    schedule_lookup_cache_save = mod.schedule_lookup_cache_save  # type: ignore
+
 BASE_URL = "https://api.openplantbook.org"
-_SPECIES_CACHE: dict[str, tuple[dict[str, Any], datetime]] = {}
-_SEARCH_CACHE: dict[str, tuple[list[dict[str, Any]], datetime]] = {}
+_SPECIES_CACHE = LookupCache("opb_species")
+_SEARCH_CACHE = LookupCache("opb_search")
 _CACHE_TTL = timedelta(hours=12)
 _TIMEOUT = aiohttp.ClientTimeout(total=20)
 
@@ -70,14 +84,11 @@ class OpenPlantbookClient:
         return data if isinstance(data, dict) else {}
 
     async def search(self, query: str) -> list[dict[str, Any]]:
-        now = datetime.now(UTC)
-        cached = _SEARCH_CACHE.get(query)
-        if cached and now - cached[1] < _CACHE_TTL:
-            return cached[0]
-        data = await self._get(f"/v1/species?search={query}")
-        results = data if isinstance(data, list) else []
-        _SEARCH_CACHE[query] = (results, now)
-        return results
+        async def _search() -> list[dict[str, Any]]:
+            data = await self._get(f"/v1/species?search={query}")
+            return data if isinstance(data, list) else []
+
+        return await _SEARCH_CACHE.get_or_create(query, _search, ttl=_CACHE_TTL, now=datetime.now(UTC))
 
     async def get_details(self, pid: str) -> dict[str, Any]:
         """Fetch species details for ``pid``."""
@@ -96,22 +107,9 @@ class OpenPlantbookClient:
         return None
 
 
-async def async_fetch_field(hass, species: str, field: str, token: str | None = None) -> tuple[float | None, str]:
-    """Fetch a numeric field for a species from OpenPlantbook.
+def _extract_field(detail: Any, field: str) -> float | None:
+    """Return the numeric value at dotted ``field`` within ``detail``."""
 
-    Returns a `(value, url)` tuple where ``value`` is coerced to ``float`` when
-    possible, otherwise ``None``. ``url`` points to the species detail page so
-    it can be used for citation links.
-    """
-    session = hass.helpers.aiohttp_client.async_get_clientsession(hass)
-    client = OpenPlantbookClient(session, token)
-    now = datetime.now(UTC)
-    cached = _SPECIES_CACHE.get(species)
-    if cached and now - cached[1] < _CACHE_TTL:
-        detail = cached[0]
-    else:
-        detail = await client.species_details(species)
-        _SPECIES_CACHE[species] = (detail, now)
     cur: Any = detail
     for part in field.split("."):
         if isinstance(cur, dict):
@@ -119,11 +117,39 @@ async def async_fetch_field(hass, species: str, field: str, token: str | None =
         else:
             cur = None
             break
-    url = f"https://openplantbook.org/{species}"
     try:
-        return float(cur), url
+        return float(cur)
     except (TypeError, ValueError):
-        return None, url
+        return None
+
+
+async def async_fetch_field(hass, species: str, field: str, token: str | None = None) -> tuple[float | None, str]:
+    """Fetch a numeric field for a species from OpenPlantbook.
+
+    Returns a `(value, url)` tuple where ``value`` is coerced to ``float`` when
+    possible, otherwise ``None``. ``url`` points to the species detail page so
+    it can be used for citation links.
+    """
+    values = await async_fetch_fields(hass, species, [field], token=token)
+    return values[field]
+
+
+async def async_fetch_fields(
+    hass, species: str, fields: list[str], token: str | None = None
+) -> dict[str, tuple[float | None, str]]:
+    """Fetch several numeric fields for ``species`` with one species lookup."""
+
+    session = hass.helpers.aiohttp_client.async_get_clientsession(hass)
+    client = OpenPlantbookClient(session, token)
+    detail = await _SPECIES_CACHE.get_or_create(
+        species,
+        lambda: client.species_details(species),
+        ttl=_CACHE_TTL,
+        now=datetime.now(UTC),
+    )
+    schedule_lookup_cache_save(hass)
+    url = f"https://openplantbook.org/{species}"
+    return {field: (_extract_field(detail, field), url) for field in fields}
 
 
 def clear_opb_cache() -> None:
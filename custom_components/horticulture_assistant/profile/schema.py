@@ -74,7 +74,7 @@ BADGE_COLORS: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Citation:
     source: SourceType
     title: str
@@ -83,7 +83,7 @@ class Citation:
     accessed: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RunEvent:
     """Represents a cultivation run lifecycle event."""
 
@@ -198,7 +198,7 @@ class RunEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CultivationEvent:
     """Represents a user-recorded cultivation milestone."""
 
@@ -306,7 +306,7 @@ class CultivationEvent:
         return {key: value for key, value in payload.items() if value not in (None, "", [])}
 
 
-@dataclass
+@dataclass(slots=True)
 class HarvestEvent:
     """Represents a single harvest outcome."""
 
@@ -571,7 +571,7 @@ class HarvestEvent:
         return round(self.yield_grams / self.area_m2, 3)
 
 
-@dataclass
+@dataclass(slots=True)
 class NutrientApplication:
     """Represents a nutrient or fertilizer application event."""
 
@@ -687,7 +687,7 @@ class NutrientApplication:
         return {key: value for key, value in payload.items() if value is not None and value != []}
 
 
-@dataclass
+@dataclass(slots=True)
 class YieldStatistic:
     """Summarised statistic for a profile or species."""
 
@@ -730,7 +730,7 @@ class YieldStatistic:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldAnnotation:
     """Metadata describing how a resolved target value was obtained."""
 
@@ -868,7 +868,7 @@ class FieldAnnotation:
         return {key: value for key, value in payload.items() if value is not None}
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileLibrarySection:
     """Canonical profile data sourced from the cloud library."""
 
@@ -940,7 +940,7 @@ class ProfileLibrarySection:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileLocalSection:
     """Locally authoritative profile details stored on the edge."""
 
@@ -1024,7 +1024,7 @@ class ProfileLocalSection:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedTarget:
     """Resolved target value including provenance annotations."""
 
@@ -1076,7 +1076,7 @@ class ResolvedTarget:
         return ResolvedTarget(value=data.get("value"), annotation=annotation, citations=citations)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileContribution:
     profile_id: str
     child_id: str
@@ -1112,7 +1112,7 @@ class ProfileContribution:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ComputedStatSnapshot:
     stats_version: str | None = None
     computed_at: str | None = None
@@ -1150,7 +1150,7 @@ class ComputedStatSnapshot:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileResolvedSection:
     """Runtime resolved data derived from local/cloud/manual sources."""
 
@@ -1206,7 +1206,7 @@ class ProfileResolvedSection:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileComputedSection:
     """Computed statistics cached from the cloud resolver."""
 
@@ -1254,7 +1254,7 @@ class ProfileComputedSection:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileLineageEntry:
     """An entry in the lineage chain used for inheritance."""
 
@@ -1332,7 +1332,7 @@ class ProfileLineageEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileSections:
     """Grouped sections that compose the full profile envelope."""
 
@@ -1768,15 +1768,22 @@ class BioProfile:
         self.nutrient_history.append(normalised)
 
     def to_json(self) -> dict[str, Any]:
-        resolved_payload = {key: value.to_json() for key, value in self.resolved_targets.items()}
+        """Serialise the profile.
+
+        Each section is serialised once. The top-level history, target and
+        library keys reuse the section payloads, so the same dictionaries
+        appear under several keys. Copy the result before mutating it.
+        """
+
+        sections = self._ensure_sections()
+        library_payload = sections.library.to_json()
+        local_payload = sections.local.to_json()
+        resolved_section_payload = sections.resolved.to_json()
+        resolved_payload = resolved_section_payload["resolved_targets"]
         variables_payload = {key: value.to_legacy() for key, value in self.resolved_targets.items()}
         thresholds_payload = self.resolved_values()
         provenance_payload = self.resolved_provenance()
 
-        sections = self._ensure_sections()
-        library_section = sections.library
-        local_section = sections.local
-
         payload = {
             "profile_id": self.profile_id,
             "plant_id": self.profile_id,
@@ -1802,12 +1809,12 @@ class BioProfile:
             "resolved_provenance": provenance_payload,
             "computed_stats": [snapshot.to_json() for snapshot in self.computed_stats],
             "general": self.general,
-            "citations": [asdict(cit) for cit in self.citations],
-            "event_history": [event.to_json() for event in self.event_history],
-            "run_history": [event.to_json() for event in self.run_history],
-            "harvest_history": [event.to_json() for event in self.harvest_history],
-            "nutrient_history": [event.to_json() for event in self.nutrient_history],
-            "statistics": [stat.to_json() for stat in self.statistics],
+            "citations": local_payload["citations"],
+            "event_history": local_payload["event_history"],
+            "run_history": local_payload["run_history"],
+            "harvest_history": local_payload["harvest_history"],
+            "nutrient_history": local_payload["nutrient_history"],
+            "statistics": local_payload["statistics"],
             "last_resolved": self.last_resolved,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
@@ -1822,9 +1829,14 @@ class BioProfile:
         if self.local_metadata:
             payload["local_metadata"] = self.local_metadata
 
-        payload["library"] = library_section.to_json()
-        payload["local"] = local_section.to_json()
-        payload["sections"] = sections.to_json()
+        payload["library"] = library_payload
+        payload["local"] = local_payload
+        payload["sections"] = {
+            "library": library_payload,
+            "local": local_payload,
+            "resolved": resolved_section_payload,
+            "computed": sections.computed.to_json(),
+        }
         if self.lineage:
             payload["lineage"] = [entry.to_json() for entry in self.lineage]
 
@@ -2180,17 +2192,23 @@ class BioProfile:
         )
 
     def local_section(self) -> ProfileLocalSection:
+        """Return the local section.
+
+        The section gets its own history lists but shares the event objects
+        with the profile, so refreshing sections does not copy every event.
+        """
+
         return ProfileLocalSection(
             species=self.species,
             general=dict(self.general),
             local_overrides=dict(self.local_overrides),
             resolver_state=dict(self.resolver_state),
-            citations=[Citation(**asdict(cit)) for cit in self.citations],
-            event_history=[CultivationEvent.from_json(event.to_json()) for event in self.event_history],
-            run_history=[RunEvent.from_json(event.to_json()) for event in self.run_history],
-            harvest_history=[HarvestEvent.from_json(event.to_json()) for event in self.harvest_history],
-            nutrient_history=[NutrientApplication.from_json(event.to_json()) for event in self.nutrient_history],
-            statistics=[YieldStatistic.from_json(stat.to_json()) for stat in self.statistics],
+            citations=list(self.citations),
+            event_history=list(self.event_history),
+            run_history=list(self.run_history),
+            harvest_history=list(self.harvest_history),
+            nutrient_history=list(self.nutrient_history),
+            statistics=list(self.statistics),
             last_resolved=self.last_resolved,
             created_at=self.created_at,
             updated_at=self.updated_at,
@@ -22,16 +22,71 @@ CACHE_KEY = _CACHE_KEY
 
 _FALLBACK_CACHE: dict[str, dict[str, Any]] = {}
 
+# Bulk profile data lives in the profile store only.  Keeping it out of config
+# entry options avoids Home Assistant rewriting ``core.config_entries`` (for
+# every integration) whenever a profile's history or statistics change.
+OPTIONS_BULK_KEYS: tuple[str, ...] = (
+    "run_history",
+    "harvest_history",
+    "statistics",
+    "computed_stats",
+    "sections",
+)
+LOCAL_BULK_KEYS: tuple[str, ...] = (
+    "event_history",
+    "run_history",
+    "harvest_history",
+    "nutrient_history",
+    "statistics",
+)
+STORE_REF_KEY = "storage_ref"
+
+
+_JSON_SCALARS = (str, int, float, bool)
+
+
+def clone_payload(value: Any) -> Any:
+    """Return a detached copy of a JSON style ``value``.
+
+    Dictionaries and lists are rebuilt and scalars are shared, which is much
+    cheaper than :func:`copy.deepcopy` for serialised profiles. Containers
+    that appear several times in ``value`` are copied once and stay shared in
+    the result. Anything else falls back to :func:`copy.deepcopy`.
+    """
+
+    memo: dict[int, Any] = {}
+
+    def _clone(item: Any) -> Any:
+        if item is None or type(item) in _JSON_SCALARS:
+            return item
+        cached = memo.get(id(item))
+        if cached is not None:
+            return cached
+        if isinstance(item, dict):
+            clone: dict[Any, Any] = {}
+            memo[id(item)] = clone
+            for key, child in item.items():
+                clone[key] = _clone(child)
+            return clone
+        if isinstance(item, list):
+            items: list[Any] = []
+            memo[id(item)] = items
+            items.extend(_clone(child) for child in item)
+            return items
+        return deepcopy(item)
+
+    return _clone(value)
+
 
 class _InMemoryStore:
     """Fallback storage used when Home Assistant isn't available."""
 
     async def async_load(self) -> dict[str, dict[str, Any]]:
-        return {k: deepcopy(v) for k, v in _FALLBACK_CACHE.items()}
+        return clone_payload(_FALLBACK_CACHE)
 
     async def async_save(self, data: Mapping[str, dict[str, Any]]) -> None:
         _FALLBACK_CACHE.clear()
-        _FALLBACK_CACHE.update({k: deepcopy(v) for k, v in data.items()})
+        _FALLBACK_CACHE.update(clone_payload(dict(data)))
 
 
 _IN_MEMORY_STORE = _InMemoryStore()
@@ -62,7 +117,7 @@ def _coerce_profiles(payload: Any) -> dict[str, dict[str, Any]]:
             for pid, data in candidate.items():
                 if not isinstance(pid, str) or not isinstance(data, Mapping):
                     continue
-                profiles[pid] = {k: deepcopy(v) for k, v in data.items()}
+                profiles[pid] = clone_payload(dict(data))
             return profiles
 
     if isinstance(payload, list):
@@ -72,7 +127,7 @@ def _coerce_profiles(payload: Any) -> dict[str, dict[str, Any]]:
             pid = item.get("plant_id") or item.get("profile_id")
             if not isinstance(pid, str) or not pid:
                 continue
-            profiles[pid] = {k: deepcopy(v) for k, v in item.items()}
+            profiles[pid] = clone_payload(dict(item))
 
     return profiles
 
@@ -97,6 +152,36 @@ def _normalise_metadata_value(value: Any) -> str | None:
     return None
 
 
+def strip_options_bulk(payload: Mapping[str, Any]) -> dict[str, Any]:
+    """Return ``payload`` without bulk data, keeping a reference to the profile store."""
+
+    light = {key: value for key, value in payload.items() if key not in OPTIONS_BULK_KEYS}
+    local = light.get("local")
+    if isinstance(local, Mapping):
+        light["local"] = {key: value for key, value in local.items() if key not in LOCAL_BULK_KEYS}
+    light[STORE_REF_KEY] = {"key": STORE_KEY, "version": STORE_VERSION}
+    return light
+
+
+def extract_options_bulk(payload: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the non-empty bulk history and statistics carried by ``payload``."""
+
+    bulk: dict[str, Any] = {}
+    local = payload.get("local")
+    if isinstance(local, Mapping):
+        for key in LOCAL_BULK_KEYS:
+            value = local.get(key)
+            if isinstance(value, list) and value:
+                bulk[key] = deepcopy(value)
+    for key in OPTIONS_BULK_KEYS:
+        if key == "sections":
+            continue
+        value = payload.get(key)
+        if isinstance(value, list) and value:
+            bulk[key] = deepcopy(value)
+    return bulk
+
+
 async def async_load_all(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
     raw = await _store(hass).async_load()
     cache = _resolve_cache(hass)
@@ -106,18 +191,18 @@ async def async_load_all(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
 
     if profiles:
         cache.clear()
-        cache.update({pid: deepcopy(payload) for pid, payload in profiles.items()})
-        return {pid: deepcopy(payload) for pid, payload in profiles.items()}
+        cache.update(profiles)
+        return clone_payload(profiles)
 
     if explicit_payload:
         cache.clear()
         return {}
 
     if hass is None and not profiles and cache:
-        return {pid: deepcopy(payload) for pid, payload in cache.items()}
+        return clone_payload(cache)
 
     if cache:
-        return {pid: deepcopy(payload) for pid, payload in cache.items()}
+        return clone_payload(cache)
 
     return {}
 
@@ -156,8 +241,64 @@ async def async_save_profile(hass: HomeAssistant | None, profile: BioProfile | d
     data[payload["plant_id"]] = payload
     cache = _resolve_cache(hass)
     cache.clear()
-    cache.update({k: deepcopy(v) for k, v in data.items()})
+    cache.update(clone_payload(data))
+    await _store(hass).async_save(data)
+
+
+async def async_update_profile_fields(
+    hass: HomeAssistant | None,
+    plant_id: str,
+    fields: Mapping[str, Any],
+    *,
+    default: Mapping[str, Any] | None = None,
+    overwrite: bool = True,
+) -> bool:
+    """Merge ``fields`` into the stored payload for ``plant_id``.
+
+    Only keys whose value differs from the stored copy are written.  When
+    ``overwrite`` is false, keys already holding data are left untouched.  If
+    no profile is stored yet, ``default`` (when given) is saved instead.
+    Returns ``True`` when the store was written.
+    """
+
+    data = await async_load_all(hass)
+    current = data.get(plant_id)
+    if current is None:
+        if default is None:
+            return False
+        payload = dict(default)
+        payload.update(fields)
+        payload.setdefault("plant_id", plant_id)
+        payload.setdefault("profile_id", plant_id)
+        await async_save_profile(hass, payload)
+        return True
+
+    changed: dict[str, Any] = {}
+    for key, value in fields.items():
+        existing = current.get(key)
+        if existing == value:
+            continue
+        if not overwrite and existing:
+            continue
+        changed[key] = deepcopy(value)
+    if not changed:
+        return False
+
+    current.update(changed)
+    # Sections are derived from the top-level fields; drop the stale copy so it
+    # is rebuilt from the merged payload when the profile is next loaded.
+    current.pop("sections", None)
+    local = current.get("local")
+    if isinstance(local, dict):
+        for key in changed:
+            if key in LOCAL_BULK_KEYS:
+                local[key] = deepcopy(changed[key])
+    data[plant_id] = current
+    cache = _resolve_cache(hass)
+    cache.clear()
+    cache.update(clone_payload(data))
     await _store(hass).async_save(data)
+    return True
 
 
 async def async_save_profile_from_options(hass: HomeAssistant, entry, profile_id: str) -> None:
@@ -169,7 +310,19 @@ async def async_save_profile_from_options(hass: HomeAssistant, entry, profile_id
         prof,
         display_name=prof.get("name") or profile_id,
     )
-    await async_save_profile(hass, profile.to_json())
+    payload = profile.to_json()
+
+    # Options only carry lightweight data; keep stored history and statistics.
+    stored = (await async_load_all(hass)).get(profile_id)
+    if isinstance(stored, Mapping):
+        for key, value in extract_options_bulk(stored).items():
+            if not payload.get(key):
+                payload[key] = value
+                local = payload.get("local")
+                if key in LOCAL_BULK_KEYS and isinstance(local, dict):
+                    local[key] = deepcopy(value)
+        payload.pop("sections", None)
+    await async_save_profile(hass, payload)
 
 
 async def async_get_profile(hass: HomeAssistant, plant_id: str) -> dict[str, Any] | None:
@@ -198,5 +351,5 @@ async def async_delete_profile(hass: HomeAssistant, plant_id: str) -> None:
         del data[plant_id]
         cache = _resolve_cache(hass)
         cache.clear()
-        cache.update({k: deepcopy(v) for k, v in data.items()})
+        cache.update(clone_payload(data))
         await _store(hass).async_save(data)
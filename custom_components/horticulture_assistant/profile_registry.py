@@ -78,6 +78,7 @@ from .utils.entry_helpers import (
     serialise_device_info,
     update_entry_data,
 )
+from .utils.perf_stats import timed
 from .validators import (
     validate_cultivation_event_dict,
     validate_harvest_event_dict,
@@ -399,6 +400,35 @@ def _load_profile_schema() -> dict[str, Any] | None:
 STORAGE_VERSION = PROFILE_STORE_VERSION
 STORAGE_KEY = PROFILE_STORE_KEY
 
+HistoryEvent = RunEvent | HarvestEvent | NutrientApplication | CultivationEvent
+
+# History kind -> (event class, validator, profile history attribute, bus event).
+_HISTORY_KINDS: dict[str, tuple[Any, Callable[[Mapping[str, Any]], list[str]], str, str]] = {
+    "run": (RunEvent, validate_run_event_dict, "run_history", EVENT_PROFILE_RUN_RECORDED),
+    "harvest": (HarvestEvent, validate_harvest_event_dict, "harvest_history", EVENT_PROFILE_HARVEST_RECORDED),
+    "nutrient": (
+        NutrientApplication,
+        validate_nutrient_event_dict,
+        "nutrient_history",
+        EVENT_PROFILE_NUTRIENT_RECORDED,
+    ),
+    "cultivation": (
+        CultivationEvent,
+        validate_cultivation_event_dict,
+        "event_history",
+        EVENT_PROFILE_CULTIVATION_RECORDED,
+    ),
+}
+
+
+def history_event_kind(event: HistoryEvent) -> str:
+    """Return the history kind (``run``, ``harvest``, ...) of ``event``."""
+
+    for kind, (event_cls, *_rest) in _HISTORY_KINDS.items():
+        if isinstance(event, event_cls):
+            return kind
+    raise TypeError(f"unsupported history event {type(event).__name__}")
+
 
 class ProfileRegistry:
     """Maintain a collection of plant profiles for the integration."""
@@ -1579,15 +1609,42 @@ class ProfileRegistry:
         with contextlib.suppress(Exception):
             await ensure_all_profile_devices_registered(self.hass, self.entry)
 
-    async def async_save(self) -> None:
+    @timed("profile_registry.save")
+    async def async_save(self, *, changed: Iterable[str] | None = None) -> None:
+        """Persist every profile.
+
+        ``changed`` limits the statistics rebuild to those profiles plus the
+        species and sibling cultivars whose aggregates depend on them.
+        """
+
         self._relink_profiles()
-        recompute_statistics(self._profiles.values())
-        payload = {pid: prof.to_json() for pid, prof in self._profiles.items()}
+        if changed is None:
+            recompute_statistics(self._profiles.values())
+        else:
+            recompute_statistics(self._statistics_scope(changed))
+        # ``to_json`` shares containers with the live profiles. One detached
+        # copy serves both the store and the cache, whose readers copy again.
+        payload = profile_store.clone_payload({pid: prof.to_json() for pid, prof in self._profiles.items()})
         cache = self.hass.data.setdefault(PROFILE_STORE_CACHE_KEY, {})
         cache.clear()
-        cache.update({pid: deepcopy(data) for pid, data in payload.items()})
+        cache.update(payload)
         await self._store.async_save({"profiles": payload})
 
+    def _statistics_scope(self, profile_ids: Iterable[str]) -> list[BioProfile]:
+        """Return ``profile_ids`` with every profile sharing their species."""
+
+        species: set[str] = set()
+        for pid in profile_ids:
+            profile = self._profiles.get(pid)
+            if profile is None:
+                continue
+            species.add(profile.species_profile_id or profile.profile_id)
+        return [
+            profile
+            for profile in self._profiles.values()
+            if profile.profile_id in species or profile.species_profile_id in species
+        ]
+
     # Backwards compatibility for previous method name
     async_initialize = async_load
 
@@ -2290,6 +2347,49 @@ class ProfileRegistry:
         await self._async_maybe_refresh_validation_notification()
         await self._async_maybe_refresh_sensor_notification()
 
+    async def async_merge_profile_bulk(self, profile_id: str, payload: Mapping[str, Any]) -> bool:
+        """Merge history and statistics carried by ``payload`` into ``profile_id`` and save.
+
+        Histories only fill lists the profile does not hold yet, so events
+        recorded since ``payload`` was built are kept. Computed snapshots
+        replace those with the same ``stats_version``. Returns ``True`` when
+        the profile changed.
+        """
+
+        profile = self._profiles.get(profile_id)
+        bulk = profile_store.extract_options_bulk(payload)
+        if profile is None or not bulk:
+            return False
+        incoming = BioProfile.from_json({**bulk, "plant_id": profile_id, "display_name": profile.display_name})
+
+        changed = False
+        for name in ("event_history", "run_history", "harvest_history", "nutrient_history", "statistics"):
+            value = getattr(incoming, name)
+            if value and not getattr(profile, name):
+                setattr(profile, name, value)
+                changed = True
+
+        snapshots = list(profile.computed_stats)
+        for snapshot in incoming.computed_stats:
+            index = next(
+                (i for i, item in enumerate(snapshots) if item.stats_version == snapshot.stats_version),
+                None,
+            )
+            if index is None:
+                snapshots.append(snapshot)
+            elif snapshots[index].to_json() != snapshot.to_json():
+                snapshots[index] = snapshot
+            else:
+                continue
+            changed = True
+        if not changed:
+            return False
+
+        profile.computed_stats = snapshots
+        profile.refresh_sections()
+        await self.async_save(changed=[profile_id])
+        return True
+
     async def async_record_run_event(
         self,
         profile_id: str,
@@ -2505,6 +2605,79 @@ class ProfileRegistry:
         await self._async_persist_history(profile_id, "cultivation", stored_payload)
         return stored
 
+    async def async_record_events(self, events: Iterable[Mapping[str, Any]]) -> list[HistoryEvent]:
+        """Append many history events across profiles with a single save.
+
+        Each item carries ``profile_id`` and ``kind`` (``run``, ``harvest``,
+        ``nutrient`` or ``cultivation``); its remaining keys form the event
+        payload. Every item is validated before any is applied, so one invalid
+        item leaves all profiles untouched. Statistics are rebuilt only for the
+        affected profiles and the store is written once.
+
+        Returns
+        -------
+        list
+            The normalised events that were stored, in input order.
+        """
+
+        pending: list[tuple[BioProfile, str, HistoryEvent]] = []
+        for index, item in enumerate(events):
+            raw_payload = dict(item)
+            profile_id = raw_payload.pop("profile_id", None)
+            kind = raw_payload.pop("kind", None)
+            spec = _HISTORY_KINDS.get(kind)
+            if spec is None:
+                raise ValueError(f"event {index}: unknown event kind {kind!r}")
+            prof = self._profiles.get(profile_id)
+            if prof is None:
+                raise ValueError(f"event {index}: unknown profile {profile_id}")
+            event_cls, validator, _history, _event_type = spec
+            raw_payload.setdefault("profile_id", profile_id)
+            self._ensure_valid_event(
+                context=f"event {index} ({kind})",
+                payload=raw_payload,
+                validator=validator,
+            )
+            pending.append((prof, kind, event_cls.from_json(raw_payload)))
+
+        if not pending:
+            return []
+
+        stored_events: list[tuple[BioProfile, str, HistoryEvent]] = []
+        for prof, kind, event in pending:
+            getattr(prof, f"add_{kind}_event")(event)
+            stored_events.append((prof, kind, getattr(prof, _HISTORY_KINDS[kind][2])[-1]))
+
+        touched = {prof.profile_id: prof for prof, _kind, _event in pending}
+        updated_at = datetime.now(tz=UTC).isoformat()
+        for prof in touched.values():
+            prof.updated_at = updated_at
+            prof.refresh_sections()
+        await self.async_save(changed=touched)
+
+        for prof in touched.values():
+            self._cloud_publish_profile(prof)
+        exported: list[tuple[str, str, dict[str, Any]]] = []
+        for prof, kind, stored in stored_events:
+            stored_payload = stored.to_json()
+            getattr(self, f"_cloud_publish_{kind}")(stored)
+            self._async_fire_history_event(
+                _HISTORY_KINDS[kind][3],
+                prof,
+                stored_payload,
+                event_kind=kind,
+                event_subtype=stored.event_type if kind == "cultivation" else None,
+                run_id=stored.run_id,
+            )
+            exported.append((prof.profile_id, kind, stored_payload))
+        exporter = getattr(self, "_history_exporter", None)
+        if exporter is not None:
+            try:
+                await exporter.async_append_many(exported)
+            except Exception as err:  # pragma: no cover - best effort persistence
+                _LOGGER.debug("Unable to persist bulk history: %s", err)
+        return [stored for _prof, _kind, stored in stored_events]
+
     async def async_import_template(self, template: str, name: str | None = None) -> str:
         """Create a profile from a bundled template.
 
@@ -2553,7 +2726,7 @@ class ProfileRegistry:
         # metadata.  ``BioProfile.to_json`` returns mutable references for the
         # ``general`` section, so work on copies before storing them.
         profiles = self._options_profiles_copy()
-        options_payload = new_prof.to_json()
+        options_payload = profile_store.strip_options_bulk(new_prof.to_json())
         options_payload["name"] = new_prof.display_name
         general_payload = (
             dict(options_payload.get("general", {})) if isinstance(options_payload.get("general"), Mapping) else {}
@@ -2620,6 +2793,7 @@ class ProfileRegistry:
                     payload = {str(key): deepcopy(value) for key, value in stored_payload.items()}
                 else:
                     payload = profile.to_json()
+                payload = profile_store.strip_options_bulk(payload)
                 display_name = payload.get("display_name") or profile.display_name
                 payload["display_name"] = display_name
                 payload.setdefault("name", display_name)
@@ -18,6 +18,7 @@ from homeassistant.util import slugify
 from .const import CONF_PROFILE_SCOPE, PROFILE_SCOPE_CHOICES, PROFILE_SCOPE_DEFAULT
 from .profile.schema import BioProfile, CultivarProfile, SpeciesProfile
 from .profile.utils import normalise_profile_payload
+from .utils.perf_stats import timed
 
 LOCAL_RELATIVE_PATH = "custom_components/horticulture_assistant/data/local"
 PROFILES_DIRNAME = "profiles"
@@ -232,6 +233,7 @@ class ProfileStore:
         except Exception:  # pragma: no cover - invalid payload
             return None
 
+    @timed("profile_store.save")
     async def async_save(
         self,
         profile: BioProfile | dict[str, Any],
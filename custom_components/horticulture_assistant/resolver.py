@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import math
-from collections.abc import Mapping
+from collections.abc import Awaitable, Mapping
 from contextlib import suppress
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -11,13 +13,22 @@ from homeassistant.core import HomeAssistant
 
 from .cloudsync import EdgeResolverService
 from .const import CONF_PROFILES, DOMAIN, OPB_FIELD_MAP, VARIABLE_SPECS
+from .profile import store as profile_store
 from .profile.options import options_profile_to_dataclass
 from .profile.resolution import annotate_inherited_target, build_profiles_index, resolve_inheritance_target
 from .profile.schema import BioProfile, FieldAnnotation, ResolvedTarget
+from .profile.store import OPTIONS_BULK_KEYS, extract_options_bulk, strip_options_bulk
 from .profile.utils import citations_map_to_list, determine_species_slug, ensure_sections
+from .utils.perf_stats import timed
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on concurrent OpenPlantbook/AI source groups per profile resolution.
+RESOLVE_CONCURRENCY = 4
+
+# AI source metadata written back after a run; not part of the request itself.
+_AI_RESULT_KEYS = frozenset({"last_run", "confidence", "notes", "links", "summary"})
+
 
 def _coerce_ttl_hours(value: Any, *, default: float) -> float:
     """Return a positive ``ttl_hours`` value or ``default`` when invalid."""
@@ -62,6 +73,46 @@ def _parse_last_run(value: Any) -> datetime | None:
     return ts.astimezone(UTC)
 
 
+def _without_access_times(payload: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a resolved target payload without citation access timestamps."""
+
+    data = dict(payload)
+    citations = data.get("citations")
+    if isinstance(citations, list):
+        data["citations"] = [
+            {key: value for key, value in item.items() if key != "accessed"} if isinstance(item, Mapping) else item
+            for item in citations
+        ]
+    return data
+
+
+def _ai_args(src: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the AI settings for a source with a normalised ``ttl_hours``."""
+
+    raw_ai = src.get("ai", {}) or {}
+    ai = dict(raw_ai) if isinstance(raw_ai, Mapping) else {}
+    ai["ttl_hours"] = _coerce_ttl_hours(ai.get("ttl_hours"), default=720)
+    return ai
+
+
+def _apply_ai_updates(
+    sources: Mapping[str, Any],
+    ai_updates: Mapping[str, Mapping[str, Any]],
+    last_run: str,
+) -> dict[str, Any]:
+    """Return ``sources`` with fresh AI run metadata recorded per key."""
+
+    updated = dict(sources)
+    for key, meta in ai_updates.items():
+        source = dict(updated.get(key, {}))
+        ai = dict(source.get("ai", {}))
+        ai["last_run"] = last_run
+        ai.update(meta)
+        source["ai"] = ai
+        updated[key] = source
+    return updated
+
+
 class PreferenceResolver:
     """Resolves per-variable values from manual/clone/opb/ai with TTL + citations."""
 
@@ -181,6 +232,7 @@ class PreferenceResolver:
         resolved._ensure_sections()
         return resolved
 
+    @timed("resolver.resolve_profile")
     async def resolve_profile(self, entry, profile_id: str) -> dict[str, Any]:
         prof = dict(entry.options.get(CONF_PROFILES, {}).get(profile_id, {}))
         profile = options_profile_to_dataclass(
@@ -201,20 +253,32 @@ class PreferenceResolver:
         citations = dict(prof.get("citations", {}))
         resolved_targets: dict[str, ResolvedTarget] = dict(profile.resolved_targets)
         changed = False
+        values_changed = False
         changed_fields: list[str] = []
 
+        previous_targets = prof.get("resolved_targets") if isinstance(prof.get("resolved_targets"), Mapping) else {}
+        previous_thresholds = prof.get("thresholds") if isinstance(prof.get("thresholds"), Mapping) else {}
+        previous_citations = prof.get("citations") if isinstance(prof.get("citations"), Mapping) else {}
+
+        ai_updates: dict[str, dict[str, Any]] = {}
+        resolved = await self._resolve_variables(entry, profile_id, sources, thresholds, ai_updates)
+
         for key, *_ in VARIABLE_SPECS:
-            target = await self._resolve_variable(
-                entry,
-                profile_id,
-                key,
-                sources.get(key),
-                thresholds,
-                entry.options,
-            )
+            target = resolved.get(key)
             if target is None:
                 continue
 
+            previous_target = previous_targets.get(key)
+            if (
+                isinstance(previous_target, Mapping)
+                and previous_thresholds.get(key) == target.value
+                and _without_access_times(previous_target) == _without_access_times(target.to_json())
+            ):
+                # Reuse the stored target so citation access times stay stable.
+                target = ResolvedTarget.from_json(dict(previous_target))
+            else:
+                values_changed = True
+
             thresholds[key] = target.value
 
             detail: str | None = None
@@ -231,11 +295,21 @@ class PreferenceResolver:
                     detail = first.details.get("note") or first.details.get("summary")
                 detail = detail or first.title
 
-            citations[key] = {
-                "mode": target.annotation.source_type,
-                "ts": datetime.now(UTC).isoformat(),
-                "source_detail": detail,
-            }
+            previous_citation = previous_citations.get(key)
+            if (
+                isinstance(previous_citation, Mapping)
+                and previous_citation.get("mode") == target.annotation.source_type
+                and previous_citation.get("source_detail") == detail
+                and previous_thresholds.get(key) == target.value
+            ):
+                # Keep the original timestamp so unchanged values do not rewrite options.
+                citations[key] = dict(previous_citation)
+            else:
+                citations[key] = {
+                    "mode": target.annotation.source_type,
+                    "ts": datetime.now(UTC).isoformat(),
+                    "source_detail": detail,
+                }
 
             resolved_targets[str(key)] = target
             changed_fields.append(str(key))
@@ -243,6 +317,11 @@ class PreferenceResolver:
 
         if changed:
             resolved_at = datetime.now(UTC).isoformat()
+            previous_resolved_at = prof.get("last_resolved")
+            if not values_changed and not prof.get("needs_resolution") and isinstance(previous_resolved_at, str):
+                resolved_at = previous_resolved_at
+            if ai_updates:
+                sources = _apply_ai_updates(sources, ai_updates, datetime.now(UTC).isoformat())
             profile.resolved_targets = resolved_targets
             profile.citations = citations_map_to_list(citations)
             source_snapshot: dict[str, Any] = {}
@@ -278,8 +357,9 @@ class PreferenceResolver:
                 profile = cloud_profile
                 profile_payload = profile.to_json()
 
-            prof.update(
+            updates = strip_options_bulk(
                 {
+                    "sources": sources,
                     "thresholds": profile_payload.get("thresholds", {}),
                     "resolved_targets": profile_payload.get("resolved_targets", {}),
                     "variables": profile_payload.get("variables", {}),
@@ -288,7 +368,6 @@ class PreferenceResolver:
                     "profile_citations": profile_payload.get("citations", []),
                     "local": profile_payload.get("local", {}),
                     "library": profile_payload.get("library", {}),
-                    "sections": profile_payload.get("sections", {}),
                     "lineage": profile_payload.get("lineage", []),
                     "needs_resolution": False,
                     "last_resolved": resolved_at,
@@ -311,23 +390,207 @@ class PreferenceResolver:
                     "traits": dict(profile.traits),
                     "curated_targets": dict(profile.curated_targets),
                     "diffs_vs_parent": dict(profile.diffs_vs_parent),
-                    "run_history": [event.to_json() for event in profile.run_history],
-                    "harvest_history": [event.to_json() for event in profile.harvest_history],
-                    "statistics": [stat.to_json() for stat in profile.statistics],
                 }
             )
-            prof["computed_stats"] = profile_payload.get("computed_stats", [])
-
-            allp = dict(entry.options.get(CONF_PROFILES, {}))
-            allp[profile_id] = prof
-            opts = dict(entry.options)
-            opts[CONF_PROFILES] = allp
-            self.hass.config_entries.async_update_entry(entry, options=opts)
-            with suppress(AttributeError):  # pragma: no cover - defensive when entry immutable
-                entry.options = opts
+            changed_keys = [key for key, value in updates.items() if prof.get(key) != value]
+            stale_keys = [key for key in OPTIONS_BULK_KEYS if key in prof]
+
+            if changed_keys or stale_keys:
+                for key in changed_keys:
+                    prof[key] = updates[key]
+                for key in stale_keys:
+                    prof.pop(key, None)
+                allp = dict(entry.options.get(CONF_PROFILES, {}))
+                allp[profile_id] = prof
+                opts = dict(entry.options)
+                opts[CONF_PROFILES] = allp
+                self.hass.config_entries.async_update_entry(entry, options=opts)
+                with suppress(AttributeError):  # pragma: no cover - defensive when entry immutable
+                    entry.options = opts
+
+            await self._async_store_bulk(entry, profile_id, profile_payload)
 
         return thresholds
 
+    async def _async_store_bulk(self, entry, profile_id: str, payload: Mapping[str, Any]) -> None:
+        """Persist resolved history and statistics to the profile store.
+
+        The profile registry owns the store and rewrites it from memory on
+        every save, so updates go through it whenever it is loaded.
+        """
+
+        bulk = extract_options_bulk(payload)
+        if not bulk:
+            return
+        registry = self._profile_registry(entry)
+        try:
+            merge = getattr(registry, "async_merge_profile_bulk", None)
+            if merge is not None:
+                await merge(profile_id, payload)
+            else:
+                await profile_store.async_update_profile_fields(self.hass, profile_id, bulk, default=payload)
+        except Exception as err:  # pragma: no cover - storage is best effort here
+            _LOGGER.debug("Unable to store resolved data for profile %s: %s", profile_id, err)
+
+    async def _resolve_variables(
+        self,
+        entry,
+        profile_id: str,
+        sources: Mapping[str, Any],
+        thresholds: dict,
+        ai_updates: dict[str, dict[str, Any]],
+    ) -> dict[str, ResolvedTarget]:
+        """Resolve every variable, batching OpenPlantbook and AI lookups by source.
+
+        OpenPlantbook keys are grouped per species so each species is fetched
+        once, AI keys sharing the same settings are sent as one batched
+        request, and the groups run concurrently behind a bounded semaphore.
+        Fresh AI results are recorded in ``ai_updates`` for a single commit.
+        """
+
+        results: dict[str, ResolvedTarget] = {}
+        opb_groups: dict[Any, list[tuple[str, Any]]] = {}
+        ai_groups: dict[str, tuple[dict[str, Any], list[str]]] = {}
+
+        for key, *_ in VARIABLE_SPECS:
+            src = sources.get(key)
+            mode = src.get("mode") if isinstance(src, Mapping) else None
+
+            if mode == "opb":
+                opb_args = src.get("opb") if isinstance(src.get("opb"), Mapping) else {}
+                opb_groups.setdefault(opb_args.get("species"), []).append((key, opb_args.get("field")))
+                continue
+
+            if mode == "ai":
+                ai = _ai_args(src)
+                cached = self._cached_ai_target(entry.options, profile_id, key, ai, thresholds)
+                if cached is not None:
+                    results[key] = cached
+                    continue
+                request = {name: value for name, value in ai.items() if name not in _AI_RESULT_KEYS}
+                signature = json.dumps(request, sort_keys=True, default=str)
+                ai_groups.setdefault(signature, (request, []))[1].append(key)
+                continue
+
+            target = await self._resolve_variable(entry, profile_id, key, src, thresholds, entry.options)
+            if target is not None:
+                results[key] = target
+
+        jobs = [self._resolve_opb_group(species, fields) for species, fields in opb_groups.items()]
+        jobs.extend(
+            self._resolve_ai_group(profile_id, request, keys, ai_updates) for request, keys in ai_groups.values()
+        )
+        if not jobs:
+            return results
+
+        semaphore = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+
+        async def _bounded(job: Awaitable[dict[str, ResolvedTarget]]) -> dict[str, ResolvedTarget]:
+            async with semaphore:
+                return await job
+
+        outcomes = await asyncio.gather(*(_bounded(job) for job in jobs), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results.update(outcome)
+        return results
+
+    async def _resolve_opb_group(self, species: Any, fields: list[tuple[str, Any]]) -> dict[str, ResolvedTarget]:
+        """Resolve OpenPlantbook-sourced keys sharing ``species`` from one lookup.
+
+        Keys whose lookup or field cannot be parsed are left out so they fall
+        back on their own, as when each key was resolved separately.
+        """
+
+        from .opb_client import async_fetch_fields
+
+        fields = [(key, field) for key, field in fields if isinstance(field, str) and field]
+        if not species or not fields:
+            return {}
+        try:
+            values = await async_fetch_fields(self.hass, species, [field for _key, field in fields])
+        except ValueError as err:
+            _LOGGER.debug("OpenPlantbook lookup for %s failed: %s", species, err)
+            return {}
+        targets: dict[str, ResolvedTarget] = {}
+        for key, field in fields:
+            try:
+                value, url = values[field]
+                targets[key] = _opb_target(species, field, value, url)
+            except (KeyError, TypeError, ValueError):
+                continue
+        return targets
+
+    async def _resolve_ai_group(
+        self,
+        profile_id: str,
+        request: dict[str, Any],
+        keys: list[str],
+        ai_updates: dict[str, dict[str, Any]],
+    ) -> dict[str, ResolvedTarget]:
+        """Resolve AI-sourced keys sharing ``request`` settings in one batch."""
+
+        from .ai_client import async_recommend_variables
+
+        try:
+            recommendations = await async_recommend_variables(self.hass, keys=keys, plant_id=profile_id, **request)
+        except ValueError:
+            return {}
+        targets: dict[str, ResolvedTarget] = {}
+        for key, result in recommendations.items():
+            target = _ai_target(result)
+            targets[key] = target
+            extras = target.annotation.extras or {}
+            ai_updates[key] = {
+                "confidence": target.annotation.confidence,
+                "notes": extras.get("summary"),
+                "links": extras.get("links"),
+            }
+        return targets
+
+    def _cached_ai_target(
+        self,
+        options: Mapping[str, Any],
+        profile_id: str,
+        key: str,
+        ai: Mapping[str, Any],
+        thresholds: Mapping[str, Any],
+    ) -> ResolvedTarget | None:
+        """Return the stored AI result for ``key`` while its TTL has not expired."""
+
+        last_run = ai.get("last_run")
+        if not last_run:
+            return None
+        ts = _parse_last_run(last_run)
+        if not ts or datetime.now(UTC) - ts >= timedelta(hours=ai["ttl_hours"]):
+            return None
+        prof = options.get(CONF_PROFILES, {}).get(profile_id, {})
+        payload = (prof.get("resolved_targets") or {}).get(key)
+        if isinstance(payload, dict):
+            cached = ResolvedTarget.from_json(payload)
+            if cached.annotation.confidence is None:
+                cached.annotation.confidence = ai.get("confidence")
+            return cached
+        cached_value = thresholds.get(key)
+        if cached_value is None:
+            return None
+        annotation = FieldAnnotation(
+            source_type="ai",
+            method=ai.get("model") or ai.get("provider") or "ai",
+            confidence=ai.get("confidence"),
+            extras={
+                extra_key: extra_value
+                for extra_key, extra_value in {
+                    "notes": ai.get("notes"),
+                    "links": ai.get("links"),
+                    "summary": ai.get("summary"),
+                }.items()
+                if extra_value
+            },
+        )
+        return ResolvedTarget(value=cached_value, annotation=annotation)
+
     async def _resolve_variable(
         self,
         entry,
@@ -337,6 +600,12 @@ class PreferenceResolver:
         thresholds: dict,
         options: dict,
     ) -> ResolvedTarget | None:
+        """Resolve a manual, clone or inherited variable.
+
+        OpenPlantbook and AI sources are scheduled in batches by
+        :meth:`_resolve_variables` instead.
+        """
+
         if not src:
             return self._resolve_via_inheritance(entry, profile_id, key)
 
@@ -388,68 +657,6 @@ class PreferenceResolver:
                     clone_from=clone_from,
                 )
 
-            if mode == "opb":
-                return await resolve_variable_from_source(
-                    self.hass,
-                    plant_id=profile_id,
-                    key=key,
-                    source="openplantbook",
-                    opb_args=src.get("opb"),
-                )
-
-            if mode == "ai":
-                raw_ai = src.get("ai", {}) or {}
-                ai = dict(raw_ai) if isinstance(raw_ai, Mapping) else {}
-                ttl_h = _coerce_ttl_hours(ai.get("ttl_hours"), default=720)
-                ai["ttl_hours"] = ttl_h
-                last_run = ai.get("last_run")
-                if last_run:
-                    ts = _parse_last_run(last_run)
-                    if ts and datetime.now(UTC) - ts < timedelta(hours=ttl_h):
-                        prof = options.get(CONF_PROFILES, {}).get(profile_id, {})
-                        payload = (prof.get("resolved_targets") or {}).get(key)
-                        if isinstance(payload, dict):
-                            cached = ResolvedTarget.from_json(payload)
-                            if cached.annotation.confidence is None:
-                                cached.annotation.confidence = ai.get("confidence")
-                            return cached
-                        cached_value = thresholds.get(key)
-                        if cached_value is not None:
-                            annotation = FieldAnnotation(
-                                source_type="ai",
-                                method=ai.get("model") or ai.get("provider") or "ai",
-                                confidence=ai.get("confidence"),
-                                extras={
-                                    extra_key: extra_value
-                                    for extra_key, extra_value in {
-                                        "notes": ai.get("notes"),
-                                        "links": ai.get("links"),
-                                        "summary": ai.get("summary"),
-                                    }.items()
-                                    if extra_value
-                                },
-                            )
-                            return ResolvedTarget(value=cached_value, annotation=annotation)
-
-                result = await resolve_variable_from_source(
-                    self.hass,
-                    plant_id=profile_id,
-                    key=key,
-                    source="ai",
-                    ai_args=ai,
-                )
-                if result is not None:
-                    self._update_ai_cache(
-                        entry,
-                        profile_id,
-                        key,
-                        result.value,
-                        result.annotation.confidence,
-                        (result.annotation.extras or {}).get("summary"),
-                        (result.annotation.extras or {}).get("links"),
-                    )
-                return result
-
         except ValueError:
             return None
 
@@ -494,26 +701,6 @@ class PreferenceResolver:
 
         return annotate_inherited_target(resolution)
 
-    def _update_ai_cache(self, entry, pid, key, val, conf, notes, links):
-        opts = dict(entry.options)
-        prof = dict(opts.get(CONF_PROFILES, {}).get(pid, {}))
-        sources = dict(prof.get("sources", {}))
-        ai = dict(sources.get(key, {}).get("ai", {}))
-        ai["last_run"] = datetime.now(UTC).isoformat()
-        ai["confidence"] = conf
-        ai["notes"] = notes
-        ai["links"] = links
-        s = dict(sources.get(key, {}))
-        s["ai"] = ai
-        sources[key] = s
-        prof["sources"] = sources
-        allp = dict(opts.get(CONF_PROFILES, {}))
-        allp[pid] = prof
-        opts[CONF_PROFILES] = allp
-        self.hass.config_entries.async_update_entry(entry, options=opts)
-        with suppress(AttributeError):  # pragma: no cover - defensive when entry immutable
-            entry.options = opts
-
 
 async def generate_profile(
     hass: HomeAssistant,
@@ -601,7 +788,7 @@ async def resolve_variable_from_source(
 
     from .ai_client import async_recommend_variable
     from .opb_client import async_fetch_field
-    from .profile.citations import ai_ref, clone_ref, manual_note, opb_ref
+    from .profile.citations import clone_ref, manual_note
     from .profile.store import async_get_profile
 
     citations = []
@@ -638,28 +825,41 @@ async def resolve_variable_from_source(
         field = (opb_args or {}).get("field")
         species = (opb_args or {}).get("species")
         value, url = await async_fetch_field(hass, species=species, field=field)
-        citations.append(opb_ref(species, field, url))
-        extras = {key: val for key, val in (("field", field), ("url", url)) if val}
-        annotation = FieldAnnotation(
-            source_type=source,
-            method=source,
-            source_ref=[species] if species else [],
-            extras=extras,
-        )
-        return ResolvedTarget(value=value, annotation=annotation, citations=citations)
+        return _opb_target(species, field, value, url)
 
     if source == "ai":
         result = await async_recommend_variable(hass, key=key, plant_id=plant_id, **(ai_args or {}))
-        value = result.get("value")
-        summary = result.get("summary", "AI generated recommendation")
-        links = result.get("links", [])
-        citations.append(ai_ref(summary, links))
-        annotation = FieldAnnotation(
-            source_type=source,
-            method=result.get("model") or result.get("provider") or source,
-            confidence=result.get("confidence"),
-            extras={"summary": summary, "links": links},
-        )
-        return ResolvedTarget(value=value, annotation=annotation, citations=citations)
+        return _ai_target(result)
 
     raise ValueError(f"Unknown source: {source}")
+
+
+def _opb_target(species: Any, field: Any, value: Any, url: str) -> ResolvedTarget:
+    """Build a resolved target for an OpenPlantbook field lookup."""
+
+    from .profile.citations import opb_ref
+
+    extras = {key: val for key, val in (("field", field), ("url", url)) if val}
+    annotation = FieldAnnotation(
+        source_type="openplantbook",
+        method="openplantbook",
+        source_ref=[species] if species else [],
+        extras=extras,
+    )
+    return ResolvedTarget(value=value, annotation=annotation, citations=[opb_ref(species, field, url)])
+
+
+def _ai_target(result: Mapping[str, Any]) -> ResolvedTarget:
+    """Build a resolved target for an AI recommendation."""
+
+    from .profile.citations import ai_ref
+
+    summary = result.get("summary", "AI generated recommendation")
+    links = result.get("links", [])
+    annotation = FieldAnnotation(
+        source_type="ai",
+        method=result.get("model") or result.get("provider") or "ai",
+        confidence=result.get("confidence"),
+        extras={"summary": summary, "links": links},
+    )
+    return ResolvedTarget(value=result.get("value"), annotation=annotation, citations=[ai_ref(summary, links)])
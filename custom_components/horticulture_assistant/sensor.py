@@ -16,7 +16,8 @@ from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import async_track_state_change_event, async_track_time_change
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
@@ -27,6 +28,7 @@ from .const import (
     FEATURE_CLOUD_SYNC,
     FEATURE_IRRIGATION_AUTOMATION,
     PLANT_SENSOR_TYPES,
+    SIGNAL_NUTRIENT_TRACKER_REGISTERED,
     signal_profile_contexts_updated,
 )
 from .coordinator import HorticultureCoordinator
@@ -44,6 +46,7 @@ from .utils.entry_helpers import (
     profile_device_identifier,
     resolve_profile_context_collection,
 )
+from .utils.quantile_sketch import QuantileSketch
 
 _DEVICE_REGISTRY_STUB = False
 
@@ -64,6 +67,17 @@ except (ImportError, ModuleNotFoundError):  # pragma: no cover - executed in stu
 
 _LOGGER = logging.getLogger(__name__)
 
+# Percentiles of raw moisture used for the estimated soil moisture limits.
+FIELD_CAPACITY_QUANTILE = 0.95
+WILTING_POINT_QUANTILE = 0.05
+MOISTURE_SKETCH_STORE_KEY = f"{DOMAIN}_moisture_sketch"
+MOISTURE_SKETCH_STORE_VERSION = 1
+MOISTURE_SKETCH_SAVE_DELAY = 60
+
+# Bump when ``_migrated_unique_id`` gains a rule so existing entries re-run it.
+SENSOR_REGISTRY_VERSION = 1
+CONF_SENSOR_REGISTRY_VERSION = "sensor_registry_version"
+
 if TYPE_CHECKING:
     from homeassistant.core import Event, EventStateChangedData
 
@@ -427,15 +441,25 @@ class PlantProfileSensor(SensorEntity):
         return context.first_sensor(role)
 
 
-class EstimatedFieldCapacitySensor(SensorEntity):
-    """Estimate field capacity as the peak observed raw moisture reading."""
+class _MoistureQuantileSensor(SensorEntity):
+    """Estimate a soil moisture limit from a quantile of raw moisture readings.
+
+    Readings stream into a bounded :class:`QuantileSketch` from state change
+    events on the raw moisture sensor, and the sketch is persisted so the
+    estimate survives restarts. See :mod:`.utils.quantile_sketch` for the
+    error bound against the exact percentile.
+    """
 
     _attr_device_class = SensorDeviceClass.MOISTURE
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_has_entity_name = True
     _attr_entity_registry_enabled_default = True
-    _attr_should_poll = True
+    _attr_should_poll = False
+
+    _quantile: float
+    _label: str
+    _key: str
 
     def __init__(self, hass: HomeAssistant, plant_name: str, profile_id: str, entry_id: str | None = None) -> None:
         super().__init__()
@@ -443,123 +467,94 @@ class EstimatedFieldCapacitySensor(SensorEntity):
         self._entry_id = entry_id
         self._profile_id = profile_id
         self._plant_name = plant_name
-        self._attr_name = f"{plant_name} Estimated Field Capacity"
+        self._attr_name = f"{plant_name} {self._label}"
         entry_key = entry_id or "entry"
         # Scope unique id to the entry to avoid collisions across multiple
         # config entries managing the same profile identifier.
-        self._attr_unique_id = f"{DOMAIN}_{entry_key}_{profile_id}_estimated_field_capacity"
+        self._attr_unique_id = f"{DOMAIN}_{entry_key}_{profile_id}_{self._key}"
         self._attr_available = False
         self._sensor_entity_id = f"sensor.{profile_id}_raw_moisture"
         self._attr_native_value: float | None = None
+        self._sketch = QuantileSketch()
+        self._last_sample: tuple[str | None, str] | None = None
+        self._store: Store | None = None
 
     @property
     def native_value(self):
         return getattr(self, "_attr_native_value", None)
 
-    async def async_update(self) -> None:
-        self._attr_available = False
-        try:
-            state = getattr(self.hass, "states", None)
-            if state is None:
-                # TODO: handle missing sensor gracefully
-                self._attr_native_value = None
-                return
-            raw = state.get(self._sensor_entity_id)
-            if raw is None or getattr(raw, "state", None) is None:
-                # TODO: handle missing sensor gracefully
-                self._attr_native_value = None
-                return
-            try:
-                value = float(raw.state)
-            except (ValueError, TypeError):
-                # TODO: handle missing sensor gracefully
-                self._attr_native_value = None
-                return
-            previous = self._attr_native_value
-            if previous is None or value > previous:
-                self._attr_native_value = value
-            self._attr_available = True
-        except Exception:  # noqa: BLE001
-            # TODO: handle missing sensor gracefully
-            self._attr_native_value = None
-            self._attr_available = False
-
     @property
-    def available(self) -> bool:
-        """Report availability only when we have a measured value."""
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return {
+            "quantile": self._quantile,
+            "samples": self._sketch.count,
+            "relative_error": self._sketch.alpha if self._sketch.count > self._sketch.exact_size else 0.0,
+        }
 
-        return super().available and self._attr_native_value is not None
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._store = Store(self.hass, MOISTURE_SKETCH_STORE_VERSION, f"{MOISTURE_SKETCH_STORE_KEY}.{self.unique_id}")
+        data = await self._store.async_load()
+        if isinstance(data, Mapping) and isinstance(data.get("sketch"), Mapping):
+            try:
+                self._sketch = QuantileSketch.from_dict(data["sketch"])
+            except (TypeError, ValueError):
+                _LOGGER.warning("Discarding unreadable moisture history for %s", self.entity_id)
+            else:
+                last = data.get("last_sample")
+                self._last_sample = tuple(last) if isinstance(last, list | tuple) else None
+                self._refresh()
+        self.async_on_remove(
+            async_track_state_change_event(self.hass, [self._sensor_entity_id], self._handle_moisture_event)
+        )
+        if self._ingest(self.hass.states.get(self._sensor_entity_id)):
+            self._schedule_save()
 
-    @property
-    def device_info(self) -> Mapping[str, Any]:
-        """Return device info so the sensor is grouped under the plant profile."""
+    async def async_will_remove_from_hass(self) -> None:
+        if self._store is not None and self._sketch.count:
+            await self._store.async_save(self._stored_data())
 
-        return {
-            # Use the config entry identifier when available so HA groups the
-            # virtual metric with the parent plant device for automation targets.
-            "identifiers": {profile_device_identifier(self._entry_id, self._profile_id)},
-            "name": self._plant_name,
-            "manufacturer": "Horticulture Assistant",
-            "model": "Plant Profile",
-        }
+    @callback
+    def _handle_moisture_event(self, event: Event[EventStateChangedData]) -> None:
+        if self._ingest(event.data.get("new_state")):
+            self._schedule_save()
+            self.async_write_ha_state()
 
+    def _ingest(self, state) -> bool:
+        """Feed a raw moisture state into the sketch once; return ``True`` if added."""
 
-class EstimatedWiltingPointSensor(SensorEntity):
-    """Estimate wilting point as the lowest observed raw moisture reading."""
+        if state is None:
+            return False
+        try:
+            value = float(state.state)
+        except (ValueError, TypeError):
+            return False
+        # Manual refreshes re-read the current state; only count it once.
+        stamp = getattr(state, "last_updated", None)
+        sample = (str(stamp) if stamp is not None else None, state.state)
+        if sample == self._last_sample:
+            return False
+        self._last_sample = sample
+        self._sketch.add(value)
+        self._refresh()
+        return True
 
-    _attr_device_class = SensorDeviceClass.MOISTURE
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_has_entity_name = True
-    _attr_entity_registry_enabled_default = True
-    _attr_should_poll = True
+    def _refresh(self) -> None:
+        value = self._sketch.quantile(self._quantile)
+        self._attr_native_value = round(value, 2) if value is not None else None
+        self._attr_available = value is not None
 
-    def __init__(self, hass: HomeAssistant, plant_name: str, profile_id: str, entry_id: str | None = None) -> None:
-        super().__init__()
-        self.hass = hass
-        self._entry_id = entry_id
-        self._profile_id = profile_id
-        self._plant_name = plant_name
-        self._attr_name = f"{plant_name} Estimated Wilting Point"
-        entry_key = entry_id or "entry"
-        # Scope unique id to the entry to avoid collisions across multiple
-        # config entries managing the same profile identifier.
-        self._attr_unique_id = f"{DOMAIN}_{entry_key}_{profile_id}_estimated_wilting_point"
-        self._attr_available = False
-        self._sensor_entity_id = f"sensor.{profile_id}_raw_moisture"
-        self._attr_native_value: float | None = None
+    def _stored_data(self) -> dict[str, Any]:
+        return {"sketch": self._sketch.as_dict(), "last_sample": self._last_sample}
 
-    @property
-    def native_value(self):
-        return getattr(self, "_attr_native_value", None)
+    def _schedule_save(self) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(self._stored_data, MOISTURE_SKETCH_SAVE_DELAY)
 
     async def async_update(self) -> None:
-        self._attr_available = False
-        try:
-            state = getattr(self.hass, "states", None)
-            if state is None:
-                # TODO: handle missing sensor gracefully
-                self._attr_native_value = None
-                return
-            raw = state.get(self._sensor_entity_id)
-            if raw is None or getattr(raw, "state", None) is None:
-                # TODO: handle missing sensor gracefully
-                self._attr_native_value = None
-                return
-            try:
-                value = float(raw.state)
-            except (ValueError, TypeError):
-                # TODO: handle missing sensor gracefully
-                self._attr_native_value = None
-                return
-            previous = self._attr_native_value
-            if previous is None or value < previous:
-                self._attr_native_value = value
-            self._attr_available = True
-        except Exception:  # noqa: BLE001
-            # TODO: handle missing sensor gracefully
-            self._attr_native_value = None
-            self._attr_available = False
+        states = getattr(self.hass, "states", None)
+        if states is not None and self._ingest(states.get(self._sensor_entity_id)):
+            self._schedule_save()
 
     @property
     def available(self) -> bool:
@@ -581,6 +576,22 @@ class EstimatedWiltingPointSensor(SensorEntity):
         }
 
 
+class EstimatedFieldCapacitySensor(_MoistureQuantileSensor):
+    """Estimate field capacity as a high percentile of raw moisture readings."""
+
+    _quantile = FIELD_CAPACITY_QUANTILE
+    _label = "Estimated Field Capacity"
+    _key = "estimated_field_capacity"
+
+
+class EstimatedWiltingPointSensor(_MoistureQuantileSensor):
+    """Estimate wilting point as a low percentile of raw moisture readings."""
+
+    _quantile = WILTING_POINT_QUANTILE
+    _label = "Estimated Wilting Point"
+    _key = "estimated_wilting_point"
+
+
 class PlantStatusSensor(ProfileContextEntityMixin, HorticultureBaseEntity, SensorEntity):
     """Summarise the overall health of a plant profile."""
 
@@ -971,13 +982,20 @@ class EntitlementSummarySensor(HorticultureEntryEntity, SensorEntity):
 
 
 class DailyNitrogenAppliedSensor(SensorEntity):
-    """Summarize daily nitrogen application for a plant profile."""
+    """Summarize daily nitrogen application for a plant profile.
+
+    The value is read from the nutrient tracker's per-day index and pushed
+    whenever the tracker logs a delivery for this plant, plus once at
+    midnight so the total resets for the new day. The tracker may be
+    registered after the sensor is added, so the subscription is resolved
+    lazily on the registration signal and on each midnight tick.
+    """
 
     _attr_native_unit_of_measurement = "mg"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_has_entity_name = True
     _attr_entity_registry_enabled_default = True
-    _attr_should_poll = True
+    _attr_should_poll = False
 
     def __init__(self, hass: HomeAssistant, plant_name: str, profile_id: str, entry_id: str | None = None) -> None:
         super().__init__()
@@ -992,36 +1010,92 @@ class DailyNitrogenAppliedSensor(SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{entry_key}_{profile_id}_daily_nitrogen_applied"
         self._attr_available = True
         self._attr_native_value: float | None = None
+        self._subscribed_tracker: Any | None = None
+        self._unsub_tracker: CALLBACK_TYPE | None = None
+        self._unavailable_logged = False
 
     @property
     def native_value(self):
         return getattr(self, "_attr_native_value", None)
 
-    async def async_update(self) -> None:
+    def _tracker(self):
+        return getattr(self.hass, "data", {}).get(DOMAIN, {}).get("nutrient_tracker")
+
+    def _refresh(self) -> None:
+        tracker = self._tracker()
+        if tracker is None:
+            self._set_unavailable("no nutrient tracker is registered")
+            return
         try:
-            tracker = getattr(self.hass, "data", {}).get(DOMAIN, {}).get("nutrient_tracker")
-            if tracker is None:
-                # TODO: handle missing sensor gracefully
-                self._attr_native_value = None
-                return
-            total = 0.0
-            today = datetime.now().date()
-            for record in getattr(tracker, "delivery_log", []):
-                if getattr(record, "plant_id", None) != self._profile_id:
-                    continue
-                if getattr(record, "timestamp", None) is None:
-                    continue
-                if record.timestamp.date() != today:
-                    continue
-                value = (record.ppm_delivered or {}).get("N")
-                if value is None:
-                    continue
-                total += float(value) * float(getattr(record, "volume_l", 0) or 0)
-            self._attr_native_value = round(total, 3)
-            self._attr_extra_state_attributes = {"plant_id": self._profile_id, "units": "mg"}
-        except Exception:  # noqa: BLE001
-            # TODO: handle missing sensor gracefully
-            self._attr_native_value = None
+            total = tracker.daily_nutrient_mg(self._profile_id, datetime.now().date(), "N")
+        except Exception as err:  # noqa: BLE001
+            self._set_unavailable(f"reading the nutrient tracker failed: {err}")
+            return
+        self._attr_native_value = round(total, 3)
+        self._attr_extra_state_attributes = {"plant_id": self._profile_id, "units": "mg"}
+        self._attr_available = True
+        self._unavailable_logged = False
+
+    def _set_unavailable(self, reason: str) -> None:
+        """Mark the sensor unavailable, logging only the first time per outage."""
+
+        self._attr_native_value = None
+        self._attr_available = False
+        if not self._unavailable_logged:
+            _LOGGER.warning("%s is unavailable: %s", self._attr_name, reason)
+            self._unavailable_logged = True
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._subscribe_tracker()
+        self.async_on_remove(self._unsubscribe_tracker)
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_NUTRIENT_TRACKER_REGISTERED, self._handle_tracker_registered)
+        )
+        self.async_on_remove(async_track_time_change(self.hass, self._handle_midnight, hour=0, minute=0, second=0))
+        self._refresh()
+
+    def _subscribe_tracker(self) -> None:
+        tracker = self._tracker()
+        if tracker is self._subscribed_tracker:
+            return
+        self._unsubscribe_tracker()
+        self._subscribed_tracker = tracker
+        if tracker is not None and hasattr(tracker, "add_listener"):
+            self._unsub_tracker = tracker.add_listener(self._handle_delivery)
+
+    @callback
+    def _unsubscribe_tracker(self) -> None:
+        if self._unsub_tracker is not None:
+            self._unsub_tracker()
+        self._unsub_tracker = None
+        self._subscribed_tracker = None
+
+    def _handle_delivery(self, plant_id: str | None, day, _totals: Mapping[str, float]) -> None:
+        # Tracker listeners run in whichever thread logged the delivery, so
+        # hop onto the event loop before touching entity state. A ``None``
+        # plant means the whole log was rebuilt.
+        if plant_id is not None and (plant_id != self._profile_id or day != datetime.now().date()):
+            return
+        self.hass.loop.call_soon_threadsafe(self._async_refresh_state)
+
+    @callback
+    def _async_refresh_state(self) -> None:
+        self._refresh()
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_tracker_registered(self) -> None:
+        self._subscribe_tracker()
+        self._async_refresh_state()
+
+    @callback
+    def _handle_midnight(self, _now: datetime) -> None:
+        self._subscribe_tracker()
+        self._async_refresh_state()
+
+    async def async_update(self) -> None:
+        self._refresh()
 
     @property
     def device_info(self) -> Mapping[str, Any]:
@@ -1037,6 +1111,79 @@ class DailyNitrogenAppliedSensor(SensorEntity):
         }
 
 
+def _migrated_unique_id(
+    unique_id: str,
+    *,
+    is_sensor: bool,
+    entry_id: str,
+    default_plant_id: str,
+    profile_ids: set[str],
+) -> str:
+    """Return the current unique id for a legacy registry ``unique_id``."""
+
+    if is_sensor:
+        # ``<entry_id>_<sensor_type>`` -> ``horticulture_<plant_id>_<sensor_type>``
+        for sensor_type in PLANT_SENSOR_TYPES:
+            if unique_id == f"{entry_id}_{sensor_type}":
+                unique_id = f"horticulture_{default_plant_id}_{sensor_type}"
+                break
+        # ``<profile_id>:<suffix>`` -> ``<profile_id>_<suffix>``
+        if not unique_id.startswith(f"{DOMAIN}_{entry_id}_") and ":" in unique_id:
+            profile_id, suffix = unique_id.rsplit(":", 1)
+            if suffix in PROFILE_SENSOR_SUFFIXES | PROFILE_AGGREGATE_SUFFIXES:
+                unique_id = f"{profile_id}_{suffix}"
+
+    # ``<domain>_<entry_id>_<profile_id>_...`` -> ``<profile_id>_...``
+    prefix = f"{DOMAIN}_{entry_id}_"
+    if unique_id.startswith(prefix):
+        remainder = unique_id.removeprefix(prefix)
+        if any(remainder.startswith(f"{pid}_") for pid in profile_ids):
+            unique_id = remainder
+
+    # ``[<entry_id>_]<profile_id>_<sensor_type>`` -> ``horticulture_<profile_id>_<sensor_type>``
+    if is_sensor and not unique_id.startswith("horticulture_"):
+        candidate = unique_id.removeprefix(f"{entry_id}_")
+        if "_" in candidate:
+            profile_id, sensor_type = candidate.rsplit("_", 1)
+            if sensor_type in PLANT_SENSOR_TYPES:
+                unique_id = f"horticulture_{profile_id}_{sensor_type}"
+    return unique_id
+
+
+@callback
+def _async_migrate_entity_registry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    default_plant_id: str,
+    profile_ids: set[str],
+) -> None:
+    """Rewrite legacy sensor unique ids in one registry pass, once per entry.
+
+    The reached :data:`SENSOR_REGISTRY_VERSION` is recorded on the entry so
+    later setups and reloads skip the registry walk entirely.
+    """
+
+    if entry.data.get(CONF_SENSOR_REGISTRY_VERSION, 0) >= SENSOR_REGISTRY_VERSION:
+        return
+    entity_registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        unique_id = entity_entry.unique_id
+        if not isinstance(unique_id, str):
+            continue
+        new_unique_id = _migrated_unique_id(
+            unique_id,
+            is_sensor=entity_entry.domain == "sensor" and entity_entry.platform == DOMAIN,
+            entry_id=entry.entry_id,
+            default_plant_id=default_plant_id,
+            profile_ids=profile_ids,
+        )
+        if new_unique_id != unique_id:
+            entity_registry.async_update_entity(entity_entry.entity_id, new_unique_id=new_unique_id)
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_SENSOR_REGISTRY_VERSION: SENSOR_REGISTRY_VERSION}
+    )
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     collection = resolve_profile_context_collection(hass, entry)
     stored = collection.stored
@@ -1059,68 +1206,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     if not contexts:
         _LOGGER.debug("No plant profiles configured yet; awaiting updates")
 
-    entity_registry = er.async_get(hass)
-
-    for entity_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
-        if entity_entry.domain != "sensor" or entity_entry.platform != DOMAIN:
-            continue
-        unique_id = entity_entry.unique_id
-        if not isinstance(unique_id, str) or "_" not in unique_id:
-            continue
-        for sensor_type in PLANT_SENSOR_TYPES:
-            legacy_unique_id = f"{entry.entry_id}_{sensor_type}"
-            if unique_id != legacy_unique_id:
-                continue
-            new_unique_id = f"horticulture_{default_plant_id}_{sensor_type}"
-            entity_registry.async_update_entity(entity_entry.entity_id, new_unique_id=new_unique_id)
-            break
-    for entity_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
-        if entity_entry.domain != "sensor" or entity_entry.platform != DOMAIN:
-            continue
-        unique_id = entity_entry.unique_id
-        if not isinstance(unique_id, str) or unique_id.startswith(f"{DOMAIN}_{entry.entry_id}_"):
-            continue
-        if ":" not in unique_id:
-            continue
-        profile_id, suffix = unique_id.rsplit(":", 1)
-        if suffix not in PROFILE_SENSOR_SUFFIXES | PROFILE_AGGREGATE_SUFFIXES:
-            continue
-        new_unique_id = f"{profile_id}_{suffix}"
-        if new_unique_id == unique_id:
-            continue
-        entity_registry.async_update_entity(entity_entry.entity_id, new_unique_id=new_unique_id)
-
-    profile_ids = set(contexts)
-    prefix = f"{DOMAIN}_{entry.entry_id}_"
-    for entity_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
-        unique_id = entity_entry.unique_id
-        if not isinstance(unique_id, str) or not unique_id.startswith(prefix):
-            continue
-        remainder = unique_id.removeprefix(prefix)
-        if not any(remainder.startswith(f"{pid}_") for pid in profile_ids):
-            continue
-        if remainder == unique_id:
-            continue
-        entity_registry.async_update_entity(entity_entry.entity_id, new_unique_id=remainder)
-
-    for entity_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
-        if entity_entry.domain != "sensor" or entity_entry.platform != DOMAIN:
-            continue
-        unique_id = entity_entry.unique_id
-        if not isinstance(unique_id, str) or unique_id.startswith("horticulture_"):
-            continue
-        candidate = unique_id
-        if candidate.startswith(f"{entry.entry_id}_"):
-            candidate = candidate.removeprefix(f"{entry.entry_id}_")
-        if "_" not in candidate:
-            continue
-        profile_id, sensor_type = candidate.rsplit("_", 1)
-        if sensor_type not in PLANT_SENSOR_TYPES:
-            continue
-        new_unique_id = f"horticulture_{profile_id}_{sensor_type}"
-        if new_unique_id == unique_id:
-            continue
-        entity_registry.async_update_entity(entity_entry.entity_id, new_unique_id=new_unique_id)
+    _async_migrate_entity_registry(hass, entry, default_plant_id, set(contexts))
 
     primary_context = contexts.get(collection.primary_id)
     plant_id = (primary_context.profile_id if primary_context else default_plant_id) or entry.entry_id
@@ -69,7 +69,7 @@ from .const import (
 from .entitlements import FeatureUnavailableError, derive_entitlements
 from .irrigation_bridge import async_apply_irrigation
 from .profile.statistics import EVENT_STATS_VERSION, NUTRIENT_STATS_VERSION, SUCCESS_STATS_VERSION
-from .profile_registry import ProfileRegistry
+from .profile_registry import ProfileRegistry, history_event_kind
 from .sensor import PlantProfileSensor
 from .sensor_validation import collate_issue_messages, validate_sensor_links
 from .storage import LocalStore
@@ -162,6 +162,7 @@ SERVICE_RECORD_RUN_EVENT = "record_run_event"
 SERVICE_RECORD_HARVEST_EVENT = "record_harvest_event"
 SERVICE_RECORD_NUTRIENT_EVENT = "record_nutrient_event"
 SERVICE_RECORD_CULTIVATION_EVENT = "record_cultivation_event"
+SERVICE_RECORD_EVENTS = "record_events"
 SERVICE_PROFILE_PROVENANCE = "profile_provenance"
 SERVICE_PROFILE_RUNS = "profile_runs"
 SERVICE_CLOUD_LOGIN = "cloud_login"
@@ -197,6 +198,7 @@ SERVICE_NAMES: Final[tuple[str, ...]] = (
     SERVICE_RECORD_HARVEST_EVENT,
     SERVICE_RECORD_NUTRIENT_EVENT,
     SERVICE_RECORD_CULTIVATION_EVENT,
+    SERVICE_RECORD_EVENTS,
     SERVICE_PROFILE_PROVENANCE,
     SERVICE_PROFILE_RUNS,
     SERVICE_CLOUD_LOGIN,
@@ -778,6 +780,19 @@ async def async_register_all(
 
         return response
 
+    async def _srv_record_events(call) -> ServiceResponse:
+        try:
+            stored = await registry.async_record_events(call.data["events"])
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+
+        counts: dict[str, dict[str, int]] = {}
+        for event in stored:
+            kind = history_event_kind(event)
+            per_profile = counts.setdefault(event.profile_id, {})
+            per_profile[kind] = per_profile.get(kind, 0) + 1
+        return {"recorded": len(stored), "profiles": counts}
+
     async def _srv_profile_provenance(call) -> ServiceResponse:
         profile_id: str = call.data["profile_id"]
         include_overlay: bool = bool(call.data.get("include_overlay", False))
@@ -1181,10 +1196,12 @@ async def async_register_all(
 
     async def _srv_clear_caches(call) -> None:
         from .ai_client import clear_ai_cache
+        from .lookup_cache import async_flush_lookup_caches
         from .opb_client import clear_opb_cache
 
         clear_ai_cache()
         clear_opb_cache()
+        await async_flush_lookup_caches(hass)
 
     _register_service(
         SERVICE_REPLACE_SENSOR,
@@ -1375,6 +1392,24 @@ async def async_register_all(
         ),
         supports_response=True,
     )
+    _register_service(
+        SERVICE_RECORD_EVENTS,
+        _srv_record_events,
+        schema=vol.Schema(
+            {
+                vol.Required("events"): [
+                    vol.Schema(
+                        {
+                            vol.Required("profile_id"): str,
+                            vol.Required("kind"): vol.In(["run", "harvest", "nutrient", "cultivation"]),
+                        },
+                        extra=vol.ALLOW_EXTRA,
+                    )
+                ],
+            }
+        ),
+        supports_response=True,
+    )
     _register_service(
         SERVICE_PROFILE_PROVENANCE,
         _srv_profile_provenance,
@@ -6,6 +6,10 @@ from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 
 from .const import DOMAIN
+from .utils import perf_stats
+
+# Operations listed in system health, slowest p95 first.
+_SLOWEST_OPERATIONS = 3
 
 
 async def async_register(system_health: system_health.SystemHealthRegistration, hass: HomeAssistant) -> None:
@@ -35,9 +39,17 @@ async def async_register(system_health: system_health.SystemHealthRegistration,
                 if coordinator in data
             }
         )
+        operations = perf_stats.snapshot()
+        slowest = sorted(operations.items(), key=lambda item: item[1]["p95_ms"], reverse=True)
         return {
             "profiles_loaded": profiles_loaded,
             "coordinators": coordinators,
+            "instrumented_calls": sum(stats["count"] for stats in operations.values()),
+            "slowest_operations": ", ".join(
+                f"{name} p95 {stats['p95_ms']} ms ({stats['count']} calls)"
+                for name, stats in slowest[:_SLOWEST_OPERATIONS]
+            )
+            or "none recorded",
         }
 
     system_health.register_info(DOMAIN, info_callback)
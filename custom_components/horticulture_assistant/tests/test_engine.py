@@ -1,6 +1,6 @@
 import json
 
-from ..engine.plant_engine import engine, growth_model
+from ..engine.plant_engine import approval_queue, engine, growth_model
 
 
 def test_run_daily_cycle_with_rootzone(tmp_path, monkeypatch):
@@ -13,6 +13,9 @@ def test_run_daily_cycle_with_rootzone(tmp_path, monkeypatch):
     monkeypatch.setattr(engine, "PLANTS_DIR", str(plants_dir))
     monkeypatch.setattr(engine, "OUTPUT_DIR", str(output_dir))
     monkeypatch.setattr(growth_model, "GROWTH_DIR", str(growth_dir))
+    # Keep water balance and pending threshold files out of the source tree
+    monkeypatch.setattr(approval_queue, "PENDING_DIR", tmp_path / "pending_thresholds")
+    monkeypatch.chdir(tmp_path)
 
     plant_path = plants_dir / "sample.json"
     plant_path.write_text(
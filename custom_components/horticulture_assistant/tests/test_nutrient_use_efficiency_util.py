@@ -31,8 +31,13 @@ def test_log_and_save(tmp_path, monkeypatch):
     nue.log_yield("p2", 200)
     assert nue.total_nutrients_applied("p2")["P"] == 50
     assert nue.yield_log["p2"] == 200
+    journal = (data_dir / "nutrient_use" / "p2.jsonl").read_text().splitlines()
+    assert json.loads(journal[0])["nutrients"]["P"] == 50
+    assert NutrientUseEfficiency().total_nutrients_applied("p2")["P"] == 50
+    nue.compact()
     data = json.loads((data_dir / "nutrient_use.json").read_text())
     assert data["p2"][0]["nutrients"]["P"] == 50
+    assert not (data_dir / "nutrient_use" / "p2.jsonl").exists()
 
 
 def test_compare_to_expected(tmp_path, monkeypatch):
@@ -50,7 +50,7 @@ def test_cache_clear():
     # change cached result by altering private data then clearing cache
     from ..engine.plant_engine import root_temperature as rt
 
-    rt._OPTIMA["test"] = 30
+    rt._OPTIMA()["test"] = 30
     clear_cache()
     second = get_uptake_factor(21, "test")
     assert first != second
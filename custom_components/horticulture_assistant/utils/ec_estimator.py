@@ -1,8 +1,9 @@
 """Utilities for estimating root zone electrical conductivity (EC).
 
 This module provides a lightweight linear estimator that can be trained on historical data and later used to infer EC
-values from recent sensor logs. The functions are intentionally dependency free so they can be executed during unit
-tests without a Home Assistant install.
+values from recent sensor logs. :class:`OnlineECModel` refines the coefficients one labelled sample at a time using
+recursive least squares, and only the tail of each log is parsed when estimating. The functions are intentionally
+dependency free so they can be executed during unit tests without a Home Assistant install.
 """
 
 from __future__ import annotations
@@ -22,10 +23,9 @@ except Exception:  # pragma: no cover - Home Assistant not installed in tests
     HomeAssistant = None  # type: ignore
 
 from ..engine.plant_engine import ec_manager
-from ..engine.plant_engine.fertigation import estimate_solution_ec
 from ..engine.plant_engine.utils import load_dataset
 from .bio_profile_loader import load_profile_by_id
-from .json_io import load_json, save_json
+from .json_io import append_json_entry, load_json, load_json_tail, save_json
 from .path_utils import data_path, plants_path
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +33,10 @@ _LOGGER = logging.getLogger(__name__)
 MODEL_FILE = Path(data_path(None, "ec_model.json"))
 DEFAULT_DATA_FILE = "ec/ec_model_defaults.json"
 
+# Recursive least squares settings for :class:`OnlineECModel`.
+DEFAULT_FORGETTING = 0.99
+RLS_INITIAL_COVARIANCE = 1000.0
+
 
 def _model_path(plant_id: str | None = None, *, base_path: str | Path | None = None) -> Path:
     """Return the path to the EC model file."""
@@ -73,20 +77,134 @@ class ECEstimator:
         return {"intercept": self.intercept, "coeffs": dict(self.coeffs)}
 
 
-_default_data = load_dataset(DEFAULT_DATA_FILE)
-_default_coeffs = _default_data.get("coeffs", {}) if isinstance(_default_data, Mapping) else {}
-if not isinstance(_default_coeffs, Mapping):
-    _default_coeffs = {}
-DEFAULT_MODEL = ECEstimator(
-    float(_default_data.get("intercept", 0.0)),
-    {
-        "moisture": 0.02,
-        "temperature": 0.05,
-        "irrigation_ml": 0.001,
-        "solution_ec": 0.8,
-        **{k: float(v) for k, v in _default_coeffs.items()},
-    },
-)
+@cache
+def default_model() -> ECEstimator:
+    """Return the bundled default estimator, loading its dataset on first use."""
+
+    data = load_dataset(DEFAULT_DATA_FILE)
+    if not isinstance(data, Mapping):
+        data = {}
+    coeffs = data.get("coeffs", {})
+    if not isinstance(coeffs, Mapping):
+        coeffs = {}
+    return ECEstimator(
+        float(data.get("intercept", 0.0)),
+        {
+            "moisture": 0.02,
+            "temperature": 0.05,
+            "irrigation_ml": 0.001,
+            "solution_ec": 0.8,
+            **{k: float(v) for k, v in coeffs.items()},
+        },
+    )
+
+
+def __getattr__(name: str):
+    # ``DEFAULT_MODEL`` used to be built at import time; keep it importable.
+    if name == "DEFAULT_MODEL":
+        return default_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class OnlineECModel:
+    """Recursive least squares EC model with exponential forgetting.
+
+    Each labelled sample updates the coefficients in ``O(features²)`` time
+    without revisiting earlier samples. ``forgetting`` below ``1.0`` weights
+    recent samples more heavily so the model tracks media and season drift.
+    """
+
+    __slots__ = ("covariance", "features", "forgetting", "samples", "theta")
+
+    def __init__(
+        self,
+        features: Iterable[str] = (),
+        *,
+        theta: Iterable[float] | None = None,
+        covariance: Iterable[Iterable[float]] | None = None,
+        forgetting: float = DEFAULT_FORGETTING,
+        samples: int = 0,
+    ) -> None:
+        if not 0 < forgetting <= 1:
+            raise ValueError("forgetting must be in (0, 1]")
+        self.features = list(features)
+        size = len(self.features) + 1
+        self.theta = np.zeros(size) if theta is None else np.asarray(list(theta), dtype=float)
+        if covariance is None:
+            self.covariance = np.eye(size) * RLS_INITIAL_COVARIANCE
+        else:
+            self.covariance = np.asarray([list(row) for row in covariance], dtype=float)
+        if self.theta.shape != (size,) or self.covariance.shape != (size, size):
+            raise ValueError("RLS state does not match feature list")
+        self.forgetting = float(forgetting)
+        self.samples = int(samples)
+
+    @classmethod
+    def from_estimator(cls, model: ECEstimator, *, forgetting: float = DEFAULT_FORGETTING) -> OnlineECModel:
+        """Return an online model seeded with ``model``'s coefficients."""
+
+        names = sorted(model.coeffs)
+        theta = [float(model.intercept)] + [float(model.coeffs[n]) for n in names]
+        return cls(names, theta=theta, forgetting=forgetting)
+
+    def _add_features(self, names: Iterable[str]) -> None:
+        new = [n for n in names if n not in self.features]
+        if not new:
+            return
+        size = len(self.theta)
+        grown = size + len(new)
+        covariance = np.eye(grown) * RLS_INITIAL_COVARIANCE
+        covariance[:size, :size] = self.covariance
+        self.covariance = covariance
+        self.theta = np.concatenate([self.theta, np.zeros(len(new))])
+        self.features.extend(new)
+
+    def _vector(self, features: Mapping[str, float]) -> np.ndarray:
+        return np.array([1.0] + [float(features.get(n, 0.0)) for n in self.features])
+
+    def update(self, features: Mapping[str, float], observed_ec: float) -> float:
+        """Incorporate one labelled sample and return the prior prediction error."""
+
+        self._add_features(k for k in features if k != "observed_ec")
+        x = self._vector(features)
+        error = float(observed_ec) - float(self.theta @ x)
+        px = self.covariance @ x
+        gain = px / (self.forgetting + float(x @ px))
+        self.theta = self.theta + gain * error
+        covariance = (self.covariance - np.outer(gain, px)) / self.forgetting
+        self.covariance = (covariance + covariance.T) / 2.0
+        self.samples += 1
+        return error
+
+    def estimator(self) -> ECEstimator:
+        """Return the current coefficients as an :class:`ECEstimator`."""
+
+        return ECEstimator(
+            float(self.theta[0]),
+            {name: float(coef) for name, coef in zip(self.features, self.theta[1:], strict=True)},
+        )
+
+    def predict(self, features: Mapping[str, float], runoff_ec: float | None = None) -> float:
+        return self.estimator().predict(features, runoff_ec)
+
+    def as_dict(self) -> dict:
+        return {
+            "features": list(self.features),
+            "theta": self.theta.tolist(),
+            "covariance": self.covariance.tolist(),
+            "forgetting": self.forgetting,
+            "samples": self.samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> OnlineECModel:
+        return cls(
+            data.get("features", []),
+            theta=data.get("theta"),
+            covariance=data.get("covariance"),
+            forgetting=float(data.get("forgetting", DEFAULT_FORGETTING)),
+            samples=int(data.get("samples", 0)),
+        )
 
 
 @dataclass(slots=True)
@@ -147,7 +265,7 @@ def load_model(
         _LOGGER.debug("EC model not found at %s, using defaults", model_path)
     except Exception as exc:  # pragma: no cover - logging only
         _LOGGER.warning("Failed to load EC model %s: %s", model_path, exc)
-    return DEFAULT_MODEL
+    return default_model()
 
 
 def save_model(
@@ -161,6 +279,67 @@ def save_model(
     out_path = Path(path) if path is not None else _model_path(plant_id, base_path=base_path)
     save_json(str(out_path), model.as_dict())
     load_model.cache_clear()
+    _ONLINE_MODELS.pop(out_path, None)
+
+
+_ONLINE_MODELS: dict[Path, OnlineECModel] = {}
+
+
+def load_online_model(
+    path: str | Path | None = None,
+    *,
+    plant_id: str | None = None,
+    base_path: str | Path | None = None,
+    forgetting: float = DEFAULT_FORGETTING,
+) -> OnlineECModel:
+    """Return the online model stored with the EC model file.
+
+    Models without saved RLS state are seeded from :func:`load_model` so
+    incremental updates start from the current coefficients.
+    """
+
+    model_path = Path(path) if path is not None else _model_path(plant_id, base_path=base_path)
+    cached = _ONLINE_MODELS.get(model_path)
+    if cached is not None:
+        return cached
+    online = None
+    try:
+        state = load_json(str(model_path)).get("rls")
+        if isinstance(state, Mapping):
+            online = OnlineECModel.from_dict(state)
+    except FileNotFoundError:
+        pass
+    except Exception as exc:  # pragma: no cover - logging only
+        _LOGGER.warning("Failed to load online EC state %s: %s", model_path, exc)
+    if online is None:
+        online = OnlineECModel.from_estimator(load_model(model_path), forgetting=forgetting)
+    _ONLINE_MODELS[model_path] = online
+    return online
+
+
+def update_ec_model(
+    features: Mapping[str, float],
+    observed_ec: float,
+    *,
+    path: str | Path | None = None,
+    plant_id: str | None = None,
+    base_path: str | Path | None = None,
+    persist: bool = True,
+) -> ECEstimator:
+    """Update the online EC model with one labelled sample.
+
+    The RLS state is persisted next to the coefficients so
+    :func:`load_model` and :func:`estimate_ec` pick up the new fit.
+    """
+
+    model_path = Path(path) if path is not None else _model_path(plant_id, base_path=base_path)
+    online = load_online_model(model_path)
+    online.update(features, observed_ec)
+    model = online.estimator()
+    if persist:
+        save_json(str(model_path), {**model.as_dict(), "rls": online.as_dict()})
+        load_model.cache_clear()
+    return model
 
 
 def estimate_ec_from_values(
@@ -202,15 +381,12 @@ def log_runoff_ec(
     plant_dir.mkdir(parents=True, exist_ok=True)
     log_file = plant_dir / "runoff_ec_log.json"
 
-    try:
-        entries = load_json(str(log_file)) if log_file.exists() else []
-    except Exception:
-        entries = []
-
     entry = {"timestamp": datetime.now().isoformat(), "ec": float(ec_value)}
-    entries.append(entry)
     try:
-        save_json(str(log_file), entries)
+        append_json_entry(log_file, entry)
+    except ValueError:
+        # Replace an unreadable log rather than losing the new reading.
+        save_json(str(log_file), [entry])
     except Exception as exc:  # pragma: no cover - logging only
         _LOGGER.error("Failed to write runoff EC log for %s: %s", plant_id, exc)
 
@@ -245,15 +421,15 @@ def _env_value(env: Mapping[str, object], names: Iterable[str]) -> float | None:
 
 
 def _load_recent_entries(log_path: Path, limit: int = 10) -> list[dict]:
-    """Return up to ``limit`` records from ``log_path`` if it exists."""
+    """Return up to ``limit`` records from ``log_path`` if it exists.
+
+    Only the end of the file is parsed so long logs do not slow estimates.
+    """
 
     try:
-        data = load_json(str(log_path))
-        if isinstance(data, list):
-            return data[-limit:]
+        return load_json_tail(log_path, limit)
     except Exception:
-        pass
-    return []
+        return []
 
 
 def estimate_ec(
@@ -295,7 +471,13 @@ def estimate_ec(
         if isinstance(data, Mapping):
             formulation = data
             break
-    nutrient_ec = estimate_solution_ec(formulation) if formulation else 0.0
+    if formulation:
+        # Deferred: the fertigation module reads a dozen datasets on import.
+        from ..engine.plant_engine.fertigation import estimate_solution_ec
+
+        nutrient_ec = estimate_solution_ec(formulation)
+    else:
+        nutrient_ec = 0.0
     if solution_ec <= 0 and nutrient_ec > 0:
         solution_ec = nutrient_ec
 
@@ -341,28 +523,27 @@ def train_ec_model(
     The resulting model is written to ``output_path`` if provided.
     """
 
-    feature_names: set[str] = set()
-    for row in samples:
-        feature_names.update(k for k in row if k != "observed_ec")
-    if not feature_names:
+    rows = list(samples)
+    names = sorted({k for row in rows for k in row if k != "observed_ec"})
+    if not names:
         raise ValueError("No valid features for training")
-    names = sorted(feature_names)
 
-    X = []
-    y = []
-    for row in samples:
+    X = np.ones((len(rows), len(names) + 1))
+    y = np.empty(len(rows))
+    valid = np.ones(len(rows), dtype=bool)
+    for i, row in enumerate(rows):
         try:
-            vec = [1.0] + [float(row.get(n, 0.0)) for n in names]
-            y.append(float(row["observed_ec"]))
-            X.append(vec)
+            X[i, 1:] = [float(row.get(n, 0.0)) for n in names]
+            y[i] = float(row["observed_ec"])
         except Exception as exc:
             _LOGGER.warning("Invalid sample row skipped: %s", exc)
-    if not X:
+            valid[i] = False
+    if not valid.any():
         raise ValueError("No valid samples for training")
 
-    coef, *_ = np.linalg.lstsq(np.array(X), np.array(y), rcond=None)
-    coeffs = {name: coef[i + 1] for i, name in enumerate(names)}
-    model = ECEstimator(intercept=coef[0], coeffs=coeffs)
+    coef, *_ = np.linalg.lstsq(X[valid], y[valid], rcond=None)
+    coeffs = {name: float(coef[i + 1]) for i, name in enumerate(names)}
+    model = ECEstimator(intercept=float(coef[0]), coeffs=coeffs)
 
     save_model(
         model,
@@ -377,3 +558,4 @@ def clear_model_cache() -> None:
     """Clear any cached EC models."""
 
     load_model.cache_clear()
+    _ONLINE_MODELS.clear()
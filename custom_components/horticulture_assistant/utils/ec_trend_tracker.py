@@ -6,29 +6,49 @@ Accepts a plant ID and analyzes recent electrical conductivity (EC) sensor readi
 - Sudden increases (e.g., rise > 1.0 mS/cm within 3 hours)
 - Sustained high EC above the plant's threshold for an extended period
 
-Any detected alerts are logged and recorded in a JSON file (`data/ec_alerts.json`).
+Readings are kept per entity in sliding windows that are updated as samples
+arrive, so checks never re-query the recorder. Each window is seeded once from
+recorder history and then fed by state change events (see
+:meth:`ECTrendTracker.async_start`). Alerts are appended to a JSON-lines
+journal next to the legacy alert log (`data/ec_alerts.json`) and folded back
+into it once the journal reaches ``COMPACT_AFTER_LINES`` lines. Inside the
+event loop, detection runs in the state change callback while journal writes
+and compaction are handed to the executor.
 """
 
 import json
 import logging
 import os
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime, timedelta
 from typing import Optional
 
+from .json_io import load_json_snapshot, save_json_snapshot
 from .path_utils import data_path, plants_path
 
 # Attempt to import HomeAssistant for type hints and runtime (if running inside HA)
 try:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import HomeAssistant, callback
 except ImportError:
     HomeAssistant = None  # type: ignore
 
+    def callback(func):  # type: ignore[no-redef]
+        return func
+
+
 # Import Home Assistant history function for state changes, if available
 try:
     from homeassistant.components.recorder.history import state_changes_during_period
 except ImportError:
     state_changes_during_period = None  # type: ignore
 
+try:
+    from homeassistant.helpers.event import async_track_state_change_event
+except ImportError:
+    async_track_state_change_event = None  # type: ignore
+
 # Import plant profile loader to retrieve sensor mapping and thresholds
 try:
     from .bio_profile_loader import load_profile
@@ -42,12 +62,116 @@ SUDDEN_CHANGE_THRESHOLD = 1.0  # mS/cm increase
 SUDDEN_CHANGE_WINDOW_HOURS = 3  # hours for sudden change detection
 SUSTAINED_HIGH_WINDOW_HOURS = 6  # hours for sustained high EC detection
 
+# Journal lines accumulated before they are folded into the alert log
+COMPACT_AFTER_LINES = 500
+
+
+class _ECWindow:
+    """Sliding window of EC readings with O(1) amortized min/max.
+
+    The oldest retained sample is the reading in effect at the window start,
+    mirroring ``include_start_time_state`` in recorder history queries.
+    """
+
+    __slots__ = ("_maxs", "_mins", "_seq", "samples", "span")
+
+    def __init__(self, span: timedelta) -> None:
+        self.span = span
+        self.samples: deque[tuple[int, datetime, float]] = deque()
+        self._mins: deque[tuple[int, float]] = deque()
+        self._maxs: deque[tuple[int, float]] = deque()
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def add(self, ts: datetime, value: float) -> None:
+        self._seq += 1
+        self.samples.append((self._seq, ts, value))
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((self._seq, value))
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((self._seq, value))
+
+    def expire(self, now: datetime) -> None:
+        start = now - self.span
+        while len(self.samples) >= 2 and self.samples[1][1] <= start:
+            seq = self.samples.popleft()[0]
+            while self._mins and self._mins[0][0] <= seq:
+                self._mins.popleft()
+            while self._maxs and self._maxs[0][0] <= seq:
+                self._maxs.popleft()
+
+    @property
+    def first(self) -> float:
+        return self.samples[0][2]
+
+    @property
+    def last(self) -> float:
+        return self.samples[-1][2]
+
+    @property
+    def last_time(self) -> datetime:
+        return self.samples[-1][1]
+
+    @property
+    def min(self) -> float:
+        return self._mins[0][1]
+
+    @property
+    def max(self) -> float:
+        return self._maxs[0][1]
+
+
+class _EntityTrend:
+    """Streaming trend state for one EC entity."""
+
+    __slots__ = ("above_since", "active", "sudden", "sustained")
+
+    def __init__(self) -> None:
+        self.sudden = _ECWindow(timedelta(hours=SUDDEN_CHANGE_WINDOW_HOURS))
+        self.sustained = _ECWindow(timedelta(hours=SUSTAINED_HIGH_WINDOW_HOURS))
+        self.above_since: datetime | None = None
+        # Alert types currently firing, per plant, for edge triggering
+        self.active: dict[str, set[str]] = {}
+
+    def add(self, ts: datetime, value: float, threshold: float | None) -> bool:
+        if self.sustained and ts <= self.sustained.last_time:
+            return False
+        self.sudden.add(ts, value)
+        self.sustained.add(ts, value)
+        if threshold is None or value <= threshold:
+            self.above_since = None
+        elif self.above_since is None:
+            self.above_since = ts
+        return True
+
+    def expire(self, now: datetime) -> None:
+        self.sudden.expire(now)
+        self.sustained.expire(now)
+
+
+def _parse_value(state) -> float | None:
+    if state is None or not hasattr(state, "state") or state.state in ("unknown", "unavailable"):
+        return None
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return None
+
+
+def _state_time(state) -> datetime:
+    ts = getattr(state, "last_changed", None) or getattr(state, "last_updated", None)
+    return ts if isinstance(ts, datetime) else datetime.now(UTC)
+
 
 class ECTrendTracker:
     def __init__(self, data_file: str | None = None, hass: Optional['HomeAssistant'] = None):
         """
         Initialize the ECTrendTracker.
-        Loads existing EC alert logs from the specified JSON file, or creates a new structure if file is absent.
+        Loads existing EC alert logs from the specified JSON file and its JSON-lines journal.
         :param data_file: Path to the EC alert log JSON file.
         Defaults to 'data/ec_alerts.json' in Home Assistant config.
         :param hass: HomeAssistant instance (optional) for sensor data access and path resolution.
@@ -57,13 +181,23 @@ class ECTrendTracker:
             # Use Home Assistant config directory if available
             data_file = data_path(hass, "ec_alerts.json")
         self._data_file = data_file
+        self._journal_file = os.path.splitext(data_file)[0] + ".jsonl"
         self._hass = hass
         # Internal alerts log structure: dict of plant_id -> list of alert entries
         self._alerts: dict[str, list[dict]] = {}
+        # Per-plant (entity_id, threshold) resolved from the profile once
+        self._plants: dict[str, tuple[str, float | None]] = {}
+        self._entity_plants: dict[str, list[str]] = {}
+        self._trends: dict[str, _EntityTrend] = {}
+        self._unsub: Callable[[], None] | None = None
+        self._journal_seq = 0
+        self._journal_lines = 0
+        # Guards the alert log and journal, which executor jobs write to
+        self._lock = threading.RLock()
+        self._pending: deque[tuple[str, list[dict]]] = deque()
         # Load existing alerts from file if available
         try:
-            with open(self._data_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data, self._journal_seq = load_json_snapshot(self._data_file)
             if isinstance(data, dict):
                 for pid, entries in data.items():
                     if isinstance(entries, list):
@@ -87,24 +221,47 @@ class ECTrendTracker:
                 self._data_file,
                 e,
             )
+        self._load_journal()
+        if self._journal_lines >= COMPACT_AFTER_LINES:
+            self._save_to_file()
 
-    def check_trends(self, plant_id: str) -> None:
-        """
-        Analyze recent EC sensor readings for the given plant and flag any significant EC trend alerts.
-        Flags:
-          - Sudden increase in EC (> SUDDEN_CHANGE_THRESHOLD within SUDDEN_CHANGE_WINDOW_HOURS).
-          - Sustained high EC above plant's threshold for > SUSTAINED_HIGH_WINDOW_HOURS.
-        Logs any detected alerts and records them in the EC alerts log.
-        """
-        if self._hass is None:
-            _LOGGER.error("HomeAssistant instance not provided; cannot retrieve sensor data for trend analysis.")
-            return
-        if state_changes_during_period is None:
-            _LOGGER.warning(
-                "History not available; EC trend analysis cannot be performed for plant %s.",
-                plant_id,
-            )
-            return
+    def _load_journal(self) -> None:
+        folded = self._journal_seq
+        try:
+            with open(self._journal_file, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(entry, dict) and entry.get("plant_id"):
+                        pid = str(entry.pop("plant_id"))
+                        seq = entry.pop("seq", 0)
+                        seq = seq if isinstance(seq, int) else 0
+                        self._journal_seq = max(self._journal_seq, seq)
+                        if seq and seq <= folded:
+                            # Already in the alert log; the journal outlived a compaction.
+                            continue
+                        self._alerts.setdefault(pid, []).append(entry)
+                        self._journal_lines += 1
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            _LOGGER.error("Error loading EC alert journal %s: %s", self._journal_file, e)
+
+    def configure_plant(self, plant_id: str, entity_id: str, threshold: float | None = None) -> None:
+        """Track ``entity_id`` for ``plant_id`` with an optional EC threshold."""
+        old = self._plants.get(plant_id)
+        if old is not None and plant_id in self._entity_plants.get(old[0], []):
+            self._entity_plants[old[0]].remove(plant_id)
+        self._plants[plant_id] = (entity_id, threshold)
+        self._entity_plants.setdefault(entity_id, []).append(plant_id)
+
+    def _plant_config(self, plant_id: str) -> tuple[str, float | None]:
+        """Return the EC entity and threshold for ``plant_id``, loading the profile once."""
+        cached = self._plants.get(plant_id)
+        if cached is not None:
+            return cached
 
         # Load plant profile to get sensor entity and threshold
         profile = {}
@@ -131,108 +288,143 @@ class ECTrendTracker:
                         _LOGGER.error("Invalid EC threshold value for plant %s: %s", plant_id, value)
                         plant_threshold = None
                     break
+        self.configure_plant(plant_id, ec_entity, plant_threshold)
+        return self._plants[plant_id]
 
-        # Get current EC sensor state
-        state = self._hass.states.get(ec_entity)
-        if not state or state.state in ("unknown", "unavailable"):
-            _LOGGER.warning(
-                "EC sensor %s is unavailable or has no data; skipping EC trend analysis for plant %s.",
-                ec_entity,
-                plant_id,
-            )
-            return
-        try:
-            current_val = float(state.state)
-        except (ValueError, TypeError):
-            _LOGGER.warning(
-                "Current state of %s is not numeric (%s); cannot analyze EC trends for plant %s.",
-                ec_entity,
-                state.state,
-                plant_id,
-            )
-            return
+    def _trend(self, entity_id: str) -> _EntityTrend:
+        trend = self._trends.get(entity_id)
+        if trend is None:
+            trend = self._trends[entity_id] = _EntityTrend()
+        return trend
 
-        # Determine time window bounds
-        now = datetime.now(UTC)
-        start_sudden = now - timedelta(hours=SUDDEN_CHANGE_WINDOW_HOURS)
-        start_sustained = now - timedelta(hours=SUSTAINED_HIGH_WINDOW_HOURS)
+    def _threshold_for(self, entity_id: str) -> float | None:
+        thresholds = [self._plants[p][1] for p in self._entity_plants.get(entity_id, []) if self._plants[p][1]]
+        return min(thresholds) if thresholds else None
+
+    def _detect(self, entity_id: str, value: float, ts: datetime) -> list[tuple[str, list[dict]]]:
+        """Feed one reading into the window and return newly fired alerts per plant.
+
+        Alerts are edge-triggered: a condition is reported when it starts and
+        re-armed once it clears. Nothing is written to disk here.
+        """
+        trend = self._trend(entity_id)
+        if not trend.add(ts, float(value), self._threshold_for(entity_id)):
+            return []
+        trend.expire(ts)
+        detected: list[tuple[str, list[dict]]] = []
+        for plant_id in self._entity_plants.get(entity_id, []):
+            alerts = self._evaluate(plant_id, trend, ts)
+            active = trend.active.get(plant_id, set())
+            new = [alert for alert in alerts if alert["type"] not in active]
+            trend.active[plant_id] = {alert["type"] for alert in alerts}
+            if new:
+                detected.append((plant_id, new))
+        return detected
+
+    def add_reading(self, entity_id: str, value: float, ts: datetime | None = None) -> list[tuple[str, dict]]:
+        """Feed one EC reading and return ``(plant_id, alert)`` pairs that newly fired.
+
+        New alerts are journaled before returning; use this outside the event loop.
+        """
+        fired: list[tuple[str, dict]] = []
+        for plant_id, alerts in self._detect(entity_id, value, ts or datetime.now(UTC)):
+            self._record(plant_id, alerts)
+            fired.extend((plant_id, alert) for alert in alerts)
+        return fired
+
+    def seed(self, entity_id: str, states: Iterable) -> None:
+        """Load historical ``states`` (oldest first) into the window for ``entity_id``."""
+        trend = self._trend(entity_id)
+        threshold = self._threshold_for(entity_id)
+        for state in states:
+            value = _parse_value(state)
+            if value is None:
+                if hasattr(state, "state") and state.state not in ("unknown", "unavailable"):
+                    _LOGGER.warning("Non-numeric EC state encountered for %s: %s", entity_id, state.state)
+                continue
+            trend.add(_state_time(state), value, threshold)
 
-        # Query state history for the EC sensor
+    def _seed_from_recorder(self, entity_id: str, now: datetime) -> bool:
+        """Query recorder history once for ``entity_id``; ``False`` on failure."""
+        start = now - timedelta(hours=SUSTAINED_HIGH_WINDOW_HOURS)
         try:
-            history_sudden = state_changes_during_period(
-                self._hass, start_sudden, now, entity_id=ec_entity, include_start_time_state=True
-            )
-            history_sustained = state_changes_during_period(
-                self._hass, start_sustained, now, entity_id=ec_entity, include_start_time_state=True
+            history = state_changes_during_period(
+                self._hass, start, now, entity_id=entity_id, include_start_time_state=True
             )
         except Exception as e:
-            _LOGGER.error("Failed to retrieve history for %s: %s", ec_entity, e)
+            _LOGGER.error("Failed to retrieve history for %s: %s", entity_id, e)
+            return False
+        states = history.get(entity_id.lower(), []) if isinstance(history, dict) else []
+        self.seed(entity_id, states)
+        return True
+
+    async def async_start(self, plant_ids: Iterable[str]) -> None:
+        """Seed windows from the recorder once and subscribe to EC state changes."""
+        if self._hass is None:
+            raise RuntimeError("HomeAssistant instance required to stream EC readings")
+        now = datetime.now(UTC)
+        for plant_id in plant_ids:
+            self._plant_config(plant_id)
+        entities = [e for e in self._entity_plants if e not in self._trends]
+        if state_changes_during_period is not None:
+            for entity_id in entities:
+                await self._hass.async_add_executor_job(self._seed_from_recorder, entity_id, now)
+        if async_track_state_change_event is None:
             return
+        if self._unsub is not None:
+            self._unsub()
+        self._unsub = async_track_state_change_event(self._hass, list(self._entity_plants), self._handle_event)
 
-        states_sudden = history_sudden.get(ec_entity.lower(), []) if isinstance(history_sudden, dict) else []
-        states_sustained = history_sustained.get(ec_entity.lower(), []) if isinstance(history_sustained, dict) else []
+    def async_stop(self) -> None:
+        """Stop listening for EC state changes."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
 
-        # Extract numeric EC values from history, filtering out invalid states
-        ec_values_sudden: list[float] = []
-        for s in states_sudden:
-            # Each state in history is a homeassistant.core.State object
-            if not hasattr(s, "state"):
-                continue
-            if s.state in ("unknown", "unavailable"):
-                continue
-            try:
-                val = float(s.state)
-                ec_values_sudden.append(val)
-            except (ValueError, TypeError):
-                _LOGGER.warning(
-                    "Non-numeric EC state encountered for %s in sudden window: %s",
-                    ec_entity,
-                    s.state,
-                )
-        ec_values_sustained: list[float] = []
-        for s in states_sustained:
-            if not hasattr(s, "state"):
-                continue
-            if s.state in ("unknown", "unavailable"):
-                continue
-            try:
-                val = float(s.state)
-                ec_values_sustained.append(val)
-            except (ValueError, TypeError):
-                _LOGGER.warning(
-                    "Non-numeric EC state encountered for %s in sustained window: %s",
-                    ec_entity,
-                    s.state,
-                )
-
-        if not ec_values_sudden or not ec_values_sustained:
-            # If there's no data in history (unlikely if current_val exists), skip
-            _LOGGER.warning(
-                "No EC history data available for plant %s (sensor %s); skipping trend analysis.",
-                plant_id,
-                ec_entity,
-            )
+    @callback
+    def _handle_event(self, event) -> None:
+        new_state = event.data.get("new_state")
+        value = _parse_value(new_state)
+        if value is None:
             return
+        entity_id = event.data.get("entity_id") or new_state.entity_id
+        self._queue(self._detect(entity_id, value, _state_time(new_state)))
 
-        # Initialize list for new alerts to record
+    def _queue(self, detected: list[tuple[str, list[dict]]]) -> None:
+        """Hand detected alerts to the executor so the journal is written off the loop."""
+        if not detected:
+            return
+        self._pending.extend(detected)
+        self._hass.async_add_executor_job(self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        """Journal alerts queued from the event loop, in detection order."""
+        with self._lock:
+            while self._pending:
+                self._record(*self._pending.popleft())
+
+    def _evaluate(self, plant_id: str, trend: _EntityTrend, now: datetime) -> list[dict]:
+        """Return alerts whose conditions currently hold for ``plant_id``."""
+        _entity, plant_threshold = self._plants[plant_id]
         new_alerts: list[dict] = []
+        if not trend.sudden or not trend.sustained:
+            return new_alerts
 
-        # Check for sudden EC increase over the defined window
         # Compare EC at start of window vs end (current) to detect a large rise
-        first_val = ec_values_sudden[0]  # state at ~start of sudden window
-        last_val = ec_values_sudden[-1] if ec_values_sudden else current_val
-        # Compute net change over the sudden window
+        first_val = trend.sudden.first
+        last_val = trend.sudden.last
         if last_val - first_val > SUDDEN_CHANGE_THRESHOLD:
             delta = last_val - first_val
-            alert_entry = {
-                "timestamp": now.isoformat(),
-                "type": "sudden_increase",
-                "change": round(delta, 2),
-                "window_hours": SUDDEN_CHANGE_WINDOW_HOURS,
-                "start_value": round(first_val, 2),
-                "end_value": round(last_val, 2),
-            }
-            new_alerts.append(alert_entry)
+            new_alerts.append(
+                {
+                    "timestamp": now.isoformat(),
+                    "type": "sudden_increase",
+                    "change": round(delta, 2),
+                    "window_hours": SUDDEN_CHANGE_WINDOW_HOURS,
+                    "start_value": round(first_val, 2),
+                    "end_value": round(last_val, 2),
+                }
+            )
             _LOGGER.warning(
                 "Sudden EC increase detected for plant %s: EC rose by %.2f mS/cm in the last %d hours (%.2f -> %.2f).",
                 plant_id,
@@ -242,43 +434,124 @@ class ECTrendTracker:
                 last_val,
             )
 
-        # Check for sustained high EC above threshold if threshold is known
-        if plant_threshold is not None and ec_values_sustained:
-            min_val = min(ec_values_sustained)
-            if min_val > plant_threshold:
-                # All readings in the sustained window were above the threshold
-                alert_entry = {
+        # Sustained high EC: every reading in the window (including the one in
+        # effect at its start) is above the plant's threshold.
+        if plant_threshold is not None and trend.sustained.min > plant_threshold:
+            min_val = trend.sustained.min
+            new_alerts.append(
+                {
                     "timestamp": now.isoformat(),
                     "type": "high_ec",
                     "threshold": round(plant_threshold, 2),
                     "min_value": round(min_val, 2),
                     "window_hours": SUSTAINED_HIGH_WINDOW_HOURS,
                 }
-                new_alerts.append(alert_entry)
-                _LOGGER.warning(
-                    "Sustained high EC for plant %s: EC has been above %.2f mS/cm "
-                    "for at least %d hours (minimum %.2f).",
-                    plant_id,
-                    plant_threshold,
-                    SUSTAINED_HIGH_WINDOW_HOURS,
-                    min_val,
-                )
-
-        # If any alerts were generated, save them to the alerts log
-        if new_alerts:
-            # Ensure the plant has an entry in the alerts log
-            if plant_id not in self._alerts:
-                self._alerts[plant_id] = []
-            # Append new alerts
-            self._alerts[plant_id].extend(new_alerts)
-            # Persist to file
-            self._save_to_file()
+            )
+            _LOGGER.warning(
+                "Sustained high EC for plant %s: EC has been above %.2f mS/cm for at least %d hours (minimum %.2f).",
+                plant_id,
+                plant_threshold,
+                SUSTAINED_HIGH_WINDOW_HOURS,
+                min_val,
+            )
+        return new_alerts
+
+    def sustained_high_since(self, plant_id: str) -> datetime | None:
+        """Return when the plant's EC last rose above its threshold, if still above."""
+        entity_id, _threshold = self._plant_config(plant_id)
+        trend = self._trends.get(entity_id)
+        return trend.above_since if trend is not None else None
+
+    async def async_check_trends(self, plant_id: str) -> None:
+        """
+        Analyze recent EC sensor readings for the given plant and flag any significant EC trend alerts.
+        Flags:
+          - Sudden increase in EC (> SUDDEN_CHANGE_THRESHOLD within SUDDEN_CHANGE_WINDOW_HOURS).
+          - Sustained high EC above plant's threshold for > SUSTAINED_HIGH_WINDOW_HOURS.
+        The current sensor state is fed through the same edge-triggered window as
+        streamed readings, so a condition that is still firing is not recorded again.
+        The recorder is queried in the executor only the first time an entity is checked.
+        """
+        if self._hass is None:
+            _LOGGER.error("HomeAssistant instance not provided; cannot retrieve sensor data for trend analysis.")
+            return
+
+        ec_entity, _threshold = self._plant_config(plant_id)
+        if ec_entity not in self._trends and state_changes_during_period is None:
+            _LOGGER.warning(
+                "History not available; EC trend analysis cannot be performed for plant %s.",
+                plant_id,
+            )
+            return
+
+        # Get current EC sensor state
+        state = self._hass.states.get(ec_entity)
+        if not state or state.state in ("unknown", "unavailable"):
+            _LOGGER.warning(
+                "EC sensor %s is unavailable or has no data; skipping EC trend analysis for plant %s.",
+                ec_entity,
+                plant_id,
+            )
+            return
+        current_val = _parse_value(state)
+        if current_val is None:
+            _LOGGER.warning(
+                "Current state of %s is not numeric (%s); cannot analyze EC trends for plant %s.",
+                ec_entity,
+                state.state,
+                plant_id,
+            )
+            return
+
+        if ec_entity not in self._trends and not await self._hass.async_add_executor_job(
+            self._seed_from_recorder, ec_entity, datetime.now(UTC)
+        ):
+            return
+        detected = self._detect(ec_entity, current_val, _state_time(state))
+        if not self._trend(ec_entity).sudden:
+            _LOGGER.warning(
+                "No EC history data available for plant %s (sensor %s); skipping trend analysis.",
+                plant_id,
+                ec_entity,
+            )
+            return
+        if detected:
+            self._pending.extend(detected)
+            await self._hass.async_add_executor_job(self._flush_pending)
+
+    def _record(self, plant_id: str, alerts: list[dict]) -> None:
+        """Keep ``alerts`` in memory and append them to the journal."""
+        with self._lock:
+            self._alerts.setdefault(plant_id, []).extend(alerts)
+            os.makedirs(os.path.dirname(self._journal_file) or ".", exist_ok=True)
+            try:
+                with open(self._journal_file, "a", encoding="utf-8") as f:
+                    for alert in alerts:
+                        self._journal_seq += 1
+                        f.write(json.dumps({"plant_id": plant_id, "seq": self._journal_seq, **alert}) + "\n")
+            except Exception as e:
+                _LOGGER.error("Failed to append EC alerts to %s: %s", self._journal_file, e)
+                return
+            self._journal_lines += len(alerts)
+            if self._journal_lines >= COMPACT_AFTER_LINES:
+                self._save_to_file()
 
     def _save_to_file(self) -> None:
-        """Save the current EC alerts log to the JSON file."""
-        os.makedirs(os.path.dirname(self._data_file) or ".", exist_ok=True)
-        try:
-            with open(self._data_file, "w", encoding="utf-8") as f:
-                json.dump(self._alerts, f, indent=2)
-        except Exception as e:
-            _LOGGER.error("Failed to write EC alerts log to %s: %s", self._data_file, e)
+        """Save the current EC alerts log to the JSON file and clear the journal.
+
+        The log is replaced atomically and its ``.seq`` sidecar records the last
+        journal sequence it contains, so a crash before the journal is removed
+        cannot duplicate alerts.
+        """
+        with self._lock:
+            try:
+                save_json_snapshot(self._data_file, self._alerts, self._journal_seq)
+            except Exception as e:
+                _LOGGER.error("Failed to write EC alerts log to %s: %s", self._data_file, e)
+                return
+            self._journal_lines = 0
+            try:
+                if os.path.exists(self._journal_file):
+                    os.remove(self._journal_file)
+            except OSError as e:
+                _LOGGER.error("Failed to remove EC alert journal %s: %s", self._journal_file, e)
@@ -47,10 +47,21 @@ except (ModuleNotFoundError, ImportError):  # pragma: no cover - executed in stu
         return None
 
 
-from ..const import CONF_PLANT_ID, CONF_PLANT_NAME, CONF_PROFILES, DOMAIN, signal_profile_contexts_updated
+from ..const import (
+    CONF_PLANT_ID,
+    CONF_PLANT_NAME,
+    CONF_PROFILES,
+    DOMAIN,
+    SIGNAL_NUTRIENT_TRACKER_REGISTERED,
+    signal_profile_contexts_updated,
+)
+from .path_utils import data_path
 
 # Keys used under ``hass.data[DOMAIN]``
 BY_PLANT_ID = "by_plant_id"
+NUTRIENT_TRACKER = "nutrient_tracker"
+# Delivery log read into the shared nutrient tracker at setup
+NUTRIENT_DELIVERY_LOG = "nutrient_delivery_log.json"
 
 
 def _mapping_proxy(payload: Mapping[str, Any] | None) -> Mapping[str, Any]:
@@ -2033,6 +2044,36 @@ def get_entry_data_by_plant_id(hass: HomeAssistant, plant_id: str) -> dict | Non
     return hass.data.get(DOMAIN, {}).get(BY_PLANT_ID, {}).get(plant_id)
 
 
+def register_nutrient_tracker(hass: HomeAssistant, tracker: Any) -> None:
+    """Store ``tracker`` for nutrient sensors and signal them to subscribe."""
+    hass.data.setdefault(DOMAIN, {})[NUTRIENT_TRACKER] = tracker
+    async_dispatcher_send(hass, SIGNAL_NUTRIENT_TRACKER_REGISTERED)
+
+
+async def async_setup_nutrient_tracker(hass: HomeAssistant) -> Any:
+    """Create the shared nutrient tracker once per ``hass`` and register it.
+
+    Fertilizer products come from the bundled dataset and earlier deliveries
+    from ``data/nutrient_delivery_log.json``; both are read in the executor.
+    """
+
+    tracker = hass.data.get(DOMAIN, {}).get(NUTRIENT_TRACKER)
+    if tracker is not None:
+        return tracker
+
+    from .nutrient_tracker import NutrientTracker, register_fertilizers_from_dataset
+
+    def _load() -> NutrientTracker:
+        tracker = NutrientTracker()
+        register_fertilizers_from_dataset(tracker)
+        tracker.load_log(data_path(hass, NUTRIENT_DELIVERY_LOG))
+        return tracker
+
+    tracker = await hass.async_add_executor_job(_load)
+    register_nutrient_tracker(hass, tracker)
+    return tracker
+
+
 def serialise_device_info(
     info: Mapping[str, Any] | None,
     *,
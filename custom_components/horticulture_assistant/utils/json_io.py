@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import textwrap
 from pathlib import Path
 from typing import Any
 
+_TAIL_BLOCK = 64 * 1024
+_DECODER = json.JSONDecoder()
+
 
 def load_json(path: str | Path) -> dict[str, Any]:
     """Return the parsed JSON contents of ``path``."""
@@ -23,4 +29,163 @@ def save_json(path: str | Path, data: dict[str, Any]) -> bool:
     return True
 
 
-__all__ = ["load_json", "save_json"]
+def _parse_tail(text: str) -> list[Any] | None:
+    """Return the trailing elements of a JSON array fragment ``text``.
+
+    ``text`` is the end of a file holding a JSON array. Candidate element
+    starts are tried from the front; a candidate is accepted when the elements
+    parsed from it run exactly to the closing bracket, which rules out objects
+    nested inside an earlier element.
+    """
+
+    end = len(text.rstrip())
+    if not end or text[end - 1] != "]":
+        return None
+    pos = 0
+    while True:
+        pos = min((i for i in (text.find("{", pos), text.find("[", pos)) if i >= 0), default=-1)
+        if pos < 0:
+            return None
+        items: list[Any] = []
+        idx = pos
+        try:
+            while True:
+                item, idx = _DECODER.raw_decode(text, idx)
+                items.append(item)
+                while idx < end and text[idx].isspace():
+                    idx += 1
+                if idx == end - 1 and text[idx] == "]":
+                    return items
+                if text[idx] != ",":
+                    break
+                idx += 1
+                while idx < end and text[idx].isspace():
+                    idx += 1
+        except (ValueError, IndexError):
+            pass
+        pos += 1
+
+
+def load_json_tail(path: str | Path, limit: int) -> list[Any]:
+    """Return the last ``limit`` elements of the JSON array stored at ``path``.
+
+    Only the end of the file is read and parsed, growing the window until
+    enough elements are found, so long append-only logs stay cheap to sample.
+    A :class:`ValueError` is raised if the file does not hold a JSON array.
+    """
+
+    p = Path(path)
+    size = p.stat().st_size
+    block = _TAIL_BLOCK
+    with p.open("rb") as handle:
+        while block < size:
+            handle.seek(size - block)
+            # Skip a partial UTF-8 sequence at the start of the window.
+            items = _parse_tail(handle.read().decode("utf-8", errors="ignore"))
+            if items is not None and len(items) >= limit:
+                return items[-limit:] if limit > 0 else []
+            block *= 4
+        handle.seek(0)
+        data = json.loads(handle.read().decode("utf-8"))
+    if not isinstance(data, list):
+        raise ValueError(f"{p} does not contain a JSON array")
+    return data[-limit:] if limit > 0 else []
+
+
+def append_json_entry(path: str | Path, entry: Any) -> None:
+    """Append ``entry`` to the JSON array at ``path`` without rewriting it.
+
+    The file is created when missing. Output matches :func:`save_json`
+    formatting so files stay readable whichever helper wrote them.
+    """
+
+    p = Path(path)
+    body = textwrap.indent(json.dumps(entry, indent=2), "  ")
+    if not p.exists() or p.stat().st_size == 0:
+        save_json(p, [entry])
+        return
+    with p.open("rb+") as handle:
+        # Find the closing bracket and the last character before it.
+        pos = handle.seek(0, os.SEEK_END)
+        closing = None
+        while pos > 0:
+            pos -= 1
+            handle.seek(pos)
+            char = handle.read(1)
+            if char.isspace():
+                continue
+            if closing is None:
+                if char != b"]":
+                    raise ValueError(f"{p} does not contain a JSON array")
+                closing = pos
+                continue
+            break
+        if closing is None:
+            raise ValueError(f"{p} does not contain a JSON array")
+        separator = "\n" if char == b"[" else ",\n"
+        handle.seek(pos + 1)
+        handle.truncate()
+        handle.write(f"{separator}{body}\n]".encode())
+
+
+def _snapshot_seq_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.seq")
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f"{path.name}.tmp")
+    with tmp.open("w", encoding="utf-8", newline="") as handle:
+        handle.write(text)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, path)
+
+
+def save_json_snapshot(path: str | Path, data: Any, journal_seq: int) -> None:
+    """Atomically replace ``path`` with ``data`` that folds a journal up to ``journal_seq``.
+
+    The sequence number is kept in a ``<path>.seq`` sidecar together with the
+    digest of the new snapshot. The sidecar is written first, so it only takes
+    effect once that exact snapshot is in place and a crash between the two
+    writes leaves the old snapshot and its journal consistent.
+    """
+
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(data, indent=2)
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    _write_atomic(_snapshot_seq_path(p), json.dumps({"seq": journal_seq, "sha256": digest}))
+    _write_atomic(p, text)
+
+
+def load_json_snapshot(path: str | Path) -> tuple[Any, int]:
+    """Return the data at ``path`` and the journal sequence it already contains.
+
+    The sequence is ``0`` unless the sidecar written by
+    :func:`save_json_snapshot` matches the snapshot on disk.
+    """
+
+    p = Path(path)
+    raw = p.read_bytes()
+    data = json.loads(raw.decode("utf-8"))
+    try:
+        checkpoint = json.loads(_snapshot_seq_path(p).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return data, 0
+    if (
+        isinstance(checkpoint, dict)
+        and isinstance(checkpoint.get("seq"), int)
+        and checkpoint.get("sha256") == hashlib.sha256(raw).hexdigest()
+    ):
+        return data, checkpoint["seq"]
+    return data, 0
+
+
+__all__ = [
+    "append_json_entry",
+    "load_json",
+    "load_json_snapshot",
+    "load_json_tail",
+    "save_json",
+    "save_json_snapshot",
+]
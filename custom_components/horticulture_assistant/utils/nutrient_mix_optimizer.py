@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any
 
-from ..engine.plant_engine.fertigation import _schedule_from_totals
+import numpy as np
+
+from ..engine.plant_engine.fertigation import (
+    _nutrient_purity,
+    _schedule_from_totals,
+    recommend_fertigation_schedule,
+)
 from ..engine.plant_engine.nutrient_manager import get_environment_adjusted_levels
+from ..engine.plant_engine.nutrient_uptake import estimate_total_uptake
 
 
 @dataclass(slots=True)
@@ -108,4 +115,258 @@ def optimize_mix(
     return OptimizedMix(schedule, cost, diagnostics)
 
 
-__all__ = ["optimize_mix", "OptimizedMix"]
+@dataclass(slots=True)
+class BatchMixPlan:
+    """Columnar result from :func:`optimize_mix_batch`.
+
+    Row ``i`` of every array corresponds to the ``i``-th input row. ``targets_ppm``
+    is ``NaN`` where a row has no guideline for a nutrient.
+    """
+
+    plant_type: list[str]
+    stage: list[str]
+    volume_l: np.ndarray
+    num_plants: np.ndarray
+    nutrients: tuple[str, ...]
+    targets_ppm: np.ndarray
+    products: tuple[str, ...]
+    grams: np.ndarray
+    cost: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.plant_type)
+
+    def row(self, index: int) -> OptimizedMix:
+        """Return row ``index`` in the same form as :func:`optimize_mix`."""
+
+        schedule = {
+            product: float(grams) for product, grams in zip(self.products, self.grams[index], strict=True) if grams > 0
+        }
+        targets = {
+            nutrient: float(ppm)
+            for nutrient, ppm in zip(self.nutrients, self.targets_ppm[index], strict=True)
+            if not np.isnan(ppm)
+        }
+        if not targets:
+            return OptimizedMix({}, 0.0, {})
+        diagnostics = {
+            "targets_ppm": targets,
+            "volume_l": float(self.volume_l[index]),
+            "num_plants": int(self.num_plants[index]),
+        }
+        return OptimizedMix(schedule, float(self.cost[index]), diagnostics)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a plain dictionary of columns."""
+        return {
+            "plant_type": list(self.plant_type),
+            "stage": list(self.stage),
+            "volume_l": self.volume_l.tolist(),
+            "num_plants": self.num_plants.tolist(),
+            "targets_ppm": {n: self.targets_ppm[:, i].tolist() for i, n in enumerate(self.nutrients)},
+            "schedule": {p: self.grams[:, i].tolist() for i, p in enumerate(self.products)},
+            "cost": self.cost.tolist(),
+        }
+
+
+def _conversion(
+    nutrients: Sequence[str],
+    ferts: Mapping[str, str],
+    purity_overrides: Mapping[str, float] | None,
+) -> tuple[tuple[str, ...], np.ndarray]:
+    """Return products for ``nutrients`` and grams of product per mg of nutrient."""
+
+    products = tuple(dict.fromkeys(ferts[n] for n in nutrients if ferts.get(n)))
+    conversion = np.zeros((len(nutrients), len(products)))
+    for j, nutrient in enumerate(nutrients):
+        fert = ferts.get(nutrient)
+        if fert:
+            conversion[j, products.index(fert)] = 1 / 1000 / _nutrient_purity(fert, nutrient, purity_overrides)
+    return products, conversion
+
+
+def _batch_cost(products: Sequence[str], grams: np.ndarray) -> np.ndarray:
+    """Return the rounded cost of each row of ``grams`` (rows × ``products``)."""
+
+    from ..catalog import CATALOG
+    from ..fertilizer_formulator import estimate_mix_cost
+
+    price_per_gram = CATALOG.cost_matrix().price_per_gram
+    prices = np.array([price_per_gram.get(p, np.nan) for p in products])
+    unpriced = np.isnan(prices)
+    if unpriced.any():
+        used = (grams[:, unpriced] > 0).any(axis=0)
+        for product in np.array(products, dtype=object)[unpriced][used]:
+            estimate_mix_cost({product: 1.0})  # raises the usual KeyError
+    return np.round(np.where(grams > 0, grams, 0.0) @ np.nan_to_num(prices), 2)
+
+
+_ROW_FIELDS = ("plant_type", "stage", "volume_l", "ph", "root_temp_c", "num_plants")
+
+
+def _normalize_row(row: Mapping[str, Any] | Sequence[Any]) -> tuple:
+    if isinstance(row, Mapping):
+        values = [row.get(field) for field in _ROW_FIELDS]
+    else:
+        values = list(row) + [None] * (len(_ROW_FIELDS) - len(row))
+    plant_type, stage, volume_l, ph, root_temp_c, num_plants = values[: len(_ROW_FIELDS)]
+    volume_l = float(volume_l) if volume_l is not None else 0.0
+    num_plants = 1 if num_plants is None else int(num_plants)
+    if volume_l <= 0:
+        raise ValueError("volume_l must be positive")
+    if num_plants <= 0:
+        raise ValueError("num_plants must be positive")
+    return plant_type, stage, volume_l, ph, root_temp_c, num_plants
+
+
+def optimize_mix_batch(
+    rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+    *,
+    use_synergy: bool = False,
+    fertilizers: Mapping[str, str] | None = None,
+    purity_overrides: Mapping[str, float] | None = None,
+) -> BatchMixPlan:
+    """Plan fertigation mixes for many zones and stages in one pass.
+
+    ``rows`` holds ``(plant_type, stage, volume_l, ph, root_temp_c, num_plants)``
+    tuples or mappings with those keys; ``ph``, ``root_temp_c`` and
+    ``num_plants`` are optional. Each distinct guideline set is resolved once
+    and product purities and prices are looked up once for the whole batch, so
+    row ``i`` matches ``optimize_mix`` for the same arguments up to gram
+    rounding.
+    """
+
+    table = [_normalize_row(row) for row in rows]
+    ferts = fertilizers or DEFAULT_FERTILIZERS
+
+    guideline_keys = list(dict.fromkeys((r[0], r[1], r[3], r[4]) for r in table))
+    guidelines = [
+        get_environment_adjusted_levels(
+            plant_type,
+            stage,
+            ph=ph,
+            root_temp_c=root_temp_c,
+            synergy=use_synergy,
+        )
+        for plant_type, stage, ph, root_temp_c in guideline_keys
+    ]
+    nutrients = tuple(dict.fromkeys(n for levels in guidelines for n in levels))
+    products, conversion = _conversion(nutrients, ferts, purity_overrides)
+
+    # ppm per unique guideline set, and grams of product per mg of nutrient.
+    targets = np.full((len(guidelines), len(nutrients)), np.nan)
+    for i, levels in enumerate(guidelines):
+        for j, nutrient in enumerate(nutrients):
+            if nutrient in levels:
+                targets[i, j] = levels[nutrient]
+
+    index = {key: i for i, key in enumerate(guideline_keys)}
+    row_group = np.array([index[(r[0], r[1], r[3], r[4])] for r in table], dtype=int)
+    volume = np.array([r[2] for r in table], dtype=float)
+    plants = np.array([r[5] for r in table], dtype=int)
+    row_targets = targets[row_group] if table else np.empty((0, len(nutrients)))
+
+    mg = np.nan_to_num(row_targets) * (volume * plants)[:, None]
+    grams = np.round(mg @ conversion, 3)
+    cost = _batch_cost(products, grams)
+
+    return BatchMixPlan(
+        [r[0] for r in table],
+        [r[1] for r in table],
+        volume,
+        plants,
+        nutrients,
+        row_targets,
+        products,
+        grams,
+        cost,
+    )
+
+
+def estimate_cycle_cost_batch(
+    rows: Iterable[str | Mapping[str, Any] | Sequence[Any]],
+    *,
+    fertilizers: Mapping[str, str] | None = None,
+    purity_overrides: Mapping[str, float] | None = None,
+) -> np.ndarray:
+    """Return whole-cycle fertilizer cost for many plantings in one pass.
+
+    ``rows`` holds plant type strings, ``(plant_type, num_plants)`` tuples or
+    mappings with those keys. Cycle uptake is totalled once per plant type and
+    purities and prices are looked up once for the batch, so entry ``i``
+    matches ``estimate_cycle_cost`` for the same arguments up to gram
+    rounding.
+    """
+
+    table = []
+    for row in rows:
+        if isinstance(row, str):
+            row = (row,)
+        if isinstance(row, Mapping):
+            plant_type, num_plants = row.get("plant_type"), row.get("num_plants")
+        else:
+            plant_type, num_plants = (list(row) + [None])[:2]
+        num_plants = 1 if num_plants is None else int(num_plants)
+        if num_plants <= 0:
+            raise ValueError("num_plants must be positive")
+        table.append((plant_type, num_plants))
+    ferts = fertilizers or DEFAULT_FERTILIZERS
+
+    plant_types = list(dict.fromkeys(plant_type for plant_type, _ in table))
+    uptake = [estimate_total_uptake(plant_type) for plant_type in plant_types]
+    nutrients = tuple(dict.fromkeys(n for totals in uptake for n in totals))
+    products, conversion = _conversion(nutrients, ferts, purity_overrides)
+
+    totals = np.zeros((len(plant_types), len(nutrients)))
+    for i, per_type in enumerate(uptake):
+        for j, nutrient in enumerate(nutrients):
+            totals[i, j] = per_type.get(nutrient, 0.0)
+    index = {plant_type: i for i, plant_type in enumerate(plant_types)}
+    row_type = np.array([index[plant_type] for plant_type, _ in table], dtype=int)
+    plants = np.array([num_plants for _, num_plants in table], dtype=float)
+
+    mg = totals[row_type] * plants[:, None] if table else np.empty((0, len(nutrients)))
+    return _batch_cost(products, np.round(mg @ conversion, 3))
+
+
+def generate_cycle_fertigation_plans(
+    plant_types: Iterable[str],
+    purity: Mapping[str, float] | None = None,
+    *,
+    product: str | None = None,
+) -> dict[str, dict[str, dict[int, dict[str, float]]]]:
+    """Return ``generate_cycle_fertigation_plan`` results for many plant types.
+
+    Every day of a stage uses the same irrigation volume and therefore the
+    same schedule, so each ``(plant_type, stage)`` schedule is computed once
+    and copied to its days. Repeated plant types are planned once.
+    """
+
+    from ..engine.plant_engine.growth_stage import get_stage_duration, list_growth_stages
+    from ..engine.plant_engine.irrigation_manager import get_daily_irrigation_target
+
+    plans: dict[str, dict[str, dict[int, dict[str, float]]]] = {}
+    for plant_type in dict.fromkeys(plant_types):
+        cycle_plan: dict[str, dict[int, dict[str, float]]] = {}
+        for stage in list_growth_stages(plant_type):
+            days = get_stage_duration(plant_type, stage)
+            if not days:
+                continue
+            daily_ml = get_daily_irrigation_target(plant_type, stage)
+            if daily_ml <= 0:
+                cycle_plan[stage] = {}
+                continue
+            schedule = recommend_fertigation_schedule(plant_type, stage, daily_ml / 1000, purity, product=product)
+            cycle_plan[stage] = {day: dict(schedule) for day in range(1, days + 1)}
+        plans[plant_type] = cycle_plan
+    return plans
+
+
+__all__ = [
+    "optimize_mix",
+    "optimize_mix_batch",
+    "estimate_cycle_cost_batch",
+    "generate_cycle_fertigation_plans",
+    "OptimizedMix",
+    "BatchMixPlan",
+]
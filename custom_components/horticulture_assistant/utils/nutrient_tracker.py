@@ -1,9 +1,15 @@
-"""Utilities for tracking nutrient applications and generating summaries."""
+"""Utilities for tracking nutrient applications and generating summaries.
+
+:class:`NutrientTracker` keeps a running ``(plant_id, day)`` index of
+delivered milligrams so daily totals are read in constant time, and notifies
+registered listeners whenever a delivery is added.
+"""
 
 import json
 from collections import defaultdict
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import asdict, dataclass, field
+from datetime import date as date_cls
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -74,6 +80,61 @@ class NutrientDeliveryRecord:
         )
 
 
+DeliveryListener = Callable[[str | None, date_cls | None, Mapping[str, float]], None]
+
+
+class _DeliveryLog(list):
+    """List of delivery records that keeps its tracker's index current.
+
+    Appends are indexed incrementally; any other mutation triggers a rebuild
+    so records added directly to ``delivery_log`` are never missed.
+    """
+
+    __slots__ = ("_on_add", "_on_reset")
+
+    def __init__(self, on_add, on_reset, records: Iterable[NutrientDeliveryRecord] = ()) -> None:
+        super().__init__(records)
+        self._on_add = on_add
+        self._on_reset = on_reset
+
+    def append(self, record: NutrientDeliveryRecord) -> None:
+        super().append(record)
+        self._on_add(record)
+
+    def extend(self, records: Iterable[NutrientDeliveryRecord]) -> None:
+        for record in records:
+            self.append(record)
+
+    def __iadd__(self, records):
+        self.extend(records)
+        return self
+
+    def insert(self, index, record) -> None:
+        super().insert(index, record)
+        self._on_add(record)
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._on_reset()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._on_reset()
+
+    def pop(self, index=-1):
+        record = super().pop(index)
+        self._on_reset()
+        return record
+
+    def remove(self, record) -> None:
+        super().remove(record)
+        self._on_reset()
+
+    def clear(self) -> None:
+        super().clear()
+        self._on_reset()
+
+
 @dataclass(slots=True)
 class NutrientTracker:
     """Track nutrient deliveries and summarize totals."""
@@ -81,12 +142,66 @@ class NutrientTracker:
     product_profiles: dict[str, ProductNutrientProfile] = field(default_factory=dict)
     delivery_log: list[NutrientDeliveryRecord] = field(default_factory=list)
     _log_by_plant: dict[str, list[NutrientDeliveryRecord]] = field(default_factory=lambda: defaultdict(list))
+    _daily: dict[tuple[str, date_cls], dict[str, float]] = field(default_factory=dict)
+    _days_by_plant: dict[str, list[date_cls]] = field(default_factory=lambda: defaultdict(list))
+    _ppm_totals: dict[str, dict[str, float]] = field(default_factory=dict)
+    _listeners: list[DeliveryListener] = field(default_factory=list, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.delivery_log = _DeliveryLog(self._index_record, self._reindex, self.delivery_log)
+        self._reindex()
 
     def register_product(self, profile: ProductNutrientProfile) -> None:
         """Register a nutrient profile so it can be referenced by ``log_delivery``."""
 
         self.product_profiles[profile.product_id] = profile
 
+    def add_listener(self, listener: DeliveryListener) -> Callable[[], None]:
+        """Call ``listener(plant_id, day, totals_mg)`` after each delivery.
+
+        When the log is rebuilt (loaded, cleared or edited in place) listeners
+        are called once with ``plant_id`` and ``day`` set to ``None`` and empty
+        totals. Listeners run synchronously in the caller's thread. Returns a
+        function that removes the listener.
+        """
+
+        self._listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove
+
+    def _index_record(self, record: NutrientDeliveryRecord) -> None:
+        plant_id = record.plant_id
+        day = record.timestamp.date()
+        self._log_by_plant[plant_id].append(record)
+        totals = self._daily.get((plant_id, day))
+        if totals is None:
+            totals = self._daily[(plant_id, day)] = {}
+            self._days_by_plant[plant_id].append(day)
+        ppm_totals = self._ppm_totals.setdefault(plant_id, {})
+        for element, ppm in record.ppm_delivered.items():
+            totals[element] = totals.get(element, 0.0) + ppm * record.volume_l
+            ppm_totals[element] = ppm_totals.get(element, 0.0) + ppm
+        for listener in list(self._listeners):
+            listener(plant_id, day, totals)
+
+    def _reindex(self) -> None:
+        self._log_by_plant.clear()
+        self._daily.clear()
+        self._days_by_plant.clear()
+        self._ppm_totals.clear()
+        listeners, self._listeners = self._listeners, []
+        try:
+            for record in self.delivery_log:
+                self._index_record(record)
+        finally:
+            self._listeners = listeners
+        for listener in list(listeners):
+            listener(None, None, {})
+
     def log_delivery(self, plant_id: str, batch_id: str, product_id: str, dose_g: float, volume_l: float) -> None:
         """Log a nutrient application for ``plant_id``."""
 
@@ -104,7 +219,6 @@ class NutrientTracker:
             volume_l=volume_l,
         )
         self.delivery_log.append(record)
-        self._log_by_plant[plant_id].append(record)
 
     def save_log(self, path: str) -> None:
         """Save delivery log to ``path`` as JSON."""
@@ -117,31 +231,37 @@ class NutrientTracker:
         if not p.is_file():
             return
         records = json.loads(p.read_text(encoding="utf-8"))
-        self.delivery_log.clear()
-        self._log_by_plant.clear()
-        for item in records:
-            rec = NutrientDeliveryRecord.from_dict(item)
-            self.delivery_log.append(rec)
-            self._log_by_plant[rec.plant_id].append(rec)
+        self.delivery_log = _DeliveryLog(
+            self._index_record,
+            self._reindex,
+            (NutrientDeliveryRecord.from_dict(item) for item in records),
+        )
+        self._reindex()
 
     def _records_for(self, plant_id: str | None) -> Iterable[NutrientDeliveryRecord]:
         """Return delivery records optionally filtered by ``plant_id``."""
 
         if plant_id is None:
             return self.delivery_log
+        return self._log_by_plant.get(plant_id, ())
 
-        stored = self._log_by_plant.get(plant_id)
-        actual_count = sum(1 for r in self.delivery_log if r.plant_id == plant_id)
-        if stored is None or len(stored) != actual_count:
-            stored = [r for r in self.delivery_log if r.plant_id == plant_id]
-            self._log_by_plant[plant_id] = stored
-        return stored
+    def daily_totals(self, plant_id: str, day: date_cls) -> dict[str, float]:
+        """Return milligrams delivered to ``plant_id`` on ``day``."""
+
+        return dict(self._daily.get((plant_id, day), {}))
+
+    def daily_nutrient_mg(self, plant_id: str, day: date_cls, element: str) -> float:
+        """Return milligrams of ``element`` delivered to ``plant_id`` on ``day``."""
+
+        return self._daily.get((plant_id, day), {}).get(element, 0.0)
 
     def summarize_nutrients(self, plant_id: str | None = None) -> dict[str, float]:
         """Return total ppm delivered across all logged applications."""
 
+        if plant_id is not None:
+            return dict(self._ppm_totals.get(plant_id, {}))
         summary: dict[str, float] = defaultdict(float)
-        for record in self._records_for(plant_id):
+        for record in self.delivery_log:
             for element, ppm in record.ppm_delivered.items():
                 summary[element] += ppm
         return dict(summary)
@@ -149,12 +269,13 @@ class NutrientTracker:
     def summarize_mg_for_day(self, date: datetime, plant_id: str | None = None) -> dict[str, float]:
         """Return total milligrams delivered on ``date``."""
 
+        day = date.date()
+        if plant_id is not None:
+            return self.daily_totals(plant_id, day)
         summary: dict[str, float] = defaultdict(float)
-        for record in self._records_for(plant_id):
-            if record.timestamp.date() != date.date():
-                continue
-            for element, ppm in record.ppm_delivered.items():
-                summary[element] += ppm * record.volume_l
+        for pid in self._days_by_plant:
+            for element, mg in self._daily.get((pid, day), {}).items():
+                summary[element] += mg
         return dict(summary)
 
     def summarize_mg_for_period(self, start: datetime, end: datetime, plant_id: str | None = None) -> dict[str, float]:
@@ -186,8 +307,12 @@ class NutrientTracker:
     def summarize_daily_totals(self, plant_id: str | None = None) -> dict[str, dict[str, float]]:
         """Return milligram totals grouped by day."""
 
+        if plant_id is not None:
+            return {
+                day.isoformat(): dict(self._daily[(plant_id, day)]) for day in self._days_by_plant.get(plant_id, ())
+            }
         daily: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
-        for record in self._records_for(plant_id):
+        for record in self.delivery_log:
             key = record.timestamp.date().isoformat()
             for element, ppm in record.ppm_delivered.items():
                 daily[key][element] += ppm * record.volume_l
@@ -5,18 +5,25 @@ The :class:`NutrientUseEfficiency` helper keeps track of all fertilizer
 applications for individual plants and aggregates yield data from the default
 ``data/yield_logs.json`` file.  It is intentionally decoupled from Home
 Assistant so the calculations can be unit tested in isolation.  Usage logs are
-stored in JSON for easy inspection and further analysis.
+stored in JSON for easy inspection and further analysis: new applications are
+appended to a per-plant JSON-lines journal next to the main log file and folded
+back into it by :meth:`NutrientUseEfficiency.compact` once the journals grow
+past :data:`COMPACT_AFTER_LINES` lines.
 """
 
 import json
 import logging
+import math
 import os
+import re
+from bisect import bisect_right
 from collections.abc import Mapping
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Optional
 
 from ..engine.plant_engine.utils import load_dataset
+from .json_io import load_json_snapshot, save_json_snapshot
 from .path_utils import config_path, data_path
 from .plant_registry import PLANT_REGISTRY_FILE
 
@@ -31,6 +38,10 @@ _LOGGER = logging.getLogger(__name__)
 EFFICIENCY_TARGET_FILE = "nutrients/nutrient_efficiency_targets.json"
 _EFFICIENCY_TARGETS: dict[str, dict[str, float]] = load_dataset(EFFICIENCY_TARGET_FILE)
 
+# Journal lines accumulated (replayed or appended) before they are folded into
+# the main log file.
+COMPACT_AFTER_LINES = 1000
+
 
 @dataclass(slots=True)
 class ApplicationRecord:
@@ -146,6 +157,86 @@ def efficiency_report(efficiency: Mapping[str, float], plant_type: str) -> dict[
     return report
 
 
+def _parse_day(value: object) -> date | None:
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+class _PlantLedger:
+    """Date-sorted, columnar application ledger for one plant.
+
+    Rows are kept in date order by bisect insertion and every append updates
+    the per-week, per-month and per-stage rollups, so summaries never rescan
+    the ledger.
+    """
+
+    __slots__ = ("columns", "days", "month", "stage", "stages", "totals", "undated", "week")
+
+    def __init__(self) -> None:
+        self.days: list[int] = []
+        self.stages: list[str] = []
+        # Nutrient columns aligned with ``days``; NaN marks "not applied".
+        self.columns: dict[str, list[float]] = {}
+        self.undated: list[dict[str, object]] = []
+        self.totals: dict[str, float] = {}
+        self.week: dict[str, dict[str, float]] = {}
+        self.month: dict[str, dict[str, float]] = {}
+        self.stage: dict[str, dict[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def add(
+        self,
+        day: date | None,
+        nutrients: Mapping[str, float],
+        stage: str,
+        raw_date: object = None,
+    ) -> None:
+        for nutrient, amount in nutrients.items():
+            self.totals[nutrient] = self.totals.get(nutrient, 0.0) + amount
+        if day is None:
+            # Undated rows count towards totals only, matching the old summaries.
+            self.undated.append({"date": raw_date, "nutrients": dict(nutrients), "stage": stage})
+            return
+        ordinal = day.toordinal()
+        index = bisect_right(self.days, ordinal)
+        self.days.insert(index, ordinal)
+        self.stages.insert(index, stage)
+        for nutrient in nutrients.keys() - self.columns.keys():
+            self.columns[nutrient] = [math.nan] * (len(self.days) - 1)
+        for nutrient, column in self.columns.items():
+            column.insert(index, nutrients.get(nutrient, math.nan))
+
+        year, week_num, _ = day.isocalendar()
+        for table, key in (
+            (self.week, f"{year}-W{week_num:02d}"),
+            (self.month, f"{day.year}-{day.month:02d}"),
+            (self.stage, stage),
+        ):
+            bucket = table.setdefault(key, {})
+            for nutrient, amount in nutrients.items():
+                bucket[nutrient] = bucket.get(nutrient, 0.0) + amount
+
+    def records(self) -> list[dict[str, object]]:
+        """Return rows as plain dictionaries in date order, undated rows last."""
+
+        rows: list[dict[str, object]] = []
+        for index, ordinal in enumerate(self.days):
+            nutrients = {n: col[index] for n, col in self.columns.items() if not math.isnan(col[index])}
+            rows.append(
+                {
+                    "date": date.fromordinal(ordinal).isoformat(),
+                    "nutrients": nutrients,
+                    "stage": self.stages[index],
+                }
+            )
+        rows.extend(self.undated)
+        return rows
+
+
 class NutrientUseEfficiency:
     """Track fertilizer usage and calculate nutrient use efficiency."""
 
@@ -165,24 +256,28 @@ class NutrientUseEfficiency:
         self._data_file = data_file
         self._hass = hass
         # Internal logs
-        self._usage_logs: dict[str, list[dict]] = {}
+        self._ledgers: dict[str, _PlantLedger] = {}
+        self._registry_cache: tuple[str, float, dict] | None = None
+        self._journal_seq = 0
+        self._journal_lines = 0
         self.application_log: dict[str, dict[str, float]] = {}
         self.tissue_log: dict[str, dict[str, float]] = {}
         self.yield_log: dict[str, float] = {}
-        # Load existing usage logs from file if available
+        # Load the compacted log, then replay per-plant journals written since.
         try:
-            with open(self._data_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data, self._journal_seq = load_json_snapshot(self._data_file)
             if isinstance(data, dict):
                 for pid, entries in data.items():
                     if isinstance(entries, list):
-                        self._usage_logs[pid] = entries
+                        for record in entries:
+                            if isinstance(record, Mapping):
+                                self._load_record(pid, record)
                     else:
                         _LOGGER.warning(
                             "Nutrient use log for plant %s is not a list; resetting to empty list.",
                             pid,
                         )
-                        self._usage_logs[pid] = []
+                        self._ledger(pid)
             else:
                 _LOGGER.warning(
                     "Nutrient use log file format invalid (expected dict at top level); starting with empty log."
@@ -204,24 +299,9 @@ class NutrientUseEfficiency:
                 self._data_file,
                 e,
             )
-        # Build application_log totals from loaded records
-        for pid, entries in self._usage_logs.items():
-            total_nutrients: dict[str, float] = {}
-            for record in entries:
-                nutrients = record.get("nutrients", {})
-                for nutrient, amt in nutrients.items():
-                    try:
-                        amt_val = float(amt)
-                    except (ValueError, TypeError):
-                        _LOGGER.warning(
-                            "Invalid nutrient amount '%s' for %s in plant %s log; skipping.",
-                            amt,
-                            nutrient,
-                            pid,
-                        )
-                        continue
-                    total_nutrients[nutrient] = total_nutrients.get(nutrient, 0.0) + amt_val
-            self.application_log[pid] = total_nutrients
+        self._replay_journals()
+        if self._journal_lines >= COMPACT_AFTER_LINES:
+            self.compact()
         # Load existing yield totals from yield tracker logs if available
         try:
             yield_file = data_path(hass, "yield_logs.json")
@@ -274,6 +354,94 @@ class NutrientUseEfficiency:
             return value.isoformat()
         return str(value)
 
+    @property
+    def _journal_dir(self) -> str:
+        """Directory holding append-only per-plant journals."""
+        return os.path.splitext(self._data_file)[0]
+
+    def _journal_path(self, plant_id: str) -> str:
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", plant_id)
+        return os.path.join(self._journal_dir, f"{safe}.jsonl")
+
+    def _ledger(self, plant_id: str) -> _PlantLedger:
+        ledger = self._ledgers.get(plant_id)
+        if ledger is None:
+            ledger = self._ledgers[plant_id] = _PlantLedger()
+            self.application_log[plant_id] = ledger.totals
+        return ledger
+
+    def _load_record(self, plant_id: str, record: Mapping[str, object]) -> None:
+        nutrients: dict[str, float] = {}
+        raw = record.get("nutrients", {})
+        for nutrient, amt in raw.items() if isinstance(raw, Mapping) else ():
+            try:
+                nutrients[nutrient] = float(amt)
+            except (ValueError, TypeError):
+                _LOGGER.warning(
+                    "Invalid nutrient amount '%s' for %s in plant %s log; skipping.",
+                    amt,
+                    nutrient,
+                    plant_id,
+                )
+        day = _parse_day(record.get("date"))
+        if day is None:
+            _LOGGER.warning("Invalid date format '%s' in logs for plant %s", record.get("date"), plant_id)
+        self._ledger(plant_id).add(day, nutrients, str(record.get("stage", "unknown")), record.get("date"))
+
+    def _replay_journals(self) -> None:
+        folded = self._journal_seq
+        try:
+            names = sorted(os.listdir(self._journal_dir))
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith(".jsonl"):
+                continue
+            path = os.path.join(self._journal_dir, name)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            _LOGGER.warning("Skipping corrupt nutrient journal line in %s", path)
+                            continue
+                        if not isinstance(record, Mapping) or not record.get("plant_id"):
+                            continue
+                        seq = record.get("seq", 0)
+                        seq = seq if isinstance(seq, int) else 0
+                        self._journal_seq = max(self._journal_seq, seq)
+                        if seq and seq <= folded:
+                            # Already folded by a compaction that stopped
+                            # before it could remove this journal.
+                            continue
+                        self._load_record(str(record["plant_id"]), record)
+                        self._journal_lines += 1
+            except OSError as e:
+                _LOGGER.error("Error reading nutrient journal %s: %s", path, e)
+
+    def _registry_stage(self, plant_id: str) -> str | None:
+        """Return the current stage from the plant registry, re-reading it only when it changes."""
+        reg_path = config_path(self._hass, PLANT_REGISTRY_FILE) if self._hass is not None else PLANT_REGISTRY_FILE
+        try:
+            mtime = os.stat(reg_path).st_mtime
+        except OSError:
+            return None
+        cached = self._registry_cache
+        if cached is None or cached[0] != reg_path or cached[1] != mtime:
+            try:
+                with open(reg_path, encoding="utf-8") as rf:
+                    reg_data = json.load(rf)
+            except Exception:
+                reg_data = {}
+            self._registry_cache = cached = (reg_path, mtime, reg_data if isinstance(reg_data, dict) else {})
+        meta = cached[2].get(plant_id)
+        if not isinstance(meta, Mapping):
+            return None
+        return meta.get("current_lifecycle_stage") or meta.get("lifecycle_stage")
+
     def log_fertilizer_application(
         self,
         plant_id: str,
@@ -289,20 +457,8 @@ class NutrientUseEfficiency:
         :param stage: Lifecycle stage of the plant at time of application (optional).
         """
         date_str = self._format_date(entry_date)
-        # Determine stage name
-        stage_name = stage
-        if stage_name is None:
-            # Try to retrieve current stage from plant registry if available
-            reg_path = config_path(self._hass, PLANT_REGISTRY_FILE) if self._hass is not None else PLANT_REGISTRY_FILE
-            try:
-                with open(reg_path, encoding="utf-8") as rf:
-                    reg_data = json.load(rf)
-                if plant_id in reg_data:
-                    stage_name = reg_data[plant_id].get("current_lifecycle_stage") or reg_data[plant_id].get(
-                        "lifecycle_stage"
-                    )
-            except Exception:
-                stage_name = None
+        # Determine stage name, falling back to the plant registry
+        stage_name = stage if stage is not None else self._registry_stage(plant_id)
         if stage_name is None:
             stage_name = "unknown"
         # Convert nutrient amounts to float and validate
@@ -314,23 +470,9 @@ class NutrientUseEfficiency:
                 _LOGGER.error("Invalid nutrient amount for %s in plant %s: %s", nut, plant_id, amt)
                 return
             nutrient_mass_clean[nut] = amt_val
-        # Create entry
         entry = {"date": date_str, "nutrients": nutrient_mass_clean, "stage": stage_name}
-        # Append entry to logs and maintain chronological order
-        if plant_id not in self._usage_logs:
-            self._usage_logs[plant_id] = []
-        self._usage_logs[plant_id].append(entry)
-        try:
-            self._usage_logs[plant_id].sort(key=lambda x: x.get("date", ""))
-        except Exception as e:
-            _LOGGER.warning("Failed to sort nutrient entries for plant %s: %s", plant_id, e)
-        # Update running total for each nutrient
-        if plant_id not in self.application_log:
-            self.application_log[plant_id] = {}
-        for nut, amt_val in nutrient_mass_clean.items():
-            self.application_log[plant_id][nut] = self.application_log[plant_id].get(nut, 0.0) + amt_val
-        # Persist to file
-        self._save_to_file()
+        self._ledger(plant_id).add(_parse_day(date_str), nutrient_mass_clean, stage_name, date_str)
+        self._append_to_journal(plant_id, entry)
         _LOGGER.info(
             "Fertilizer application logged for plant %s: %s on %s (stage: %s)",
             plant_id,
@@ -444,73 +586,72 @@ class NutrientUseEfficiency:
                  and values are dicts of total nutrient applied in that period.
         """
         group_by = str(by).lower()
-        if plant_id not in self._usage_logs or not self._usage_logs[plant_id]:
+        if group_by not in ("week", "month", "stage"):
+            raise ValueError(f"Invalid summary grouping: {by}. Use 'week', 'month', or 'stage'.")
+        ledger = self._ledgers.get(plant_id)
+        if ledger is None or not ledger:
             return {}
-        summary: dict[str, dict[str, float]] = {}
-        for entry in self._usage_logs[plant_id]:
-            date_str = entry.get("date")
-            # Parse date string to date object for grouping
-            try:
-                entry_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            except Exception as e:
-                _LOGGER.warning("Invalid date format '%s' in logs for plant %s: %s", date_str, plant_id, e)
-                continue
-            if group_by == "week":
-                year, week_num, _ = entry_date.isocalendar()
-                key = f"{year}-W{week_num:02d}"
-            elif group_by == "month":
-                key = f"{entry_date.year}-{entry_date.month:02d}"
-            elif group_by == "stage":
-                key = entry.get("stage", "unknown")
-            else:
-                raise ValueError(f"Invalid summary grouping: {by}. Use 'week', 'month', or 'stage'.")
-            # Aggregate nutrient amounts
-            if key not in summary:
-                summary[key] = {}
-            for nut, amt in entry.get("nutrients", {}).items():
-                try:
-                    amt_val = float(amt)
-                except (ValueError, TypeError):
-                    amt_val = 0.0
-                summary[key][nut] = summary[key].get(nut, 0.0) + amt_val
-        return summary
+        table = getattr(ledger, group_by)
+        keys = sorted(table) if group_by != "stage" else list(table)
+        return {key: dict(table[key]) for key in keys}
 
     def average_weekly_usage(self, plant_id: str) -> dict[str, float]:
         """Return average weekly nutrient application for ``plant_id``."""
 
-        if plant_id not in self._usage_logs or not self._usage_logs[plant_id]:
+        ledger = self._ledgers.get(plant_id)
+        if ledger is None or not ledger:
             return {}
 
-        records = [ApplicationRecord.from_dict(e) for e in self._usage_logs[plant_id]]
-        records.sort(key=lambda r: r.date)
-        start = records[0].date
-        end = records[-1].date
-        weeks = max(1, ((end - start).days // 7) + 1)
+        weeks = max(1, ((ledger.days[-1] - ledger.days[0]) // 7) + 1)
         totals: dict[str, float] = {}
-        for rec in records:
-            for nutrient, amt in rec.nutrients.items():
+        for bucket in ledger.week.values():
+            for nutrient, amt in bucket.items():
                 totals[nutrient] = totals.get(nutrient, 0.0) + amt
         return {n: round(v / weeks, 2) for n, v in totals.items()}
 
-    def _save_to_file(self) -> None:
-        """Persist usage logs to ``self._data_file``."""
-        os.makedirs(os.path.dirname(self._data_file) or ".", exist_ok=True)
+    def _append_to_journal(self, plant_id: str, entry: Mapping[str, object]) -> None:
+        """Append ``entry`` to the plant's journal without touching other plants."""
+        path = self._journal_path(plant_id)
+        self._journal_seq += 1
+        line = {"plant_id": plant_id, "seq": self._journal_seq, **entry}
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(line, separators=(",", ":")) + "\n")
+        except Exception as e:
+            _LOGGER.error("Failed to append nutrient use log to %s: %s", path, e)
+            return
+        self._journal_lines += 1
+        if self._journal_lines >= COMPACT_AFTER_LINES:
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold per-plant journals into the main log file and remove them.
+
+        The main file is replaced atomically and a ``.seq`` sidecar records
+        the last journal sequence number it contains, so a crash before the
+        journals are removed cannot replay their lines twice.
+        """
+        if not self._save_to_file():
+            return
+        self._journal_lines = 0
+        try:
+            names = os.listdir(self._journal_dir)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(".jsonl"):
+                try:
+                    os.remove(os.path.join(self._journal_dir, name))
+                except OSError as e:
+                    _LOGGER.error("Failed to remove nutrient journal %s: %s", name, e)
+
+    def _save_to_file(self) -> bool:
+        """Persist usage logs to ``self._data_file`` and return ``True`` on success."""
         try:
-            with open(self._data_file, "w", encoding="utf-8") as f:
-                serializable = {}
-                for pid, entries in self._usage_logs.items():
-                    out: list[dict[str, object]] = []
-                    for e in entries:
-                        if isinstance(e, dict):
-                            out.append(e)
-                        elif isinstance(e, ApplicationRecord):
-                            out.append(e.as_dict())
-                        else:
-                            try:
-                                out.append(asdict(e))
-                            except Exception:
-                                continue
-                    serializable[pid] = out
-                json.dump(serializable, f, indent=2)
+            serializable = {pid: ledger.records() for pid, ledger in self._ledgers.items()}
+            save_json_snapshot(self._data_file, serializable, self._journal_seq)
         except Exception as e:
             _LOGGER.error("Failed to write nutrient use logs to %s: %s", self._data_file, e)
+            return False
+        return True
@@ -0,0 +1,145 @@
+"""Lightweight timing counters for expensive integration operations.
+
+Instrumented code calls :func:`timed` (as a decorator) or :func:`measure`
+(as a context manager) with a dotted operation name such as
+``"resolver.resolve_profile"``. Recording a call costs two
+``perf_counter`` reads and a deque append. Percentiles are only computed when
+:func:`snapshot` is read, for example by diagnostics or system health.
+
+Counts, error counts, the total and the maximum cover every call since
+start-up or the last :func:`reset`. Percentiles cover the most recent
+:data:`WINDOW_SIZE` calls of each operation.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+__all__ = ["WINDOW_SIZE", "measure", "record", "reset", "snapshot", "timed"]
+
+WINDOW_SIZE = 256
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _OperationStats:
+    __slots__ = ("count", "errors", "total", "max", "recent")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: deque[float] = deque(maxlen=WINDOW_SIZE)
+
+    def add(self, seconds: float, error: bool) -> None:
+        self.count += 1
+        if error:
+            self.errors += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.recent.append(seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.recent)
+
+        def _pct(q: float) -> float:
+            rank = min(len(ordered), max(1, math.ceil(q * len(ordered))))
+            return round(ordered[rank - 1] * 1000, 2)
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total * 1000, 1),
+            "mean_ms": round(self.total / self.count * 1000, 2),
+            "p50_ms": _pct(0.5),
+            "p95_ms": _pct(0.95),
+            "p99_ms": _pct(0.99),
+            "max_ms": round(self.max * 1000, 2),
+        }
+
+
+_STATS: dict[str, _OperationStats] = {}
+
+
+def record(name: str, seconds: float, *, error: bool = False) -> None:
+    """Record one call of ``name`` that took ``seconds``."""
+
+    stats = _STATS.get(name)
+    if stats is None:
+        stats = _STATS[name] = _OperationStats()
+    stats.add(seconds, error)
+
+
+class _Measure:
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> _Measure:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        record(self.name, time.perf_counter() - self._start, error=exc_type is not None)
+
+
+def measure(name: str) -> _Measure:
+    """Return a context manager recording the duration of its block under ``name``."""
+
+    return _Measure(name)
+
+
+def timed(name: str) -> Callable[[_F], _F]:
+    """Decorate a function or coroutine function to record each call."""
+
+    def decorator(func: _F) -> _F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                error = True
+                try:
+                    result = await func(*args, **kwargs)
+                    error = False
+                    return result
+                finally:
+                    record(name, time.perf_counter() - start, error=error)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            error = True
+            try:
+                result = func(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                record(name, time.perf_counter() - start, error=error)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Return aggregated statistics keyed by operation name."""
+
+    return {name: _STATS[name].as_dict() for name in sorted(_STATS)}
+
+
+def reset() -> None:
+    """Forget every recorded call."""
+
+    _STATS.clear()
@@ -0,0 +1,201 @@
+"""Bounded-memory streaming quantile estimation.
+
+:class:`QuantileSketch` keeps the first ``exact_size`` samples verbatim and
+answers exact nearest-rank quantiles from them. Once that buffer overflows the
+samples are folded into logarithmic buckets (a DDSketch): each bucket covers
+values within a relative factor ``gamma = (1 + alpha) / (1 - alpha)``.
+
+Error bound: for any ``q`` the reported value is within ``alpha`` relative
+error of the exact nearest-rank quantile of every sample seen, i.e.
+``|estimate - exact| <= alpha * |exact|``. Values whose magnitude is below
+``min_value`` share a zero bucket, adding at most ``min_value`` absolute
+error. The bound holds while the sketch uses at most ``max_buckets`` buckets,
+which covers magnitudes from ``min_value`` up to ``min_value * gamma **
+max_buckets`` (about 7e5 with the defaults). Beyond that the buckets nearest
+zero are merged. The smallest and largest samples are always exact.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+__all__ = ["QuantileSketch"]
+
+
+class QuantileSketch:
+    """Streaming quantile estimator with a documented relative error bound."""
+
+    __slots__ = (
+        "alpha",
+        "exact_size",
+        "max_buckets",
+        "min_value",
+        "_gamma",
+        "_log_gamma",
+        "_samples",
+        "_pos",
+        "_neg",
+        "_zero",
+        "count",
+        "min",
+        "max",
+    )
+
+    def __init__(
+        self,
+        alpha: float = 0.005,
+        *,
+        exact_size: int = 128,
+        max_buckets: int = 2048,
+        min_value: float = 1e-3,
+    ) -> None:
+        if not 0 < alpha < 1:
+            raise ValueError("alpha must be between 0 and 1")
+        self.alpha = alpha
+        self.exact_size = exact_size
+        self.max_buckets = max_buckets
+        self.min_value = min_value
+        self._gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self._gamma)
+        self._samples: list[float] | None = []
+        self._pos: dict[int, int] = {}
+        self._neg: dict[int, int] = {}
+        self._zero = 0
+        self.count = 0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float) -> None:
+        """Add one sample."""
+
+        value = float(value)
+        if math.isnan(value):
+            return
+        self.count += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self._samples is not None:
+            self._samples.append(value)
+            if len(self._samples) > self.exact_size:
+                samples, self._samples = self._samples, None
+                for sample in samples:
+                    self._bucket(sample)
+            return
+        self._bucket(value)
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add several samples."""
+
+        for value in values:
+            self.add(value)
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _bucket(self, value: float) -> None:
+        if value > self.min_value:
+            key = self._key(value)
+            self._pos[key] = self._pos.get(key, 0) + 1
+        elif value < -self.min_value:
+            key = self._key(-value)
+            self._neg[key] = self._neg.get(key, 0) + 1
+        else:
+            self._zero += 1
+            return
+        if len(self._pos) + len(self._neg) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        """Merge the buckets nearest zero until the bucket budget is met."""
+
+        while len(self._pos) + len(self._neg) > self.max_buckets:
+            candidates = [(min(store), store) for store in (self._pos, self._neg) if len(store) > 1]
+            if not candidates:
+                return
+            lowest, store = min(candidates, key=lambda item: item[0])
+            count = store.pop(lowest)
+            nearest = min(store)
+            store[nearest] += count
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> float | None:
+        """Return the nearest-rank ``q`` quantile, or ``None`` when empty."""
+
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return None
+        rank = min(self.count, max(1, math.ceil(q * self.count)))
+        if rank == 1:
+            return self.min
+        if rank == self.count:
+            return self.max
+        if self._samples is not None:
+            return sorted(self._samples)[rank - 1]
+        seen = 0
+        for key in sorted(self._neg, reverse=True):
+            seen += self._neg[key]
+            if seen >= rank:
+                return self._clamp(-self._value(key))
+        seen += self._zero
+        if seen >= rank:
+            return self._clamp(0.0)
+        for key in sorted(self._pos):
+            seen += self._pos[key]
+            if seen >= rank:
+                return self._clamp(self._value(key))
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot of the sketch."""
+
+        data: dict[str, Any] = {
+            "alpha": self.alpha,
+            "exact_size": self.exact_size,
+            "max_buckets": self.max_buckets,
+            "min_value": self.min_value,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+        }
+        if self._samples is not None:
+            data["samples"] = list(self._samples)
+        else:
+            data["pos"] = {str(k): v for k, v in self._pos.items()}
+            data["neg"] = {str(k): v for k, v in self._neg.items()}
+            data["zero"] = self._zero
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> QuantileSketch:
+        """Rebuild a sketch from :meth:`as_dict` output."""
+
+        sketch = cls(
+            float(data.get("alpha", 0.005)),
+            exact_size=int(data.get("exact_size", 128)),
+            max_buckets=int(data.get("max_buckets", 2048)),
+            min_value=float(data.get("min_value", 1e-3)),
+        )
+        sketch.count = int(data.get("count", 0))
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        if "samples" in data:
+            sketch._samples = [float(v) for v in data["samples"]]
+        else:
+            sketch._samples = None
+            sketch._pos = {int(k): int(v) for k, v in (data.get("pos") or {}).items()}
+            sketch._neg = {int(k): int(v) for k, v in (data.get("neg") or {}).items()}
+            sketch._zero = int(data.get("zero", 0))
+        return sketch
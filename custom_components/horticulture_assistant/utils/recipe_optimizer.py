@@ -1,21 +1,407 @@
 """
 Core module for optimizing fertilizer recipes to meet plant nutrient targets.
+
+Recipes are solved as linear programs over the product × nutrient analysis
+matrix: minimise cost subject to per-nutrient minimum/maximum concentrations
+and per-product solubility limits. Incompatible product pairs are excluded by
+a bounded branch and bound on the LP solution. The solver is a dense two-phase
+simplex written with NumPy so no external optimisation package is required.
+
+Liquid products are dosed in mL: their percentages are by weight, so one mL
+delivers ``density_g_per_ml`` grams of product. Solubility limits and
+incompatible pairs default to the fertilizer catalog when not given.
 """
 
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+_TOL = 1e-9
+# Simplex pivots allowed per tableau row and column before giving up
+_MAX_ITERATIONS = 500
+# LPs solved while branching on incompatible pairs before diving greedily
+_MAX_BRANCH_NODES = 128
+
+
+@dataclass(frozen=True, slots=True)
+class _ProductMatrix:
+    """Products and their nutrient yields per dosing unit (mg per g or mL)."""
+
+    products: tuple[Mapping, ...]
+    names: tuple[str, ...]
+    nutrients: tuple[str, ...]
+    yields: np.ndarray
+    prices: np.ndarray
+    solubility: np.ndarray
+    conflicts: tuple[tuple[int, int], ...]
+
+
+def _product_id(product: Mapping) -> str:
+    return str(product.get("id") or product["name"])
+
 
-def optimize_recipe(plant_profile: dict[str, float], products: list[dict]) -> dict:
+def _build_matrix(
+    products: Sequence[Mapping],
+    nutrients: Iterable[str],
+    solubility: Mapping[str, float] | None,
+    compatibility: Mapping[str, Mapping[str, str]] | None,
+) -> _ProductMatrix:
+    nutrients = tuple(nutrients)
+    usable = [prod for prod in products if float(prod.get("price_per_unit", 0.0) or 0.0) > 0]
+    yields = np.zeros((len(nutrients), len(usable)))
+    column = {nutrient: idx for idx, nutrient in enumerate(nutrients)}
+    for j, prod in enumerate(usable):
+        scale = 10.0  # 1 g at X % yields X * 10 mg
+        if prod.get("form") == "liquid":
+            scale *= float(prod.get("density_g_per_ml", 1.0))
+        for nutrient, pct in (prod.get("analysis") or {}).items():
+            if nutrient in column and pct and pct > 0:
+                yields[column[nutrient], j] = float(pct) * scale
+
+    prices = np.array([float(prod["price_per_unit"]) for prod in usable])
+    solubility = solubility or {}
+    limits = np.full(len(usable), np.inf)
+    for j, prod in enumerate(usable):
+        limit = solubility.get(_product_id(prod))
+        if limit is not None and prod.get("form") != "liquid":
+            limits[j] = float(limit)
+
+    compatibility = compatibility or {}
+    ids = [_product_id(prod) for prod in usable]
+    conflicts = tuple(
+        (i, k)
+        for i in range(len(ids))
+        for k in range(i + 1, len(ids))
+        if ids[k] in compatibility.get(ids[i], {}) or ids[i] in compatibility.get(ids[k], {})
+    )
+    return _ProductMatrix(
+        tuple(usable),
+        tuple(prod["name"] for prod in usable),
+        nutrients,
+        yields,
+        prices,
+        limits,
+        conflicts,
+    )
+
+
+def _pivot(tableau: np.ndarray, basis: list[int], row: int, col: int) -> None:
+    tableau[row] /= tableau[row, col]
+    factors = tableau[:, col].copy()
+    factors[row] = 0.0
+    tableau -= np.outer(factors, tableau[row])
+    basis[row] = col
+
+
+def _run_simplex(tableau: np.ndarray, basis: list[int], n_cols: int) -> bool:
+    """Optimise ``tableau`` in place using Bland's rule; ``False`` if unbounded."""
+
+    for _ in range(_MAX_ITERATIONS * max(tableau.shape[0], n_cols)):
+        reduced = tableau[-1, :n_cols]
+        entering = np.flatnonzero(reduced < -_TOL)
+        if entering.size == 0:
+            return True
+        col = int(entering[0])
+        column = tableau[:-1, col]
+        candidates = np.flatnonzero(column > _TOL)
+        if candidates.size == 0:
+            return False
+        ratios = tableau[candidates, -1] / column[candidates]
+        best = ratios.min()
+        ties = candidates[np.abs(ratios - best) <= _TOL]
+        row = int(min(ties, key=lambda idx: basis[idx]))
+        _pivot(tableau, basis, row, col)
+    raise ValueError("Recipe optimisation did not converge")
+
+
+def _linprog(A: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray | None:
+    """Minimise ``c @ x`` subject to ``A @ x == b`` and ``x >= 0``.
+
+    Returns ``None`` when the problem is infeasible.
     """
-    Generate a fertilizer recipe to meet nutrient targets specified in a plant profile.
+
+    A = A.astype(float, copy=True)
+    b = b.astype(float, copy=True)
+    negative = b < 0
+    A[negative] *= -1
+    b[negative] *= -1
+    m, n = A.shape
+
+    # Phase 1: minimise the sum of artificial variables.
+    tableau = np.zeros((m + 1, n + m + 1))
+    tableau[:m, :n] = A
+    tableau[:m, n : n + m] = np.eye(m)
+    tableau[:m, -1] = b
+    tableau[-1, n : n + m] = 1.0
+    tableau[-1] -= tableau[:m].sum(axis=0)
+    basis = list(range(n, n + m))
+    _run_simplex(tableau, basis, n + m)
+    if -tableau[-1, -1] > 1e-7 * max(1.0, float(b.max(initial=0.0))):
+        return None
+
+    for row, var in enumerate(basis):
+        if var < n:
+            continue
+        pivots = np.flatnonzero(np.abs(tableau[row, :n]) > _TOL)
+        if pivots.size:
+            _pivot(tableau, basis, row, int(pivots[0]))
+
+    # Phase 2: drop artificial columns and optimise the real objective.
+    keep = [row for row, var in enumerate(basis) if var < n]
+    tableau = np.vstack([tableau[keep][:, list(range(n)) + [-1]], np.append(c, 0.0)])
+    basis = [basis[row] for row in keep]
+    for row, var in enumerate(basis):
+        tableau[-1] -= tableau[-1, var] * tableau[row]
+    if not _run_simplex(tableau, basis, n):
+        return None
+
+    x = np.zeros(n)
+    for row, var in enumerate(basis):
+        x[var] = tableau[row, -1]
+    return x
+
+
+def _solve_relaxation(
+    matrix: _ProductMatrix,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    excluded: frozenset[int],
+) -> np.ndarray | None:
+    """Return the cheapest per-litre doses honouring bounds and exclusions."""
+
+    n_products = len(matrix.names)
+    n_nutrients = len(matrix.nutrients)
+    caps = matrix.solubility.copy()
+    for idx in excluded:
+        caps[idx] = 0.0
+    upper_rows = np.flatnonzero(np.isfinite(upper))
+    cap_rows = np.flatnonzero(np.isfinite(caps))
+    n_slack = n_nutrients + upper_rows.size + cap_rows.size
+    n_rows = n_nutrients + upper_rows.size + cap_rows.size
+
+    A = np.zeros((n_rows, n_products + n_slack))
+    b = np.zeros(n_rows)
+    # yields @ x - surplus == lower
+    A[:n_nutrients, :n_products] = matrix.yields
+    A[:n_nutrients, n_products : n_products + n_nutrients] = -np.eye(n_nutrients)
+    b[:n_nutrients] = lower
+    row = n_nutrients
+    slack = n_products + n_nutrients
+    # yields @ x + slack == upper
+    for idx in upper_rows:
+        A[row, :n_products] = matrix.yields[idx]
+        A[row, slack] = 1.0
+        b[row] = upper[idx]
+        row += 1
+        slack += 1
+    # x + slack == solubility cap
+    for idx in cap_rows:
+        A[row, idx] = 1.0
+        A[row, slack] = 1.0
+        b[row] = caps[idx]
+        row += 1
+        slack += 1
+
+    c = np.concatenate([matrix.prices, np.zeros(n_slack)])
+    solution = _linprog(A, b, c)
+    if solution is None:
+        return None
+    return solution[:n_products]
+
+
+def _conflict(matrix: _ProductMatrix, doses: np.ndarray) -> tuple[int, int] | None:
+    """Return the first incompatible pair dosed together, if any."""
+
+    for i, k in matrix.conflicts:
+        if doses[i] > _TOL and doses[k] > _TOL:
+            return i, k
+    return None
+
+
+def _solve_doses(matrix: _ProductMatrix, lower: np.ndarray, upper: np.ndarray) -> np.ndarray | None:
+    """Return the cheapest compatible per-litre doses, or ``None`` if infeasible.
+
+    Nodes are explored cheapest first: a node dosing an incompatible pair
+    branches into excluding one product or the other, and each exclusion set
+    is solved once. Excluding products only raises the cost, so the first
+    compatible node taken from the queue is optimal. After
+    ``_MAX_BRANCH_NODES`` solves, the open nodes are finished by a greedy dive
+    that drops the cheaper-to-replace product of each conflict. That result
+    is compatible but not necessarily the cheapest.
+    """
+
+    order = itertools.count()
+    heap: list[tuple[float, int, frozenset[int], np.ndarray]] = []
+    seen: set[frozenset[int]] = set()
+
+    def _push(excluded: frozenset[int]) -> None:
+        seen.add(excluded)
+        doses = _solve_relaxation(matrix, lower, upper, excluded)
+        if doses is not None:
+            heapq.heappush(heap, (float(matrix.prices @ doses), next(order), excluded, doses))
+
+    _push(frozenset())
+    while heap and len(seen) < _MAX_BRANCH_NODES:
+        _cost, _order, excluded, doses = heapq.heappop(heap)
+        pair = _conflict(matrix, doses)
+        if pair is None:
+            return doses
+        for drop in pair:
+            if excluded | {drop} not in seen:
+                _push(excluded | {drop})
+
+    while heap:
+        _cost, _order, excluded, doses = heapq.heappop(heap)
+        while doses is not None and (pair := _conflict(matrix, doses)) is not None:
+            drop = min(pair, key=lambda idx: doses[idx] * matrix.prices[idx])
+            excluded = excluded | {drop}
+            doses = _solve_relaxation(matrix, lower, upper, excluded)
+        if doses is not None:
+            return doses
+    return None
+
+
+def _parse_targets(targets: Mapping[str, object]) -> dict[str, tuple[float, float]]:
+    """Return ``{nutrient: (min_mg_l, max_mg_l)}`` from profile targets."""
+
+    bounds: dict[str, tuple[float, float]] = {}
+    for nutrient, target in targets.items():
+        if isinstance(target, Mapping):
+            low = float(target.get("min", 0.0) or 0.0)
+            high = target.get("max")
+            high = float(high) if high is not None else np.inf
+        elif target is None:
+            continue
+        else:
+            low, high = float(target), np.inf
+        if high < low:
+            raise ValueError(f"Maximum for '{nutrient}' is below its minimum")
+        if low <= 0 and not np.isfinite(high):
+            continue
+        bounds[nutrient] = (max(low, 0.0), high)
+    return bounds
+
+
+def _recipe(matrix: _ProductMatrix, doses: np.ndarray, volume_l: float) -> dict:
+    ingredients = []
+    total_cost = 0.0
+    liquid_volume_ml = 0.0
+    for idx in np.flatnonzero(doses > _TOL):
+        prod = matrix.products[idx]
+        dose = round(float(doses[idx]) * volume_l, 4)
+        cost = dose * float(matrix.prices[idx])
+        liquid = prod.get("form") == "liquid"
+        if liquid:
+            liquid_volume_ml += dose
+        ingredients.append(
+            {"product": matrix.names[idx], "dose": dose, "unit": "mL" if liquid else "g", "cost": round(cost, 2)}
+        )
+        total_cost += cost
+    return {
+        "ingredients": ingredients,
+        "total_cost": round(total_cost, 2),
+        "total_volume": round(volume_l + liquid_volume_ml / 1000.0, 3),
+    }
+
+
+def _default_datasets(
+    solubility: Mapping[str, float] | None,
+    compatibility: Mapping[str, Mapping[str, str]] | None,
+) -> tuple[Mapping[str, float], Mapping[str, Mapping[str, str]]]:
+    if solubility is None or compatibility is None:
+        from ..catalog import CATALOG
+
+        if solubility is None:
+            solubility = CATALOG.solubility()
+        if compatibility is None:
+            compatibility = CATALOG.compatibility()
+    return solubility, compatibility
+
+
+def optimize_recipes(
+    scenarios: Iterable[Mapping],
+    products: list[dict],
+    *,
+    solubility: Mapping[str, float] | None = None,
+    compatibility: Mapping[str, Mapping[str, str]] | None = None,
+) -> list[dict]:
+    """Solve many recipes against the same product list in one call.
+
+    Each scenario is a plant profile as accepted by :func:`optimize_recipe`
+    and may carry a ``volume_l`` key (default ``1.0``). The analysis matrix is
+    built once, and scenarios sharing the same targets reuse one per-litre
+    solution scaled to their volume. A ``ValueError`` is raised for the first
+    infeasible scenario.
+    """
+
+    scenarios = list(scenarios)
+    solubility, compatibility = _default_datasets(solubility, compatibility)
+    parsed = []
+    for scenario in scenarios:
+        targets = scenario.get("nutrient_targets", {})
+        if not targets:
+            raise ValueError("Plant profile must include 'nutrient_targets' for current stage")
+        volume_l = float(scenario.get("volume_l", 1.0))
+        if volume_l <= 0:
+            raise ValueError("volume_l must be positive")
+        parsed.append((_parse_targets(targets), volume_l))
+
+    nutrients = sorted({nutrient for bounds, _ in parsed for nutrient in bounds})
+    matrix = _build_matrix(products, nutrients, solubility, compatibility)
+    solved: dict[tuple, np.ndarray] = {}
+    recipes = []
+    for bounds, volume_l in parsed:
+        for nutrient, (low, _high) in bounds.items():
+            row = matrix.yields[matrix.nutrients.index(nutrient)]
+            if low > 0 and not row.any():
+                raise ValueError(f"No available product contains nutrient '{nutrient}' to meet target {low} mg/L")
+        key = tuple(sorted(bounds.items()))
+        if key not in solved:
+            lower = np.array([bounds.get(n, (0.0, np.inf))[0] for n in matrix.nutrients])
+            upper = np.array([bounds.get(n, (0.0, np.inf))[1] for n in matrix.nutrients])
+            doses = _solve_doses(matrix, lower, upper)
+            if doses is None:
+                raise ValueError(f"Could not meet all targets within bounds: {dict(bounds)}")
+            solved[key] = doses
+        recipes.append(_recipe(matrix, solved[key], volume_l))
+    return recipes
+
+
+def optimize_recipe(
+    plant_profile: dict[str, float],
+    products: list[dict],
+    *,
+    volume_l: float = 1.0,
+    solubility: Mapping[str, float] | None = None,
+    compatibility: Mapping[str, Mapping[str, str]] | None = None,
+) -> dict:
+    """
+    Generate the least-cost fertilizer recipe meeting a plant profile's targets.
 
     Parameters:
     - plant_profile: dict with nutrient targets for the current growth stage, e.g.
-        {"nutrient_targets": {"N": 100.0, "P": 50.0, "K": 150.0, "Fe": 2.0}}
-        Targets are in mg of nutrient per liter of solution.
+        {"nutrient_targets": {"N": 100.0, "P": 50.0, "K": {"min": 150.0, "max": 200.0}}}
+        Targets are in mg of nutrient per liter of solution. A number is a
+        minimum; a mapping may give ``min`` and/or ``max``.
     - products: list of fertilizer products available. Each product is a dict with keys:
-        - "name": product name
+        - "name": product name (and optional "id" used for dataset lookups)
         - "form": "solid" or "liquid"
         - "analysis": dict of nutrient percentages by weight (e.g. {"N": 15.5, "P": 20.0})
         - "price_per_unit": cost per gram for solids or per mL for liquids.
+        - "density_g_per_ml": optional density for liquids (default 1.0)
+    - volume_l: liters of solution to prepare.
+    - solubility: product ID to maximum grams per liter. When omitted the
+      limits come from the fertilizer catalog; pass ``{}`` for no limits.
+    - compatibility: product ID to incompatible product IDs. When omitted the
+      pairs come from the fertilizer catalog; pass ``{}`` to allow any mix.
+
+    Liquid doses are reported in mL and priced per mL; their analysis is by
+    weight, so each mL supplies ``density_g_per_ml`` grams of product.
 
     Returns:
     A dict with the proposed recipe:
@@ -31,101 +417,8 @@ def optimize_recipe(plant_profile: dict[str, float], products: list[dict]) -> di
     Raises:
         ValueError: if the targets cannot be met with the available products.
     """
-    # Extract nutrient targets (mg per liter)
-    targets = plant_profile.get("nutrient_targets", {})
-    if not targets:
-        raise ValueError("Plant profile must include 'nutrient_targets' for current stage")
-
-    # Check that each required nutrient is present in at least one product
-    for nutrient, target in targets.items():
-        if target is None or target <= 0:
-            continue
-        found = any((nutrient in prod.get("analysis", {}) and prod["analysis"][nutrient] > 0) for prod in products)
-        if not found:
-            raise ValueError(f"No available product contains nutrient '{nutrient}' to meet target {target} mg/L")
-
-    # Initialize remaining targets (mg)
-    remaining = {nut: val for nut, val in targets.items() if val > 0}
-    # Track doses (grams for solids, mL for liquids) for each product by name
-    doses: dict[str, float] = {}
-    # Total additional volume (mL) from liquid products
-    liquid_volume_ml = 0.0
-
-    # Sort nutrients by descending target to prioritize largest needs
-    nutrients_sorted = sorted(remaining.keys(), key=lambda x: remaining[x], reverse=True)
-    for nutrient in nutrients_sorted:
-        needed = remaining.get(nutrient, 0.0)
-        if needed <= 0:
-            continue
-
-        # Select best product: lowest cost per mg of this nutrient
-        best_prod = None
-        best_cost_per_mg = float("inf")
-        for prod in products:
-            analysis = prod.get("analysis", {})
-            if nutrient not in analysis or analysis[nutrient] <= 0:
-                continue
-            # mg of nutrient per gram of product
-            mg_per_g = analysis[nutrient] * 10.0  # 1g yields (percent/100)*1000 mg
-            if mg_per_g <= 0:
-                continue
-            cost = prod.get("price_per_unit", 0.0)
-            if cost <= 0:
-                continue
-            cost_per_mg = cost / mg_per_g
-            if cost_per_mg < best_cost_per_mg:
-                best_cost_per_mg = cost_per_mg
-                best_prod = prod
-
-        if not best_prod:
-            raise ValueError(f"No suitable product found to meet nutrient '{nutrient}'")
-
-        # Calculate required dose of the chosen product (in its unit) to meet the nutrient need
-        analysis_val = best_prod["analysis"][nutrient]
-        mg_per_g = analysis_val * 10.0
-        dose_g = needed / mg_per_g
-        dose_g = round(dose_g, 4)
-
-        prod_name = best_prod["name"]
-        doses[prod_name] = doses.get(prod_name, 0.0) + dose_g
-
-        # Subtract provided nutrients from remaining targets
-        for nut, pct in best_prod.get("analysis", {}).items():
-            if nut in remaining and remaining[nut] > 0:
-                mg_provided = dose_g * (pct * 10.0)
-                remaining[nut] = max(remaining[nut] - mg_provided, 0.0)
-
-        # If the product is liquid, convert its dose to volume and add to total volume
-        if best_prod.get("form") == "liquid":
-            density = best_prod.get("density_g_per_ml", 1.0)  # default assume 1 g/mL
-            volume_ml = dose_g / density
-            liquid_volume_ml += volume_ml
-
-    # Check if any nutrient targets remain unmet
-    unmet = {nut: amt for nut, amt in remaining.items() if amt > 1e-3}
-    if unmet:
-        raise ValueError(f"Could not meet all targets, remaining: {unmet}")
-
-    # Build the recipe output
-    recipe_ingredients = []
-    total_cost = 0.0
-    for prod_name, dose in doses.items():
-        prod = next((p for p in products if p["name"] == prod_name), None)
-        if not prod:
-            continue
-        unit = "g" if prod.get("form") == "solid" else "mL"
-        price = prod.get("price_per_unit", 0.0)
-        cost = dose * price
-        recipe_ingredients.append({"product": prod_name, "dose": dose, "unit": unit, "cost": round(cost, 2)})
-        total_cost += cost
-
-    total_volume_liters = (1000.0 + liquid_volume_ml) / 1000.0  # base 1L plus liquids
-
-    return {
-        "ingredients": recipe_ingredients,
-        "total_cost": round(total_cost, 2),
-        "total_volume": round(total_volume_liters, 3),
-    }
+    scenario = {**plant_profile, "volume_l": volume_l}
+    return optimize_recipes([scenario], products, solubility=solubility, compatibility=compatibility)[0]
 
 
 # Example usage (mock data for demonstration)
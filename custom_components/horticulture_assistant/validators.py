@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import datetime as dt
 import json
-from collections.abc import Mapping, Sequence
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import UTC
 from functools import lru_cache
 from pathlib import Path
@@ -25,14 +26,41 @@ def _validator() -> type[Draft202012Validator] | None:
     return Draft202012Validator
 
 
+# Compiled validators keyed by schema identity. The schema object is kept
+# alongside its validator so the ``id`` cannot be reused while cached.
+_COMPILED: OrderedDict[tuple[int, Any], tuple[Mapping[str, Any], Any]] = OrderedDict()
+_COMPILED_MAX = 32
+
+
+def compiled_validator(validator_cls, schema: Mapping[str, Any] | None):
+    """Return a reusable validator instance for ``schema``.
+
+    Schemas are compiled once and treated as immutable afterwards. ``None`` is
+    returned when ``jsonschema`` is unavailable or no schema is given.
+    """
+
+    if validator_cls is None or schema is None:
+        return None
+    key = (id(schema), validator_cls)
+    cached = _COMPILED.get(key)
+    if cached is not None and cached[0] is schema:
+        _COMPILED.move_to_end(key)
+        return cached[1]
+    validator = validator_cls(schema)
+    _COMPILED[key] = (schema, validator)
+    while len(_COMPILED) > _COMPILED_MAX:
+        _COMPILED.popitem(last=False)
+    return validator
+
+
 def _format_errors(
     validator_cls,
     payload: Mapping[str, Any],
     schema: Mapping[str, Any] | None,
 ) -> list[str]:
-    if validator_cls is None or schema is None:
+    validator = compiled_validator(validator_cls, schema)
+    if validator is None or validator.is_valid(payload):
         return []
-    validator = validator_cls(schema)
     issues: list[str] = []
     for err in validator.iter_errors(payload):
         location = ".".join(str(part) for part in err.absolute_path) or "<root>"
@@ -40,12 +68,26 @@ def _format_errors(
     return issues
 
 
+def is_valid_profile(profile: Mapping[str, Any], schema: Mapping[str, Any]) -> bool:
+    """Return ``True`` if ``profile`` satisfies ``schema`` without formatting errors."""
+
+    validator = compiled_validator(_validator(), schema)
+    return validator is None or validator.is_valid(profile)
+
+
 def validate_profile_dict(profile: Mapping[str, Any], schema: Mapping[str, Any]) -> list[str]:
     """Return a list of human-readable errors (empty if valid)."""
 
     return _format_errors(_validator(), profile, schema)
 
 
+def validate_profile_dicts(profiles: Iterable[Mapping[str, Any]], schema: Mapping[str, Any]) -> list[list[str]]:
+    """Return validation errors for each profile using a single compiled schema."""
+
+    validator_cls = _validator()
+    return [_format_errors(validator_cls, profile, schema) for profile in profiles]
+
+
 @lru_cache(maxsize=1)
 def _bio_schema() -> dict[str, Any]:
     from . import __path__
@@ -0,0 +1,201 @@
+"""Bounded, rate-limited page fetching for AI web sweeps.
+
+Pages are streamed with a byte cap and converted to text incrementally so a
+large or hostile page cannot exhaust memory on small Home Assistant hosts.
+Requests are limited per host, page text is cached by URL and revalidated
+with ``ETag``/``Last-Modified`` headers, and per-request timings are kept for
+diagnostics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import time
+import weakref
+from collections import deque
+from datetime import UTC, datetime, timedelta
+from html.parser import HTMLParser
+from typing import Any
+
+from yarl import URL
+
+from .lookup_cache import LookupCache
+
+MAX_PAGE_BYTES = 512 * 1024
+MAX_PAGE_CHARS = 64 * 1024
+CHUNK_SIZE = 16 * 1024
+PER_HOST_CONCURRENCY = 2
+PER_HOST_INTERVAL = 0.25
+REQUEST_TIMEOUT = 15
+PAGE_FRESH_FOR = timedelta(hours=1)
+
+_SKIP_TAGS = frozenset({"script", "style", "noscript", "template", "svg"})
+
+_PAGE_CACHE = LookupCache("web_pages", max_entries=128, persist=False)
+_TIMINGS: deque[dict[str, Any]] = deque(maxlen=50)
+
+
+class _TextExtractor(HTMLParser):
+    """Collect visible text from HTML fed in chunks, up to ``limit`` characters."""
+
+    def __init__(self, limit: int = MAX_PAGE_CHARS) -> None:
+        super().__init__(convert_charrefs=True)
+        self._limit = limit
+        self._parts: list[str] = []
+        self._size = 0
+        self._skip_depth = 0
+
+    @property
+    def full(self) -> bool:
+        return self._size >= self._limit
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        self._parts.append(" ")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        self._parts.append(" ")
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth or self.full:
+            return
+        chunk = data[: self._limit - self._size]
+        self._parts.append(chunk)
+        self._size += len(chunk)
+
+    def text(self) -> str:
+        # Data may arrive split across chunks, so only tags separate words.
+        return " ".join("".join(self._parts).split())
+
+
+class _HostLimiter:
+    """Per-host concurrency cap and minimum spacing between request starts."""
+
+    def __init__(self, concurrency: int, interval: float) -> None:
+        self._concurrency = concurrency
+        self._interval = interval
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._next_start: dict[str, float] = {}
+
+    def semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = self._semaphores[host] = asyncio.Semaphore(self._concurrency)
+        return sem
+
+    async def wait_turn(self, host: str) -> None:
+        now = time.monotonic()
+        start = max(now, self._next_start.get(host, now))
+        self._next_start[host] = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+# Semaphores belong to an event loop, so keep one limiter per running loop.
+_LIMITERS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _HostLimiter] = weakref.WeakKeyDictionary()
+
+
+def _limiter() -> _HostLimiter:
+    loop = asyncio.get_running_loop()
+    limiter = _LIMITERS.get(loop)
+    if limiter is None:
+        limiter = _LIMITERS[loop] = _HostLimiter(PER_HOST_CONCURRENCY, PER_HOST_INTERVAL)
+    return limiter
+
+
+async def _read_text(resp, max_bytes: int) -> tuple[str, int]:
+    """Stream ``resp`` into the text extractor, stopping after ``max_bytes``."""
+
+    charset = getattr(resp, "charset", None) or "utf-8"
+    try:
+        decoder = codecs.getincrementaldecoder(charset)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parser = _TextExtractor()
+    received = 0
+    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+        chunk = chunk[: max_bytes - received]
+        received += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if received >= max_bytes or parser.full:
+            break
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser.text(), received
+
+
+def _record(url: str, status: int | None, started: float, received: int, cached: bool) -> None:
+    _TIMINGS.append(
+        {
+            "host": URL(url).host,
+            "status": status,
+            "bytes": received,
+            "cached": cached,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+    )
+
+
+async def fetch_page_text(session, url: str, *, max_bytes: int = MAX_PAGE_BYTES) -> str:
+    """Return visible text for ``url`` or an empty string on failure."""
+
+    started = time.perf_counter()
+    now = datetime.now(UTC)
+    hit, cached = _PAGE_CACHE.get(url, ttl=PAGE_FRESH_FOR, now=now)
+    if hit:
+        _record(url, None, started, 0, True)
+        return cached["text"]
+    stale = _PAGE_CACHE.peek(url)
+
+    headers: dict[str, str] = {}
+    if stale:
+        if stale.get("etag"):
+            headers["If-None-Match"] = stale["etag"]
+        if stale.get("last_modified"):
+            headers["If-Modified-Since"] = stale["last_modified"]
+
+    host = URL(url).host or ""
+    limiter = _limiter()
+    status: int | None = None
+    received = 0
+    try:
+        async with limiter.semaphore(host):
+            await limiter.wait_turn(host)
+            async with session.get(url, headers=headers, timeout=REQUEST_TIMEOUT) as resp:
+                status = resp.status
+                if status == 304 and stale:
+                    _PAGE_CACHE.set(url, stale, now=now)
+                    _record(url, status, started, 0, True)
+                    return stale["text"]
+                if status != 200:
+                    _record(url, status, started, 0, False)
+                    return ""
+                text, received = await _read_text(resp, max_bytes)
+                entry = {
+                    "text": text,
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }
+    except Exception:
+        _record(url, status, started, received, False)
+        return ""
+    _PAGE_CACHE.set(url, entry, now=now)
+    _record(url, status, started, received, False)
+    return text
+
+
+def fetch_timings() -> list[dict[str, Any]]:
+    """Return timing records for the most recent page fetches."""
+
+    return list(_TIMINGS)
+
+
+def clear_page_cache() -> None:
+    """Forget cached page text and timing records."""
+
+    _PAGE_CACHE.clear()
+    _TIMINGS.clear()
@@ -1,48 +1,191 @@
 #!/usr/bin/env python3
+"""Validate profile JSON against the BioProfile schema.
+
+Files are hashed and compared with a cache from the previous run so only new
+or changed profiles are validated. The cache is dropped whenever the schema,
+``validators.py`` or the installed ``jsonschema`` version changes; the rest are validated across a process
+pool. Results can be streamed as JSON lines with ``--jsonl``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib.metadata
 import importlib.util
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
+SCHEMA_PATH = ROOT / "custom_components" / "horticulture_assistant" / "data" / "schema" / "bio_profile.schema.json"
+VALIDATORS_PATH = ROOT / "custom_components" / "horticulture_assistant" / "validators.py"
+CACHE_PATH = ROOT / ".cache" / "profile_validation.json"
+PROFILE_DIRS = [
+    ROOT / "plants",
+    ROOT / "data" / "local" / "plants",
+]
 
-spec = importlib.util.spec_from_file_location(
-    "validators",
-    ROOT / "custom_components" / "horticulture_assistant" / "validators.py",
-)
+spec = importlib.util.spec_from_file_location("validators", VALIDATORS_PATH)
 module = importlib.util.module_from_spec(spec)
 assert spec and spec.loader
 spec.loader.exec_module(module)
-validate_all_profiles = module.validate_all_profiles
-schema = ROOT / "custom_components" / "horticulture_assistant" / "data" / "schema" / "bio_profile.schema.json"
 
-dirs = [
-    ROOT / "plants",
-    ROOT / "data" / "local" / "plants",
-]
+_SCHEMA: dict | None = None
+
 
-issues = validate_all_profiles(dirs, schema)
-if issues:
-    print("Profile validation failed:")
-    for i in issues:
-        print(" -", i)
-    sys.exit(1)
+def _init_worker(schema_path: str) -> None:
+    global _SCHEMA
+    _SCHEMA = json.loads(Path(schema_path).read_text(encoding="utf-8"))
+
+
+def _validate_file(item: tuple[str, str]) -> tuple[str, str, list[str]]:
+    """Validate one file and return ``(path, sha256, issues)``."""
+
+    path, digest = item
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception as exc:
+        return path, digest, [f"invalid JSON ({exc})"]
+    return path, digest, module.validate_profile_dict(data, _SCHEMA)
+
+
+def _digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _cache_key(schema_path: Path) -> str:
+    """Return a digest of everything besides the profile that decides its issues."""
+
+    try:
+        jsonschema_version = importlib.metadata.version("jsonschema")
+    except importlib.metadata.PackageNotFoundError:
+        jsonschema_version = "absent"
+    parts = (_digest(schema_path), _digest(VALIDATORS_PATH), f"jsonschema={jsonschema_version}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
 
-data_dir = ROOT / "custom_components" / "horticulture_assistant" / "data" / "fertilizers" / "detail"
 
-errors = 0
-for path in data_dir.rglob("*.json"):
-    text = path.read_text(encoding="utf-8")
+def _load_cache(path: Path | None, cache_key: str) -> dict[str, dict]:
+    if path is None or not path.exists():
+        return {}
     try:
-        json.loads(text)
-    except Exception as e:  # pragma: no cover - debug aid
-        print(f"[JSON] {path}: {e}")
-        errors += 1
-    if not text.endswith("\n") or text.endswith("\n\n"):
-        print(f"[EOL] {path}: file must end with exactly one newline")
-        errors += 1
-
-if errors:
-    sys.exit(1)
-
-print("Profile validation passed.")
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("schema") != cache_key:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(path: Path | None, cache_key: str, files: dict[str, dict]) -> None:
+    if path is None:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"schema": cache_key, "files": files}, sort_keys=True), encoding="utf-8")
+    tmp.replace(path)
+
+
+def validate_profiles(
+    roots: list[Path],
+    schema_path: Path = SCHEMA_PATH,
+    *,
+    cache_path: Path | None = CACHE_PATH,
+    jobs: int | None = None,
+):
+    """Yield ``{"path", "status", "issues"}`` for every profile under ``roots``.
+
+    ``status`` is ``"cached"`` for files whose content is unchanged since the
+    cached run with the same schema, validators and ``jsonschema`` version,
+    otherwise ``"ok"`` or ``"invalid"``.
+    """
+
+    cache_key = _cache_key(schema_path)
+    cached = _load_cache(cache_path, cache_key)
+    seen: dict[str, dict] = {}
+    pending: list[tuple[str, str]] = []
+    for root in roots:
+        if not root.exists():
+            continue
+        for p in sorted(root.rglob("*.json")):
+            key = str(p)
+            digest = _digest(p)
+            entry = cached.get(key)
+            if isinstance(entry, dict) and entry.get("sha256") == digest:
+                seen[key] = entry
+                yield {"path": key, "status": "cached", "issues": list(entry.get("issues", []))}
+            else:
+                pending.append((key, digest))
+
+    jobs = jobs or os.cpu_count() or 1
+    try:
+        if jobs <= 1 or len(pending) <= 1:
+            _init_worker(str(schema_path))
+            results = map(_validate_file, pending)
+            for path, digest, issues in results:
+                seen[path] = {"sha256": digest, "issues": issues}
+                yield {"path": path, "status": "invalid" if issues else "ok", "issues": issues}
+        else:
+            chunksize = max(1, len(pending) // (jobs * 4))
+            with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(str(schema_path),)) as pool:
+                for path, digest, issues in pool.map(_validate_file, pending, chunksize=chunksize):
+                    seen[path] = {"sha256": digest, "issues": issues}
+                    yield {"path": path, "status": "invalid" if issues else "ok", "issues": issues}
+    finally:
+        _save_cache(cache_path, cache_key, seen)
+
+
+def _check_fertilizer_details() -> int:
+    data_dir = ROOT / "custom_components" / "horticulture_assistant" / "data" / "fertilizers" / "detail"
+
+    errors = 0
+    for path in data_dir.rglob("*.json"):
+        text = path.read_text(encoding="utf-8")
+        try:
+            json.loads(text)
+        except Exception as e:  # pragma: no cover - debug aid
+            print(f"[JSON] {path}: {e}")
+            errors += 1
+        if not text.endswith("\n") or text.endswith("\n\n"):
+            print(f"[EOL] {path}: file must end with exactly one newline")
+            errors += 1
+    return errors
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", action="append", type=Path, help="profile directory (repeatable)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--cache", type=Path, default=CACHE_PATH, help="validation cache file")
+    parser.add_argument("--no-cache", action="store_true", help="validate every file and skip the cache")
+    parser.add_argument("--jsonl", action="store_true", help="stream one JSON result per file")
+    args = parser.parse_args(argv)
+
+    roots = args.profiles or PROFILE_DIRS
+    cache_path = None if args.no_cache else args.cache
+    issues: list[str] = []
+    for result in validate_profiles(roots, cache_path=cache_path, jobs=args.jobs):
+        if args.jsonl:
+            print(json.dumps(result), flush=True)
+        issues.extend(f"{result['path']}: {msg}" for msg in result["issues"])
+
+    if issues:
+        if not args.jsonl:
+            print("Profile validation failed:")
+            for i in issues:
+                print(" -", i)
+        return 1
+
+    if _check_fertilizer_details():
+        return 1
+
+    if not args.jsonl:
+        print("Profile validation passed.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Benchmarks for the edge sync store and worker."""
+
+from datetime import UTC, datetime, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import ClientSession
+
+from custom_components.horticulture_assistant.cloudsync import (
+    ConflictResolver,
+    EdgeSyncStore,
+    EdgeSyncWorker,
+    SyncEvent,
+    encode_ndjson,
+)
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _events(count: int, *, entities: int = 300) -> list[SyncEvent]:
+    return [
+        SyncEvent(
+            event_id=f"01E{idx:08d}",
+            tenant_id="tenant-1",
+            device_id="edge-1",
+            ts=START + timedelta(seconds=idx),
+            entity_type="profile",
+            entity_id=f"plant-{idx % entities}",
+            op="upsert",
+            patch={"thresholds": {"temp_c_max": 20 + idx % 10}, "note": f"reading {idx}"},
+            org_id="org-1",
+        )
+        for idx in range(count)
+    ]
+
+
+def test_edge_store_append_outbox(benchmark, tmp_path):
+    events = _events(benchmark.scaled(1_000))
+    paths = iter(range(1_000))
+
+    def _fresh_store():
+        return (EdgeSyncStore(tmp_path / f"append_{next(paths)}.db"),)
+
+    def _append(store):
+        for event in events:
+            store.append_outbox(event)
+        return store
+
+    store = benchmark(_append, setup=_fresh_store)
+    assert store.outbox_size() == len(events)
+
+
+def test_edge_store_fetch_outbox(benchmark, tmp_path):
+    store = EdgeSyncStore(tmp_path / "fetch.db")
+    for event in _events(benchmark.scaled(2_000)):
+        store.append_outbox(event)
+
+    def _drain():
+        return sum(len(store.get_outbox_batch(500)) for _ in range(4)) + len(store.export_outbox_ndjson())
+
+    assert benchmark(_drain) > 0
+
+
+def test_edge_store_compact_outbox(benchmark, tmp_path):
+    events = _events(benchmark.scaled(2_000))
+    paths = iter(range(1_000))
+
+    def _backlog():
+        store = EdgeSyncStore(tmp_path / f"compact_{next(paths)}.db")
+        for event in events:
+            store.append_outbox(event)
+        return store, ConflictResolver()
+
+    def _compact(store, resolver):
+        store.compact_outbox(resolver)
+        return store
+
+    store = benchmark(_compact, setup=_backlog)
+    assert store.outbox_size() == min(len(events), 300)
+
+
+def test_edge_store_fetch_cloud_cache(benchmark, tmp_path):
+    store = EdgeSyncStore(tmp_path / "cache.db")
+    store.record_incoming_events(_events(300))
+    for idx in range(300):
+        store.update_cloud_cache("profile", f"plant-{idx}", "tenant-1", {"value": idx}, org_id="org-1")
+
+    entries = benchmark(
+        lambda: [
+            store.fetch_cloud_cache_entry("profile", f"plant-{idx}", tenant_id="tenant-1", org_id="org-1")
+            for idx in range(300)
+        ]
+    )
+    assert all(entry is not None for entry in entries)
+
+
+async def test_edge_worker_pull_once(benchmark, tmp_path):
+    payload = encode_ndjson(_events(benchmark.scaled(2_000))).encode()
+    paths = iter(range(1_000))
+
+    class _Content:
+        async def iter_chunked(self, size):
+            for start in range(0, len(payload), size):
+                yield payload[start : start + size]
+
+    def _worker():
+        response = MagicMock()
+        response.status = 200
+        response.headers = {"Content-Type": "application/x-ndjson", "X-Sync-Cursor": "c1"}
+        response.content = _Content()
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock()
+        session.get.return_value = response
+        store = EdgeSyncStore(tmp_path / f"pull_{next(paths)}.db")
+        return (EdgeSyncWorker(store, cast(ClientSession, session), "https://api.example", "token", "tenant-1"),)
+
+    async def _pull(worker):
+        return await worker.pull_once()
+
+    assert await benchmark.async_run(_pull, setup=_worker) == benchmark.scaled(2_000)
@@ -0,0 +1,142 @@
+"""Benchmarks for dataset loading, fertilizer lookups and the plant engine."""
+
+import json
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from custom_components.horticulture_assistant.engine.plant_engine import fertilizer_dataset_loader
+from custom_components.horticulture_assistant.engine.plant_engine import fertilizer_dataset_lookup as fertilizers
+from custom_components.horticulture_assistant.engine.plant_engine.environment_manager import (
+    score_environment_series,
+)
+from custom_components.horticulture_assistant.engine.plant_engine.utils import clear_dataset_cache, load_dataset
+from custom_components.horticulture_assistant.engine.run_daily_cycle import run_daily_cycle
+
+DATASETS = (
+    "coefficients/crop_coefficients.json",
+    "environment/environment_guidelines.json",
+    "nutrients/nutrient_guidelines.json",
+    "irrigation/irrigation_guidelines.json",
+    "fertilizers/fertilizer_purity.json",
+    "fertilizers/fertilizer_solubility.json",
+    "nutrients/nutrient_deficiency_symptoms.json",
+    "environment/vpd_guidelines.json",
+)
+
+
+def test_load_dataset_cold(benchmark):
+    def _load():
+        clear_dataset_cache()
+        return [load_dataset(name) for name in DATASETS]
+
+    assert any(benchmark(_load))
+
+
+def test_load_dataset_warm(benchmark):
+    for name in DATASETS:
+        load_dataset(name)
+
+    benchmark(lambda: [load_dataset(name) for name in DATASETS * 250])
+
+
+def _clear_fertilizer_caches():
+    for func in (fertilizers._records, fertilizers._build_indexes, fertilizers._load_analysis):
+        func.cache_clear()
+
+
+@pytest.fixture
+def fertilizer_dataset(benchmark, tmp_path, monkeypatch):
+    """Write a synthetic sharded fertilizer index with matching detail files."""
+
+    rng = random.Random(5)
+    index_dir = tmp_path / "index_sharded"
+    detail_dir = tmp_path / "detail"
+    index_dir.mkdir()
+    words = ["grow", "bloom", "cal", "mag", "fish", "kelp", "micro", "base", "boost", "pro"]
+    count = benchmark.scaled(3_000)
+    shards: dict[int, list[str]] = {}
+    for idx in range(count):
+        product_id = f"{idx:06d}"
+        composition = {
+            "npk": {"N_pct": rng.randint(0, 20), "P2O5_pct": rng.randint(0, 20), "K2O_pct": rng.randint(0, 20)},
+            "macros_pct": {"Ca": rng.uniform(0, 10), "Mg": rng.uniform(0, 5)},
+        }
+        name = f"{rng.choice(words)} {rng.choice(words)} {idx}"
+        record = {"id": product_id, "product": {"name": name}, "metadata": {"wsda_reg_no": f"#{idx}"}}
+        shards.setdefault(idx % 16, []).append(json.dumps({**record, "composition": composition}))
+        detail = detail_dir / product_id[:2]
+        detail.mkdir(parents=True, exist_ok=True)
+        (detail / f"{product_id}.json").write_text(json.dumps({"composition": composition}), encoding="utf-8")
+    for shard, lines in shards.items():
+        (index_dir / f"shard_{shard:02d}.jsonl").write_text("\n".join(lines), encoding="utf-8")
+
+    monkeypatch.setattr(fertilizer_dataset_loader, "FERTILIZER_DATASET_INDEX_DIR", index_dir)
+    monkeypatch.setattr(fertilizer_dataset_loader, "FERTILIZER_DATASET_DETAIL_DIR", detail_dir)
+    _clear_fertilizer_caches()
+    yield count
+    _clear_fertilizer_caches()
+
+
+def test_fertilizer_search_products(benchmark, fertilizer_dataset):
+    queries = ["grow", "bloom", "cal mag", "fish", "12", "zz-no-match"]
+
+    results = benchmark(lambda: [fertilizers.search_products(q, limit=20) for q in queries * 20])
+    assert results[0]
+
+
+def test_fertilizer_recommend_for_nutrient(benchmark, fertilizer_dataset):
+    results = benchmark(lambda: [fertilizers.recommend_products_for_nutrient(n) for n in ("N", "P", "K") * 4])
+    assert all(len(names) == 5 for names in results)
+
+
+def test_score_environment_series(benchmark):
+    rng = random.Random(11)
+    readings = [
+        {
+            "temp_c": rng.uniform(12, 34),
+            "humidity_pct": rng.uniform(30, 90),
+            "light_ppfd": rng.uniform(100, 1200),
+            "co2_ppm": rng.uniform(350, 1400),
+        }
+        for _ in range(benchmark.scaled(10_000))
+    ]
+
+    score = benchmark(score_environment_series, setup=lambda: (readings, "tomato", "vegetative"))
+    assert 0 <= score <= 100
+
+
+def test_run_daily_cycle(benchmark, tmp_path):
+    plants_dir = tmp_path / "plants"
+    plants_dir.mkdir()
+    now = datetime.now(UTC)
+    plant_ids = [f"plant_{idx}" for idx in range(benchmark.scaled(50))]
+    for plant_id in plant_ids:
+        (plants_dir / f"{plant_id}.json").write_text(
+            json.dumps({"general": {"plant_type": "tomato", "lifecycle_stage": "vegetative"}}),
+            encoding="utf-8",
+        )
+        logs = plants_dir / plant_id
+        logs.mkdir()
+        stamps = [(now - timedelta(minutes=15 * step)).isoformat() for step in range(96)]
+        (logs / "sensor_reading_log.json").write_text(
+            json.dumps(
+                [
+                    {"timestamp": ts, "sensor_type": "temperature", "value": 20 + step % 6}
+                    for step, ts in enumerate(stamps)
+                ]
+            ),
+            encoding="utf-8",
+        )
+        (logs / "irrigation_log.json").write_text(
+            json.dumps([{"timestamp": ts, "volume_ml": 250} for ts in stamps[::8]]),
+            encoding="utf-8",
+        )
+
+    reports = benchmark(
+        lambda: [
+            run_daily_cycle(pid, base_path=str(plants_dir), output_path=str(tmp_path / "out")) for pid in plant_ids
+        ]
+    )
+    assert len(reports) == len(plant_ids)
@@ -0,0 +1,88 @@
+"""Benchmarks for profile event recording and preference resolution."""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.horticulture_assistant.const import DOMAIN
+from custom_components.horticulture_assistant.profile import store as profile_store
+from custom_components.horticulture_assistant.profile.schema import BioProfile
+from custom_components.horticulture_assistant.profile_registry import ProfileRegistry
+from custom_components.horticulture_assistant.resolver import PreferenceResolver
+
+
+def _events(profile_ids: list[str], count: int) -> list[dict]:
+    start = datetime.now(UTC) - timedelta(days=60)
+    events = []
+    for idx in range(count):
+        profile_id = profile_ids[idx % len(profile_ids)]
+        stamp = (start + timedelta(minutes=idx)).isoformat()
+        if idx % 2:
+            events.append(
+                {
+                    "profile_id": profile_id,
+                    "kind": "harvest",
+                    "harvest_id": f"h-{idx}",
+                    "harvested_at": stamp,
+                    "yield_grams": 5.0 + idx % 40,
+                }
+            )
+        else:
+            events.append(
+                {
+                    "profile_id": profile_id,
+                    "kind": "cultivation",
+                    "event_id": f"c-{idx}",
+                    "occurred_at": stamp,
+                    "event_type": "inspection",
+                }
+            )
+    return events
+
+
+async def test_profile_registry_record_events(benchmark, hass, tmp_path):
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+    profile_ids = [f"plant.{idx}" for idx in range(benchmark.scaled(300))]
+    for profile_id in profile_ids:
+        await profile_store.async_save_profile(
+            hass, BioProfile(profile_id=profile_id, display_name=profile_id, profile_type="cultivar")
+        )
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={})
+    entry.add_to_hass(hass)
+    events = _events(profile_ids, benchmark.scaled(10_000))
+
+    async def _fresh_registry():
+        registry = ProfileRegistry(hass, entry)
+        await registry.async_load()
+        return registry, events
+
+    async def _record(registry, batch):
+        return await registry.async_record_events(batch)
+
+    stored = await benchmark.async_run(_record, setup=_fresh_registry)
+    assert len(stored) == len(events)
+
+
+async def test_preference_resolver_resolve_profile(benchmark, hass):
+    profiles = {
+        f"plant.{idx}": {
+            "name": f"Plant {idx}",
+            "sources": {
+                "temp_c_min": {"mode": "manual", "value": 16.0 + idx % 4},
+                "temp_c_max": {"mode": "manual", "value": 28.0},
+                "rh_min": {"mode": "clone", "copy_from": "plant.0"},
+            },
+            "thresholds": {"rh_min": 45.0},
+        }
+        for idx in range(benchmark.scaled(300))
+    }
+    entry = SimpleNamespace(entry_id="bench", options={"profiles": profiles})
+    resolver = PreferenceResolver(hass)
+
+    async def _resolve_all():
+        for profile_id in profiles:
+            await resolver.resolve_profile(entry, profile_id)
+
+    await benchmark.async_run(_resolve_all)
+    assert entry.options["profiles"]["plant.1"]["thresholds"]["temp_c_min"] == 17.0
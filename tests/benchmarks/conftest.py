@@ -0,0 +1,167 @@
+"""Timing and peak-memory harness for the benchmark suite.
+
+Benchmarks live in ``bench_*.py`` modules, which the default ``python_files``
+list does not collect. Run them explicitly::
+
+    pytest tests/benchmarks -o python_files='bench_*.py' --benchmark-save bench.json
+    pytest tests/benchmarks -o python_files='bench_*.py' --benchmark-compare bench.json
+
+Each benchmark runs one untimed warm-up round under :mod:`tracemalloc` to
+record peak memory, then ``--benchmark-rounds`` timed rounds. With
+``--benchmark-compare`` a benchmark fails when its fastest round or peak memory
+exceeds the stored baseline by more than ``--benchmark-tolerance``.
+"""
+
+from __future__ import annotations
+
+import gc
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+# Differences below these floors are treated as noise when comparing.
+MIN_TIME_DELTA_S = 0.002
+MIN_MEMORY_DELTA_KIB = 256.0
+
+_RESULTS: dict[str, dict[str, Any]] = {}
+
+
+class Benchmark:
+    """Measure a callable; ``setup`` builds fresh arguments for every round."""
+
+    def __init__(self, name: str, *, rounds: int, scale: float, baseline: dict[str, Any] | None, tolerance: float):
+        self.name = name
+        self.rounds = max(rounds, 1)
+        self.scale = scale
+        self._baseline = baseline
+        self._tolerance = tolerance
+
+    def scaled(self, size: int) -> int:
+        """Return ``size`` multiplied by ``--benchmark-scale`` (at least 1)."""
+
+        return max(int(size * self.scale), 1)
+
+    def __call__(self, func: Callable[..., Any], *, setup: Callable[[], tuple] | None = None) -> Any:
+        return self._finish(*self._measure(func, setup))
+
+    async def async_run(self, func: Callable[..., Any], *, setup: Callable[[], tuple] | None = None) -> Any:
+        """Measure a coroutine function; ``setup`` may itself be async."""
+
+        async def _args():
+            args = setup() if setup is not None else ()
+            return await args if inspect.isawaitable(args) else args
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = await func(*(await _args()))
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        times = []
+        for _ in range(self.rounds):
+            args = await _args()
+            start = time.perf_counter()
+            await func(*args)
+            times.append(time.perf_counter() - start)
+        return self._finish(result, times, peak)
+
+    def _measure(self, func, setup) -> tuple[Any, list[float], int]:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = func(*(setup() if setup is not None else ()))
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        times = []
+        for _ in range(self.rounds):
+            args = setup() if setup is not None else ()
+            start = time.perf_counter()
+            func(*args)
+            times.append(time.perf_counter() - start)
+        return result, times, peak
+
+    def _finish(self, result: Any, times: list[float], peak: int) -> Any:
+        record = {
+            "rounds": len(times),
+            "min_s": min(times),
+            "median_s": statistics.median(times),
+            "peak_kib": round(peak / 1024, 1),
+        }
+        _RESULTS[self.name] = record
+        if self._baseline is not None:
+            self._compare(record)
+        return result
+
+    def _compare(self, record: dict[str, Any]) -> None:
+        base = self._baseline.get(self.name)
+        if base is None:
+            return
+        limit = 1 + self._tolerance
+        problems = []
+        if record["min_s"] > base["min_s"] * limit and record["min_s"] - base["min_s"] > MIN_TIME_DELTA_S:
+            problems.append(f"min {record['min_s']:.4f}s vs baseline {base['min_s']:.4f}s")
+        if (
+            record["peak_kib"] > base["peak_kib"] * limit
+            and record["peak_kib"] - base["peak_kib"] > MIN_MEMORY_DELTA_KIB
+        ):
+            problems.append(f"peak {record['peak_kib']:.0f} KiB vs baseline {base['peak_kib']:.0f} KiB")
+        if problems:
+            pytest.fail(f"{self.name} regressed: " + "; ".join(problems))
+
+
+def _load_baseline(config: pytest.Config) -> dict[str, Any] | None:
+    path = config.getoption("--benchmark-compare")
+    if not path:
+        return None
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("scale") != config.getoption("--benchmark-scale"):
+        raise pytest.UsageError(f"baseline {path} was recorded at scale {data.get('scale')}")
+    return data.get("benchmarks", {})
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Benchmark:
+    """Return a :class:`Benchmark` named after the requesting test."""
+
+    config = request.config
+    if not hasattr(config, "_horti_benchmark_baseline"):
+        config._horti_benchmark_baseline = _load_baseline(config)
+    return Benchmark(
+        request.node.name.removeprefix("test_"),
+        rounds=config.getoption("--benchmark-rounds"),
+        scale=config.getoption("--benchmark-scale"),
+        baseline=config._horti_benchmark_baseline,
+        tolerance=config.getoption("--benchmark-tolerance"),
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not _RESULTS:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(f"{'name':<44} {'median ms':>10} {'min ms':>10} {'peak KiB':>10}")
+    for name, record in sorted(_RESULTS.items()):
+        terminalreporter.write_line(
+            f"{name:<44} {record['median_s'] * 1000:>10.2f} {record['min_s'] * 1000:>10.2f} {record['peak_kib']:>10.0f}"
+        )
+    path = config.getoption("--benchmark-save")
+    if path:
+        payload = {
+            "scale": config.getoption("--benchmark-scale"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "benchmarks": dict(sorted(_RESULTS.items())),
+        }
+        Path(path).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        terminalreporter.write_line(f"saved benchmark results to {path}")
@@ -267,6 +267,16 @@ def async_track_state_change_event(_hass, _entity_ids, _action):  # pragma: no c
 
 
 event.async_track_state_change_event = async_track_state_change_event
+
+
+def async_track_time_change(_hass, _action, **_kwargs):  # pragma: no cover - stub scheduler
+    def _cancel():
+        return None
+
+    return _cancel
+
+
+event.async_track_time_change = async_track_time_change
 sys.modules["homeassistant.helpers.event"] = event
 
 aiohttp_client = types.ModuleType("homeassistant.helpers.aiohttp_client")
@@ -551,6 +561,10 @@ class Store:  # pragma: no cover - minimal persistent store per hass/key
         self._bucket.clear()
         self._bucket.update(deepcopy(data))
 
+    def async_delay_save(self, data_func, _delay=0) -> None:
+        self._bucket.clear()
+        self._bucket.update(deepcopy(data_func()))
+
 
 storage.Store = Store
 sys.modules["homeassistant.helpers.storage"] = storage
@@ -593,3 +607,14 @@ def hass_admin_user():
 hca_module = importlib.import_module("custom_components.horticulture_assistant")
 hca_module.__init__ = hca_module  # type: ignore[attr-defined]
 sys.modules["custom_components.horticulture_assistant.__init__"] = hca_module
+
+
+def pytest_addoption(parser):
+    """Register options used by the benchmark suite in ``tests/benchmarks``."""
+
+    group = parser.getgroup("benchmark", "horticulture assistant benchmarks")
+    group.addoption("--benchmark-scale", type=float, default=1.0, help="multiply fixture sizes by this factor")
+    group.addoption("--benchmark-rounds", type=int, default=3, help="timed rounds per benchmark")
+    group.addoption("--benchmark-save", default=None, help="write results as JSON to this path")
+    group.addoption("--benchmark-compare", default=None, help="fail benchmarks slower than this baseline JSON")
+    group.addoption("--benchmark-tolerance", type=float, default=0.25, help="allowed regression ratio (0.25 = 25%%)")
@@ -0,0 +1,205 @@
+"""Tests for bulk event ingestion through the registry, service and exporter."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.horticulture_assistant.const import CONF_API_KEY, DOMAIN
+from custom_components.horticulture_assistant.history.exporter import HistoryExporter
+from custom_components.horticulture_assistant.profile import store as profile_store
+from custom_components.horticulture_assistant.profile.schema import BioProfile, CultivationEvent, HarvestEvent
+from custom_components.horticulture_assistant.profile.statistics import EVENT_STATS_VERSION
+from custom_components.horticulture_assistant.profile_registry import ProfileRegistry
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.usefixtures("enable_custom_integrations"),
+]
+
+
+async def _make_entry(hass, options=None):
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options=options or {})
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def _setup_entry_with_profile(hass):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_API_KEY: "key"},
+        options={"profiles": {"p1": {"name": "Plant 1", "sensors": {"moisture": "sensor.old"}}}},
+    )
+    entry.add_to_hass(hass)
+    import custom_components.horticulture_assistant as hca
+
+    hca.PLATFORMS = []
+    with (
+        patch.object(hca, "HortiAICoordinator") as mock_ai,
+        patch.object(hca, "HortiLocalCoordinator") as mock_local,
+    ):
+        mock_ai.return_value.async_config_entry_first_refresh = AsyncMock()
+        mock_local.return_value.async_config_entry_first_refresh = AsyncMock()
+        await hca.async_setup_entry(hass, entry)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def test_record_events_applies_batch_with_single_save(hass):
+    species = BioProfile(profile_id="species.1", display_name="Species", profile_type="species")
+    cultivar = BioProfile(
+        profile_id="cultivar.1",
+        display_name="Cultivar",
+        profile_type="cultivar",
+        species="species.1",
+    )
+    other = BioProfile(profile_id="other.1", display_name="Other", profile_type="cultivar")
+    for prof in (species, cultivar, other):
+        await profile_store.async_save_profile(hass, prof)
+
+    entry = await _make_entry(hass)
+    reg = ProfileRegistry(hass, entry)
+    await reg.async_load()
+
+    harvested = (datetime.now(UTC) - timedelta(days=2)).isoformat()
+    events = [
+        {"profile_id": "cultivar.1", "kind": "run", "run_id": "run-1", "started_at": "2024-01-01T00:00:00+00:00"},
+        *(
+            {
+                "profile_id": "cultivar.1",
+                "kind": "harvest",
+                "harvest_id": f"h-{idx}",
+                "harvested_at": harvested,
+                "yield_grams": 10.0,
+            }
+            for idx in range(50)
+        ),
+        {
+            "profile_id": "other.1",
+            "kind": "cultivation",
+            "event_id": "evt-1",
+            "occurred_at": harvested,
+            "event_type": "inspection",
+        },
+    ]
+
+    with patch.object(reg._store, "async_save", wraps=reg._store.async_save) as save:
+        stored = await reg.async_record_events(events)
+
+    assert save.await_count == 1
+    assert len(stored) == 52
+    assert stored[1].run_id == "run-1"
+    assert len(reg.get("cultivar.1").harvest_history) == 50
+    assert reg.get("cultivar.1").statistics[0].metrics["total_yield_grams"] == pytest.approx(500.0)
+    assert reg.get("species.1").statistics[0].metrics["total_yield_grams"] == pytest.approx(500.0)
+    event_stats = next(snap for snap in reg.get("other.1").computed_stats if snap.stats_version == EVENT_STATS_VERSION)
+    assert event_stats.payload["metrics"]["total_events"] == pytest.approx(1.0)
+
+
+async def test_record_events_rejects_whole_batch_on_invalid_item(hass):
+    await profile_store.async_save_profile(hass, BioProfile(profile_id="p1", display_name="P1"))
+    entry = await _make_entry(hass)
+    reg = ProfileRegistry(hass, entry)
+    await reg.async_load()
+
+    valid = {
+        "profile_id": "p1",
+        "kind": "harvest",
+        "harvest_id": "h1",
+        "harvested_at": "2024-01-01T00:00:00+00:00",
+        "yield_grams": 1,
+    }
+    with pytest.raises(ValueError, match="event 1"):
+        await reg.async_record_events([valid, {**valid, "harvest_id": "h2", "yield_grams": -5}])
+    with pytest.raises(ValueError, match="unknown event kind"):
+        await reg.async_record_events([{**valid, "kind": "pruning"}])
+
+    assert reg.get("p1").harvest_history == []
+
+
+async def test_record_events_service_stores_batch(hass):
+    entry = await _setup_entry_with_profile(hass)
+    response = await hass.services.async_call(
+        DOMAIN,
+        "record_events",
+        {
+            "events": [
+                {
+                    "profile_id": "p1",
+                    "kind": "cultivation",
+                    "event_id": f"evt-{idx}",
+                    "occurred_at": "2024-04-02T10:15:00Z",
+                    "event_type": "inspection",
+                }
+                for idx in range(3)
+            ]
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {"recorded": 3, "profiles": {"p1": {"cultivation": 3}}}
+    registry = hass.data[DOMAIN][entry.entry_id]["profile_registry"]
+    assert len(registry.get("p1").event_history) == 3
+
+
+async def test_append_many_groups_files_and_index(tmp_path: Path, hass) -> None:
+    exporter = HistoryExporter(hass, base_path=tmp_path)
+
+    await exporter.async_append_many(
+        [
+            ("plant-1", "harvest", {"harvest_id": "h1", "harvested_at": "2024-03-01T00:00:00+00:00"}),
+            ("plant-1", "harvest", {"harvest_id": "h2", "harvested_at": "2024-03-02T00:00:00+00:00"}),
+            ("plant-2", "nutrient", {"event_id": "n1", "applied_at": "2024-03-03T00:00:00+00:00"}),
+        ]
+    )
+
+    lines = (tmp_path / "plant-1" / "harvest_events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["harvest_id"] for line in lines] == ["h1", "h2"]
+    index = await exporter.async_index()
+    assert index["plant-1"].counts == {"harvest": 2}
+    assert index["plant-1"].last_updated == "2024-03-02T00:00:00+00:00"
+    assert index["plant-2"].counts == {"nutrient": 1}
+
+    with pytest.raises(ValueError):
+        await exporter.async_append_many([("plant-1", "unknown", {})])
+
+
+async def test_record_events_service_counts_stored_events(hass):
+    entry = await _setup_entry_with_profile(hass)
+    registry = hass.data[DOMAIN][entry.entry_id]["profile_registry"]
+    events = [
+        {
+            "profile_id": "p1",
+            "kind": "cultivation",
+            "event_id": f"evt-{idx}",
+            "occurred_at": "2024-04-02T10:15:00Z",
+            "event_type": "inspection",
+        }
+        for idx in range(3)
+    ]
+    stored = [
+        CultivationEvent.from_json(
+            {
+                "event_id": "evt-0",
+                "profile_id": "p1",
+                "occurred_at": "2024-04-02T10:15:00Z",
+                "event_type": "inspection",
+            }
+        ),
+        HarvestEvent.from_json({"harvest_id": "h1", "profile_id": "p2", "harvested_at": "2024-04-02T10:15:00Z"}),
+    ]
+
+    with patch.object(registry, "async_record_events", AsyncMock(return_value=stored)):
+        response = await hass.services.async_call(
+            DOMAIN,
+            "record_events",
+            {"events": events},
+            blocking=True,
+            return_response=True,
+        )
+
+    assert response == {"recorded": 2, "profiles": {"p1": {"cultivation": 1}, "p2": {"harvest": 1}}}
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from custom_components.horticulture_assistant.calibration import services as calib_services
+from custom_components.horticulture_assistant.calibration import store as store_mod
+from custom_components.horticulture_assistant.calibration.fit import (
+    IncrementalFit,
+    compile_evaluator,
+    eval_model,
+    fit_many,
+    fit_models,
+    fit_quadratic,
+    select_model,
+)
+
+LUX = np.linspace(50, 60000, 24)
+
+
+def test_fit_models_matches_single_fits_and_selects_by_cv():
+    ppfd = 2e-8 * LUX**2 + 0.015 * LUX + 3
+    results = fit_models(LUX, ppfd, folds=5)
+
+    coeffs, r2, _ = fit_quadratic(LUX, ppfd)
+    assert results["quadratic"].coefficients == pytest.approx(coeffs, rel=1e-6)
+    assert results["quadratic"].r2 == pytest.approx(r2)
+    assert results["quadratic"].cv_rmse < results["linear"].cv_rmse
+    assert select_model(LUX, ppfd).model == "quadratic"
+
+    linear = 0.0185 * LUX + 2
+    assert select_model(LUX, linear).model == "linear"
+
+
+@pytest.mark.parametrize("robust", ["huber", "ransac"])
+def test_robust_fits_ignore_outliers(robust):
+    ppfd = 0.02 * LUX + 5
+    noisy = ppfd.copy()
+    noisy[[3, 11, 17]] = [900.0, 5.0, 1500.0]
+
+    plain = fit_models(LUX, noisy, ("linear",))["linear"]
+    robust_fit = fit_models(LUX, noisy, ("linear",), robust=robust)["linear"]
+
+    assert robust_fit.coefficients[0] == pytest.approx(0.02, rel=1e-3)
+    assert abs(robust_fit.coefficients[1] - 5) < abs(plain.coefficients[1] - 5) / 10
+
+
+def test_incremental_fit_matches_batch_fit():
+    ppfd = 3 * LUX**0.8
+    fitter = IncrementalFit()
+    fitter.add(LUX[0], ppfd[0])
+    for lux, value in zip(LUX[1:], ppfd[1:], strict=True):
+        fitter.add(lux, value)
+
+    for model in ("linear", "quadratic", "power"):
+        batch = fit_models(LUX, ppfd, (model,))[model]
+        assert fitter.fit(model).coefficients == pytest.approx(batch.coefficients, rel=1e-6)
+    assert fitter.fit("power").coefficients == pytest.approx([3.0, 0.8], rel=1e-6)
+    assert fitter.select().model == "power"
+
+
+def test_fit_many_handles_sensors_with_different_lengths():
+    datasets = {
+        "sensor.a": (LUX, 0.02 * LUX + 1),
+        "sensor.b": (LUX[:7], 2 * LUX[:7] ** 0.7),
+        "sensor.c": (LUX[:12], 1e-8 * LUX[:12] ** 2 + 0.01 * LUX[:12]),
+    }
+
+    fits = fit_many(datasets)
+
+    assert [fits[k].model for k in datasets] == ["linear", "power", "quadratic"]
+    assert fits["sensor.b"].n == 7
+    assert fit_many(datasets, "linear")["sensor.c"].model == "linear"
+
+
+def test_compiled_evaluator_matches_eval_model():
+    history = np.linspace(0, 80000, 1000)
+    for model, coeffs in (("linear", [0.02, 1.0]), ("quadratic", [1e-8, 0.01, 2.0]), ("power", [3.0, 0.8])):
+        evaluate = compile_evaluator(model, coeffs)
+        assert np.allclose(evaluate(history), eval_model(model, coeffs, history))
+    with pytest.raises(ValueError):
+        compile_evaluator("cubic", [1.0])
+
+
+async def test_recalibrate_refits_stored_records_in_one_write(hass):
+    class CountingStore:
+        def __init__(self):
+            self.data = {}
+            self.saves = 0
+
+        async def async_load(self):
+            return self.data
+
+        async def async_save(self, data):
+            self.data = data
+            self.saves += 1
+
+    dummy = CountingStore()
+    store_mod._store = lambda _hass: dummy
+    for i, slope in enumerate((0.02, 0.03)):
+        dummy.data[f"sensor.lux_{i}"] = {
+            "lux_entity_id": f"sensor.lux_{i}",
+            "device_id": None,
+            "model": {"model": "linear", "coefficients": [1.0, 0.0], "notes": "meter A"},
+            "points": [{"lux": x, "ppfd": slope * x, "at_utc": ""} for x in LUX[:8]],
+        }
+
+    updated = await calib_services.async_recalibrate(hass)
+
+    assert dummy.saves == 1
+    assert updated["sensor.lux_1"]["coefficients"][0] == pytest.approx(0.03)
+    assert dummy.data["sensor.lux_0"]["model"]["notes"] == "meter A"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import random
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, cast
@@ -22,8 +23,10 @@ from custom_components.horticulture_assistant.cloudsync import (
     EdgeResolverService,
     EdgeSyncStore,
     EdgeSyncWorker,
+    NDJSONDecoder,
     SyncEvent,
     VectorClock,
+    encode_ndjson,
     resolve_result_to_resolved_target,
 )
 from custom_components.horticulture_assistant.const import (
@@ -82,6 +85,28 @@ def test_edge_store_outbox(tmp_path: Path) -> None:
     assert store.get_outbox_batch() == []
 
 
+def test_ndjson_decoder_handles_split_lines() -> None:
+    events = [make_event(f"01K{i}", "profile", {"value": i}) for i in range(3)]
+    payload = encode_ndjson(events).encode()
+    decoder = NDJSONDecoder()
+    decoded: list[SyncEvent] = []
+    for start in range(0, len(payload), 7):
+        decoded.extend(decoder.feed(payload[start : start + 7]))
+    decoded.extend(decoder.flush())
+    assert [event.event_id for event in decoded] == ["01K0", "01K1", "01K2"]
+    assert decoded[2].patch == {"value": 2}
+
+
+def test_edge_store_export_outbox_pages(tmp_path: Path) -> None:
+    store = EdgeSyncStore(tmp_path / "sync.db")
+    events = [make_event(f"01L{i}", "profile", {"value": i}) for i in range(5)]
+    for event in events:
+        store.append_outbox(event)
+    pages = list(store.iter_outbox_ndjson(page_size=2))
+    assert len(pages) == 3
+    assert "".join(pages) == store.export_outbox_ndjson() == encode_ndjson(events)
+
+
 def test_cloud_auth_tokens_parses_numeric_expiry() -> None:
     now = datetime(2025, 1, 1, tzinfo=UTC)
     payload = {
@@ -146,6 +171,83 @@ def test_conflict_resolver_or_set() -> None:
     assert sorted(merged["tags"]) == ["b", "c"]
 
 
+def _edit_events(count: int, seed: int) -> list[SyncEvent]:
+    rng = random.Random(seed)
+    start = datetime(2025, 10, 20, tzinfo=UTC)
+    events = []
+    for idx in range(count):
+        patch: dict[str, Any] = {}
+        if rng.random() < 0.7:
+            patch["thresholds"] = {rng.choice(["temp_c_max", "rh_min", "vpd"]): rng.randint(0, 40)}
+        if rng.random() < 0.4:
+            patch["note"] = f"edit {idx}"
+        if rng.random() < 0.4:
+            tags = [rng.choice("abcde") for _ in range(2)]
+            patch["tags"] = {"add": tags[:1], "remove": tags[1:]} if rng.random() < 0.5 else tags
+        if rng.random() < 0.3:
+            patch["notes"] = [f"n{idx % 3}"]
+        event = make_event(f"01N{idx:04d}", "profile", patch or {"note": "touch"})
+        event.ts = start + timedelta(seconds=idx // 2)
+        event.vector = VectorClock(device="edge-1", counter=idx + 1)
+        events.append(event)
+    return events
+
+
+def test_conflict_resolver_compact_matches_sequential_apply() -> None:
+    resolver = ConflictResolver(field_policies={"tags": ConflictPolicy.OR_SET, "notes": ConflictPolicy.MV_REGISTER})
+    for seed in range(20):
+        events = _edit_events(40, seed)
+        # Cloud state holding concurrent writes from another device.
+        remote = make_event("01R", "profile", {"thresholds": {"rh_min": 1, "vpd": 2}, "note": "remote"})
+        remote.device_id = "edge-2"
+        remote.vector = VectorClock(device="edge-2", counter=9)
+        remote.ts = datetime(2025, 10, 20, 0, 0, 10, tzinfo=UTC)
+        initial = resolver.apply({"tags": ["a", "z"], "notes": ["n0"]}, remote)
+
+        expected = initial
+        for event in events:
+            expected = resolver.apply(expected, event)
+        compacted = resolver.compact(events)
+        actual = initial
+        for event in compacted:
+            actual = resolver.apply(actual, event)
+
+        assert actual == expected
+        assert len(compacted) <= 6
+
+
+def test_edge_store_compact_outbox(tmp_path: Path) -> None:
+    store = EdgeSyncStore(tmp_path / "sync.db")
+    resolver = ConflictResolver(field_policies={"tags": ConflictPolicy.OR_SET})
+    for event in _edit_events(200, seed=1):
+        event.patch.pop("notes", None)
+        store.append_outbox(event)
+    sent = make_event("01A", "profile", {"note": "sent"})
+    sent.ts = datetime(2025, 10, 19, tzinfo=UTC)
+    store.append_outbox(sent)
+    store.mark_outbox_attempt(["01A"])
+    doomed = [make_event(f"01D{idx}", "profile", {"note": idx}) for idx in range(3)]
+    for idx, event in enumerate(doomed):
+        event.entity_id = "entity-2"
+        event.op = "delete" if idx == 2 else "upsert"
+        store.append_outbox(event)
+
+    removed = store.compact_outbox(resolver)
+
+    remaining = store.get_outbox_batch(1_000)
+    assert removed == 204 - len(remaining)
+    assert [event.event_id for event in remaining if event.entity_id == "entity-2"] == ["01D2"]
+    assert remaining[0].event_id == "01A" and remaining[0].patch == {"note": "sent"}
+    fields = []
+    for event in remaining[1:]:
+        if event.entity_id == "entity-1":
+            fields.extend(event.patch.get("thresholds", {}))
+            fields.extend(key for key in event.patch if key != "thresholds")
+    # One write per distinct field: three thresholds, the note and the tag delta.
+    assert sorted(fields) == ["note", "rh_min", "tags", "temp_c_max", "vpd"]
+    assert store.compact_outbox(resolver) == 0
+
+
 def test_edge_resolver_prefers_local_override(tmp_path: Path) -> None:
     store = EdgeSyncStore(tmp_path / "sync.db")
     profile_event = make_event(
@@ -404,6 +506,128 @@ def test_edge_worker_response_parsing(
     assert cursor == expected_cursor
 
 
+@pytest.mark.asyncio
+async def test_edge_worker_pull_streams_ndjson(tmp_path: Path) -> None:
+    store = EdgeSyncStore(tmp_path / "sync.db")
+    events = [make_event(f"01M{i}", "profile", {"value": i}) for i in range(3)]
+    events[1].entity_id = "entity-2"
+    payload = encode_ndjson(events).encode()
+
+    class _Content:
+        async def iter_chunked(self, size):
+            for start in range(0, len(payload), 11):
+                yield payload[start : start + 11]
+
+    response = MagicMock()
+    response.status = 200
+    response.headers = {"Content-Type": "application/x-ndjson", "X-Sync-Cursor": "c3"}
+    response.content = _Content()
+    response.read = AsyncMock(side_effect=AssertionError("body should be streamed"))
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=False)
+    session = MagicMock()
+    session.get.return_value = response
+
+    worker = EdgeSyncWorker(store, cast(ClientSession, session), "https://api.example", "token", "tenant-1")
+    assert await worker.pull_once() == 3
+    assert store.get_cursor("cloud") == "c3"
+    entry = store.fetch_cloud_cache_entry("profile", "entity-1", tenant_id="tenant-1", org_id="org-1")
+    assert entry is not None and entry.payload["value"] == 2
+
+
+@pytest.mark.asyncio
+async def test_edge_worker_pull_empty_page_advances_cursor(tmp_path: Path) -> None:
+    store = EdgeSyncStore(tmp_path / "sync.db")
+    response = MagicMock()
+    response.status = 200
+    response.headers = {"Content-Type": "application/json"}
+    response.read = AsyncMock(return_value=json.dumps({"events": [], "cursor": "c9"}).encode())
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=False)
+    session = MagicMock()
+    session.get.return_value = response
+
+    worker = EdgeSyncWorker(store, cast(ClientSession, session), "https://api.example", "token", "tenant-1")
+    worker.last_pull_error = "old"
+    assert await worker.pull_once() == 0
+    assert store.get_cursor("cloud") == "c9"
+    assert worker.last_pull_error is None
+    assert worker.last_success_at is not None
+
+
+@pytest.mark.asyncio
+async def test_edge_worker_push_compacts_backlog(tmp_path: Path) -> None:
+    store = EdgeSyncStore(tmp_path / "sync.db")
+    for idx in range(5):
+        event = make_event(f"01P{idx}", "profile", {"value": idx})
+        event.vector = VectorClock(device="edge-1", counter=idx + 1)
+        store.append_outbox(event)
+    sent: list[bytes] = []
+
+    class _Post:
+        def __init__(self, url, *, data, headers, timeout) -> None:
+            self.data = data
+
+        async def __aenter__(self):
+            sent.extend([chunk async for chunk in self.data])
+            response = MagicMock()
+            response.status = 200
+            response.text = AsyncMock(return_value=json.dumps({"acked": ["01P4"]}))
+            return response
+
+        async def __aexit__(self, *exc) -> bool:
+            return False
+
+    session = MagicMock()
+    session.post = _Post
+    worker = EdgeSyncWorker(store, cast(ClientSession, session), "https://api.example", "token", "tenant-1")
+
+    assert await worker.push_once(limit=2) == 1
+    assert [SyncEvent.from_json_line(line).patch for line in b"".join(sent).decode().splitlines()] == [{"value": 4}]
+    assert store.outbox_size() == 0
+
+
+@pytest.mark.asyncio
+async def test_edge_worker_compacts_each_backlog_once(tmp_path: Path) -> None:
+    store = EdgeSyncStore(tmp_path / "sync.db")
+    for idx in range(6):
+        event = make_event(f"01Q{idx}", "profile", {"value": idx})
+        event.entity_id = f"entity-{idx}"
+        store.append_outbox(event)
+    passes: list[int] = []
+    compact = store.compact_outbox
+    store.compact_outbox = lambda resolver: passes.append(1) or compact(resolver)
+
+    class _Post:
+        def __init__(self, url, *, data, headers, timeout) -> None:
+            self.data = data
+
+        async def __aenter__(self):
+            lines = b"".join([chunk async for chunk in self.data]).decode().splitlines()
+            response = MagicMock()
+            response.status = 200
+            acked = [SyncEvent.from_json_line(line).event_id for line in lines]
+            response.text = AsyncMock(return_value=json.dumps({"acked": acked}))
+            return response
+
+        async def __aexit__(self, *exc) -> bool:
+            return False
+
+    session = MagicMock()
+    session.post = _Post
+    worker = EdgeSyncWorker(store, cast(ClientSession, session), "https://api.example", "token", "tenant-1")
+
+    # Six distinct entities cannot be compacted below the batch size.
+    assert await worker.push_once(limit=2) == 2
+    assert await worker.push_once(limit=2) == 2
+    assert len(passes) == 1 and not store.outbox_dirty
+
+    for idx in range(2):
+        store.append_outbox(make_event(f"01R{idx}", "profile", {"value": idx}))
+    assert await worker.push_once(limit=2) == 2
+    assert len(passes) == 2
+
+
 @pytest.mark.asyncio
 async def test_cloud_sync_manager_disabled(hass, tmp_path):
     entry = MockConfigEntry(domain=DOMAIN, entry_id="entry", data={}, options={})
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from custom_components.horticulture_assistant.dafe.ec_model import calculate_ec_drift
+from custom_components.horticulture_assistant.dafe.media_models import get_media_profile
+from custom_components.horticulture_assistant.dafe.pulse_scheduler import generate_pulse_schedule
+from custom_components.horticulture_assistant.dafe.simulation import rank_schedules, simulate_pulse_schedules
+from custom_components.horticulture_assistant.dafe.species_profiles import get_species_profile
+from custom_components.horticulture_assistant.engine.plant_engine.nutrient_diffusion import (
+    calculate_effective_diffusion,
+    estimate_diffusion_mass,
+)
+
+MEDIA_ML = 2000.0
+EC_IN = 1.8
+ET_ML = 40.0
+
+
+def _reference(volumes, wc, ec, media):
+    """Step one schedule with the scalar DAFE helpers."""
+
+    water = wc * MEDIA_ML
+    wcs, ecs, drains, masses = [wc], [ec], [], []
+    for pulse in volumes:
+        drained = max(water + pulse - media.fc * MEDIA_ML, 0.0)
+        if water > 0:
+            ec += calculate_ec_drift(EC_IN, ec, pulse, drained, water)
+        elif pulse > 0:
+            ec = EC_IN
+        water += pulse - drained
+        masses.append(
+            estimate_diffusion_mass(1e-5, water / MEDIA_ML, media.porosity, media.tortuosity, 100, 50, 1, 10, 3600)
+        )
+        if water > media.pwp * MEDIA_ML:
+            water = max(water - ET_ML, media.pwp * MEDIA_ML)
+        wcs.append(water / MEDIA_ML)
+        ecs.append(ec)
+        drains.append(drained)
+    return wcs, ecs, drains, masses
+
+
+def test_batch_matches_scalar_reference():
+    media = get_media_profile("coco_coir")
+    rng = np.random.default_rng(3)
+    schedules = rng.choice([0.0, 30.0, 60.0, 120.0], size=(64, 12))
+
+    result = simulate_pulse_schedules(
+        schedules,
+        wc=0.38,
+        ec=2.2,
+        media_profile=media,
+        media_volume_ml=MEDIA_ML,
+        ec_in=EC_IN,
+        et_ml_per_hour=ET_ML,
+    )
+
+    assert result.wc.shape == (64, 13) and result.mass_mg.shape == (64, 12)
+    for row in (0, 17, 63):
+        wcs, ecs, drains, masses = _reference(schedules[row], 0.38, 2.2, media)
+        np.testing.assert_allclose(result.wc[row], wcs, rtol=1e-9)
+        np.testing.assert_allclose(result.ec[row], ecs, rtol=1e-9)
+        np.testing.assert_allclose(result.drainage_ml[row], drains, atol=1e-9)
+        np.testing.assert_allclose(result.mass_mg[row], masses, rtol=1e-9)
+
+
+def test_rank_schedules_prefers_plateau_and_ec_band():
+    species = get_species_profile("Cannabis_sativa")
+    media = get_media_profile("coco_coir")
+    candidates = np.array([[0.0] * 6, [60.0] * 6, [400.0] * 6])
+
+    result = simulate_pulse_schedules(
+        candidates,
+        wc=species.ideal_wc_plateau - 0.05,
+        ec=2.0,
+        media_profile=media,
+        media_volume_ml=MEDIA_ML,
+        ec_in=0.0,
+        et_ml_per_hour=ET_ML,
+    )
+
+    order = rank_schedules(result, species)
+    assert order[0] == 1
+    assert sorted(order.tolist()) == [0, 1, 2]
+    with pytest.raises(ValueError):
+        simulate_pulse_schedules([-1.0], wc=0.4, ec=2.0, media_profile=media, media_volume_ml=MEDIA_ML, ec_in=1.0)
+
+
+def test_pulse_schedule_repeats_one_pulse():
+    species = get_species_profile("Cannabis_sativa")
+    media = get_media_profile("coco_coir")
+    wc = species.ideal_wc_plateau - 0.01
+    d_eff = calculate_effective_diffusion(1e-5, wc, media.porosity, media.tortuosity)
+
+    schedule = generate_pulse_schedule(wc, 2.2, d_eff, species, media, hours=4)
+    assert len(schedule) == 4
+    assert len({(p["volume"], p["mass_mg"]) for p in schedule}) == 1
+    assert generate_pulse_schedule(species.ideal_wc_plateau, 2.2, d_eff, species, media) == []
+
+
+def test_dry_start_takes_irrigation_ec():
+    media = get_media_profile("coco_coir")
+
+    result = simulate_pulse_schedules(
+        [[0.0, 100.0], [100.0, 0.0], [1e-3, 0.0]],
+        wc=0.0,
+        ec=3.0,
+        media_profile=media,
+        media_volume_ml=MEDIA_ML,
+        ec_in=EC_IN,
+    )
+
+    np.testing.assert_allclose(result.ec[0], [3.0, 3.0, EC_IN])
+    np.testing.assert_allclose(result.ec[1], [3.0, EC_IN, EC_IN])
+    np.testing.assert_allclose(result.ec[2, 1], EC_IN)
+    assert np.isfinite(result.ec).all()
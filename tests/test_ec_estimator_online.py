@@ -0,0 +1,68 @@
+import json
+
+import numpy as np
+import pytest
+
+from custom_components.horticulture_assistant.utils import ec_estimator, json_io
+from custom_components.horticulture_assistant.utils.ec_estimator import OnlineECModel
+
+
+@pytest.fixture(autouse=True)
+def _clear_models():
+    ec_estimator.clear_model_cache()
+    yield
+    ec_estimator.clear_model_cache()
+
+
+def _samples(count, rng):
+    for _ in range(count):
+        moisture = rng.uniform(20, 50)
+        solution_ec = rng.uniform(0.8, 2.5)
+        yield {
+            "moisture": moisture,
+            "solution_ec": solution_ec,
+            "observed_ec": 0.3 + 0.01 * moisture + 0.7 * solution_ec,
+        }
+
+
+def test_online_model_converges_to_batch_fit():
+    rng = np.random.default_rng(1)
+    samples = list(_samples(200, rng))
+    online = OnlineECModel(forgetting=1.0)
+    for row in samples:
+        online.update(row, row["observed_ec"])
+
+    model = online.estimator()
+    assert model.intercept == pytest.approx(0.3, abs=1e-3)
+    assert model.coeffs["moisture"] == pytest.approx(0.01, abs=1e-4)
+    assert model.coeffs["solution_ec"] == pytest.approx(0.7, abs=1e-3)
+    assert OnlineECModel.from_dict(json.loads(json.dumps(online.as_dict()))).estimator() == model
+
+
+def test_update_ec_model_persists_state(tmp_path):
+    rng = np.random.default_rng(2)
+    for row in _samples(50, rng):
+        ec_estimator.update_ec_model(row, row["observed_ec"], plant_id="p1", base_path=tmp_path)
+
+    saved = json.loads((tmp_path / "p1" / "ec_model.json").read_text())
+    assert saved["rls"]["samples"] == 50
+    ec_estimator.clear_model_cache()
+
+    loaded = ec_estimator.load_model(plant_id="p1", base_path=tmp_path)
+    assert loaded.coeffs["solution_ec"] == pytest.approx(saved["coeffs"]["solution_ec"])
+    assert ec_estimator.load_online_model(plant_id="p1", base_path=tmp_path).samples == 50
+
+
+def test_log_tail_reading_and_append(tmp_path, monkeypatch):
+    monkeypatch.setattr(json_io, "_TAIL_BLOCK", 128)
+    log = tmp_path / "p1" / "runoff_ec_log.json"
+    for value in range(40):
+        ec_estimator.log_runoff_ec("p1", value / 10, base_path=tmp_path)
+
+    entries = json.loads(log.read_text())
+    assert [e["ec"] for e in entries] == [v / 10 for v in range(40)]
+    assert ec_estimator._load_recent_entries(log, 3) == entries[-3:]
+
+    nested = tmp_path / "nested.json"
+    json_io.save_json(nested, [{"id": i, "tags": [{"k": "]"}], "note": "},{"} for i in range(30)])
+    assert [e["id"] for e in json_io.load_json_tail(nested, 4)] == [26, 27, 28, 29]
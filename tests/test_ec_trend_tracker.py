@@ -0,0 +1,116 @@
+import json
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+from custom_components.horticulture_assistant.utils import ec_trend_tracker
+from custom_components.horticulture_assistant.utils.ec_trend_tracker import ECTrendTracker
+
+T0 = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _state(value, ts):
+    return SimpleNamespace(state=str(value), last_changed=ts, entity_id="sensor.ec")
+
+
+def test_streaming_alerts_are_edge_triggered_and_journaled(tmp_path):
+    tracker = ECTrendTracker(str(tmp_path / "ec_alerts.json"))
+    tracker.configure_plant("p1", "sensor.ec", threshold=2.0)
+
+    fired = []
+    for minutes, value in ((0, 1.0), (60, 1.5), (120, 2.5), (130, 2.6), (140, 2.7)):
+        fired += tracker.add_reading("sensor.ec", value, T0 + timedelta(minutes=minutes))
+    assert [alert["type"] for _, alert in fired] == ["sudden_increase"]
+
+    # Once the low start value ages out of the 3h window the alert re-arms.
+    assert tracker.add_reading("sensor.ec", 2.8, T0 + timedelta(hours=4)) == []
+    high = tracker.add_reading("sensor.ec", 2.9, T0 + timedelta(hours=8, minutes=1))
+    assert [alert["type"] for _, alert in high] == ["high_ec"]
+    assert high[0][1]["min_value"] == 2.5
+    assert tracker.sustained_high_since("p1") == T0 + timedelta(minutes=120)
+
+    lines = (tmp_path / "ec_alerts.jsonl").read_text().splitlines()
+    assert [json.loads(line)["type"] for line in lines] == ["sudden_increase", "high_ec"]
+    reloaded = ECTrendTracker(str(tmp_path / "ec_alerts.json"))
+    assert [a["type"] for a in reloaded._alerts["p1"]] == ["sudden_increase", "high_ec"]
+
+
+class _Hass(SimpleNamespace):
+    async def async_add_executor_job(self, func, *args):
+        self.jobs.append(func)
+        return func(*args)
+
+
+async def test_check_trends_queries_recorder_once_and_is_edge_triggered(tmp_path, monkeypatch):
+    queries = []
+    now = datetime.now(UTC)
+
+    def _history(hass, start, end, entity_id, include_start_time_state):
+        queries.append(entity_id)
+        return {entity_id: [_state(1.0, now - timedelta(hours=2)), _state(1.5, now - timedelta(hours=1))]}
+
+    current = {"value": _state(2.6, now - timedelta(minutes=5))}
+    hass = _Hass(
+        jobs=[],
+        states=SimpleNamespace(get=lambda entity_id: current["value"]),
+        config=SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts))),
+    )
+    monkeypatch.setattr(ec_trend_tracker, "state_changes_during_period", _history)
+    monkeypatch.setattr(
+        ec_trend_tracker,
+        "load_profile",
+        lambda plant_id, base_dir: {"sensor_entities": {"ec": "sensor.ec"}, "thresholds": {"ec": 3.0}},
+    )
+    tracker = ECTrendTracker(str(tmp_path / "ec_alerts.json"), hass=hass)
+
+    await tracker.async_check_trends("p1")
+    current["value"] = _state(2.7, now - timedelta(minutes=1))
+    await tracker.async_check_trends("p1")
+
+    assert queries == ["sensor.ec"]
+    assert hass.jobs[0] == tracker._seed_from_recorder
+    # The rise is still in progress on the second check, so it is not recorded again.
+    assert [a["type"] for a in tracker._alerts["p1"]] == ["sudden_increase"]
+    assert [a["end_value"] for a in tracker._alerts["p1"]] == [2.6]
+
+
+def test_state_events_journal_in_executor(tmp_path):
+    jobs = []
+    hass = SimpleNamespace(async_add_executor_job=lambda func, *args: jobs.append((func, args)))
+    tracker = ECTrendTracker(str(tmp_path / "ec_alerts.json"), hass=hass)
+    tracker.configure_plant("p1", "sensor.ec", threshold=5.0)
+
+    for minutes, value in ((0, 1.0), (60, 2.5)):
+        state = _state(value, T0 + timedelta(minutes=minutes))
+        tracker._handle_event(SimpleNamespace(data={"entity_id": "sensor.ec", "new_state": state}))
+
+    assert not (tmp_path / "ec_alerts.jsonl").exists()
+    assert jobs == [(tracker._flush_pending, ())]
+    jobs[0][0]()
+    lines = (tmp_path / "ec_alerts.jsonl").read_text().splitlines()
+    assert [json.loads(line)["type"] for line in lines] == ["sudden_increase"]
+    assert [a["type"] for a in tracker._alerts["p1"]] == ["sudden_increase"]
+
+
+def test_journal_is_compacted_at_threshold_without_duplicates(tmp_path, monkeypatch):
+    monkeypatch.setattr(ec_trend_tracker, "COMPACT_AFTER_LINES", 2)
+    data_file = tmp_path / "ec_alerts.json"
+    journal = tmp_path / "ec_alerts.jsonl"
+    tracker = ECTrendTracker(str(data_file))
+    tracker.configure_plant("p1", "sensor.ec", threshold=2.0)
+
+    tracker.add_reading("sensor.ec", 1.0, T0)
+    tracker.add_reading("sensor.ec", 2.5, T0 + timedelta(hours=1))
+    assert len(journal.read_text().splitlines()) == 1
+    tracker.add_reading("sensor.ec", 2.6, T0 + timedelta(hours=7, minutes=1))
+
+    assert not journal.exists()
+    saved = json.loads(data_file.read_text())
+    assert list(saved) == ["p1"]
+    assert [a["type"] for a in saved["p1"]] == ["sudden_increase", "high_ec"]
+    assert json.loads((tmp_path / "ec_alerts.json.seq").read_text())["seq"] == 2
+
+    # A journal left behind by an interrupted compaction is not replayed twice.
+    journal.write_text(json.dumps({"plant_id": "p1", "seq": 2, "type": "high_ec"}) + "\n")
+    reloaded = ECTrendTracker(str(data_file))
+    assert [a["type"] for a in reloaded._alerts["p1"]] == ["sudden_increase", "high_ec"]
+    assert set(reloaded._alerts) == {"p1"}
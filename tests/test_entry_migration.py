@@ -51,7 +51,7 @@ async def test_migrate_entry_materialises_profile_payload(hass):
 
     await async_migrate_entry(hass, entry)
 
-    assert entry.version == 4
+    assert entry.version == 5
     assert entry.options[CONF_KEEP_STALE] == DEFAULT_KEEP_STALE
     assert entry.options["thresholds"]["moisture_min"] == 10
     profile_map = entry.options[CONF_PROFILES]
@@ -63,7 +63,8 @@ async def test_migrate_entry_materialises_profile_payload(hass):
     assert profile["general"]["sensors"]["moisture"] == "sensor.alpha"
     assert profile["general"][CONF_PROFILE_SCOPE] == PROFILE_SCOPE_DEFAULT
     assert profile["species_display"] == "Basil"
-    assert "sections" in profile and "library" in profile and "local" in profile
+    assert "library" in profile and "local" in profile
+    assert "sections" not in profile
     assert entry.options["sensors"]["moisture"] == "sensor.alpha"
 
 
@@ -89,12 +90,13 @@ async def test_migrate_entry_preserves_existing_profiles(hass):
 
     await async_migrate_entry(hass, entry)
 
-    assert entry.version == 4
+    assert entry.version == 5
     profile = entry.options[CONF_PROFILES]["beta"]
     assert profile["general"]["sensors"]["temperature"] == "sensor.temp"
     assert profile["general"][CONF_PROFILE_SCOPE] == PROFILE_SCOPE_DEFAULT
     assert profile["citations"]["temperature"]["mode"] == "manual"
-    assert "sections" in profile and "library" in profile and "local" in profile
+    assert "library" in profile and "local" in profile
+    assert "sections" not in profile
 
 
 @pytest.mark.asyncio
@@ -111,8 +113,48 @@ async def test_migrate_entry_prefixes_profile_unique_ids(hass):
 
     await async_migrate_entry(hass, entry)
 
-    assert entry.version == 4
+    assert entry.version == 5
     migrated = registry.entities["sensor.alpha_moisture"].unique_id
     untouched = registry.entities["sensor.beta"].unique_id
     assert migrated == "entry_alpha_moisture"
     assert untouched == "entry_beta_temp"
+
+
+@pytest.mark.asyncio
+async def test_migrate_entry_moves_profile_history_to_store(hass):
+    module = importlib.import_module("custom_components.horticulture_assistant.__init__")
+    async_migrate_entry = module.async_migrate_entry
+    from custom_components.horticulture_assistant.profile import store as profile_store
+
+    run = {"run_id": "run-1", "profile_id": "gamma", "started_at": "2024-01-01T00:00:00+00:00"}
+    entry = DummyConfigEntry(
+        version=4,
+        options={
+            CONF_PROFILES: {
+                "gamma": {
+                    "name": "Gamma",
+                    "thresholds": {"temp_c_min": 12},
+                    "run_history": [run],
+                    "computed_stats": [{"stats_version": "yield/v1", "computed_at": "2024-02-01T00:00:00Z"}],
+                    "sections": {"local": {"run_history": [run]}},
+                    "local": {"general": {}, "run_history": [run]},
+                }
+            }
+        },
+    )
+    hass.config_entries._entries[entry.entry_id] = entry
+
+    await async_migrate_entry(hass, entry)
+
+    assert entry.version == 5
+    profile = entry.options[CONF_PROFILES]["gamma"]
+    for key in ("run_history", "computed_stats", "sections"):
+        assert key not in profile
+    assert "run_history" not in profile["local"]
+    assert profile["thresholds"]["temp_c_min"] == 12
+    assert profile["storage_ref"]["key"] == profile_store.STORE_KEY
+
+    stored = await profile_store.async_get_profile(hass, "gamma")
+    assert stored is not None
+    assert stored["run_history"][0]["run_id"] == "run-1"
+    assert stored["computed_stats"][0]["stats_version"] == "yield/v1"
@@ -0,0 +1,98 @@
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from custom_components.horticulture_assistant.engine.plant_engine.compute_transpiration import (
+    compute_transpiration,
+    compute_transpiration_batch,
+    compute_transpiration_series,
+)
+from custom_components.horticulture_assistant.engine.plant_engine.constants import default_env
+from custom_components.horticulture_assistant.engine.plant_engine.et_model import (
+    calculate_et0,
+    calculate_et0_array,
+)
+
+PROFILES = [
+    {"plant_type": "lettuce", "stage": "vegetative"},
+    {"kc": 0.9, "canopy_m2": 0.3},
+    {"plant_type": "tomato", "stage": "fruiting", "canopy_m2": 0.5},
+]
+
+
+def _readings(count, seed=1):
+    rng = np.random.default_rng(seed)
+    return {
+        "temp_c": rng.uniform(5.0, 38.0, count),
+        "rh_pct": rng.uniform(20.0, 95.0, count),
+        "par_w_m2": rng.uniform(0.0, 800.0, count),
+        "wind_speed_m_s": rng.uniform(0.2, 4.0, count),
+    }
+
+
+def test_et0_array_matches_scalar():
+    env = _readings(50)
+    result = calculate_et0_array(env["temp_c"], env["rh_pct"], env["par_w_m2"], env["wind_speed_m_s"])
+
+    expected = [
+        calculate_et0(t, rh, par, wind)
+        for t, rh, par, wind in zip(env["temp_c"], env["rh_pct"], env["par_w_m2"], env["wind_speed_m_s"], strict=True)
+    ]
+    np.testing.assert_allclose(result, expected, atol=0.011)
+
+
+def test_batch_matches_scalar_per_plant_and_reading():
+    env = _readings(40)
+    env["temp_c"][3] = np.nan
+
+    result = compute_transpiration_batch(PROFILES, env)
+
+    assert result["transpiration_ml_day"].shape == (len(PROFILES), 40)
+    for p, profile in enumerate(PROFILES):
+        for i in (0, 3, 39):
+            reading = {key: float(values[i]) for key, values in env.items()}
+            if np.isnan(reading["temp_c"]):
+                reading["temp_c"] = default_env()["temp_c"]
+            expected = compute_transpiration(profile, reading)
+            assert result["et0_mm_day"][p, i] == pytest.approx(expected["et0_mm_day"], abs=0.011)
+            assert result["eta_mm_day"][p, i] == pytest.approx(expected["eta_mm_day"], abs=0.011)
+            assert result["transpiration_ml_day"][p, i] == pytest.approx(expected["transpiration_ml_day"], abs=15)
+
+
+def test_series_from_records_uses_weights():
+    records = [{"temp_c": 25, "rh_pct": 50, "par_w_m2": 400}, {"temp_c": 30, "rh_pct": 40, "par_w_m2": 600}]
+    first = compute_transpiration(PROFILES[1], records[0])
+
+    assert compute_transpiration_series(PROFILES[1], records, weights=[1, 0]) == first
+    assert compute_transpiration_series(PROFILES[1], [])["et0_mm_day"] == 0.0
+    with pytest.raises(ValueError):
+        compute_transpiration_series(PROFILES[1], records, weights=[1])
+
+
+def test_year_of_readings_for_hundred_plants_is_fast():
+    profiles = [{"kc": 0.6 + i / 200, "canopy_m2": 0.1 + i / 100} for i in range(100)]
+    env = _readings(365)
+    compute_transpiration_batch(profiles[:1], env)
+
+    start = time.perf_counter()
+    result = compute_transpiration_batch(profiles, env)
+    elapsed = time.perf_counter() - start
+
+    assert result["eta_mm_day"].shape == (100, 365)
+    assert elapsed < 0.5
+
+
+def test_batch_path_does_not_import_pandas():
+    code = (
+        "import sys\n"
+        "from tests.conftest import *\n"
+        "from custom_components.horticulture_assistant.engine.plant_engine import compute_transpiration as ct\n"
+        "ct.compute_transpiration_batch([{'kc': 1.0, 'canopy_m2': 0.2}], {'temp_c': [20.0, 25.0]})\n"
+        "ct.compute_transpiration_series({'kc': 1.0}, [{'temp_c': 20.0}])\n"
+        "assert 'pandas' not in sys.modules, 'pandas imported'\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=".")
+    assert proc.returncode == 0, proc.stderr
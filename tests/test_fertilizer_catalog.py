@@ -0,0 +1,43 @@
+import math
+
+import pytest
+
+from custom_components.horticulture_assistant import catalog as catalog_mod
+from custom_components.horticulture_assistant.catalog import CATALOG, FertilizerCatalog
+from custom_components.horticulture_assistant.fertilizer_formulator import (
+    estimate_cost_per_nutrient,
+    get_cheapest_product,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_catalog():
+    FertilizerCatalog.refresh()
+    yield
+    FertilizerCatalog.refresh()
+
+
+def test_cost_matrix_matches_per_product_costs():
+    matrix = CATALOG.cost_matrix()
+    assert matrix is CATALOG.cost_matrix()
+
+    for row, pid in zip(matrix.costs, matrix.products, strict=True):
+        costs = estimate_cost_per_nutrient(pid)
+        for nutrient, cost in zip(matrix.nutrients, row, strict=True):
+            assert costs.get(nutrient, math.inf) == cost
+
+    for nutrient, sources in matrix.cheapest.items():
+        assert get_cheapest_product(nutrient) == sources[0]
+        assert [cost for _pid, cost in sources] == sorted(cost for _pid, cost in sources)
+
+
+def test_cost_matrix_rebuilds_when_prices_reload(monkeypatch):
+    product, cost = get_cheapest_product("N")
+    before = CATALOG.cost_matrix()
+
+    doubled = {pid: price * 2 for pid, price in CATALOG.prices().items()}
+    monkeypatch.setattr(catalog_mod, "_PRICES", lambda: doubled)
+    FertilizerCatalog.prices.cache_clear()
+
+    assert CATALOG.cost_matrix() is not before
+    assert get_cheapest_product("N") == (product, pytest.approx(cost * 2, abs=1e-3))
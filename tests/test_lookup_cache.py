@@ -0,0 +1,110 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.horticulture_assistant import lookup_cache
+from custom_components.horticulture_assistant.lookup_cache import (
+    LookupCache,
+    async_flush_lookup_caches,
+    async_setup_lookup_caches,
+    async_unload_lookup_caches,
+    schedule_lookup_cache_save,
+)
+
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+TTL = timedelta(hours=1)
+
+
+def test_lookup_cache_evicts_least_recently_used():
+    cache = LookupCache("test_lru", max_entries=2, persist=False)
+    cache.set("a", 1, now=NOW)
+    cache.set("b", 2, now=NOW)
+    assert cache.get("a", ttl=TTL, now=NOW) == (True, 1)
+    cache.set("c", 3, now=NOW)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.get("a", ttl=TTL, now=NOW + TTL) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_coalesces_concurrent_requests():
+    cache = LookupCache("test_single_flight", persist=False)
+    release = asyncio.Event()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"ok": True}
+
+    tasks = [asyncio.create_task(cache.get_or_create("species", factory, ttl=TTL, now=NOW)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert results == [{"ok": True}] * 5
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_remembers_failures_briefly():
+    cache = LookupCache("test_negative", negative_ttl=timedelta(minutes=5), persist=False)
+    factory = AsyncMock(side_effect=[RuntimeError("down"), "recovered"])
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_create("key", factory, ttl=TTL, now=NOW)
+    with pytest.raises(RuntimeError):
+        await cache.get_or_create("key", factory, ttl=TTL, now=NOW + timedelta(minutes=1))
+    assert factory.call_count == 1
+
+    value = await cache.get_or_create("key", factory, ttl=TTL, now=NOW + timedelta(minutes=6))
+    assert value == "recovered"
+    assert factory.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_persists_to_storage(hass):
+    cache = LookupCache("test_persist")
+    await async_setup_lookup_caches(hass)
+    cache.set(("p1", "temp", (("model", "m"),)), {"value": 1.0}, now=NOW)
+    await async_flush_lookup_caches(hass)
+
+    cache.clear()
+    restored = LookupCache("test_persist")
+    lookup_cache._STORES.pop(id(hass))
+    await async_setup_lookup_caches(hass)
+
+    assert restored.get(("p1", "temp", (("model", "m"),)), ttl=TTL, now=NOW) == (True, {"value": 1.0})
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_delays_saves_and_releases_store_on_unload(hass, monkeypatch):
+    cache = LookupCache("test_delayed")
+    await async_setup_lookup_caches(hass)
+    store = lookup_cache._STORES[id(hass)]
+    delayed = []
+    monkeypatch.setattr(store, "async_delay_save", lambda func, delay: delayed.append((func, delay)))
+
+    cache.set("good", {"value": 1.0}, now=NOW)
+    cache.set("bad", object(), now=NOW)
+    schedule_lookup_cache_save(hass)
+    schedule_lookup_cache_save(hass)
+
+    assert [delay for _func, delay in delayed] == [lookup_cache.SAVE_DELAY] * 2
+    payload = delayed[-1][0]()
+    assert payload["test_delayed"] == [["good", {"value": 1.0}, NOW.isoformat()]]
+    assert cache.peek("bad") is not None
+
+    # Nothing changed since the payload was built, so no further write is queued.
+    schedule_lookup_cache_save(hass)
+    assert len(delayed) == 2
+
+    cache.set("late", 2.0, now=NOW)
+    await async_unload_lookup_caches(hass)
+    assert id(hass) not in lookup_cache._STORES
+    stored = await store.async_load()
+    assert ["late", 2.0, NOW.isoformat()] in stored["test_delayed"]
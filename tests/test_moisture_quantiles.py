@@ -0,0 +1,104 @@
+import asyncio
+import math
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import custom_components.horticulture_assistant.sensor as sensor_mod
+from custom_components.horticulture_assistant.sensor import (
+    EstimatedFieldCapacitySensor,
+    EstimatedWiltingPointSensor,
+)
+from custom_components.horticulture_assistant.utils.quantile_sketch import QuantileSketch
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(q * len(ordered))))
+    return ordered[rank - 1]
+
+
+def test_sketch_is_exact_for_small_samples():
+    sketch = QuantileSketch()
+    sketch.extend([40.0, 35.0, 50.0])
+
+    assert sketch.quantile(0.95) == 50.0
+    assert sketch.quantile(0.05) == 35.0
+    assert sketch.quantile(0.5) == 40.0
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_sketch_stays_within_error_bound_with_bounded_memory():
+    rng = random.Random(7)
+    values = [rng.uniform(5.0, 60.0) for _ in range(20_000)] + [0.0, -2.5]
+    sketch = QuantileSketch(alpha=0.01)
+    sketch.extend(values)
+
+    for q in (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99):
+        exact = _exact(values, q)
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.01)
+    assert sketch.quantile(0.0) == -2.5
+    assert sketch.quantile(1.0) == max(values)
+    state = sketch.as_dict()
+    assert "samples" not in state
+    assert len(state["pos"]) + len(state["neg"]) < 250
+
+    restored = QuantileSketch.from_dict(state)
+    assert restored.count == len(values)
+    assert restored.quantile(0.95) == sketch.quantile(0.95)
+
+
+def test_sketch_collapses_buckets_nearest_zero():
+    sketch = QuantileSketch(alpha=0.01, exact_size=0, max_buckets=20)
+    sketch.extend(float(v) for v in range(1, 1000))
+
+    assert len(sketch.as_dict()["pos"]) <= 20
+    assert sketch.quantile(0.99) == pytest.approx(_exact(range(1, 1000), 0.99), rel=0.01)
+
+
+class _States(dict):
+    def set(self, entity_id, value, stamp):
+        state = SimpleNamespace(state=value, last_updated=stamp)
+        self[entity_id] = state
+        return state
+
+
+def test_moisture_sensors_stream_and_restore(monkeypatch):
+    listeners = []
+
+    def _track(_hass, entity_ids, action):
+        listeners.append((entity_ids, action))
+        return lambda: None
+
+    monkeypatch.setattr(sensor_mod, "async_track_state_change_event", _track)
+    hass = SimpleNamespace(states=_States())
+    hass.states.set("sensor.pid_raw_moisture", "40", 0)
+
+    fc = EstimatedFieldCapacitySensor(hass, "Plant", "pid", "e1")
+    wp = EstimatedWiltingPointSensor(hass, "Plant", "pid", "e1")
+    for entity in (fc, wp):
+        entity.async_write_ha_state = lambda: None
+        asyncio.run(entity.async_added_to_hass())
+
+    assert fc.should_poll is False
+    assert [ids for ids, _ in listeners] == [["sensor.pid_raw_moisture"]] * 2
+    assert (fc.native_value, wp.native_value) == (40.0, 40.0)
+
+    for stamp, value in enumerate(["35", "unavailable", "50", "45"], start=1):
+        new_state = hass.states.set("sensor.pid_raw_moisture", value, stamp)
+        for _ids, action in listeners:
+            action(SimpleNamespace(data={"new_state": new_state}))
+
+    assert (fc.native_value, wp.native_value) == (50.0, 35.0)
+    assert fc.extra_state_attributes["samples"] == 4
+
+    # Re-reading the unchanged current state does not count it twice.
+    asyncio.run(fc.async_update())
+    assert fc.extra_state_attributes["samples"] == 4
+
+    restored = EstimatedFieldCapacitySensor(hass, "Plant", "pid", "e1")
+    restored.async_write_ha_state = lambda: None
+    asyncio.run(restored.async_added_to_hass())
+    assert restored.native_value == 50.0
+    assert restored.extra_state_attributes["samples"] == 4
@@ -0,0 +1,124 @@
+import json
+import os
+
+from custom_components.horticulture_assistant.utils.nutrient_use_efficiency import NutrientUseEfficiency
+
+
+def _nue(tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir(exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    return NutrientUseEfficiency(str(data_dir / "nutrient_use.json"))
+
+
+def test_rollups_follow_out_of_order_inserts(tmp_path, monkeypatch):
+    nue = _nue(tmp_path, monkeypatch)
+    nue.log_fertilizer_application("p1", {"N": 100}, "2025-01-15", stage="veg")
+    nue.log_fertilizer_application("p1", {"N": 50, "K": 20}, "2025-01-01", stage="veg")
+    nue.log_fertilizer_application("p1", {"K": 40}, "2025-02-03", stage="flower")
+
+    assert nue.get_usage_summary("p1", "month") == {"2025-01": {"N": 150.0, "K": 20.0}, "2025-02": {"K": 40.0}}
+    assert list(nue.get_usage_summary("p1", "week")) == ["2025-W01", "2025-W03", "2025-W06"]
+    assert nue.get_usage_summary("p1", "stage")["flower"] == {"K": 40.0}
+    assert nue.average_weekly_usage("p1") == {"N": 30.0, "K": 12.0}
+
+    nue.compact()
+    saved = json.loads((tmp_path / "data" / "nutrient_use.json").read_text())
+    assert [row["date"] for row in saved["p1"]] == ["2025-01-01", "2025-01-15", "2025-02-03"]
+    assert saved["p1"][1]["nutrients"] == {"N": 100.0}
+
+
+def test_journal_is_per_plant_and_replayed(tmp_path, monkeypatch):
+    nue = _nue(tmp_path, monkeypatch)
+    nue.log_fertilizer_application("a", {"N": 1}, "2025-01-01", stage="veg")
+    nue.log_fertilizer_application("b/c", {"P": 2}, "2025-01-02", stage="veg")
+
+    journal_dir = tmp_path / "data" / "nutrient_use"
+    assert sorted(p.name for p in journal_dir.iterdir()) == ["a.jsonl", "b_c.jsonl"]
+    reloaded = NutrientUseEfficiency(str(tmp_path / "data" / "nutrient_use.json"))
+    assert reloaded.total_nutrients_applied("b/c") == {"P": 2.0}
+
+
+def test_registry_stage_is_cached_until_file_changes(tmp_path, monkeypatch):
+    nue = _nue(tmp_path, monkeypatch)
+    registry = tmp_path / "data" / "local" / "plants" / "plant_registry.json"
+    registry.parent.mkdir(parents=True)
+    registry.write_text(json.dumps({"p1": {"lifecycle_stage": "veg"}}))
+
+    opened = []
+    real_open = open
+
+    def _tracking_open(path, *args, **kwargs):
+        if str(path).endswith("plant_registry.json"):
+            opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", _tracking_open)
+    for day in ("2025-01-01", "2025-01-02", "2025-01-03"):
+        nue.log_fertilizer_application("p1", {"N": 1}, day)
+    assert len(opened) == 1
+
+    registry.write_text(json.dumps({"p1": {"lifecycle_stage": "flower"}}))
+    os.utime(registry, (0, 1))
+    nue.log_fertilizer_application("p1", {"N": 1}, "2025-01-04")
+    assert nue.get_usage_summary("p1", "stage") == {"veg": {"N": 3.0}, "flower": {"N": 1.0}}
+
+
+def test_compaction_survives_crash_before_journals_are_removed(tmp_path, monkeypatch):
+    nue = _nue(tmp_path, monkeypatch)
+    nue.log_fertilizer_application("p1", {"N": 10}, "2025-01-01", stage="veg")
+    nue.log_fertilizer_application("p1", {"N": 5}, "2025-01-02", stage="veg")
+
+    # Simulate a crash after the snapshot is written but before cleanup.
+    with monkeypatch.context() as patched:
+        patched.setattr(os, "listdir", lambda _path: (_ for _ in ()).throw(OSError("crash")))
+        nue.compact()
+
+    data_file = str(tmp_path / "data" / "nutrient_use.json")
+    assert (tmp_path / "data" / "nutrient_use" / "p1.jsonl").exists()
+    reloaded = NutrientUseEfficiency(data_file)
+    assert reloaded.total_nutrients_applied("p1") == {"N": 15.0}
+
+    reloaded.log_fertilizer_application("p1", {"N": 1}, "2025-01-03", stage="veg")
+    assert NutrientUseEfficiency(data_file).total_nutrients_applied("p1") == {"N": 16.0}
+
+
+def test_journal_is_compacted_past_line_threshold(tmp_path, monkeypatch):
+    monkeypatch.setattr("custom_components.horticulture_assistant.utils.nutrient_use_efficiency.COMPACT_AFTER_LINES", 3)
+    nue = _nue(tmp_path, monkeypatch)
+    journal = tmp_path / "data" / "nutrient_use" / "p1.jsonl"
+    for day in ("2025-01-01", "2025-01-02"):
+        nue.log_fertilizer_application("p1", {"N": 1}, day, stage="veg")
+    assert len(journal.read_text().splitlines()) == 2
+
+    nue.log_fertilizer_application("p1", {"N": 1}, "2025-01-03", stage="veg")
+    assert not journal.exists()
+    saved = json.loads((tmp_path / "data" / "nutrient_use.json").read_text())
+    assert list(saved) == ["p1"] and len(saved["p1"]) == 3
+    assert json.loads((tmp_path / "data" / "nutrient_use.json.seq").read_text())["seq"] == 3
+
+    reloaded = NutrientUseEfficiency(str(tmp_path / "data" / "nutrient_use.json"))
+    assert reloaded.total_nutrients_applied("p1") == {"N": 3.0}
+    assert set(reloaded.application_log) == {"p1"}
+
+
+def test_crash_before_snapshot_replace_replays_journal(tmp_path, monkeypatch):
+    nue = _nue(tmp_path, monkeypatch)
+    nue.log_fertilizer_application("p1", {"N": 10}, "2025-01-01", stage="veg")
+    nue.compact()
+    nue.log_fertilizer_application("p1", {"N": 5}, "2025-01-02", stage="veg")
+
+    # The sidecar for the next snapshot lands, but the snapshot itself does not.
+    real_replace = os.replace
+
+    def _replace(src, dst):
+        if str(dst).endswith("nutrient_use.json"):
+            raise OSError("crash")
+        real_replace(src, dst)
+
+    with monkeypatch.context() as patched:
+        patched.setattr(os, "replace", _replace)
+        nue.compact()
+
+    reloaded = NutrientUseEfficiency(str(tmp_path / "data" / "nutrient_use.json"))
+    assert reloaded.total_nutrients_applied("p1") == {"N": 15.0}
@@ -0,0 +1,85 @@
+import pytest
+
+from custom_components.horticulture_assistant.utils import nutrient_mix_optimizer as nmo
+from custom_components.horticulture_assistant.utils.nutrient_mix_optimizer import (
+    optimize_mix,
+    optimize_mix_batch,
+)
+
+ROWS = [
+    ("tomato", "vegetative", 10.0),
+    {"plant_type": "tomato", "stage": "vegetative", "volume_l": 4.0, "num_plants": 2},
+    ("tomato", "fruiting", 8.0, 6.2, 18.0),
+    ("lettuce", "vegetative", 3.0),
+    ("unknown_crop", "vegetative", 5.0),
+]
+
+
+def test_batch_rows_match_single_mix():
+    plan = optimize_mix_batch(ROWS)
+
+    assert len(plan) == len(ROWS)
+    for index, row in enumerate(ROWS):
+        args = nmo._normalize_row(row)
+        single = optimize_mix(args[0], args[1], args[2], ph=args[3], root_temp_c=args[4], num_plants=args[5])
+        batched = plan.row(index)
+        assert batched.schedule.keys() == single.schedule.keys()
+        for product, grams in single.schedule.items():
+            assert batched.schedule[product] == pytest.approx(grams, abs=2e-3)
+        assert batched.cost == pytest.approx(single.cost, abs=0.011)
+        assert batched.diagnostics == single.diagnostics
+
+
+def test_batch_resolves_each_guideline_once(monkeypatch):
+    calls = []
+    original = nmo.get_environment_adjusted_levels
+
+    def _counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(nmo, "get_environment_adjusted_levels", _counting)
+    rows = [("tomato", stage, float(zone + 1)) for zone in range(40) for stage in ("vegetative", "fruiting")]
+    plan = optimize_mix_batch(rows)
+
+    assert len(calls) == 2
+    assert plan.as_dict()["cost"][:2] == plan.cost[:2].tolist()
+
+
+def test_batch_rejects_invalid_volume():
+    with pytest.raises(ValueError):
+        optimize_mix_batch([("tomato", "vegetative", 0)])
+
+
+def test_cycle_cost_batch_matches_single_estimates():
+    from custom_components.horticulture_assistant.engine.plant_engine.fertigation import estimate_cycle_cost
+
+    rows = ["tomato", ("tomato", 3), {"plant_type": "lettuce", "num_plants": 2}, "unknown_crop"]
+    costs = nmo.estimate_cycle_cost_batch(rows)
+
+    expected = [estimate_cycle_cost("tomato"), estimate_cycle_cost("tomato", num_plants=3)]
+    expected += [estimate_cycle_cost("lettuce", num_plants=2), estimate_cycle_cost("unknown_crop")]
+    assert costs.tolist() == pytest.approx(expected, abs=0.011)
+    with pytest.raises(ValueError):
+        nmo.estimate_cycle_cost_batch([("tomato", 0)])
+
+
+def test_cycle_plans_compute_each_stage_schedule_once(monkeypatch):
+    from custom_components.horticulture_assistant.engine.plant_engine.fertigation import (
+        generate_cycle_fertigation_plan,
+    )
+
+    calls = []
+    original = nmo.recommend_fertigation_schedule
+
+    def _counting(*args, **kwargs):
+        calls.append(args[:2])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(nmo, "recommend_fertigation_schedule", _counting)
+    plans = nmo.generate_cycle_fertigation_plans(["tomato", "lettuce", "tomato"])
+
+    assert list(plans) == ["tomato", "lettuce"]
+    for plant_type, plan in plans.items():
+        assert plan == generate_cycle_fertigation_plan(plant_type)
+    assert len(calls) == len(set(calls)) == sum(1 for plan in plans.values() for days in plan.values() if days)
@@ -0,0 +1,158 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from custom_components.horticulture_assistant.const import DOMAIN
+from custom_components.horticulture_assistant.sensor import DailyNitrogenAppliedSensor
+from custom_components.horticulture_assistant.utils.entry_helpers import async_setup_nutrient_tracker
+from custom_components.horticulture_assistant.utils.nutrient_tracker import (
+    NutrientDeliveryRecord,
+    NutrientTracker,
+    ProductNutrientProfile,
+)
+
+
+def _tracker() -> NutrientTracker:
+    tracker = NutrientTracker()
+    profile = ProductNutrientProfile("urea")
+    profile.add_element("N", 460_000)
+    tracker.register_product(profile)
+    return tracker
+
+
+def test_daily_index_tracks_logged_and_appended_records(tmp_path):
+    tracker = _tracker()
+    today = datetime.now()
+    yesterday = today - timedelta(days=1)
+
+    tracker.log_delivery("p1", "b1", "urea", 1.0, 2.0)
+    tracker.delivery_log.append(NutrientDeliveryRecord("p1", "b2", yesterday, {"N": 10.0}, 1.0))
+    tracker.delivery_log.extend([NutrientDeliveryRecord("p2", "b3", today, {"N": 5.0, "K": 2.0}, 2.0)])
+
+    assert tracker.daily_nutrient_mg("p1", today.date(), "N") == 460.0
+    assert tracker.daily_totals("p1", yesterday.date()) == {"N": 10.0}
+    assert tracker.summarize_mg_for_day(today) == {"N": 470.0, "K": 4.0}
+    assert tracker.summarize_daily_totals("p1") == {
+        today.date().isoformat(): {"N": 460.0},
+        yesterday.date().isoformat(): {"N": 10.0},
+    }
+
+    tracker.delivery_log.pop(0)
+    assert tracker.daily_nutrient_mg("p1", today.date(), "N") == 0.0
+
+    path = tmp_path / "log.json"
+    tracker.save_log(str(path))
+    restored = NutrientTracker()
+    restored.load_log(str(path))
+    assert restored.daily_totals("p2", today.date()) == {"N": 10.0, "K": 4.0}
+    assert restored.summarize_nutrients("p1") == {"N": 10.0}
+
+
+def test_listeners_receive_running_totals():
+    tracker = _tracker()
+    seen = []
+    remove = tracker.add_listener(lambda pid, day, totals: seen.append((pid, day, dict(totals))))
+
+    tracker.log_delivery("p1", "b1", "urea", 1.0, 1.0)
+    tracker.log_delivery("p1", "b2", "urea", 1.0, 1.0)
+    remove()
+    tracker.log_delivery("p1", "b3", "urea", 1.0, 1.0)
+
+    today = datetime.now().date()
+    assert seen == [("p1", today, {"N": 460.0}), ("p1", today, {"N": 920.0})]
+
+
+def test_listeners_notified_once_after_reindex(tmp_path):
+    tracker = _tracker()
+    tracker.log_delivery("p1", "b1", "urea", 1.0, 1.0)
+    tracker.log_delivery("p1", "b2", "urea", 1.0, 1.0)
+    seen = []
+    tracker.add_listener(lambda pid, day, totals: seen.append((pid, day, dict(totals))))
+
+    tracker.delivery_log.pop()
+    path = tmp_path / "log.json"
+    tracker.save_log(str(path))
+    tracker.load_log(str(path))
+
+    assert seen == [(None, None, {}), (None, None, {})]
+    assert tracker.daily_nutrient_mg("p1", datetime.now().date(), "N") == 460.0
+
+
+def test_daily_nitrogen_sensor_updates_on_delivery():
+    tracker = _tracker()
+    writes = []
+
+    async def _run() -> DailyNitrogenAppliedSensor:
+        hass = SimpleNamespace(data={}, loop=asyncio.get_running_loop())
+        sensor = DailyNitrogenAppliedSensor(hass, "Plant", "p1")
+        sensor.async_write_ha_state = lambda: writes.append(sensor.native_value)
+
+        await sensor.async_added_to_hass()
+        assert sensor.native_value is None
+
+        # The tracker is registered after the sensor was added.
+        hass.data[DOMAIN] = {"nutrient_tracker": tracker}
+        sensor._handle_tracker_registered()
+        assert writes == [0.0]
+
+        # Deliveries logged off the loop are marshalled back onto it.
+        await asyncio.to_thread(tracker.log_delivery, "p1", "b1", "urea", 0.5, 1.0)
+        await asyncio.to_thread(tracker.log_delivery, "p2", "b2", "urea", 0.5, 1.0)
+        await asyncio.sleep(0)
+        assert writes == [0.0, 230.0]
+
+        tracker.delivery_log.clear()
+        await asyncio.sleep(0)
+        assert writes == [0.0, 230.0, 0.0]
+
+        # Re-resolving the same tracker does not subscribe twice.
+        sensor._handle_midnight(datetime.now())
+        tracker.log_delivery("p1", "b3", "urea", 0.5, 1.0)
+        await asyncio.sleep(0)
+        assert writes == [0.0, 230.0, 0.0, 0.0, 230.0]
+        return sensor
+
+    sensor = asyncio.run(_run())
+    assert sensor.should_poll is False
+    assert sensor.native_value == 230.0
+
+
+def test_setup_creates_tracker_once_with_saved_log(tmp_path):
+    saved = _tracker()
+    saved.log_delivery("p1", "b1", "urea", 1.0, 1.0)
+    (tmp_path / "data").mkdir()
+    saved.save_log(str(tmp_path / "data" / "nutrient_delivery_log.json"))
+
+    async def _executor(func, *args):
+        return func(*args)
+
+    hass = SimpleNamespace(
+        data={},
+        config=SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts))),
+        async_add_executor_job=_executor,
+    )
+
+    tracker = asyncio.run(async_setup_nutrient_tracker(hass))
+
+    assert hass.data[DOMAIN]["nutrient_tracker"] is tracker
+    assert tracker.product_profiles
+    assert tracker.daily_nutrient_mg("p1", datetime.now().date(), "N") == 460.0
+    assert asyncio.run(async_setup_nutrient_tracker(hass)) is tracker
+
+
+def test_daily_nitrogen_sensor_unavailable_without_tracker(caplog):
+    hass = SimpleNamespace(data={})
+    sensor = DailyNitrogenAppliedSensor(hass, "Plant", "p1")
+
+    with caplog.at_level(logging.WARNING):
+        sensor._refresh()
+        sensor._refresh()
+    assert sensor._attr_available is False
+    assert sensor.native_value is None
+    assert len([r for r in caplog.records if "unavailable" in r.getMessage()]) == 1
+
+    hass.data[DOMAIN] = {"nutrient_tracker": _tracker()}
+    sensor._refresh()
+    assert sensor._attr_available is True
+    assert sensor.native_value == 0.0
@@ -192,3 +192,26 @@ async def test_search_cache_expires():
     assert data1 == [{"pid": "p1"}]
     assert data2 == [{"pid": "p2"}]
     assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_field_coalesces_concurrent_lookups():
+    opb_module.clear_opb_cache()
+    dummy_hass = SimpleNamespace(
+        helpers=SimpleNamespace(
+            aiohttp_client=SimpleNamespace(async_get_clientsession=MagicMock(return_value=MagicMock()))
+        )
+    )
+
+    async def _details(_self, _slug):
+        await asyncio.sleep(0)
+        return {"temp": {"min_c": 18, "max_c": 27}}
+
+    with patch.object(OpenPlantbookClient, "species_details", autospec=True, side_effect=_details) as mock_details:
+        results = await asyncio.gather(
+            async_fetch_field(dummy_hass, "slug", "temp.min_c"),
+            async_fetch_field(dummy_hass, "slug", "temp.max_c"),
+            async_fetch_field(dummy_hass, "slug", "temp.min_c"),
+        )
+    assert [value for value, _url in results] == [18.0, 27.0, 18.0]
+    assert mock_details.call_count == 1
@@ -0,0 +1,82 @@
+import asyncio
+import importlib
+import sys
+import types
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.horticulture_assistant.const import DOMAIN
+from custom_components.horticulture_assistant.diagnostics import async_get_config_entry_diagnostics
+from custom_components.horticulture_assistant.utils import perf_stats
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    perf_stats.reset()
+    yield
+    perf_stats.reset()
+
+
+def test_timed_records_sync_and_async_calls_and_errors():
+    @perf_stats.timed("demo.sync")
+    def _sync(value):
+        return value * 2
+
+    @perf_stats.timed("demo.async")
+    async def _async(fail):
+        if fail:
+            raise RuntimeError("boom")
+        return "ok"
+
+    assert _sync(2) == 4
+    assert asyncio.run(_async(False)) == "ok"
+    with pytest.raises(RuntimeError):
+        asyncio.run(_async(True))
+    with pytest.raises(ValueError), perf_stats.measure("demo.block"):
+        raise ValueError
+
+    stats = perf_stats.snapshot()
+    assert list(stats) == ["demo.async", "demo.block", "demo.sync"]
+    assert stats["demo.async"]["count"] == 2 and stats["demo.async"]["errors"] == 1
+    assert stats["demo.block"]["errors"] == 1
+    assert stats["demo.sync"]["errors"] == 0
+
+
+def test_percentiles_cover_recent_window():
+    for ms in range(1, 1001):
+        perf_stats.record("demo.op", ms / 1000)
+
+    stats = perf_stats.snapshot()["demo.op"]
+    assert stats["count"] == 1000
+    assert stats["max_ms"] == 1000.0
+    window_start = 1000 - perf_stats.WINDOW_SIZE + 1
+    assert stats["p50_ms"] == pytest.approx(window_start + perf_stats.WINDOW_SIZE / 2 - 1, abs=1)
+    assert stats["p99_ms"] == pytest.approx(998, abs=1)
+    assert stats["mean_ms"] == pytest.approx(500.5)
+
+
+async def test_diagnostics_and_system_health_expose_stats(hass, monkeypatch):
+    perf_stats.record("resolver.resolve_profile", 0.2)
+    perf_stats.record("cloud_sync.pull", 0.05)
+    perf_stats.record("dataset.load", 0.01)
+    perf_stats.record("coordinator.refresh", 0.001)
+
+    entry = SimpleNamespace(entry_id="e1", title="Hort", data={}, options={})
+    result = await async_get_config_entry_diagnostics(hass, entry)
+    assert result["performance"]["operations"]["resolver.resolve_profile"]["count"] == 1
+    assert isinstance(result["performance"]["recent_page_fetches"], list)
+
+    registered = {}
+    stub = types.ModuleType("homeassistant.components.system_health")
+    stub.SystemHealthRegistration = object
+    monkeypatch.setitem(sys.modules, "homeassistant.components.system_health", stub)
+    monkeypatch.delitem(sys.modules, "custom_components.horticulture_assistant.system_health", raising=False)
+    system_health = importlib.import_module("custom_components.horticulture_assistant.system_health")
+    registration = SimpleNamespace(register_info=lambda domain, func: registered.setdefault(domain, func))
+    await system_health.async_register(registration, hass)
+
+    info = registered[DOMAIN](hass)
+    assert info["instrumented_calls"] == 4
+    assert info["slowest_operations"].startswith("resolver.resolve_profile p95 200.0 ms (1 calls)")
+    assert "coordinator.refresh" not in info["slowest_operations"]
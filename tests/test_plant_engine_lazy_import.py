@@ -0,0 +1,77 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Runs in a fresh interpreter.  The integration package is registered as a
+# bare namespace so its Home Assistant imports do not run.
+_PROBE = """
+import json, sys, time, types
+pkg = types.ModuleType("custom_components.horticulture_assistant")
+pkg.__path__ = [sys.argv[1]]
+sys.modules[pkg.__name__] = pkg
+
+start = time.perf_counter()
+import custom_components.horticulture_assistant.engine.plant_engine as pe
+elapsed = time.perf_counter() - start
+prefix = pe.__name__ + "."
+loaded = sorted(m[len(prefix):] for m in sys.modules if m.startswith(prefix))
+
+calls = []
+real = pe.utils.load_dataset
+def counting(name):
+    calls.append(name)
+    return real(name)
+counting.cache_clear = real.cache_clear
+pe.utils.load_dataset = counting
+from custom_components.horticulture_assistant.engine.plant_engine import (
+    chill_risk, compute_transpiration, disease_monitor, growth_stage, micro_manager,
+    precipitation_risk, propagation_manager, root_temperature, water_usage,
+)
+at_import = len(calls)
+pandas_loaded = "pandas" in sys.modules
+micro_manager.list_supported_plants()
+growth_stage.stage_bounds("tomato")
+print(json.dumps({
+    "elapsed": elapsed,
+    "loaded": loaded,
+    "at_import": at_import,
+    "after_use": len(calls),
+    "pandas": pandas_loaded,
+    "lazy_attr": pe.generate_crop_advice.__module__,
+    "star_attr": "get_environment_tips" in pe.__all__,
+}))
+"""
+
+
+def _probe() -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE, str(ROOT / "custom_components" / "horticulture_assistant")],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def test_plant_engine_import_is_lazy():
+    result = _probe()
+
+    assert result["loaded"] == ["utils"]
+    assert result["at_import"] == 0
+    assert result["after_use"] >= 2
+    assert result["pandas"] is False
+    assert result["lazy_attr"].endswith("plant_engine.crop_advisor")
+    assert result["star_attr"] is True
+    # Generous bound; the eager package took well over a second to import.
+    assert result["elapsed"] < 1.0
+
+
+def test_ec_estimator_default_model_is_built_on_first_use():
+    from custom_components.horticulture_assistant.utils import ec_estimator
+
+    assert ec_estimator.DEFAULT_MODEL is ec_estimator.default_model()
+    assert ec_estimator.default_model().coeffs["solution_ec"] == 0.8
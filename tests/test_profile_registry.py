@@ -1924,6 +1924,36 @@ async def test_record_run_event_appends_and_persists(hass):
     assert stored is not None and len(stored.run_history) == 1
 
 
+async def test_merge_profile_bulk_updates_registry_and_store(hass):
+    await profile_store.async_save_profile(hass, BioProfile(profile_id="p1", display_name="P1"))
+    entry = await _make_entry(hass)
+    reg = ProfileRegistry(hass, entry)
+    await reg.async_load()
+    await reg.async_record_run_event("p1", {"run_id": "run-new", "started_at": "2024-02-01T00:00:00Z"})
+
+    payload = {
+        "run_history": [{"run_id": "run-stale", "profile_id": "p1", "started_at": "2024-01-01T00:00:00Z"}],
+        "harvest_history": [
+            {"harvest_id": "h1", "profile_id": "p1", "harvested_at": "2024-03-01T00:00:00Z", "yield_grams": 5}
+        ],
+        "computed_stats": [{"stats_version": "cloud/v1", "payload": {"targets": {"vpd": 0.8}}}],
+    }
+    assert await reg.async_merge_profile_bulk("p1", payload) is True
+    assert await reg.async_merge_profile_bulk("p1", payload) is False
+
+    profile = reg.get("p1")
+    assert [run.run_id for run in profile.run_history] == ["run-new"]
+    assert [harvest.harvest_id for harvest in profile.harvest_history] == ["h1"]
+    cloud = next(snap for snap in profile.computed_stats if snap.stats_version == "cloud/v1")
+    assert cloud.payload["targets"]["vpd"] == 0.8
+
+    # A later registry save keeps the merged data in the store.
+    await reg.async_save()
+    stored = await profile_store.async_load_profile(hass, "p1")
+    assert [harvest.harvest_id for harvest in stored.harvest_history] == ["h1"]
+    assert any(snap.stats_version == "cloud/v1" for snap in stored.computed_stats)
+
+
 async def test_record_run_event_rejects_invalid_success_rate(hass):
     entry = await _make_entry(hass)
     reg = ProfileRegistry(hass, entry)
@@ -0,0 +1,107 @@
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.horticulture_assistant.const import CONF_PROFILES, DOMAIN
+from custom_components.horticulture_assistant.profile import store as profile_store
+from custom_components.horticulture_assistant.profile.schema import (
+    BioProfile,
+    Citation,
+    CultivarProfile,
+    CultivationEvent,
+    FieldAnnotation,
+    HarvestEvent,
+    NutrientApplication,
+    ResolvedTarget,
+    RunEvent,
+)
+from custom_components.horticulture_assistant.profile_registry import ProfileRegistry
+
+
+def _profile() -> CultivarProfile:
+    profile = CultivarProfile(profile_id="basil", display_name="Basil", species="ocimum", area_m2=1.5)
+    profile.general["sensors"] = {"temperature": "sensor.temp"}
+    profile.citations.append(Citation(source="manual", title="Grower notes"))
+    profile.resolved_targets["temp_c_max"] = ResolvedTarget(
+        value=28.0,
+        annotation=FieldAnnotation(source_type="manual"),
+        citations=[Citation(source="manual", title="Manual")],
+    )
+    profile.add_run_event(
+        RunEvent(run_id="r1", profile_id="basil", species_id=None, started_at="2025-01-01T00:00:00+00:00")
+    )
+    profile.add_cultivation_event(
+        CultivationEvent(
+            event_id="c1",
+            profile_id="basil",
+            species_id=None,
+            run_id=None,
+            occurred_at="2025-01-02T00:00:00+00:00",
+            event_type="pruning",
+            tags=["canopy"],
+        )
+    )
+    profile.add_harvest_event(
+        HarvestEvent(
+            harvest_id="h1",
+            profile_id="basil",
+            species_id=None,
+            run_id=None,
+            harvested_at="2025-02-01T00:00:00+00:00",
+            yield_grams=120.0,
+        )
+    )
+    profile.add_nutrient_event(
+        NutrientApplication(
+            event_id="n1",
+            profile_id="basil",
+            species_id=None,
+            run_id=None,
+            applied_at="2025-01-05T00:00:00+00:00",
+            product_name="Grow A",
+        )
+    )
+    return profile
+
+
+def test_round_trip_preserves_payload_and_uses_slots():
+    profile = BioProfile.from_json(_profile().to_json())
+    payload = profile.to_json()
+
+    restored = BioProfile.from_json(profile_store.clone_payload(payload))
+    assert isinstance(restored, CultivarProfile)
+    assert restored.to_json() == payload
+    assert payload["local"]["harvest_history"] == payload["harvest_history"]
+    assert payload["sections"]["local"] == payload["local"]
+
+    # Sections share event objects instead of copying every event.
+    assert profile.local.harvest_history[0] is profile.harvest_history[0]
+    assert not hasattr(profile.harvest_history[0], "__dict__")
+    assert not hasattr(profile.citations[0], "__dict__")
+
+
+def test_clone_payload_detaches_and_keeps_sharing():
+    shared = [{"value": 1}]
+    payload = {"a": shared, "b": shared, "c": (1, 2), "d": None}
+
+    clone = profile_store.clone_payload(payload)
+
+    assert clone == payload
+    assert clone["a"] is clone["b"]
+    assert clone["a"] is not shared and clone["a"][0] is not shared[0]
+    shared[0]["value"] = 2
+    assert clone["a"][0]["value"] == 1
+
+
+async def test_registry_save_detaches_cache_from_live_profiles(hass, tmp_path):
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={CONF_PROFILES: {}})
+    entry.add_to_hass(hass)
+    registry = ProfileRegistry(hass, entry)
+    await registry.async_load()
+    registry._profiles["basil"] = _profile()
+
+    await registry.async_save()
+    registry._profiles["basil"].general["sensors"]["temperature"] = "sensor.other"
+
+    cached = hass.data[profile_store.CACHE_KEY]["basil"]
+    assert cached["general"]["sensors"]["temperature"] == "sensor.temp"
+    assert BioProfile.from_json(cached).harvest_history[0].yield_grams == 120.0
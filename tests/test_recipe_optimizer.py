@@ -0,0 +1,94 @@
+import pytest
+
+from custom_components.horticulture_assistant.utils.recipe_optimizer import (
+    optimize_recipe,
+    optimize_recipes,
+)
+
+PRODUCTS = [
+    {"name": "Blend", "form": "solid", "analysis": {"N": 20.0, "K": 20.0}, "price_per_unit": 0.02},
+    {"name": "Urea", "form": "solid", "analysis": {"N": 40.0}, "price_per_unit": 0.01},
+    {"name": "Potash", "form": "solid", "analysis": {"K": 40.0}, "price_per_unit": 0.01},
+]
+
+
+def _doses(recipe):
+    return {item["product"]: item["dose"] for item in recipe["ingredients"]}
+
+
+def test_optimize_recipe_finds_least_cost_mix():
+    recipe = optimize_recipe({"nutrient_targets": {"N": 100.0, "K": 100.0}}, PRODUCTS, solubility={}, compatibility={})
+
+    assert _doses(recipe) == {"Urea": 0.25, "Potash": 0.25}
+    assert recipe["total_cost"] == pytest.approx(0.01, abs=0.005)
+
+
+def test_optimize_recipe_respects_compatibility_and_solubility():
+    conflict = {"Urea": {"Potash": "precipitates"}}
+    recipe = optimize_recipe(
+        {"nutrient_targets": {"N": 100.0, "K": 100.0}}, PRODUCTS, solubility={}, compatibility=conflict
+    )
+    doses = _doses(recipe)
+    assert not ("Urea" in doses and "Potash" in doses)
+    assert sum(doses.values()) == pytest.approx(0.5)
+
+    capped = optimize_recipe({"nutrient_targets": {"N": 100.0}}, PRODUCTS, solubility={"Urea": 0.1}, compatibility={})
+    assert _doses(capped) == {"Urea": 0.1, "Blend": 0.3}
+
+
+def test_optimize_recipe_enforces_maximum_targets():
+    with pytest.raises(ValueError):
+        optimize_recipe(
+            {"nutrient_targets": {"N": 100.0, "K": {"max": 10.0}}},
+            PRODUCTS,
+            solubility={"Urea": 0.0},
+            compatibility={},
+        )
+    with pytest.raises(ValueError, match="No available product"):
+        optimize_recipe({"nutrient_targets": {"Fe": 2.0}}, PRODUCTS, solubility={}, compatibility={})
+
+
+def test_optimize_recipes_scales_shared_solution_by_volume():
+    recipes = optimize_recipes(
+        [
+            {"nutrient_targets": {"N": 100.0}, "volume_l": 10.0},
+            {"nutrient_targets": {"N": 100.0}},
+            {"nutrient_targets": {"K": 80.0}},
+        ],
+        PRODUCTS,
+        solubility={},
+        compatibility={},
+    )
+
+    assert [_doses(r) for r in recipes] == [{"Urea": 2.5}, {"Urea": 0.25}, {"Potash": 0.2}]
+    assert recipes[0]["total_volume"] == 10.0
+
+
+def test_optimize_recipe_bounds_branching_on_many_conflicts():
+    cheap = [
+        {"name": f"C{idx}", "form": "solid", "analysis": {"N": 10.0}, "price_per_unit": 0.01 + idx * 1e-4}
+        for idx in range(14)
+    ]
+    products = [*cheap, {"name": "Big", "form": "solid", "analysis": {"N": 10.0}, "price_per_unit": 0.05}]
+    conflicts = {a["name"]: {b["name"]: "precipitates" for b in cheap if b is not a} for a in cheap}
+    caps = {prod["name"]: 0.02 for prod in cheap}
+
+    recipe = optimize_recipe({"nutrient_targets": {"N": 10.0}}, products, solubility=caps, compatibility=conflicts)
+
+    doses = _doses(recipe)
+    assert len([name for name in doses if name != "Big"]) <= 1
+    assert sum(doses.values()) == pytest.approx(0.1)
+
+
+def test_optimize_recipe_doses_liquids_by_volume():
+    liquid = {"name": "Liquid N", "form": "liquid", "analysis": {"N": 10.0}, "density_g_per_ml": 1.25}
+    recipe = optimize_recipe(
+        {"nutrient_targets": {"N": 100.0}},
+        [{**liquid, "price_per_unit": 0.05}],
+        volume_l=2.0,
+        solubility={},
+        compatibility={},
+    )
+
+    assert recipe["ingredients"] == [{"product": "Liquid N", "dose": 1.6, "unit": "mL", "cost": 0.08}]
+    assert recipe["total_volume"] == 2.002
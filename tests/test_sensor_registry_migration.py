@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import custom_components.horticulture_assistant.sensor as sensor_mod
+from custom_components.horticulture_assistant.const import DOMAIN
+
+
+class _Registry:
+    def __init__(self, entities):
+        self.entities = {e.entity_id: e for e in entities}
+        self.updates = []
+        self.walks = 0
+
+    def async_update_entity(self, entity_id, *, new_unique_id):
+        self.updates.append((entity_id, new_unique_id))
+        self.entities[entity_id].unique_id = new_unique_id
+
+    def entries_for(self, _registry, entry_id):
+        self.walks += 1
+        return [e for e in self.entities.values() if e.config_entry_id == entry_id]
+
+
+def _entity(entity_id, unique_id, domain="sensor"):
+    return SimpleNamespace(
+        entity_id=entity_id,
+        unique_id=unique_id,
+        domain=domain,
+        platform=DOMAIN,
+        config_entry_id="e1",
+    )
+
+
+def test_registry_migration_runs_once_per_entry(monkeypatch):
+    registry = _Registry(
+        [
+            _entity("sensor.legacy_light", "e1_light"),
+            _entity("sensor.colon", "p1:ppfd"),
+            _entity("switch.prefixed", f"{DOMAIN}_e1_p1_irrigation_switch", domain="switch"),
+            _entity("sensor.bare", "p1_light"),
+            _entity("sensor.current", "horticulture_e1_p1_vpd"),
+        ]
+    )
+    monkeypatch.setattr(sensor_mod.er, "async_get", lambda _hass: registry)
+    monkeypatch.setattr(sensor_mod.er, "async_entries_for_config_entry", registry.entries_for)
+
+    def _update_entry(entry, *, data=None, options=None):
+        entry.data = data
+
+    hass = SimpleNamespace(config_entries=SimpleNamespace(async_update_entry=_update_entry))
+    entry = SimpleNamespace(entry_id="e1", data={})
+
+    sensor_mod._async_migrate_entity_registry(hass, entry, "p1", {"p1"})
+
+    assert dict(registry.updates) == {
+        "sensor.legacy_light": "horticulture_p1_light",
+        "sensor.colon": "p1_ppfd",
+        "switch.prefixed": "p1_irrigation_switch",
+        "sensor.bare": "horticulture_p1_light",
+    }
+    assert entry.data[sensor_mod.CONF_SENSOR_REGISTRY_VERSION] == sensor_mod.SENSOR_REGISTRY_VERSION
+
+    registry.updates.clear()
+    sensor_mod._async_migrate_entity_registry(hass, entry, "p1", {"p1"})
+
+    assert registry.updates == []
+    assert registry.walks == 1
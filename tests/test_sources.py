@@ -12,6 +12,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from custom_components.horticulture_assistant.ai_client import clear_ai_cache
+from custom_components.horticulture_assistant.opb_client import clear_opb_cache
 
 pytest.importorskip("homeassistant.exceptions")
 
@@ -51,6 +52,7 @@ from custom_components.horticulture_assistant.profile.schema import (  # noqa: E
     FieldAnnotation,
     ResolvedTarget,
 )
+from custom_components.horticulture_assistant.profile.store import async_get_profile  # noqa: E402
 from custom_components.horticulture_assistant.profile.utils import link_species_and_cultivars  # noqa: E402
 from custom_components.horticulture_assistant.resolver import PreferenceResolver, generate_profile  # noqa: E402
 
@@ -440,12 +442,16 @@ async def test_resolver_uses_cloud_overlay_when_available():
     assert profile_options["thresholds"]["temp_c_min"] == 5.0
     assert profile_options["library"]["curated_targets"]["targets"]["vpd"]["vegetative"] == 0.9
     assert profile_options["identity"]["name"] == "Tophat Cloud"
-    computed = profile_options["computed_stats"]
-    assert computed and computed[0]["payload"]["targets"]["vpd"]["vegetative"] == 0.8
+    assert "computed_stats" not in profile_options
+    assert "sections" not in profile_options
     resolved = profile_options["resolved_targets"]["targets.vpd.vegetative"]
     assert resolved["value"] == 0.9
     assert resolved["annotation"]["overlay"] == 0.8
-    sections = profile_options["sections"]
+
+    stored = await async_get_profile(hass, "p1")
+    computed = stored["computed_stats"]
+    assert computed and computed[0]["payload"]["targets"]["vpd"]["vegetative"] == 0.8
+    sections = stored["sections"]
     assert sections["library"]["profile_id"] == "p1"
     assert sections["resolved"]["thresholds"]["temp_c_min"] == 5.0
     assert sections["resolved"]["resolved_targets"]["targets.vpd.vegetative"]["value"] == 0.9
@@ -615,3 +621,171 @@ async def test_options_flow_generate_profile_clone():
     prof = entry.options["profiles"]["p1"]
     assert prof["thresholds"]["temp_c_min"] == 7.0
     assert prof["sources"]["temp_c_min"]["mode"] == "clone"
+
+
+@pytest.mark.asyncio
+async def test_resolve_profile_skips_options_write_when_unchanged():
+    hass = make_hass()
+    writes: list[dict] = []
+
+    def update_entry(entry, *, options):
+        writes.append(options)
+        entry.options = options
+
+    hass.config_entries.async_update_entry = update_entry
+    entry = DummyEntry({"profiles": {"p1": {"sources": {"temp_c_min": {"mode": "manual", "value": 3.0}}}}})
+    resolver = PreferenceResolver(hass)
+
+    await resolver.resolve_profile(entry, "p1")
+    assert len(writes) == 1
+    profile_options = entry.options["profiles"]["p1"]
+    for key in ("run_history", "harvest_history", "statistics", "computed_stats", "sections"):
+        assert key not in profile_options
+    assert "run_history" not in profile_options["local"]
+
+    await resolver.resolve_profile(entry, "p1")
+    assert len(writes) == 1
+
+
+@pytest.mark.asyncio
+async def test_resolve_profile_refreshes_citation_when_value_changes():
+    hass = make_hass()
+    entry = DummyEntry({"profiles": {"p1": {"sources": {"temp_c_min": {"mode": "manual", "value": 3.0}}}}})
+    resolver = PreferenceResolver(hass)
+
+    await resolver.resolve_profile(entry, "p1")
+    options = dict(entry.options)
+    prof = dict(options["profiles"]["p1"])
+    stale = "2000-01-01T00:00:00+00:00"
+    prof["citations"] = {"temp_c_min": {**prof["citations"]["temp_c_min"], "ts": stale}}
+    prof["sources"] = {"temp_c_min": {"mode": "manual", "value": 4.0}}
+    entry.options = {**options, "profiles": {"p1": prof}}
+
+    await resolver.resolve_profile(entry, "p1")
+    citation = entry.options["profiles"]["p1"]["citations"]["temp_c_min"]
+    assert entry.options["profiles"]["p1"]["thresholds"]["temp_c_min"] == 4.0
+    assert citation["mode"] == "manual"
+    assert citation["ts"] != stale
+
+
+@pytest.mark.asyncio
+async def test_opb_sources_share_one_species_lookup():
+    clear_opb_cache()
+    hass = make_hass()
+    entry = DummyEntry(
+        {
+            "opb_token": "t",
+            "profiles": {
+                "p1": {
+                    "sources": {
+                        "temp_c_min": {"mode": "opb", "opb": {"species": "s", "field": "temp.min"}},
+                        "temp_c_max": {"mode": "opb", "opb": {"species": "s", "field": "temp.max"}},
+                    }
+                }
+            },
+        }
+    )
+    mock = AsyncMock(return_value={"temp": {"min": 5, "max": 30}})
+    with patch(
+        "custom_components.horticulture_assistant.opb_client.OpenPlantbookClient.species_details",
+        mock,
+    ):
+        await PreferenceResolver(hass).resolve_profile(entry, "p1")
+    assert mock.call_count == 1
+    thresholds = entry.options["profiles"]["p1"]["thresholds"]
+    assert thresholds["temp_c_min"] == 5
+    assert thresholds["temp_c_max"] == 30
+
+
+@pytest.mark.asyncio
+async def test_ai_sources_resolve_in_one_batch_and_single_write():
+    clear_ai_cache()
+    hass = make_hass()
+    writes: list[dict] = []
+
+    def update_entry(entry, *, options):
+        writes.append(options)
+        entry.options = options
+
+    hass.config_entries.async_update_entry = update_entry
+    ai_source = {"mode": "ai", "ai": {"ttl_hours": 720}}
+    entry = DummyEntry({"profiles": {"p1": {"sources": {"temp_c_min": ai_source, "temp_c_max": ai_source}}}})
+    mock = AsyncMock(
+        return_value={
+            "temp_c_min": (12.0, 0.8, "min note", []),
+            "temp_c_max": (28.0, 0.7, "max note", ["https://example.com"]),
+        }
+    )
+    with patch(
+        "custom_components.horticulture_assistant.ai_client.AIClient.generate_setpoints",
+        mock,
+    ):
+        await PreferenceResolver(hass).resolve_profile(entry, "p1")
+    assert mock.call_count == 1
+    assert len(writes) == 1
+    prof = entry.options["profiles"]["p1"]
+    assert prof["thresholds"]["temp_c_min"] == 12.0
+    assert prof["thresholds"]["temp_c_max"] == 28.0
+    ai_meta = prof["sources"]["temp_c_max"]["ai"]
+    assert ai_meta["last_run"]
+    assert ai_meta["confidence"] == 0.7
+    assert ai_meta["links"] == ["https://example.com"]
+
+
+@pytest.mark.asyncio
+async def test_opb_failures_only_drop_affected_variables():
+    clear_opb_cache()
+    hass = make_hass()
+    entry = DummyEntry(
+        {
+            "opb_token": "t",
+            "profiles": {
+                "p1": {
+                    "sources": {
+                        "temp_c_min": {"mode": "opb", "opb": {"species": "good", "field": "temp.min"}},
+                        "temp_c_max": {"mode": "opb", "opb": {"species": "good", "field": None}},
+                        "rh_min": {"mode": "opb", "opb": {"species": "broken", "field": "rh.min"}},
+                        "rh_max": {"mode": "manual", "value": 80},
+                    }
+                }
+            },
+        }
+    )
+
+    async def _details(_self, species):
+        if species == "broken":
+            raise ValueError("invalid JSON")
+        return {"temp": {"min": 5}}
+
+    with patch(
+        "custom_components.horticulture_assistant.opb_client.OpenPlantbookClient.species_details",
+        _details,
+    ):
+        await PreferenceResolver(hass).resolve_profile(entry, "p1")
+    thresholds = entry.options["profiles"]["p1"]["thresholds"]
+    assert thresholds["temp_c_min"] == 5
+    assert thresholds["rh_max"] == 80
+    assert "temp_c_max" not in thresholds
+    assert "rh_min" not in thresholds
+
+
+@pytest.mark.asyncio
+async def test_resolver_stores_bulk_through_registry():
+    hass = make_hass()
+    merged: list[tuple[str, dict]] = []
+
+    class MergingRegistry(DummyRegistry):
+        async def async_merge_profile_bulk(self, profile_id, payload):
+            merged.append((profile_id, payload))
+            return True
+
+    entry = DummyEntry({"profiles": {"p1": {"name": "P1"}}})
+    registry = MergingRegistry([BioProfile(profile_id="p1", display_name="P1")])
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"profile_registry": registry}
+    payload = {"plant_id": "p1", "computed_stats": [{"stats_version": "cloud/v1", "payload": {}}]}
+
+    await PreferenceResolver(hass)._async_store_bulk(entry, "p1", payload)
+
+    # The registry owns the store, so nothing is written behind its back.
+    assert merged == [("p1", payload)]
+    assert await async_get_profile(hass, "p1") is None
@@ -0,0 +1,87 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "validate_profiles.py"
+
+
+@pytest.fixture(scope="module")
+def script():
+    spec = importlib.util.spec_from_file_location("validate_profiles_script", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    # Worker processes unpickle functions by module name.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_profiles(script, root: Path) -> None:
+    schema = json.loads(script.SCHEMA_PATH.read_text(encoding="utf-8"))
+    required = schema.get("required", [])
+    for idx in range(6):
+        (root / f"p{idx}.json").write_text(json.dumps({"profile_id": f"p{idx}"}), encoding="utf-8")
+    (root / "broken.json").write_text("{", encoding="utf-8")
+    assert required  # schema requires more than profile_id, so stubs are invalid
+
+
+def test_bulk_validation_streams_and_caches(script, tmp_path):
+    profiles = tmp_path / "profiles"
+    profiles.mkdir()
+    _write_profiles(script, profiles)
+    cache = tmp_path / "cache.json"
+
+    first = list(script.validate_profiles([profiles], cache_path=cache, jobs=2))
+    assert len(first) == 7
+    assert {r["status"] for r in first} == {"invalid"}
+    broken = next(r for r in first if r["path"].endswith("broken.json"))
+    assert broken["issues"][0].startswith("invalid JSON")
+
+    (profiles / "p0.json").write_text(json.dumps({"profile_id": "changed"}), encoding="utf-8")
+    second = list(script.validate_profiles([profiles], cache_path=cache, jobs=1))
+
+    statuses = {Path(r["path"]).name: r["status"] for r in second}
+    assert statuses.pop("p0.json") == "invalid"
+    assert set(statuses.values()) == {"cached"}
+    assert [r["issues"] for r in second if r["path"].endswith("p1.json")] == [
+        r["issues"] for r in first if r["path"].endswith("p1.json")
+    ]
+
+
+def test_cli_reports_jsonl(script, tmp_path, capsys):
+    profiles = tmp_path / "profiles"
+    profiles.mkdir()
+    (profiles / "bad.json").write_text("[]", encoding="utf-8")
+
+    assert script.main(["--profiles", str(profiles), "--no-cache", "--jsonl", "--jobs", "1"]) == 1
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["status"] for line in lines] == ["invalid"]
+
+
+def test_cache_is_dropped_when_validators_or_jsonschema_change(script, tmp_path, monkeypatch):
+    profiles = tmp_path / "profiles"
+    profiles.mkdir()
+    (profiles / "p.json").write_text(json.dumps({"profile_id": "p"}), encoding="utf-8")
+    cache = tmp_path / "cache.json"
+    validators = tmp_path / "validators.py"
+    validators.write_text("# v1\n", encoding="utf-8")
+    monkeypatch.setattr(script, "VALIDATORS_PATH", validators)
+
+    def _statuses():
+        return [r["status"] for r in script.validate_profiles([profiles], cache_path=cache, jobs=1)]
+
+    assert _statuses() == ["invalid"]
+    assert _statuses() == ["cached"]
+
+    validators.write_text("# v2\n", encoding="utf-8")
+    assert _statuses() == ["invalid"]
+    assert _statuses() == ["cached"]
+
+    def _missing(name):
+        raise script.importlib.metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(script.importlib.metadata, "version", _missing)
+    assert _statuses() == ["invalid"]
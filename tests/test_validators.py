@@ -0,0 +1,47 @@
+from custom_components.horticulture_assistant import validators
+from custom_components.horticulture_assistant.validators import (
+    is_valid_profile,
+    validate_harvest_event_dict,
+    validate_profile_dict,
+    validate_profile_dicts,
+)
+
+SCHEMA = {
+    "type": "object",
+    "required": ["profile_id"],
+    "properties": {"profile_id": {"type": "string"}, "age": {"type": "integer", "minimum": 0}},
+}
+
+
+def test_schema_is_compiled_once(monkeypatch):
+    compiled = []
+    base = validators._validator()
+
+    def counting_validator(schema):
+        compiled.append(schema)
+        return base(schema)
+
+    monkeypatch.setattr(validators, "_validator", lambda: counting_validator)
+    monkeypatch.setattr(validators, "_COMPILED", validators.OrderedDict())
+    payload = {
+        "harvest_id": "h1",
+        "profile_id": "p1",
+        "harvested_at": "2024-01-01T00:00:00+00:00",
+        "yield_grams": 120.0,
+    }
+    for _ in range(3):
+        assert validate_harvest_event_dict(payload) == []
+        assert validate_profile_dict({"profile_id": "p"}, SCHEMA) == []
+
+    assert len(compiled) == 2
+
+
+def test_batch_and_fast_path_validation():
+    profiles = [{"profile_id": "a"}, {"profile_id": 1, "age": -1}, {}]
+
+    results = validate_profile_dicts(profiles, SCHEMA)
+
+    assert results[0] == []
+    assert sorted(results[1]) == ["age: -1 is less than the minimum of 0", "profile_id: 1 is not of type 'string'"]
+    assert results[2] == ["<root>: 'profile_id' is a required property"]
+    assert [is_valid_profile(p, SCHEMA) for p in profiles] == [True, False, False]
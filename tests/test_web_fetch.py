@@ -0,0 +1,104 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from custom_components.horticulture_assistant import web_fetch
+
+
+class _Content:
+    def __init__(self, body: bytes, chunk: int = 8) -> None:
+        self._body = body
+        self._chunk = chunk
+        self.read = 0
+
+    async def iter_chunked(self, _size):
+        for start in range(0, len(self._body), self._chunk):
+            self.read += self._chunk
+            yield self._body[start : start + self._chunk]
+
+
+class _Response:
+    def __init__(self, status=200, body=b"", headers=None, session=None) -> None:
+        self.status = status
+        self.charset = "utf-8"
+        self.headers = headers or {}
+        self.content = _Content(body)
+        self._session = session
+
+    async def __aenter__(self):
+        if self._session is not None:
+            self._session.active += 1
+            self._session.peak = max(self._session.peak, self._session.active)
+            await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *_exc):
+        if self._session is not None:
+            self._session.active -= 1
+        return False
+
+
+class _Session:
+    def __init__(self, responses) -> None:
+        self._responses = list(responses)
+        self.requests: list[tuple[str, dict]] = []
+        self.active = 0
+        self.peak = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, dict(headers or {})))
+        response = self._responses.pop(0)
+        response._session = self
+        return response
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch):
+    monkeypatch.setattr(web_fetch, "PER_HOST_INTERVAL", 0)
+    web_fetch.clear_page_cache()
+    yield
+    web_fetch.clear_page_cache()
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_text_strips_markup_and_caps_bytes():
+    body = b"<html><script>var x = 999;</script><p>Keep 21 C</p>" + b"<p>filler</p>" * 1000
+    response = _Response(body=body)
+    session = _Session([response])
+
+    text = await web_fetch.fetch_page_text(session, "https://a.example/page", max_bytes=64)
+
+    assert "Keep 21 C" in text
+    assert "999" not in text
+    assert response.content.read <= 72
+    timing = web_fetch.fetch_timings()[-1]
+    assert timing["host"] == "a.example"
+    assert timing["bytes"] == 64
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_text_revalidates_with_etag(monkeypatch):
+    monkeypatch.setattr(web_fetch, "PAGE_FRESH_FOR", timedelta(0))
+    session = _Session(
+        [
+            _Response(body=b"<p>pH 6.2</p>", headers={"ETag": '"v1"'}),
+            _Response(status=304),
+        ]
+    )
+
+    first = await web_fetch.fetch_page_text(session, "https://a.example/ph")
+    second = await web_fetch.fetch_page_text(session, "https://a.example/ph")
+
+    assert first == second == "pH 6.2"
+    assert session.requests[1][1]["If-None-Match"] == '"v1"'
+    assert web_fetch.fetch_timings()[-1]["cached"] is True
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_text_limits_concurrency_per_host():
+    session = _Session([_Response(body=f"<p>{i}</p>".encode()) for i in range(6)])
+
+    await asyncio.gather(*(web_fetch.fetch_page_text(session, f"https://a.example/{i}") for i in range(6)))
+
+    assert session.peak == web_fetch.PER_HOST_CONCURRENCY